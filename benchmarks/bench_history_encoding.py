@@ -0,0 +1,193 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+History Encoding Benchmark for Ash-Bot Service
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-10-11.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+
+Compares the stored history member formats:
+
+    json        → json.dumps(StoredMessage.to_dict()) (pre-Phase 10)
+    compact     → StoredMessage.encode() (version 1)
+    compressed  → StoredMessage.encode(compress=True)
+
+Always reports member size and encode/decode throughput. With --redis it
+also writes --users histories per format and reports Redis memory scaled
+to 10k users (INFO used_memory delta), using ash:bench:* keys that are
+deleted afterwards.
+
+USAGE (from a checkout):
+    python benchmarks/bench_history_encoding.py
+    BOT_REDIS_HOST=localhost python benchmarks/bench_history_encoding.py \\
+        --redis --users 2000 --messages 100
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Allow running from the repository root or the benchmarks directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.history_models import StoredMessage  # noqa: E402
+
+KEY_PREFIX = "ash:bench:encoding"
+WORDS = (
+    "i feel so tired of everything today and nobody really gets it "
+    "work was rough again but my friends helped a bit honestly "
+    "cant sleep again thinking about what they said to me last night"
+).split()
+
+ENCODERS: Dict[str, Callable[[StoredMessage], str]] = {
+    "json": lambda msg: json.dumps(msg.to_dict()),
+    "compact": lambda msg: msg.encode(),
+    "compressed": lambda msg: msg.encode(compress=True),
+}
+
+
+# =============================================================================
+# Sample Data
+# =============================================================================
+
+
+def make_messages(count: int, seed: int = 10) -> List[StoredMessage]:
+    """Build history entries with a realistic spread of lengths."""
+    rng = random.Random(seed)
+    start = datetime.now(timezone.utc) - timedelta(days=14)
+    messages = []
+    for i in range(count):
+        length = min(500, int(rng.lognormvariate(4.3, 0.8)))
+        text = " ".join(rng.choice(WORDS) for _ in range(length // 5 + 1))[:length]
+        burst = None
+        if rng.random() < 0.1:
+            burst = [str(1_200_000_000_000_000_000 + i * 10 + j) for j in range(3)]
+        messages.append(
+            StoredMessage.create(
+                message=text,
+                timestamp=start + timedelta(seconds=i * 37),
+                crisis_score=rng.random(),
+                severity=rng.choice(("low", "medium", "high", "critical")),
+                message_id=str(1_200_000_000_000_000_000 + i),
+                burst_message_ids=burst,
+            )
+        )
+    return messages
+
+
+# =============================================================================
+# Local Benchmarks
+# =============================================================================
+
+
+def bench_codecs(messages: List[StoredMessage], rounds: int) -> None:
+    """Print member size and encode/decode throughput per format."""
+    print(f"{'format':<11} {'mean bytes':>10} {'encode/s':>12} {'decode/s':>12}")
+    for name, encode in ENCODERS.items():
+        members = [encode(msg) for msg in messages]
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for msg in messages:
+                encode(msg)
+        encode_rate = rounds * len(messages) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for member in members:
+                StoredMessage.decode(member)
+        decode_rate = rounds * len(messages) / (time.perf_counter() - start)
+
+        # Every format must round-trip to the same entry
+        for msg, member in zip(messages, members):
+            decoded = StoredMessage.decode(member)
+            if decoded != msg:
+                print(f"  ⚠️ {name}: round trip changed {msg} → {decoded}")
+                break
+
+        size = statistics.mean(len(member.encode("utf-8")) for member in members)
+        print(f"{name:<11} {size:>10.1f} {encode_rate:>12,.0f} {decode_rate:>12,.0f}")
+
+
+# =============================================================================
+# Redis Memory
+# =============================================================================
+
+
+async def bench_redis_memory(
+    messages: List[StoredMessage], users: int, per_user: int
+) -> None:
+    """Print Redis memory per 10k users for each format."""
+    from src.managers import create_config_manager, create_secrets_manager
+    from src.managers.storage import create_redis_manager
+
+    config_manager = create_config_manager()
+    secrets_manager = create_secrets_manager()
+    redis_manager = create_redis_manager(config_manager, secrets_manager)
+    await redis_manager.connect()
+
+    async def used_memory() -> int:
+        info = await redis_manager.info("memory") or {}
+        return int(info.get("used_memory", 0))
+
+    try:
+        print(f"\nRedis memory ({users} users x {per_user} messages, scaled to 10k users)")
+        for name, encode in ENCODERS.items():
+            before = await used_memory()
+            for user in range(users):
+                key = f"{KEY_PREFIX}:{name}:{user}"
+                async with redis_manager.pipeline(transaction=False) as pipe:
+                    for i in range(per_user):
+                        msg = messages[(user * per_user + i) % len(messages)]
+                        pipe.zadd(key, msg.parsed_timestamp.timestamp() + i, encode(msg))
+            used = await used_memory() - before
+            print(f"{name:<11} {used / users * 10_000 / 1024 / 1024:10.1f} MiB")
+    finally:
+        for key in await redis_manager.scan_iter(f"{KEY_PREFIX}:*"):
+            await redis_manager.delete(key)
+        await redis_manager.disconnect()
+
+
+def main() -> int:
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("USAGE")[0])
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--redis", action="store_true", help="Also measure Redis memory")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=100)
+    args = parser.parse_args()
+
+    messages = make_messages(args.samples)
+    bench_codecs(messages, args.rounds)
+
+    if args.redis:
+        asyncio.run(bench_redis_memory(messages, args.users, args.messages))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+History Write Microbenchmark for Ash-Bot Service
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-10-8.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+
+Compares the two ways of writing one history entry against a live Redis:
+
+    sequential → ZADD, EXPIRE, ZCARD, ZREMRANGEBYRANK (4 round trips)
+    scripted   → RedisManager.zadd_capped (1 EVALSHA round trip)
+
+Uses the normal configuration and secrets (BOT_REDIS_HOST, redis_token),
+writes only to ash:bench:* keys and deletes them afterwards.
+
+USAGE (from a checkout, with Redis reachable):
+    BOT_REDIS_HOST=localhost python benchmarks/bench_history_writes.py
+    BOT_REDIS_HOST=localhost python benchmarks/bench_history_writes.py \\
+        --iterations 5000 --concurrency 16 --max-messages 100
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+# Allow running from the repository root or the benchmarks directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.managers import create_config_manager, create_secrets_manager  # noqa: E402
+from src.managers.storage import create_redis_manager  # noqa: E402
+from src.managers.storage.redis_manager import RedisManager  # noqa: E402
+
+KEY_PREFIX = "ash:bench:history"
+TTL_SECONDS = 3600
+
+
+# =============================================================================
+# Write Paths
+# =============================================================================
+
+
+async def write_sequential(
+    redis_manager: RedisManager, key: str, score: float, member: str, max_messages: int
+) -> None:
+    """Pre-Phase 10 add_message: four dependent round trips."""
+    await redis_manager.zadd(key, score, member)
+    await redis_manager.expire(key, TTL_SECONDS)
+    count = await redis_manager.zcard(key)
+    if count > max_messages:
+        await redis_manager.zremrangebyrank(key, 0, count - max_messages - 1)
+
+
+async def write_scripted(
+    redis_manager: RedisManager, key: str, score: float, member: str, max_messages: int
+) -> None:
+    """Phase 10 add_message: one atomic EVALSHA."""
+    await redis_manager.zadd_capped(
+        key, score, member, max_size=max_messages, ttl_seconds=TTL_SECONDS
+    )
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+async def run_path(
+    name: str,
+    write: Callable[..., Awaitable[None]],
+    redis_manager: RedisManager,
+    iterations: int,
+    concurrency: int,
+    users: int,
+    max_messages: int,
+    report: bool = True,
+) -> None:
+    """Run one write path and print latency/throughput figures."""
+    latencies: List[float] = []
+    counter = iter(range(iterations))
+    payload = json.dumps({"message": "x" * 120, "crisis_score": 0.42, "severity": "low"})
+
+    async def worker() -> None:
+        for i in counter:
+            key = f"{KEY_PREFIX}:{name}:{i % users}"
+            start = time.perf_counter()
+            await write(redis_manager, key, time.time(), f"{i}:{payload}", max_messages)
+            latencies.append(time.perf_counter() - start)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+    if not report:
+        return
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<11} n={len(latencies):<6} "
+        f"mean={statistics.mean(latencies) * 1e6:8.0f}µs  "
+        f"p50={statistics.median(latencies) * 1e6:8.0f}µs  "
+        f"p99={p99 * 1e6:8.0f}µs  "
+        f"throughput={len(latencies) / wall:8.0f} writes/s"
+    )
+
+    # Both paths must leave every key bounded
+    for user in range(users):
+        size = await redis_manager.zcard(f"{KEY_PREFIX}:{name}:{user}")
+        if size > max_messages:
+            print(f"  ⚠️ {name}: key {user} holds {size} > {max_messages} members")
+
+
+async def main() -> int:
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("USAGE:")[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--max-messages", type=int, default=100)
+    args = parser.parse_args()
+
+    config_manager = create_config_manager()
+    secrets_manager = create_secrets_manager()
+    redis_manager = create_redis_manager(config_manager, secrets_manager)
+    await redis_manager.connect()
+
+    try:
+        for name, write in (("sequential", write_sequential), ("scripted", write_scripted)):
+            # Warm up connections (and load the script) outside the measurement
+            await run_path(
+                name, write, redis_manager, 50, 1, 1, args.max_messages, report=False
+            )
+            await run_path(
+                name,
+                write,
+                redis_manager,
+                args.iterations,
+                args.concurrency,
+                args.users,
+                args.max_messages,
+            )
+    finally:
+        for key in await redis_manager.scan_iter(f"{KEY_PREFIX}:*"):
+            await redis_manager.delete(key)
+        await redis_manager.disconnect()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
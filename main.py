@@ -14,8 +14,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Main Entry Point for Ash-Bot Service
 ---
-FILE VERSION: v5.0-6-1.0-2
-LAST MODIFIED: 2026-01-17
+FILE VERSION: v5.0-6-1.0-15
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 6 - Logging Colorization Enforcement
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -48,7 +48,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 # Module version
-__version__ = "v5.0-6-1.0-2"
+__version__ = "v5.0-6-1.0-15"
 
 # Global logging manager instance (initialized in main)
 _logging_manager = None
@@ -292,7 +292,9 @@ async def main_async(args: argparse.Namespace) -> int:
     from src.managers import create_config_manager, create_secrets_manager
     from src.managers.discord import (
         create_channel_config_manager,
+        create_deferred_analysis_queue,
         create_discord_manager,
+        create_elevated_user_tracker,
     )
     from src.managers.nlp import create_nlp_client_manager
     from src.managers.storage import (
@@ -310,6 +312,8 @@ async def main_async(args: argparse.Namespace) -> int:
         create_claude_client_manager,
         create_ash_session_manager,
         create_ash_personality_manager,
+        create_context_window_manager,
+        create_claude_scheduler,
     )
     from src.managers.user import create_user_preferences_manager
     # Phase 5: Import health and metrics managers
@@ -325,6 +329,14 @@ async def main_async(args: argparse.Namespace) -> int:
     from src.managers.session import create_handoff_manager, create_notes_manager
     # Phase 9.3: Import follow-up manager
     from src.managers.session import create_followup_manager
+    # Phase 10: Import shared background job scheduler
+    from src.managers.scheduling import create_scheduler_manager
+    # Phase 10: Import background job lease manager
+    from src.managers.scheduling import create_lease_manager
+    # Phase 10: Import outbound Discord queue
+    from src.managers.discord import create_outbound_queue
+    # Phase 10: Import shared Discord lookup cache
+    from src.managers.discord import create_discord_resolver
 
     # Initialize managers
     logger.info("🔧 Initializing managers...")
@@ -342,6 +354,9 @@ async def main_async(args: argparse.Namespace) -> int:
     notes_manager = None
     handoff_manager = None
     followup_manager = None
+    scheduler_manager = None
+    lease_manager = None
+    outbound_queue = None
 
     try:
         # Set environment for config manager
@@ -366,6 +381,37 @@ async def main_async(args: argparse.Namespace) -> int:
             except Exception as e:
                 logger.warning(f"⚠️ Metrics initialization failed: {e}")
 
+        # Phase 10: Create the shared scheduler for timed background work
+        try:
+            scheduler_manager = create_scheduler_manager(
+                config_manager=config_manager,
+                metrics_manager=metrics_manager,
+            )
+            scheduler_manager.start()
+            logger.info("✅ SchedulerManager started (Phase 10)")
+        except Exception as e:
+            logger.warning(
+                f"⚠️ SchedulerManager startup failed: {e}\n"
+                "   Background jobs will use polling loops"
+            )
+            scheduler_manager = None
+
+        # Phase 10: Create the outbound queue shared by everything that posts
+        try:
+            outbound_queue = create_outbound_queue(
+                config_manager=config_manager,
+                metrics_manager=metrics_manager,
+            )
+            if outbound_queue:
+                outbound_queue.start()
+                logger.info("✅ OutboundQueue started (Phase 10)")
+        except Exception as e:
+            logger.warning(
+                f"⚠️ OutboundQueue startup failed: {e}\n"
+                "   Discord calls will be sent directly"
+            )
+            outbound_queue = None
+
         # Create channel config manager
         channel_config = create_channel_config_manager(
             config_manager=config_manager,
@@ -392,6 +438,7 @@ async def main_async(args: argparse.Namespace) -> int:
             user_history = create_user_history_manager(
                 config_manager=config_manager,
                 redis_manager=redis_manager,
+                metrics_manager=metrics_manager,
             )
             logger.info("✅ UserHistoryManager initialized (Phase 2)")
 
@@ -404,6 +451,26 @@ async def main_async(args: argparse.Namespace) -> int:
             redis_manager = None
             user_history = None
 
+        # Phase 10: Create the lease manager so each background job runs on
+        # one replica (needs Redis)
+        if redis_manager:
+            try:
+                lease_manager = create_lease_manager(
+                    config_manager=config_manager,
+                    redis_manager=redis_manager,
+                    metrics_manager=metrics_manager,
+                )
+                if scheduler_manager:
+                    lease_manager.set_scheduler_manager(scheduler_manager)
+                await lease_manager.start()
+                logger.info("✅ LeaseManager started (Phase 10)")
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ LeaseManager startup failed: {e}\n"
+                    "   Background jobs will run on every replica"
+                )
+                lease_manager = None
+
         # Phase 3: Create alerting managers
         alert_dispatcher = None
         cooldown_manager = None
@@ -412,6 +479,7 @@ async def main_async(args: argparse.Namespace) -> int:
             # Create cooldown manager
             cooldown_manager = create_cooldown_manager(
                 config_manager=config_manager,
+                redis_manager=redis_manager,
             )
 
             # Create embed builder
@@ -429,22 +497,42 @@ async def main_async(args: argparse.Namespace) -> int:
 
         # Phase 4: Prepare Claude client (session manager needs bot, created later)
         claude_client = None
+        context_window_manager = None
         ash_personality_manager = None
         try:
             # Check for Claude API token first
             claude_token = secrets_manager.get_claude_api_token()
             if claude_token:
-                # Create Claude client (no metrics_manager support yet)
+                # Phase 10: Shared priority scheduler for all Claude requests
+                claude_scheduler = create_claude_scheduler(
+                    config_manager=config_manager,
+                    metrics_manager=metrics_manager,
+                )
+
+                # Create Claude client (Phase 10: records time to first token)
                 claude_client = create_claude_client_manager(
                     config_manager=config_manager,
                     secrets_manager=secrets_manager,
+                    metrics_manager=metrics_manager,
+                    scheduler=claude_scheduler,
+                )
+
+                # Phase 10: Token-budgeted context window with rolling summary
+                context_window_manager = create_context_window_manager(
+                    config_manager=config_manager,
+                    claude_client=claude_client,
+                    metrics_manager=metrics_manager,
                 )
 
                 # Create personality manager (doesn't need bot)
                 ash_personality_manager = create_ash_personality_manager(
                     config_manager=config_manager,
                     claude_client=claude_client,
+                    metrics_manager=metrics_manager,
+                    context_window_manager=context_window_manager,
                 )
+                if outbound_queue:
+                    ash_personality_manager.set_outbound_queue(outbound_queue)
 
                 logger.info("✅ Claude client and personality manager initialized (Phase 4)")
             else:
@@ -456,6 +544,7 @@ async def main_async(args: argparse.Namespace) -> int:
                 "   Bot will start without Ash AI support"
             )
             claude_client = None
+            context_window_manager = None
             ash_personality_manager = None
 
         # Validate startup
@@ -483,6 +572,65 @@ async def main_async(args: argparse.Namespace) -> int:
             metrics_manager=metrics_manager,
         )
 
+        # Phase 10: Drained by disconnect() before the bot closes
+        if outbound_queue:
+            discord_manager.set_outbound_queue(outbound_queue)
+
+        # Phase 10: Shared user/channel/message cache, attached to the bot so
+        # managers and button views resolve through the same instance
+        try:
+            discord_resolver = create_discord_resolver(
+                config_manager=config_manager,
+                bot=discord_manager.bot,
+                metrics_manager=metrics_manager,
+            )
+            if discord_resolver:
+                if outbound_queue:
+                    discord_resolver.set_outbound_queue(outbound_queue)
+                discord_manager.bot.discord_resolver = discord_resolver
+                logger.info("✅ DiscordResolver initialized (Phase 10)")
+        except Exception as e:
+            logger.warning(
+                f"⚠️ DiscordResolver initialization failed: {e}\n"
+                "   Users and channels will be fetched via REST"
+            )
+
+        # Phase 10: Persist and share elevated users (needs Redis)
+        if redis_manager:
+            try:
+                elevated_users = create_elevated_user_tracker(
+                    config_manager=config_manager,
+                    redis_manager=redis_manager,
+                )
+                if scheduler_manager:
+                    elevated_users.set_scheduler_manager(scheduler_manager)
+                else:
+                    await elevated_users.refresh()
+                discord_manager.set_elevated_user_tracker(elevated_users)
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ ElevatedUserTracker initialization failed: {e}\n"
+                    "   Elevated users will be tracked in memory only"
+                )
+
+        # Phase 10: Create deferred analysis queue (needs Redis)
+        if redis_manager:
+            try:
+                deferred_queue = create_deferred_analysis_queue(
+                    config_manager=config_manager,
+                    redis_manager=redis_manager,
+                    replay=discord_manager.replay_deferred_analysis,
+                    capacity=discord_manager.deferred_drain_capacity,
+                    metrics_manager=metrics_manager,
+                )
+                discord_manager.set_deferred_analysis_queue(deferred_queue)
+                logger.info("✅ DeferredAnalysisQueue initialized (Phase 10)")
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ DeferredAnalysisQueue initialization failed: {e}\n"
+                    "   Messages will not be re-analyzed after NLP outages"
+                )
+
         # Phase 7: Create user preferences manager
         user_preferences_manager = None
         user_optout_enabled = config_manager.get("user_preferences", "optout_enabled", True)
@@ -507,6 +655,8 @@ async def main_async(args: argparse.Namespace) -> int:
                     config_manager=config_manager,
                     redis_manager=redis_manager,
                 )
+                if outbound_queue:
+                    notes_manager.set_outbound_queue(outbound_queue)
                 logger.info("✅ NotesManager initialized (Phase 9.2)")
 
                 handoff_manager = create_handoff_manager(
@@ -553,6 +703,10 @@ async def main_async(args: argparse.Namespace) -> int:
                     ash_session_manager.set_notes_manager(notes_manager)
                     logger.info("✅ NotesManager integrated with AshSessionManager (Phase 9.2)")
 
+                # Phase 10: Expire sessions at their deadline
+                if scheduler_manager:
+                    ash_session_manager.set_scheduler_manager(scheduler_manager)
+
                 # Inject into discord_manager
                 discord_manager.ash_session_manager = ash_session_manager
                 discord_manager.bot.ash_session_manager = ash_session_manager
@@ -589,6 +743,14 @@ async def main_async(args: argparse.Namespace) -> int:
                 # Attach to bot for response detection
                 discord_manager.bot.followup_manager = followup_manager
 
+                # Phase 10: Wake at the next due follow-up instead of polling
+                if scheduler_manager:
+                    followup_manager.set_scheduler_manager(scheduler_manager)
+                if lease_manager:
+                    followup_manager.set_lease_manager(lease_manager)
+                if outbound_queue:
+                    followup_manager.set_outbound_queue(outbound_queue)
+
                 # Start the scheduler
                 await followup_manager.start()
 
@@ -618,6 +780,9 @@ async def main_async(args: argparse.Namespace) -> int:
                     cooldown_manager=cooldown_manager,
                     bot=discord_manager.bot,
                 )
+                # Phase 10: Alerts go out ahead of all other posts
+                if outbound_queue:
+                    alert_dispatcher.set_outbound_queue(outbound_queue)
                 # Inject alert_dispatcher into discord_manager
                 discord_manager.alert_dispatcher = alert_dispatcher
                 logger.info("✅ AlertDispatcher configured (Phase 3)")
@@ -663,6 +828,14 @@ async def main_async(args: argparse.Namespace) -> int:
                 # Attach to bot instance for button access
                 discord_manager.bot.auto_initiate_manager = auto_initiate_manager
 
+                # Phase 10: One scheduler job per pending alert
+                if scheduler_manager:
+                    auto_initiate_manager.set_scheduler_manager(scheduler_manager)
+                if lease_manager:
+                    auto_initiate_manager.set_lease_manager(lease_manager)
+                if outbound_queue:
+                    auto_initiate_manager.set_outbound_queue(outbound_queue)
+
                 # Start the background check loop
                 await auto_initiate_manager.start()
 
@@ -685,6 +858,7 @@ async def main_async(args: argparse.Namespace) -> int:
                     redis_manager=redis_manager,
                     ash_session_manager=ash_session_manager,
                     ash_personality_manager=ash_personality_manager,
+                    lease_manager=lease_manager,
                 )
 
                 # Create and start health server (need routes first)
@@ -721,6 +895,12 @@ async def main_async(args: argparse.Namespace) -> int:
                     redis_manager=redis_manager,
                 )
 
+                # Phase 10: Run on the shared scheduler
+                if scheduler_manager:
+                    data_retention_manager.set_scheduler_manager(scheduler_manager)
+                if lease_manager:
+                    data_retention_manager.set_lease_manager(lease_manager)
+
                 # Start the retention scheduler
                 await data_retention_manager.start()
 
@@ -743,6 +923,14 @@ async def main_async(args: argparse.Namespace) -> int:
                     bot=discord_manager.bot,
                 )
 
+                # Phase 10: Run on the shared scheduler
+                if scheduler_manager:
+                    weekly_report_manager.set_scheduler_manager(scheduler_manager)
+                if lease_manager:
+                    weekly_report_manager.set_lease_manager(lease_manager)
+                if outbound_queue:
+                    weekly_report_manager.set_outbound_queue(outbound_queue)
+
                 # Start the scheduler (will check channel config internally)
                 await weekly_report_manager.start()
 
@@ -821,6 +1009,27 @@ async def main_async(args: argparse.Namespace) -> int:
                 await auto_initiate_manager.stop()
                 logger.info("🔌 AutoInitiateManager stopped")
 
+            # Phase 10: Cancel background conversation summaries
+            if context_window_manager:
+                await context_window_manager.close()
+                logger.info("🔌 ContextWindowManager stopped")
+
+            # Phase 10: DiscordManager.disconnect() drains the outbound queue
+            # before the bot closes; this only stops it if connect() failed
+            if outbound_queue and outbound_queue.is_running:
+                await outbound_queue.stop()
+                logger.info("🔌 OutboundQueue stopped")
+
+            # Phase 10: Release job leases so a standby can take over
+            if lease_manager:
+                await lease_manager.stop()
+                logger.info("🔌 LeaseManager stopped")
+
+            # Phase 10: Stop the shared scheduler after its job owners
+            if scheduler_manager:
+                await scheduler_manager.stop()
+                logger.info("🔌 SchedulerManager stopped")
+
             # Phase 5: Stop health server
             if health_server:
                 await health_server.stop()
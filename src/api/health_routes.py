@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Health Routes for Ash-Bot Service
 ---
-FILE VERSION: v5.0-5-5.4-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-5-5.4-2
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 5 - Production Hardening
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -56,7 +56,7 @@ from typing import Any, Dict, Optional, TYPE_CHECKING
 from aiohttp import web
 
 # Module version
-__version__ = "v5.0-5-5.4-1"
+__version__ = "v5.0-5-5.4-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -165,7 +165,8 @@ class HealthRoutes:
         Readiness check endpoint.
 
         Returns 200 if the bot is ready to serve traffic.
-        Returns 503 if not ready (e.g., Discord not connected).
+        Returns 503 if not ready (e.g., Discord not connected or
+        the analysis queue is saturated).
 
         This is used by load balancers and Kubernetes to determine
         if traffic should be routed to this instance.
@@ -184,7 +185,10 @@ class HealthRoutes:
         }
 
         if not is_ready:
-            body["message"] = "Service not ready - Discord connection required"
+            if self._health.is_analysis_queue_saturated():
+                body["message"] = "Service not ready - analysis queue saturated"
+            else:
+                body["message"] = "Service not ready - Discord connection required"
 
         status_code = 200 if is_ready else 503
         return web.json_response(body, status=status_code)
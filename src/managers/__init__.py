@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Managers Package for Ash-Bot Service
 ---
-FILE VERSION: v5.0-9-1.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-9-1.0-2
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 9 - CRT Workflow Enhancements (Step 9.1)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -39,6 +39,7 @@ MANAGERS:
 - MetricsManager: Operational metrics collection (Phase 5)
 - HealthManager: Component health monitoring (Phase 5)
 - SlashCommandManager: CRT slash commands (Phase 9)
+- SchedulerManager: Shared deadline scheduler for background jobs (Phase 10)
 
 USAGE:
     from src.managers import (
@@ -70,7 +71,7 @@ USAGE:
 """
 
 # Module version
-__version__ = "v5.0-9-1.0-1"
+__version__ = "v5.0-9-1.0-2"
 
 # =============================================================================
 # Configuration Manager
@@ -193,6 +194,15 @@ from .commands import (
     create_slash_command_manager,
 )
 
+# =============================================================================
+# Scheduler Manager (Phase 10)
+# =============================================================================
+
+from .scheduling import (
+    SchedulerManager,
+    create_scheduler_manager,
+)
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -260,4 +270,7 @@ __all__ = [
     # Commands (Phase 9)
     "SlashCommandManager",
     "create_slash_command_manager",
+    # Scheduling (Phase 10)
+    "SchedulerManager",
+    "create_scheduler_manager",
 ]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Alerting Package for Ash-Bot Service
 ---
-FILE VERSION: v5.0-7-1.0-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-7-1.0-4
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 7 - Core Safety & User Preferences
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -24,6 +24,9 @@ This package contains alert system managers for Ash-Bot:
 
 MANAGERS:
 - CooldownManager: Prevents alert spam per user
+- MemoryCooldownBackend / RedisCooldownBackend: Cooldown storage (Phase 10)
+- AlertStormTracker: Alert storm detection and digest embeds (Phase 10)
+- AlertDelivery / fan_out: Concurrent multi-channel alert sends (Phase 10)
 - EmbedBuilder: Creates Discord embeds for alerts
 - AlertDispatcher: Routes alerts to appropriate channels
 - AutoInitiateManager: Automatic Ash outreach for unacknowledged alerts
@@ -36,13 +39,13 @@ USAGE:
         create_auto_initiate_manager,
     )
 
-    cooldown = create_cooldown_manager(config_manager)
+    cooldown = create_cooldown_manager(config_manager, redis_manager)
     embed_builder = create_embed_builder()
     dispatcher = create_alert_dispatcher(...)
 """
 
 # Module version
-__version__ = "v5.0-7-1.0-1"
+__version__ = "v5.0-7-1.0-4"
 
 # =============================================================================
 # Cooldown Manager
@@ -52,6 +55,23 @@ from .cooldown_manager import (
     CooldownManager,
     create_cooldown_manager,
 )
+from .cooldown_backends import (
+    CooldownBackend,
+    MemoryCooldownBackend,
+    RedisCooldownBackend,
+)
+
+# =============================================================================
+# Alert Storm Digest (Phase 10)
+# =============================================================================
+
+from .alert_storm import AlertStormTracker
+
+# =============================================================================
+# Alert Fan-Out (Phase 10)
+# =============================================================================
+
+from .alert_fanout import AlertDelivery, fan_out
 
 # =============================================================================
 # Embed Builder
@@ -90,6 +110,14 @@ __all__ = [
     # Cooldown
     "CooldownManager",
     "create_cooldown_manager",
+    "CooldownBackend",
+    "MemoryCooldownBackend",
+    "RedisCooldownBackend",
+    # Alert Storm
+    "AlertStormTracker",
+    # Alert Fan-Out
+    "AlertDelivery",
+    "fan_out",
     # Embed Builder
     "EmbedBuilder",
     "create_embed_builder",
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Alert Dispatcher for Ash-Bot Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-1.0-2
-LAST MODIFIED: 2026-01-06
+FILE VERSION: v5.0-8-1.0-13
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -27,6 +27,11 @@ RESPONSIBILITIES:
 - Ping CRT role for HIGH/CRITICAL alerts
 - Track cooldowns to prevent spam
 - Record response metrics for alert tracking (Phase 8)
+- Fold MEDIUM alerts into a digest during alert storms (Phase 10)
+- Send through the priority outbound queue when one is set (Phase 10)
+- Fan out to every alert channel for the severity concurrently, with
+  per-channel success/failure accounting; slow sends are awaited, never
+  cancelled (Phase 10)
 
 USAGE:
     from src.managers.alerting import create_alert_dispatcher
@@ -44,7 +49,7 @@ USAGE:
 
 import discord
 from discord.ext import commands
-from typing import List, Optional, Set, TYPE_CHECKING
+from typing import Awaitable, Callable, List, Optional, Set, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:
@@ -54,12 +59,21 @@ if TYPE_CHECKING:
     from src.managers.alerting.cooldown_manager import CooldownManager
     from src.managers.alerting.auto_initiate_manager import AutoInitiateManager
     from src.managers.metrics.response_metrics_manager import ResponseMetricsManager
+    from src.managers.discord.outbound_queue import OutboundQueue
     from src.models.nlp_models import CrisisAnalysisResult
 
+from src.managers.alerting.alert_fanout import AlertDelivery, fan_out
+from src.managers.alerting.alert_storm import AlertStormTracker, DIGEST_SEVERITIES
+from src.managers.discord.discord_resolver import get_resolver
+from src.managers.discord.outbound_queue import (
+    PRIORITY_ALERT,
+    PRIORITY_CRITICAL,
+    send_message,
+)
 from src.views.alert_buttons import AlertButtonView
 
 # Module version
-__version__ = "v5.0-8-1.0-2"
+__version__ = "v5.0-8-1.0-13"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -89,7 +103,7 @@ class AlertDispatcher:
     1. Check if severity qualifies for alerting
     2. Check cooldown to prevent spam
     3. Build embed with crisis details
-    4. Route to correct channel based on severity
+    4. Route to every alert channel for the severity, concurrently (Phase 10)
     5. Add interactive buttons
     6. Ping CRT role if needed
     7. Set cooldown for user
@@ -142,6 +156,7 @@ class AlertDispatcher:
         self._bot = bot
         self._auto_initiate = auto_initiate_manager
         self._response_metrics = response_metrics_manager
+        self._outbound: Optional["OutboundQueue"] = None
 
         # Load configuration
         self._enabled = self._config.get("alerting", "enabled", True)
@@ -149,11 +164,31 @@ class AlertDispatcher:
             "alerting", "min_severity_to_alert", "medium"
         )
         self._crt_role_ids = self._channel_config.get_crt_role_ids()
+        self._send_timeout = float(
+            self._config.get("alerting", "send_timeout_seconds", 10)
+        )
+
+        # Phase 10: Alert storm digest (per-channel rate detection)
+        self._storm: Optional[AlertStormTracker] = None
+        if self._config.get("alerting", "storm_enabled", True):
+            self._storm = AlertStormTracker(
+                embed_builder=embed_builder,
+                threshold=self._config.get("alerting", "storm_threshold", 10),
+                window_seconds=self._config.get("alerting", "storm_window_seconds", 60),
+                digest_interval_seconds=self._config.get(
+                    "alerting", "digest_interval_seconds", 15
+                ),
+            )
 
         # Statistics
         self._alerts_sent = 0
         self._alerts_skipped_cooldown = 0
         self._alerts_skipped_severity = 0
+        self._alerts_folded = 0
+        self._channel_sends = 0
+        self._channel_failures = 0
+        self._partial_deliveries = 0
+        self._failures_by_channel: dict = {}
 
         logger.info(
             f"✅ AlertDispatcher initialized "
@@ -210,37 +245,172 @@ class AlertDispatcher:
         mentions = [f"<@&{role_id}>" for role_id in self._crt_role_ids]
         return " ".join(mentions)
 
-    def _get_alert_channel(
+    def _get_alert_channels(
         self,
         severity: str,
-    ) -> Optional[discord.TextChannel]:
+    ) -> List[discord.TextChannel]:
         """
-        Get the alert channel for a severity level.
+        Get all alert channels for a severity level (Phase 10).
+
+        Channels that are missing or not text channels are logged and
+        left out.
 
         Args:
             severity: Crisis severity level
 
         Returns:
-            Discord TextChannel or None if not configured
+            Discord TextChannels in configured order (empty if none)
         """
-        channel_id = self._channel_config.get_alert_channel(severity)
-        if channel_id is None:
-            return None
+        channels = []
+        for channel_id in self._channel_config.get_alert_channels(severity):
+            channel = self._bot.get_channel(channel_id)
+            if channel is None:
+                logger.warning(
+                    f"⚠️ Alert channel {channel_id} not found for severity {severity}"
+                )
+                continue
 
-        channel = self._bot.get_channel(channel_id)
-        if channel is None:
-            logger.warning(
-                f"⚠️ Alert channel {channel_id} not found for severity {severity}"
+            if not isinstance(channel, discord.TextChannel):
+                logger.warning(
+                    f"⚠️ Alert channel {channel_id} is not a text channel"
+                )
+                continue
+
+            channels.append(channel)
+
+        return channels
+
+    def _build_alert_view(
+        self,
+        message: discord.Message,
+        severity: str,
+        alert_id: Optional[str],
+    ) -> AlertButtonView:
+        """
+        Build the button view for one alert message.
+
+        Each channel's copy gets its own view, carrying the metrics alert_id.
+
+        Args:
+            message: Original Discord message
+            severity: Crisis severity level
+            alert_id: Response metrics alert ID (if tracked)
+
+        Returns:
+            AlertButtonView for the alert message
+        """
+        return AlertButtonView(
+            user_id=message.author.id,
+            message_id=message.id,
+            severity=severity,
+            alert_id=alert_id,
+        )
+
+    async def _record_alert_delivered(
+        self,
+        alert_message: discord.Message,
+        message: discord.Message,
+        severity: str,
+        alert_id: Optional[str],
+        channel_sensitivity: float,
+        elapsed: float,
+    ) -> None:
+        """
+        Bookkeeping for the first delivered copy of any alert.
+
+        Shared by crisis and escalation alerts, so both get a metrics
+        record and an auto-initiate timer.
+
+        Args:
+            alert_message: First alert message to land
+            message: Original Discord message
+            severity: Crisis severity level
+            alert_id: Response metrics alert ID (if tracked)
+            channel_sensitivity: Channel sensitivity modifier
+            elapsed: Seconds until the first send landed
+        """
+        # Phase 8: Record alert creation in response metrics
+        if self._response_metrics and alert_id:
+            await self._response_metrics.record_alert_created(
+                alert_id=alert_id,
+                alert_message_id=alert_message.id,
+                user_id=message.author.id,
+                channel_id=message.channel.id,
+                severity=severity,
+                channel_sensitivity=channel_sensitivity,
+                time_to_first_alert_seconds=round(elapsed, 3),
             )
-            return None
 
-        if not isinstance(channel, discord.TextChannel):
+        # Phase 7: Track alert for auto-initiate
+        if self._auto_initiate and self._auto_initiate.is_enabled:
+            await self._auto_initiate.track_alert(
+                alert_message=alert_message,
+                user_id=message.author.id,
+                severity=severity,
+                original_message=message,
+            )
+
+    async def _deliver(
+        self,
+        channels: List[discord.TextChannel],
+        send: Callable[[discord.TextChannel], Awaitable[discord.Message]],
+        on_first: Callable[[discord.TextChannel, discord.Message, float], Awaitable[None]],
+        alert_id: Optional[str],
+    ) -> AlertDelivery:
+        """
+        Send an alert to all its channels and account for the outcome.
+
+        Args:
+            channels: Alert channels to send to
+            send: Coroutine function performing one channel's send
+            on_first: Callback for the first send to land
+            alert_id: Response metrics alert ID (if tracked)
+
+        Returns:
+            AlertDelivery with per-channel results
+        """
+        delivery = await fan_out(channels, send, self._send_timeout, on_first)
+
+        # Keep the sent messages so embed updates skip fetch_message
+        resolver = get_resolver(self._bot)
+        if resolver:
+            for alert_message in delivery.messages.values():
+                resolver.remember_message(alert_message)
+
+        self._channel_sends += len(delivery.messages)
+        self._channel_failures += len(delivery.failed)
+        for channel_id in delivery.failed:
+            self._failures_by_channel[channel_id] = (
+                self._failures_by_channel.get(channel_id, 0) + 1
+            )
+
+        if delivery.is_partial:
+            self._partial_deliveries += 1
             logger.warning(
-                f"⚠️ Alert channel {channel_id} is not a text channel"
+                f"⚠️ Alert reached {len(delivery.messages)}/{len(channels)} channels "
+                f"(failed: {delivery.failed}, alert_id: {alert_id})"
             )
-            return None
 
-        return channel
+        if delivery.primary is None:
+            return delivery
+
+        primary_id = delivery.primary.id
+        mirror_ids = [m.id for m in delivery.messages.values() if m.id != primary_id]
+
+        # One metrics record per alert; mirrors and failures are added to it
+        if self._response_metrics and alert_id and (mirror_ids or delivery.failed):
+            await self._response_metrics.record_alert_delivery(
+                alert_id=alert_id,
+                mirror_message_ids=mirror_ids,
+                alert_channel_ids=delivery.delivered_channel_ids,
+                failed_channel_ids=delivery.failed_channel_ids,
+            )
+
+        # Buttons on any copy must stop the auto-initiate timer
+        if mirror_ids and self._auto_initiate and self._auto_initiate.is_enabled:
+            await self._auto_initiate.track_mirrors(primary_id, mirror_ids)
+
+        return delivery
 
     # =========================================================================
     # Main Dispatch Method
@@ -252,6 +422,7 @@ class AlertDispatcher:
         result: "CrisisAnalysisResult",
         force: bool = False,
         channel_sensitivity: float = 1.0,
+        message_content: Optional[str] = None,
     ) -> Optional[discord.Message]:
         """
         Dispatch a crisis alert if appropriate.
@@ -261,6 +432,8 @@ class AlertDispatcher:
             result: NLP analysis result
             force: If True, bypass cooldown check
             channel_sensitivity: Channel sensitivity modifier (Phase 7)
+            message_content: Text to preview instead of message.content,
+                e.g. a coalesced message burst (Phase 10)
 
         Returns:
             Sent alert message, or None if not sent
@@ -275,24 +448,46 @@ class AlertDispatcher:
             )
             return None
 
-        # Check cooldown (unless forced)
-        if not force and self._cooldown.is_on_cooldown(message.author.id):
+        # Claim the cooldown (unless forced). Phase 10: check-and-set is
+        # atomic, so concurrent alerts for one user produce a single winner
+        if not force and not await self._cooldown.try_acquire(message.author.id):
             self._alerts_skipped_cooldown += 1
-            remaining = self._cooldown.get_remaining_cooldown(message.author.id)
+            remaining = await self._cooldown.get_remaining_cooldown(message.author.id)
             logger.debug(
                 f"Skipping alert: user {message.author.id} on cooldown "
                 f"({remaining}s remaining)"
             )
             return None
 
-        # Get target channel
-        channel = self._get_alert_channel(severity)
-        if channel is None:
+        # Get target channels (Phase 10: all configured, not just the first)
+        channels = self._get_alert_channels(severity)
+        if not channels:
             logger.warning(
                 f"⚠️ No alert channel configured for severity {severity}"
             )
+            if not force:
+                await self._cooldown.release_cooldown(message.author.id)
             return None
 
+        # Phase 10: During an alert storm, MEDIUM alerts go into the
+        # channel's digest (one edit) instead of a send each. HIGH and
+        # CRITICAL still go out individually below.
+        if self._storm:
+            storming = [c for c in channels if self._storm.record(c.id)]
+            if storming and severity in DIGEST_SEVERITIES:
+                for channel in storming:
+                    await self._storm.fold(channel, message, result)
+                channels = [c for c in channels if c not in storming]
+                if not channels:
+                    self._alerts_folded += 1
+                    # A digest line starts no auto-initiate timer or response
+                    # metrics, so it must not hold the cooldown either: the
+                    # user's next alert should go out (and be tracked) once
+                    # the storm is over
+                    if not force:
+                        await self._cooldown.release_cooldown(message.author.id)
+                    return None
+
         # Phase 8: Generate alert ID for metrics tracking
         alert_id = None
         if self._response_metrics:
@@ -303,14 +498,7 @@ class AlertDispatcher:
         embed = self._embed_builder.build_crisis_embed(
             message=message,
             result=result,
-        )
-
-        # Build button view with alert_id for metrics tracking
-        view = AlertButtonView(
-            user_id=message.author.id,
-            message_id=message.id,
-            severity=severity,
-            alert_id=alert_id,  # Phase 8: Pass alert_id to view
+            content=message_content,
         )
 
         # Build content (CRT ping if needed)
@@ -319,16 +507,26 @@ class AlertDispatcher:
             content = self._get_crt_ping_content()
             logger.debug(f"Will ping CRT roles: {self._crt_role_ids}")
 
-        # Send alert
-        try:
-            alert_message = await channel.send(
+        priority = PRIORITY_ALERT if severity in DIGEST_SEVERITIES else PRIORITY_CRITICAL
+
+        async def send(channel: discord.TextChannel) -> discord.Message:
+            return await send_message(
+                self._outbound,
+                channel,
+                priority,
                 content=content,
                 embed=embed,
-                view=view,
+                view=self._build_alert_view(message, severity, alert_id),
             )
 
-            # Set cooldown
-            self._cooldown.set_cooldown(message.author.id)
+        async def on_first(
+            channel: discord.TextChannel,
+            alert_message: discord.Message,
+            elapsed: float,
+        ) -> None:
+            # Forced alerts restart the cooldown (claimed ones already hold it)
+            if force:
+                await self._cooldown.set_cooldown(message.author.id)
 
             # Update statistics
             self._alerts_sent += 1
@@ -337,41 +535,27 @@ class AlertDispatcher:
             logger.info(
                 f"🚨 Alert dispatched for user {message.author.id} "
                 f"(severity: {severity}, channel: #{channel.name}, "
-                f"ping_crt: {content is not None}, alert_id: {alert_id})"
+                f"ping_crt: {content is not None}, alert_id: {alert_id}, "
+                f"first_send: {elapsed * 1000:.0f}ms)"
             )
 
-            # Phase 8: Record alert creation in response metrics
-            if self._response_metrics and alert_id:
-                await self._response_metrics.record_alert_created(
-                    alert_id=alert_id,
-                    alert_message_id=alert_message.id,
-                    user_id=message.author.id,
-                    channel_id=message.channel.id,
-                    severity=severity,
-                    channel_sensitivity=channel_sensitivity,
-                )
-
-            # Phase 7: Track alert for auto-initiate
-            if self._auto_initiate and self._auto_initiate.is_enabled:
-                await self._auto_initiate.track_alert(
-                    alert_message=alert_message,
-                    user_id=message.author.id,
-                    severity=severity,
-                    original_message=message,
-                )
+            await self._record_alert_delivered(
+                alert_message, message, severity, alert_id, channel_sensitivity, elapsed
+            )
 
-            return alert_message
+        # Send to all channels at once
+        delivery = await self._deliver(channels, send, on_first, alert_id)
 
-        except discord.Forbidden:
+        if delivery.primary is None:
             logger.error(
-                f"❌ No permission to send to channel #{channel.name} "
-                f"(ID: {channel.id})"
+                f"❌ Alert for user {message.author.id} reached no channel "
+                f"(failed: {delivery.failed})"
             )
+            if not force:
+                await self._cooldown.release_cooldown(message.author.id)
             return None
 
-        except discord.HTTPException as e:
-            logger.error(f"❌ Failed to send alert: {e}")
-            return None
+        return delivery.primary
 
     # =========================================================================
     # Escalation Alert
@@ -384,6 +568,7 @@ class AlertDispatcher:
         history_count: int,
         trend: str,
         channel_sensitivity: float = 1.0,
+        trend_detail: Optional[str] = None,
     ) -> Optional[discord.Message]:
         """
         Dispatch an escalation alert (when pattern detected).
@@ -396,6 +581,8 @@ class AlertDispatcher:
             history_count: Number of messages in history
             trend: Trend direction (escalating, stable, etc.)
             channel_sensitivity: Channel sensitivity modifier (Phase 7)
+            trend_detail: Optional extra embed line describing the trend
+                (Phase 10)
 
         Returns:
             Sent alert message, or None if not sent
@@ -408,11 +595,16 @@ class AlertDispatcher:
 
         # Escalation alerts bypass cooldown (they're more important)
 
-        # Get target channel (use one level higher for escalations)
-        channel = self._get_alert_channel(severity)
-        if channel is None:
+        # Get target channels
+        channels = self._get_alert_channels(severity)
+        if not channels:
             return None
 
+        # Phase 10: Counts toward the storm rate, but is never folded
+        if self._storm:
+            for channel in channels:
+                self._storm.record(channel.id)
+
         # Phase 8: Generate alert ID for metrics tracking
         alert_id = None
         if self._response_metrics:
@@ -425,14 +617,7 @@ class AlertDispatcher:
             result=result,
             history_count=history_count,
             trend=trend,
-        )
-
-        # Build button view with alert_id
-        view = AlertButtonView(
-            user_id=message.author.id,
-            message_id=message.id,
-            severity=severity,
-            alert_id=alert_id,  # Phase 8
+            trend_detail=trend_detail,
         )
 
         # Always ping CRT for escalations
@@ -441,16 +626,23 @@ class AlertDispatcher:
             crt_ping = self._get_crt_ping_content()
             content = f"📈 **ESCALATION** {crt_ping}"
 
-        # Send alert
-        try:
-            alert_message = await channel.send(
+        async def send(channel: discord.TextChannel) -> discord.Message:
+            return await send_message(
+                self._outbound,
+                channel,
+                PRIORITY_CRITICAL,
                 content=content,
                 embed=embed,
-                view=view,
+                view=self._build_alert_view(message, severity, alert_id),
             )
 
+        async def on_first(
+            channel: discord.TextChannel,
+            alert_message: discord.Message,
+            elapsed: float,
+        ) -> None:
             # Set cooldown
-            self._cooldown.set_cooldown(message.author.id)
+            await self._cooldown.set_cooldown(message.author.id)
 
             # Update statistics
             self._alerts_sent += 1
@@ -461,26 +653,17 @@ class AlertDispatcher:
                 f"history: {history_count} messages, alert_id: {alert_id})"
             )
 
-            # Phase 8: Record alert creation in response metrics
-            if self._response_metrics and alert_id:
-                await self._response_metrics.record_alert_created(
-                    alert_id=alert_id,
-                    alert_message_id=alert_message.id,
-                    user_id=message.author.id,
-                    channel_id=message.channel.id,
-                    severity=severity,
-                    channel_sensitivity=channel_sensitivity,
-                )
+            await self._record_alert_delivered(
+                alert_message, message, severity, alert_id, channel_sensitivity, elapsed
+            )
 
-            return alert_message
+        # Send to all channels at once
+        delivery = await self._deliver(channels, send, on_first, alert_id)
 
-        except discord.Forbidden:
-            logger.error(f"❌ No permission to send escalation alert")
-            return None
+        if delivery.primary is None:
+            logger.error(f"❌ Failed to send escalation alert (failed: {delivery.failed})")
 
-        except discord.HTTPException as e:
-            logger.error(f"❌ Failed to send escalation alert: {e}")
-            return None
+        return delivery.primary
 
     # =========================================================================
     # Auto-Initiate Integration (Phase 7)
@@ -529,6 +712,22 @@ class AlertDispatcher:
         """Get the response metrics manager (if set)."""
         return self._response_metrics
 
+    # =========================================================================
+    # Outbound Queue Integration (Phase 10)
+    # =========================================================================
+
+    def set_outbound_queue(self, outbound_queue: "OutboundQueue") -> None:
+        """
+        Route alert sends (and digest posts) through the outbound queue.
+
+        Args:
+            outbound_queue: OutboundQueue instance
+        """
+        self._outbound = outbound_queue
+        if self._storm:
+            self._storm.set_outbound_queue(outbound_queue)
+        logger.debug("OutboundQueue injected into AlertDispatcher")
+
     # =========================================================================
     # Properties
     # =========================================================================
@@ -543,6 +742,11 @@ class AlertDispatcher:
         """Get count of alerts sent."""
         return self._alerts_sent
 
+    @property
+    def alerts_folded(self) -> int:
+        """Get count of MEDIUM alerts folded into storm digests (Phase 10)."""
+        return self._alerts_folded
+
     @property
     def alerts_skipped(self) -> int:
         """Get total count of skipped alerts."""
@@ -568,6 +772,13 @@ class AlertDispatcher:
             "alerts_skipped_severity": self._alerts_skipped_severity,
             "alert_channels": self._channel_config.get_all_alert_channels(),
             "response_metrics_enabled": self._response_metrics is not None,
+            "alerts_folded": self._alerts_folded,
+            "storm": self._storm.get_status() if self._storm else None,
+            "send_timeout_seconds": self._send_timeout,
+            "channel_sends": self._channel_sends,
+            "channel_failures": self._channel_failures,
+            "partial_deliveries": self._partial_deliveries,
+            "failures_by_channel": dict(self._failures_by_channel),
         }
 
     def __repr__(self) -> str:
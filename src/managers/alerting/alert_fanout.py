@@ -0,0 +1,233 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Alert Fan-Out for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-18.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Send one alert to every configured alert channel concurrently
+- Flag sends that outlast their deadline without cancelling them, so an
+  alert held back by a rate limit still lands and is still tracked
+- Record which channels received the alert and why others did not
+- Report the first delivery as soon as it lands, without waiting for
+  slower mirror channels
+
+USAGE:
+    from src.managers.alerting.alert_fanout import fan_out
+
+    delivery = await fan_out(
+        channels,
+        send=lambda channel: channel.send(embed=embed),
+        timeout=10.0,
+        on_first=record_first_delivery,
+    )
+    if delivery.primary:
+        ...
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import discord
+
+# Module version
+__version__ = "v5.0-10-18.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Failure reasons recorded per channel
+FAILURE_TIMEOUT = "timeout"
+FAILURE_FORBIDDEN = "forbidden"
+FAILURE_HTTP = "http_error"
+FAILURE_ERROR = "error"
+
+
+# =============================================================================
+# Delivery Result
+# =============================================================================
+
+
+@dataclass
+class AlertDelivery:
+    """
+    Outcome of sending one alert to its channels.
+
+    Attributes:
+        messages: Channel ID → sent alert message, in order of arrival
+        failed: Channel ID → failure reason
+        first_delivery_seconds: Time until the first send landed
+    """
+
+    messages: Dict[int, discord.Message] = field(default_factory=dict)
+    failed: Dict[int, str] = field(default_factory=dict)
+    first_delivery_seconds: Optional[float] = None
+
+    @property
+    def primary(self) -> Optional[discord.Message]:
+        """First alert message to land (None if every send failed)."""
+        return next(iter(self.messages.values()), None)
+
+    @property
+    def delivered_channel_ids(self) -> List[int]:
+        """Channels that received the alert."""
+        return list(self.messages)
+
+    @property
+    def failed_channel_ids(self) -> List[int]:
+        """Channels that did not receive the alert."""
+        return list(self.failed)
+
+    @property
+    def is_partial(self) -> bool:
+        """Check if some, but not all, channels received the alert."""
+        return bool(self.messages) and bool(self.failed)
+
+
+# =============================================================================
+# Fan-Out
+# =============================================================================
+
+
+async def fan_out(
+    channels: List[discord.TextChannel],
+    send: Callable[[discord.TextChannel], Awaitable[discord.Message]],
+    timeout: float,
+    on_first: Optional[
+        Callable[[discord.TextChannel, discord.Message, float], Awaitable[None]]
+    ] = None,
+) -> AlertDelivery:
+    """
+    Send to all channels at once and wait for every send to finish.
+
+    on_first is awaited as soon as the first send succeeds, while the
+    remaining sends keep running, so mirror channels never delay it.
+
+    Sends are never cancelled. One still running after timeout is usually
+    queued behind a rate limit, and cancelling it would either drop the
+    queued job or hide an embed that is posted anyway. It is logged as slow
+    and awaited, and is recorded like any other send when it lands.
+
+    Args:
+        channels: Alert channels to send to
+        send: Coroutine function performing one channel's send
+        timeout: Seconds after which unfinished sends are reported as slow
+        on_first: Optional callback(channel, message, seconds) for the
+            first successful send
+
+    Returns:
+        AlertDelivery with per-channel results
+    """
+    delivery = AlertDelivery()
+    started = time.monotonic()
+
+    tasks = {asyncio.create_task(send(channel)): channel for channel in channels}
+    pending = set(tasks)
+    warned = False
+
+    try:
+        while pending:
+            wait_for = None
+            if not warned:
+                wait_for = max(0.0, started + timeout - time.monotonic())
+
+            done, pending = await asyncio.wait(
+                pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not done:
+                warned = True
+                slow = ", ".join(f"#{tasks[task].name}" for task in pending)
+                logger.warning(
+                    f"⏳ Alert send still pending after {timeout:g}s "
+                    f"(channels: {slow}), waiting for it"
+                )
+                continue
+
+            for task in done:
+                channel = tasks[task]
+                try:
+                    alert_message = task.result()
+
+                except asyncio.TimeoutError:
+                    delivery.failed[channel.id] = FAILURE_TIMEOUT
+                    logger.error(f"❌ Alert send to #{channel.name} timed out")
+
+                except discord.Forbidden:
+                    delivery.failed[channel.id] = FAILURE_FORBIDDEN
+                    logger.error(
+                        f"❌ No permission to send to channel #{channel.name} "
+                        f"(ID: {channel.id})"
+                    )
+
+                except discord.HTTPException as e:
+                    delivery.failed[channel.id] = FAILURE_HTTP
+                    logger.error(f"❌ Failed to send alert to #{channel.name}: {e}")
+
+                except Exception as e:
+                    delivery.failed[channel.id] = FAILURE_ERROR
+                    logger.error(
+                        f"❌ Unexpected error sending alert to #{channel.name}: {e}",
+                        exc_info=True,
+                    )
+
+                else:
+                    delivery.messages[channel.id] = alert_message
+                    if delivery.first_delivery_seconds is None:
+                        delivery.first_delivery_seconds = time.monotonic() - started
+                        if on_first:
+                            try:
+                                await on_first(
+                                    channel, alert_message, delivery.first_delivery_seconds
+                                )
+                            except Exception as e:
+                                # Bookkeeping must not cancel the other sends
+                                logger.error(
+                                    f"❌ First-delivery callback failed: {e}",
+                                    exc_info=True,
+                                )
+
+    finally:
+        # Only reached with sends pending if the caller itself was cancelled
+        for task in pending:
+            task.cancel()
+
+    return delivery
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "AlertDelivery",
+    "fan_out",
+    "FAILURE_TIMEOUT",
+    "FAILURE_FORBIDDEN",
+    "FAILURE_HTTP",
+    "FAILURE_ERROR",
+]
@@ -0,0 +1,403 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Alert Storm Digest for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-16.0-3
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Track the alert rate per alert channel over a sliding window
+- Enter storm mode above a threshold, leave it once the rate halves
+- Fold MEDIUM alerts into one digest embed per channel, edited on an
+  interval (one message edit instead of one send per alert)
+- Mark the digest as ended when the storm passes
+- Post and edit digests through the outbound queue when one is set
+
+HIGH and CRITICAL alerts are never folded; AlertDispatcher keeps sending
+them individually and immediately.
+
+USAGE:
+    from src.managers.alerting.alert_storm import AlertStormTracker
+
+    storm = AlertStormTracker(embed_builder, threshold=10, window_seconds=60)
+
+    if storm.record(channel.id) and severity in DIGEST_SEVERITIES:
+        await storm.fold(channel, message, result)
+    else:
+        await channel.send(embed=...)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, Dict, Optional, Set, TYPE_CHECKING
+
+import discord
+
+from src.managers.discord.outbound_queue import (
+    PRIORITY_ALERT,
+    PRIORITY_EDIT,
+    edit_message,
+    send_message,
+)
+
+if TYPE_CHECKING:
+    from src.managers.alerting.embed_builder import EmbedBuilder
+    from src.managers.discord.outbound_queue import OutboundQueue
+    from src.models.nlp_models import CrisisAnalysisResult
+
+# Module version
+__version__ = "v5.0-10-16.0-3"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Severities folded into the digest during a storm
+DIGEST_SEVERITIES: Set[str] = {"medium"}
+
+# Most recent entries listed in a digest embed (keeps it under embed limits)
+MAX_DIGEST_ENTRIES = 15
+
+
+# =============================================================================
+# Digest State
+# =============================================================================
+
+
+@dataclass
+class DigestEntry:
+    """One folded alert."""
+
+    user_id: int
+    user_name: str
+    severity: str
+    crisis_score: float
+    jump_url: str
+    created_at: datetime
+
+
+@dataclass
+class ChannelDigest:
+    """Digest message and pending entries for one alert channel."""
+
+    channel: discord.TextChannel
+    started_at: datetime
+    entries: Deque[DigestEntry] = field(
+        default_factory=lambda: deque(maxlen=MAX_DIGEST_ENTRIES)
+    )
+    total: int = 0
+    message: Optional[discord.Message] = None
+    dirty: bool = False
+    ended: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    task: Optional[asyncio.Task] = None
+
+
+# =============================================================================
+# Alert Storm Tracker
+# =============================================================================
+
+
+class AlertStormTracker:
+    """
+    Detects alert storms per channel and maintains digest embeds.
+
+    A channel is storming once threshold alerts arrive within
+    window_seconds, and stops once the count in the window falls below
+    half the threshold. While storming, folded alerts are added to the
+    channel's digest: the first one posts it, later ones are published
+    by a single edit every digest_interval_seconds.
+
+    Example:
+        >>> storm = AlertStormTracker(embed_builder, threshold=10)
+        >>> if storm.record(channel.id):
+        ...     await storm.fold(channel, message, result)
+    """
+
+    def __init__(
+        self,
+        embed_builder: "EmbedBuilder",
+        threshold: int = 10,
+        window_seconds: float = 60.0,
+        digest_interval_seconds: float = 15.0,
+    ):
+        """
+        Initialize AlertStormTracker.
+
+        Args:
+            embed_builder: Builds the digest embed
+            threshold: Alerts per window that start a storm
+            window_seconds: Sliding window for the alert rate
+            digest_interval_seconds: Seconds between digest edits
+        """
+        self._embed_builder = embed_builder
+        self._threshold = max(2, int(threshold))
+        self._exit_level = max(1, self._threshold // 2)
+        self._window = float(window_seconds)
+        self._interval = float(digest_interval_seconds)
+
+        # Per-channel alert times (monotonic) and storm flags
+        self._recent: Dict[int, Deque[float]] = {}
+        self._storming: Set[int] = set()
+        self._digests: Dict[int, ChannelDigest] = {}
+        self._outbound: Optional["OutboundQueue"] = None
+
+        # Statistics
+        self._storms_started = 0
+        self._alerts_folded = 0
+        self._digest_posts = 0
+        self._digest_edits = 0
+        self._digest_failures = 0
+
+    def set_outbound_queue(self, outbound_queue: "OutboundQueue") -> None:
+        """Send digest posts and edits through the outbound queue."""
+        self._outbound = outbound_queue
+
+    # =========================================================================
+    # Storm Detection
+    # =========================================================================
+
+    def record(self, channel_id: int) -> bool:
+        """
+        Count an alert for a channel and report whether it is storming.
+
+        Args:
+            channel_id: Alert channel ID
+
+        Returns:
+            True if the channel is in storm mode
+        """
+        recent = self._recent.setdefault(channel_id, deque())
+        recent.append(time.monotonic())
+        return self._update(channel_id)
+
+    def is_storming(self, channel_id: int) -> bool:
+        """Check if a channel is in storm mode (without counting an alert)."""
+        return self._update(channel_id)
+
+    def _update(self, channel_id: int) -> bool:
+        """Drop alerts outside the window and apply storm hysteresis."""
+        recent = self._recent.get(channel_id)
+        if recent is None:
+            return False
+
+        cutoff = time.monotonic() - self._window
+        while recent and recent[0] < cutoff:
+            recent.popleft()
+
+        count = len(recent)
+        if channel_id in self._storming:
+            if count < self._exit_level:
+                self._storming.discard(channel_id)
+                logger.info(
+                    f"🌤️ Alert storm over in channel {channel_id} "
+                    f"({count} alerts in last {self._window:.0f}s)"
+                )
+        elif count >= self._threshold:
+            self._storming.add(channel_id)
+            self._storms_started += 1
+            logger.warning(
+                f"🌩️ Alert storm in channel {channel_id} "
+                f"({count} alerts in last {self._window:.0f}s), "
+                "folding MEDIUM alerts into a digest"
+            )
+
+        if not recent and channel_id not in self._storming:
+            del self._recent[channel_id]
+
+        return channel_id in self._storming
+
+    # =========================================================================
+    # Digest
+    # =========================================================================
+
+    async def fold(
+        self,
+        channel: discord.TextChannel,
+        message: discord.Message,
+        result: "CrisisAnalysisResult",
+    ) -> None:
+        """
+        Add an alert to the channel's digest.
+
+        The first alert of a storm posts the digest right away; later
+        ones are picked up by the next periodic edit.
+
+        Args:
+            channel: Alert channel
+            message: Original Discord message
+            result: NLP analysis result
+        """
+        digest = self._digests.get(channel.id)
+        is_new = digest is None or digest.ended
+        if is_new:
+            digest = ChannelDigest(channel=channel, started_at=datetime.now(timezone.utc))
+            self._digests[channel.id] = digest
+
+        digest.entries.append(
+            DigestEntry(
+                user_id=message.author.id,
+                user_name=message.author.display_name,
+                severity=result.severity.lower(),
+                crisis_score=result.crisis_score,
+                jump_url=message.jump_url,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        digest.total += 1
+        digest.dirty = True
+        self._alerts_folded += 1
+
+        logger.info(
+            f"🌩️ Folded {result.severity.upper()} alert for user {message.author.id} "
+            f"into digest for #{channel.name} ({digest.total} this storm)"
+        )
+
+        if is_new:
+            digest.task = asyncio.create_task(
+                self._digest_loop(channel.id, digest), name=f"alert-digest-{channel.id}"
+            )
+            await self._publish(digest)
+
+    async def _digest_loop(self, channel_id: int, digest: ChannelDigest) -> None:
+        """Publish pending entries every interval until the storm ends."""
+        try:
+            while True:
+                await asyncio.sleep(self._interval)
+
+                # A newer storm's digest has its own loop
+                if self._digests.get(channel_id) is not digest:
+                    return
+
+                if not self._update(channel_id):
+                    digest.ended = True
+
+                if digest.dirty or digest.ended:
+                    await self._publish(digest)
+
+                if digest.ended:
+                    self._drop_digest(channel_id, digest)
+                    return
+
+        except asyncio.CancelledError:
+            pass
+
+    async def _publish(self, digest: ChannelDigest) -> None:
+        """Post or edit the digest message."""
+        async with digest.lock:
+            digest.dirty = False
+            embed = self._embed_builder.build_storm_digest_embed(
+                entries=list(digest.entries),
+                total=digest.total,
+                started_at=digest.started_at,
+                interval_seconds=self._interval,
+                ended=digest.ended,
+            )
+
+            try:
+                if digest.message is not None:
+                    try:
+                        await edit_message(
+                            self._outbound, digest.message, PRIORITY_EDIT, embed=embed
+                        )
+                        self._digest_edits += 1
+                        return
+                    except discord.NotFound:
+                        # Digest was deleted; post a fresh one below
+                        digest.message = None
+
+                digest.message = await send_message(
+                    self._outbound, digest.channel, PRIORITY_ALERT, embed=embed
+                )
+                self._digest_posts += 1
+
+            except discord.HTTPException as e:
+                digest.dirty = True
+                self._digest_failures += 1
+                logger.error(f"❌ Failed to publish alert digest to #{digest.channel.name}: {e}")
+
+    async def close(self) -> None:
+        """Publish outstanding entries and stop digest tasks."""
+        for channel_id, digest in list(self._digests.items()):
+            if digest.task:
+                digest.task.cancel()
+            if digest.dirty:
+                await self._publish(digest)
+            self._drop_digest(channel_id, digest)
+
+    def _drop_digest(self, channel_id: int, digest: ChannelDigest) -> None:
+        """Forget a digest unless a new storm replaced it meanwhile."""
+        if self._digests.get(channel_id) is digest:
+            del self._digests[channel_id]
+
+    # =========================================================================
+    # Status
+    # =========================================================================
+
+    @property
+    def storming_channels(self) -> Set[int]:
+        """Get IDs of channels currently in storm mode."""
+        return set(self._storming)
+
+    def get_status(self) -> dict:
+        """
+        Get storm tracker status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "threshold": self._threshold,
+            "window_seconds": self._window,
+            "digest_interval_seconds": self._interval,
+            "storming_channels": sorted(self._storming),
+            "storms_started": self._storms_started,
+            "alerts_folded": self._alerts_folded,
+            "digest_posts": self._digest_posts,
+            "digest_edits": self._digest_edits,
+            "digest_failures": self._digest_failures,
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"AlertStormTracker("
+            f"threshold={self._threshold}/{self._window:.0f}s, "
+            f"storming={len(self._storming)}, "
+            f"folded={self._alerts_folded})"
+        )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "AlertStormTracker",
+    "ChannelDigest",
+    "DigestEntry",
+    "DIGEST_SEVERITIES",
+]
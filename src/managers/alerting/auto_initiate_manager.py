@@ -17,8 +17,8 @@ Manages automatic Ash outreach when CRT staff doesn't respond to alerts
 within a configurable timeout. Ensures no community member in crisis
 is left without support during off-hours or when staff is unavailable.
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-1.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-8-1.0-10
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,24 +26,35 @@ Repository: https://github.com/the-alphabet-cartel/ash-bot
 """
 
 import asyncio
+import functools
 import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Optional, Set, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
 
 import discord
 
+from src.managers.discord.discord_resolver import get_resolver, resolve_user
+from src.managers.discord.outbound_queue import (
+    PRIORITY_EDIT,
+    edit_message,
+    fetch_message,
+)
+
 if TYPE_CHECKING:
     from discord.ext import commands
     from src.managers.config_manager import ConfigManager
-    from src.managers.storage.redis_manager import RedisManager
+    from src.managers.storage.redis_manager import RedisManager, RedisPipeline
     from src.managers.ash.ash_session_manager import AshSessionManager
     from src.managers.ash.ash_personality_manager import AshPersonalityManager
     from src.managers.metrics.response_metrics_manager import ResponseMetricsManager
+    from src.managers.scheduling.scheduler_manager import SchedulerManager
+    from src.managers.scheduling.lease_manager import LeaseManager
+    from src.managers.discord.outbound_queue import OutboundQueue
 
 # Module version
-__version__ = "v5.0-8-1.0-1"
+__version__ = "v5.0-8-1.0-10"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -56,12 +67,36 @@ logger = logging.getLogger(__name__)
 # Redis key prefix for pending alerts
 REDIS_KEY_PREFIX = "ash:pending_alert:"
 
+# Phase 10: Due-time index of open alerts (member = alert ID, score = expires_at)
+REDIS_KEY_DUE = "ash:pending_alert_index"
+
+# Phase 10: Set (NX) by the replica that backfills the due index, so the
+# SCAN runs once per deployment rather than on every start
+REDIS_KEY_DUE_BACKFILL = "ash:migration:pending_alert_index:v1"
+
+# Phase 10: Mirror alert message → tracked (first-delivered) alert message
+REDIS_KEY_MIRROR_PREFIX = "ash:pending_alert_mirror:"
+
+# Local mirror lookups kept before entries of finished alerts are pruned
+MIRROR_PRUNE_THRESHOLD = 1000
+
+# Alerts read from the due index per round trip on startup
+LOAD_BATCH_SIZE = 200
+
 # Severities eligible for auto-initiate (configurable minimum)
 SEVERITY_ORDER = ["low", "medium", "high", "critical"]
 
 # Background check interval (seconds)
 CHECK_INTERVAL_SECONDS = 30
 
+# Phase 10: Scheduler job name (one job per alert, keyed by alert ID)
+SCHEDULER_JOB_NAME = "auto_initiate"
+
+# Phase 10: Lease so only one replica auto-initiates, and the job key of the
+# lease holder's sweep for due alerts tracked by other replicas
+LEASE_NAME = "auto_initiate"
+SWEEP_JOB_KEY = "auto_initiate:sweep"
+
 
 # =============================================================================
 # Data Classes
@@ -215,9 +250,21 @@ class AutoInitiateManager:
         # Response metrics manager (Phase 8)
         self._response_metrics: Optional["ResponseMetricsManager"] = None
 
+        # Phase 10: Shared deadline scheduler (replaces the 30s check loop)
+        self._scheduler: Optional["SchedulerManager"] = None
+
+        # Phase 10: Optional lease (one replica auto-initiates)
+        self._leases: Optional["LeaseManager"] = None
+
+        # Phase 10: Optional outbound queue (embed updates yield to alerts)
+        self._outbound: Optional["OutboundQueue"] = None
+
         # In-memory tracking (primary)
         self._pending_alerts: Dict[int, PendingAlert] = {}
 
+        # Phase 10: Mirror alert message ID -> tracked alert message ID
+        self._mirror_of: Dict[int, int] = {}
+
         # Background task
         self._check_task: Optional[asyncio.Task] = None
         self._running = False
@@ -279,6 +326,55 @@ class AutoInitiateManager:
         self._response_metrics = response_metrics_manager
         logger.debug("ResponseMetricsManager injected into AutoInitiateManager")
 
+    def set_scheduler_manager(
+        self,
+        scheduler: "SchedulerManager",
+    ) -> None:
+        """
+        Inject the shared scheduler (Phase 10).
+
+        When set, each tracked alert gets its own job at its expiry time,
+        and cancel_alert() removes it, instead of a 30 second check loop.
+
+        Args:
+            scheduler: SchedulerManager instance
+        """
+        self._scheduler = scheduler
+        logger.debug("SchedulerManager injected into AutoInitiateManager")
+
+    def set_lease_manager(
+        self,
+        lease_manager: "LeaseManager",
+    ) -> None:
+        """
+        Inject the lease manager (Phase 10).
+
+        When set, only the replica holding the auto_initiate lease reaches
+        out. It re-reads each alert from Redis before firing (so an
+        acknowledgment on another replica is respected) and sweeps the
+        due index for alerts tracked by other replicas.
+
+        Args:
+            lease_manager: LeaseManager instance
+        """
+        self._leases = lease_manager
+        logger.debug("LeaseManager injected into AutoInitiateManager")
+
+    def set_outbound_queue(
+        self,
+        outbound_queue: "OutboundQueue",
+    ) -> None:
+        """
+        Inject the outbound Discord queue (Phase 10).
+
+        Alert embed updates (fetch + edit) go out at edit priority.
+
+        Args:
+            outbound_queue: OutboundQueue instance
+        """
+        self._outbound = outbound_queue
+        logger.debug("OutboundQueue injected into AutoInitiateManager")
+
     # =========================================================================
     # Lifecycle Methods
     # =========================================================================
@@ -300,9 +396,21 @@ class AutoInitiateManager:
         # Load pending alerts from Redis (if available)
         await self._load_from_redis()
 
-        # Start background check loop
+        # Start background check loop (or one scheduler job per alert)
         self._running = True
-        self._check_task = asyncio.create_task(self._check_loop())
+        if self._scheduler:
+            for pending in self._pending_alerts.values():
+                self._schedule_alert(pending)
+            if self._leases and self._leases.is_enabled:
+                self._scheduler.schedule(
+                    SWEEP_JOB_KEY,
+                    self._run_sweep_job,
+                    delay=CHECK_INTERVAL_SECONDS,
+                    name=SCHEDULER_JOB_NAME,
+                    retry_after=CHECK_INTERVAL_SECONDS,
+                )
+        else:
+            self._check_task = asyncio.create_task(self._check_loop())
 
         logger.info(
             f"🚀 AutoInitiateManager started "
@@ -321,6 +429,9 @@ class AutoInitiateManager:
         self._running = False
 
         # Cancel background task
+        if self._scheduler:
+            self._scheduler.cancel_name(SCHEDULER_JOB_NAME)
+
         if self._check_task:
             self._check_task.cancel()
             try:
@@ -409,6 +520,8 @@ class AutoInitiateManager:
         # Persist to Redis
         await self._save_alert_to_redis(pending)
 
+        self._schedule_alert(pending)
+
         logger.info(
             f"⏱️ Tracking alert {alert_message.id} for user {user_id} "
             f"(severity: {severity}, auto-initiate in {self._delay_minutes}min)"
@@ -416,6 +529,50 @@ class AutoInitiateManager:
 
         return True
 
+    async def track_mirrors(
+        self,
+        alert_message_id: int,
+        mirror_message_ids: List[int],
+    ) -> None:
+        """
+        Register the other channels' copies of a tracked alert (Phase 10).
+
+        Only the first delivered alert message is tracked; this lets
+        buttons on any mirror cancel its timer through cancel_alert().
+
+        Args:
+            alert_message_id: ID of the tracked alert message
+            mirror_message_ids: IDs of the alert's copies in other channels
+        """
+        pending = self._pending_alerts.get(alert_message_id)
+        if pending is None or not mirror_message_ids:
+            return
+
+        for mirror_id in mirror_message_ids:
+            self._mirror_of[mirror_id] = alert_message_id
+
+        if len(self._mirror_of) > MIRROR_PRUNE_THRESHOLD:
+            self._mirror_of = {
+                mirror_id: alert_id
+                for mirror_id, alert_id in self._mirror_of.items()
+                if alert_id in self._pending_alerts
+            }
+
+        if not self._redis or not self._redis.is_connected:
+            return
+
+        # Same lifetime as the alert's own record
+        ttl_seconds = max(60, int(pending.seconds_until_expiry()) + 300)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for mirror_id in mirror_message_ids:
+                    pipe.set(
+                        self._mirror_key(mirror_id), str(alert_message_id), ttl=ttl_seconds
+                    )
+
+        except Exception as e:
+            logger.warning(f"Failed to save alert mirrors to Redis: {e}")
+
     async def cancel_alert(
         self,
         alert_message_id: int,
@@ -433,8 +590,18 @@ class AutoInitiateManager:
         Returns:
             True if alert was cancelled, False if not found
         """
+        # Staff are editing the alert; the resolver's copy is going stale
+        resolver = get_resolver(self._bot)
+        if resolver:
+            resolver.forget_message(alert_message_id)
+
         pending = self._pending_alerts.get(alert_message_id)
 
+        if not pending:
+            # Phase 10: A button on a mirror copy acts on the tracked alert
+            alert_message_id = await self._resolve_mirror(alert_message_id)
+            pending = self._pending_alerts.get(alert_message_id)
+
         if not pending:
             # Check if it's in Redis but not loaded
             pending = await self._load_alert_from_redis(alert_message_id)
@@ -451,6 +618,9 @@ class AutoInitiateManager:
         pending.cancelled = True
         self._total_cancelled += 1
 
+        if self._scheduler:
+            self._scheduler.cancel(self._job_key(alert_message_id))
+
         # Update Redis
         await self._save_alert_to_redis(pending)
 
@@ -472,7 +642,8 @@ class AutoInitiateManager:
         Background loop checking for expired alerts.
 
         Runs every CHECK_INTERVAL_SECONDS and processes any alerts
-        that have expired without acknowledgment.
+        that have expired without acknowledgment. Only used when no
+        SchedulerManager is injected (Phase 10).
         """
         logger.debug("AutoInitiate check loop started")
 
@@ -500,6 +671,149 @@ class AutoInitiateManager:
 
         # Process each expired alert
         for pending in expired:
+            if await self._should_auto_initiate(pending):
+                await self._auto_initiate(pending)
+
+        # Phase 10: Lease holder also picks up other replicas' alerts
+        if self._leases and self._leases.is_enabled:
+            await self._adopt_due_alerts()
+
+    def _job_key(self, alert_id: int) -> str:
+        """Get the scheduler job key for an alert."""
+        return f"{SCHEDULER_JOB_NAME}:{alert_id}"
+
+    def _schedule_alert(self, pending: PendingAlert) -> None:
+        """Register a scheduler job at the alert's expiry time."""
+        if not self._scheduler or not self._running:
+            return
+
+        self._scheduler.schedule(
+            self._job_key(pending.alert_message_id),
+            functools.partial(self._run_alert_job, pending.alert_message_id),
+            at=pending.expires_at,
+            name=SCHEDULER_JOB_NAME,
+        )
+
+    async def _run_alert_job(self, alert_id: int) -> None:
+        """Scheduled job: auto-initiate if the alert is still unhandled."""
+        pending = self._pending_alerts.get(alert_id)
+        if pending and not pending.cancelled and not pending.auto_initiated:
+            if await self._should_auto_initiate(pending):
+                await self._auto_initiate(pending)
+
+    async def _run_sweep_job(self) -> float:
+        """Scheduled job: adopt due alerts tracked by other replicas."""
+        await self._adopt_due_alerts()
+        return CHECK_INTERVAL_SECONDS
+
+    # =========================================================================
+    # Multi-Replica Coordination (Phase 10)
+    # =========================================================================
+
+    async def _should_auto_initiate(self, pending: PendingAlert) -> bool:
+        """
+        Decide whether this replica auto-initiates an expired alert.
+
+        Without leasing every replica fires its own alerts. With leasing,
+        a standby drops its local copy (the Redis record stays indexed for
+        the lease holder), and the lease holder re-reads the record so an
+        acknowledgment made on another replica is respected. If Redis
+        cannot be read, the local copy is trusted.
+
+        Args:
+            pending: The expired alert
+
+        Returns:
+            True if this replica should reach out now
+        """
+        if not self._leases or not self._leases.is_enabled:
+            return True
+
+        alert_id = pending.alert_message_id
+
+        if not await self._leases.ensure(LEASE_NAME):
+            self._pending_alerts.pop(alert_id, None)
+            logger.debug(f"Alert {alert_id} expired on standby, leaving it to the lease holder")
+            return False
+
+        if not self._redis or not self._redis.is_connected:
+            return True
+
+        records = await self._redis.mget([self._redis_key(alert_id)])
+        if records is None:
+            return True
+
+        try:
+            current = PendingAlert.from_dict(json.loads(records[0])) if records[0] else None
+        except Exception as e:
+            logger.warning(f"Failed to parse pending alert: {e}")
+            return True
+
+        if current is None or current.cancelled or current.auto_initiated:
+            self._pending_alerts.pop(alert_id, None)
+            logger.debug(f"Alert {alert_id} already handled on another replica")
+            return False
+
+        return True
+
+    async def _adopt_due_alerts(self) -> None:
+        """
+        Auto-initiate due alerts that were tracked by another replica.
+
+        Lease holder only. Reads the head of the due index, skips alerts
+        this replica already tracks, and fires the rest. Index entries
+        whose record has expired are pruned.
+        """
+        if not self._redis or not self._redis.is_connected:
+            return
+
+        if not await self._leases.ensure(LEASE_NAME):
+            return
+
+        now = datetime.now(timezone.utc)
+        alert_ids = await self._redis.zrangebyscore(
+            REDIS_KEY_DUE, "-inf", now.timestamp(), count=LOAD_BATCH_SIZE
+        )
+        alert_ids = [
+            alert_id for alert_id in alert_ids or []
+            if int(alert_id) not in self._pending_alerts
+        ]
+        if not alert_ids:
+            return
+
+        records = await self._redis.mget(
+            [self._redis_key(int(alert_id)) for alert_id in alert_ids]
+        )
+        if records is None:
+            return
+
+        stale = []
+        adopted: list[PendingAlert] = []
+        for alert_id, data in zip(alert_ids, records):
+            if not data:
+                stale.append(alert_id)
+                continue
+
+            try:
+                pending = PendingAlert.from_dict(json.loads(data))
+            except Exception as e:
+                logger.warning(f"Failed to parse pending alert: {e}")
+                continue
+
+            if pending.cancelled or pending.auto_initiated:
+                stale.append(alert_id)
+                continue
+
+            self._pending_alerts[pending.alert_message_id] = pending
+            adopted.append(pending)
+
+        if stale:
+            await self._redis.zrem(REDIS_KEY_DUE, *stale)
+
+        if adopted:
+            logger.info(f"📥 Adopted {len(adopted)} due alerts from other replicas")
+
+        for pending in adopted:
             await self._auto_initiate(pending)
 
     # =========================================================================
@@ -543,16 +857,18 @@ class AutoInitiateManager:
             return
 
         try:
-            # Fetch the user
-            user = await self._bot.fetch_user(pending.user_id)
+            # Resolve the user (gateway/resolver cache before REST)
+            user = await resolve_user(self._bot, pending.user_id)
 
             # Start Ash session
-            from src.managers.ash import SessionExistsError
+            from src.managers.ash import PRIORITY_URGENT, SessionExistsError
 
             try:
+                # Phase 10: Auto-initiated sessions go first for Claude
                 session = await self._ash_sessions.start_session(
                     user=user,
                     trigger_severity=pending.severity,
+                    priority=PRIORITY_URGENT,
                 )
             except SessionExistsError:
                 logger.info(f"Session already exists for user {pending.user_id}")
@@ -636,22 +952,32 @@ class AutoInitiateManager:
         """
         Update the alert embed to show auto-initiation occurred.
 
+        The alert was never acknowledged, so the copy the dispatcher left
+        in the resolver is still current and no fetch_message is needed.
+
         Args:
             pending: The pending alert that was auto-initiated
         """
-        try:
-            # Get the alert channel
-            channel = self._bot.get_channel(pending.alert_channel_id)
-            if not channel:
-                logger.warning(
-                    f"Could not find channel {pending.alert_channel_id} "
-                    "to update alert embed"
-                )
-                return
+        resolver = get_resolver(self._bot)
 
-            # Fetch the alert message
+        try:
+            # Fetch the alert message (resolver cache first)
             try:
-                message = await channel.fetch_message(pending.alert_message_id)
+                if resolver:
+                    message = await resolver.fetch_message(
+                        pending.alert_channel_id, pending.alert_message_id, PRIORITY_EDIT
+                    )
+                else:
+                    channel = self._bot.get_channel(pending.alert_channel_id)
+                    if not channel:
+                        logger.warning(
+                            f"Could not find channel {pending.alert_channel_id} "
+                            "to update alert embed"
+                        )
+                        return
+                    message = await fetch_message(
+                        self._outbound, channel, pending.alert_message_id, PRIORITY_EDIT
+                    )
             except discord.NotFound:
                 logger.warning(
                     f"Alert message {pending.alert_message_id} not found"
@@ -661,8 +987,8 @@ class AutoInitiateManager:
             if not message.embeds:
                 return
 
-            # Update the embed
-            embed = message.embeds[0]
+            # Update a copy of the embed (the cached message stays untouched)
+            embed = message.embeds[0].copy()
 
             # Change color to purple (auto-action indicator)
             embed.color = discord.Color.purple()
@@ -690,7 +1016,13 @@ class AutoInitiateManager:
                     if isinstance(item, discord.ui.Button):
                         item.disabled = True
 
-            await message.edit(embed=embed, view=view)
+            await edit_message(
+                self._outbound, message, PRIORITY_EDIT, embed=embed, view=view
+            )
+
+            # Embed has changed; later readers must fetch the new one
+            if resolver:
+                resolver.forget_message(pending.alert_message_id)
 
             logger.debug(
                 f"Updated alert embed {pending.alert_message_id} "
@@ -708,21 +1040,60 @@ class AutoInitiateManager:
         """Get Redis key for an alert."""
         return f"{REDIS_KEY_PREFIX}{alert_id}"
 
+    def _mirror_key(self, message_id: int) -> str:
+        """Get Redis key for a mirror alert message's lookup."""
+        return f"{REDIS_KEY_MIRROR_PREFIX}{message_id}"
+
+    async def _resolve_mirror(self, message_id: int) -> int:
+        """
+        Map a mirror alert message to the tracked alert message.
+
+        Returns:
+            The tracked alert's message ID, or message_id if it is not a mirror
+        """
+        alert_id = self._mirror_of.get(message_id)
+        if alert_id is not None:
+            return alert_id
+
+        if not self._redis or not self._redis.is_connected:
+            return message_id
+
+        try:
+            raw = await self._redis.get(self._mirror_key(message_id))
+            return int(raw) if raw else message_id
+
+        except Exception as e:
+            logger.warning(f"Failed to look up alert mirror in Redis: {e}")
+            return message_id
+
+    def _queue_save(self, pipe: "RedisPipeline", pending: PendingAlert) -> None:
+        """Queue a pending alert write on a Redis pipeline."""
+        key = self._redis_key(pending.alert_message_id)
+        data = json.dumps(pending.to_dict())
+
+        # Calculate TTL (expiry + 5 minutes buffer)
+        ttl_seconds = int(pending.seconds_until_expiry()) + 300
+        if ttl_seconds < 60:
+            ttl_seconds = 60
+
+        pipe.set(key, data, ttl=ttl_seconds)
+
+        # Phase 10: Keep the due index in step with the record
+        if pending.cancelled or pending.auto_initiated:
+            pipe.zrem(REDIS_KEY_DUE, str(pending.alert_message_id))
+        else:
+            pipe.zadd(
+                REDIS_KEY_DUE, pending.expires_at.timestamp(), str(pending.alert_message_id)
+            )
+
     async def _save_alert_to_redis(self, pending: PendingAlert) -> None:
         """Save a pending alert to Redis."""
         if not self._redis or not self._redis.is_connected:
             return
 
         try:
-            key = self._redis_key(pending.alert_message_id)
-            data = json.dumps(pending.to_dict())
-
-            # Calculate TTL (expiry + 5 minutes buffer)
-            ttl_seconds = int(pending.seconds_until_expiry()) + 300
-            if ttl_seconds < 60:
-                ttl_seconds = 60
-
-            await self._redis.set(key, data, ttl=ttl_seconds)
+            async with self._redis.pipeline(transaction=False) as pipe:
+                self._queue_save(pipe, pending)
 
         except Exception as e:
             logger.warning(f"Failed to save pending alert to Redis: {e}")
@@ -753,24 +1124,56 @@ class AutoInitiateManager:
             return
 
         try:
-            key = self._redis_key(alert_id)
-            await self._redis.delete(key)
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.delete(self._redis_key(alert_id))
+                pipe.zrem(REDIS_KEY_DUE, str(alert_id))
 
         except Exception as e:
             logger.warning(f"Failed to delete pending alert from Redis: {e}")
 
     async def _load_from_redis(self) -> None:
-        """Load all pending alerts from Redis on startup."""
+        """
+        Load all pending alerts from Redis on startup.
+
+        Pages through the due-time index (oldest first) and fetches each
+        page of records with one MGET, instead of scanning the keyspace.
+        Index entries whose record has expired are pruned.
+        """
         if not self._redis or not self._redis.is_connected:
             return
 
         try:
-            # Get all pending alert keys
-            keys = await self._redis.keys(f"{REDIS_KEY_PREFIX}*")
+            # Alerts tracked before the index existed: find them via SCAN,
+            # once per deployment (released again if the backfill fails)
+            if await self._redis.set(
+                REDIS_KEY_DUE_BACKFILL, datetime.now(timezone.utc).isoformat(), nx=True
+            ):
+                try:
+                    await self._index_unindexed_alerts()
+                except Exception:
+                    await self._redis.delete(REDIS_KEY_DUE_BACKFILL)
+                    raise
+
+            offset = 0
+            while True:
+                alert_ids = await self._redis.zrangebyscore(
+                    REDIS_KEY_DUE, "-inf", "+inf", offset=offset, count=LOAD_BATCH_SIZE
+                )
+                if not alert_ids:
+                    break
+
+                records = await self._redis.mget(
+                    [self._redis_key(int(alert_id)) for alert_id in alert_ids]
+                )
+                if records is None:
+                    break
+
+                stale = []
+                for alert_id, data in zip(alert_ids, records):
+                    if not data:
+                        stale.append(alert_id)
+                        continue
 
-            for key in keys:
-                data = await self._redis.get(key)
-                if data:
                     try:
                         pending = PendingAlert.from_dict(json.loads(data))
 
@@ -781,6 +1184,13 @@ class AutoInitiateManager:
                     except Exception as e:
                         logger.warning(f"Failed to parse pending alert: {e}")
 
+                if stale:
+                    await self._redis.zrem(REDIS_KEY_DUE, *stale)
+
+                if len(alert_ids) < LOAD_BATCH_SIZE:
+                    break
+                offset += len(alert_ids) - len(stale)
+
             if self._pending_alerts:
                 logger.info(
                     f"📥 Loaded {len(self._pending_alerts)} pending alerts from Redis"
@@ -789,19 +1199,50 @@ class AutoInitiateManager:
         except Exception as e:
             logger.warning(f"Failed to load pending alerts from Redis: {e}")
 
+    async def _index_unindexed_alerts(self) -> None:
+        """Add pending alert records missing from the due index (uses SCAN)."""
+        keys = await self._redis.scan_iter(f"{REDIS_KEY_PREFIX}*")
+        records = await self._redis.mget(keys)
+        if not records:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for data in records:
+                if not data:
+                    continue
+                try:
+                    pending = PendingAlert.from_dict(json.loads(data))
+                except Exception as e:
+                    logger.warning(f"Failed to parse pending alert: {e}")
+                    continue
+                if not pending.cancelled and not pending.auto_initiated:
+                    pipe.zadd(
+                        REDIS_KEY_DUE,
+                        pending.expires_at.timestamp(),
+                        str(pending.alert_message_id),
+                    )
+
+        if pipe.succeeded and len(pipe):
+            logger.info(f"📇 Indexed {len(pipe)} existing pending alerts by due time")
+
     async def _save_to_redis(self) -> None:
         """Save all pending alerts to Redis on shutdown."""
         if not self._redis or not self._redis.is_connected:
             return
 
-        saved = 0
-        for pending in self._pending_alerts.values():
-            if not pending.cancelled and not pending.auto_initiated:
-                await self._save_alert_to_redis(pending)
-                saved += 1
+        # Phase 10: Write every pending alert in one round trip
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for pending in self._pending_alerts.values():
+                    if not pending.cancelled and not pending.auto_initiated:
+                        self._queue_save(pipe, pending)
+
+        except Exception as e:
+            logger.warning(f"Failed to save pending alerts to Redis: {e}")
+            return
 
-        if saved:
-            logger.info(f"📤 Saved {saved} pending alerts to Redis")
+        if pipe.succeeded and len(pipe):
+            logger.info(f"📤 Saved {len(pipe)} pending alerts to Redis")
 
     # =========================================================================
     # Properties and Statistics
@@ -832,6 +1273,7 @@ class AutoInitiateManager:
         return {
             "enabled": self._enabled,
             "running": self._running,
+            "scheduled_by": "scheduler" if self._scheduler else "poll",
             "delay_minutes": self._delay_minutes,
             "min_severity": self._min_severity,
             "pending_count": len(self._pending_alerts),
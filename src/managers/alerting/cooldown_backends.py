@@ -0,0 +1,459 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Cooldown Backends for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-15.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Store per-user alert cooldown expiries for CooldownManager
+- In-memory: expiry heap so expired entries are dropped in order and
+  status reads never sweep the whole table
+- Redis: atomic check-and-set (SET NX EX) shared by every replica and
+  surviving restarts, with a short local cache of known-active cooldowns
+  so repeat alerts for a cooled-down user skip the round trip
+- Count and list active cooldowns from the backing store, not a cache
+
+USAGE:
+    from src.managers.alerting.cooldown_backends import (
+        MemoryCooldownBackend,
+        RedisCooldownBackend,
+    )
+
+    backend = RedisCooldownBackend(redis_manager)
+
+    if await backend.acquire(user_id, 300):
+        ...  # this caller owns the cooldown window, send the alert
+"""
+
+import heapq
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.managers.storage.redis_manager import RedisManager
+
+# Module version
+__version__ = "v5.0-10-15.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+COOLDOWN_BACKEND_MEMORY = "memory"
+COOLDOWN_BACKEND_REDIS = "redis"
+COOLDOWN_BACKENDS = (COOLDOWN_BACKEND_MEMORY, COOLDOWN_BACKEND_REDIS)
+
+# Redis key prefix (value = expiry as a Unix timestamp)
+REDIS_KEY_PREFIX = "ash:cooldown:"
+
+# Longest a Redis cooldown is trusted from the local cache. Bounds how long
+# a clear_cooldown() on another replica can go unnoticed here.
+LOCAL_CACHE_MAX_SECONDS = 30
+
+# Set the cooldown if none is active. Returns {1, expiry} when set, or
+# {0, existing expiry} when another caller holds it.
+#   KEYS[1] = cooldown key
+#   ARGV    = expiry timestamp, duration seconds
+SCRIPT_COOLDOWN_ACQUIRE = """
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    return {1, ARGV[1]}
+end
+return {0, redis.call('GET', KEYS[1]) or ARGV[1]}
+"""
+
+
+# =============================================================================
+# Backend Interface
+# =============================================================================
+
+
+class CooldownBackend(ABC):
+    """
+    Storage interface used by CooldownManager.
+
+    Expiries are Unix timestamps (float). Methods never raise for storage
+    failures; a backend that cannot reach its store degrades to allowing
+    alerts rather than suppressing them.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def acquire(self, user_id: int, duration_seconds: int) -> bool:
+        """
+        Start a cooldown only if none is active (atomic check-and-set).
+
+        Args:
+            user_id: Discord user ID
+            duration_seconds: Cooldown length
+
+        Returns:
+            True if this caller started the cooldown
+        """
+
+    @abstractmethod
+    async def set(self, user_id: int, duration_seconds: int) -> float:
+        """
+        Start or restart a cooldown unconditionally.
+
+        Returns:
+            Expiry timestamp
+        """
+
+    @abstractmethod
+    async def get_expiry(self, user_id: int) -> Optional[float]:
+        """Get the expiry timestamp of an active cooldown, or None."""
+
+    @abstractmethod
+    async def clear(self, user_id: int) -> bool:
+        """Clear a cooldown. Returns True if one was active."""
+
+    @abstractmethod
+    async def clear_all(self) -> int:
+        """Clear every cooldown. Returns the number cleared."""
+
+    @abstractmethod
+    async def active_count(self) -> int:
+        """Get the number of active cooldowns in the backing store."""
+
+    @abstractmethod
+    async def snapshot(self) -> Dict[int, float]:
+        """Get active cooldowns in the backing store (user_id → expiry)."""
+
+    def prune(self) -> int:
+        """Drop expired cooldowns held locally. Returns the number removed."""
+        return 0
+
+    def get_status(self) -> dict:
+        """Get backend status for logging/debugging (no store round trip)."""
+        return {"backend": self.name}
+
+
+# =============================================================================
+# In-Memory Backend
+# =============================================================================
+
+
+class MemoryCooldownBackend(CooldownBackend):
+    """
+    Process-local cooldowns (reset on restart, not shared).
+
+    Expiries live in a dict with a min-heap of (evict_at, user_id, expiry)
+    beside it; evict_at is the expiry unless the entry is only cached.
+    Every call first pops heap entries that have expired, so each entry is
+    removed once, in expiry order, and counting active cooldowns is
+    len(dict). Heap entries left behind by a reset or clear are skipped
+    when popped and the heap is rebuilt if they pile up.
+    """
+
+    name = COOLDOWN_BACKEND_MEMORY
+
+    def __init__(self):
+        """Initialize MemoryCooldownBackend."""
+        self._expiries: Dict[int, float] = {}
+        self._heap: List[Tuple[float, int, float]] = []
+
+    async def acquire(self, user_id: int, duration_seconds: int) -> bool:
+        """Start a cooldown only if none is active."""
+        return self.acquire_local(user_id, duration_seconds)
+
+    async def set(self, user_id: int, duration_seconds: int) -> float:
+        """Start or restart a cooldown."""
+        expiry = time.time() + duration_seconds
+        self.put(user_id, expiry)
+        return expiry
+
+    async def get_expiry(self, user_id: int) -> Optional[float]:
+        """Get the expiry of an active cooldown."""
+        return self.get_local(user_id)
+
+    async def clear(self, user_id: int) -> bool:
+        """Clear a cooldown."""
+        return self.discard(user_id)
+
+    async def clear_all(self) -> int:
+        """Clear every cooldown."""
+        self.prune()
+        count = len(self._expiries)
+        self._expiries.clear()
+        self._heap.clear()
+        return count
+
+    async def active_count(self) -> int:
+        """Get the number of active cooldowns."""
+        return self.local_count()
+
+    async def snapshot(self) -> Dict[int, float]:
+        """Get a copy of the active cooldowns."""
+        self.prune()
+        return dict(self._expiries)
+
+    def get_status(self) -> dict:
+        """Get backend status."""
+        status = super().get_status()
+        status["active_cooldowns"] = self.local_count()
+        return status
+
+    # -------------------------------------------------------------------------
+    # Synchronous helpers (also used as RedisCooldownBackend's local cache)
+    # -------------------------------------------------------------------------
+
+    def acquire_local(self, user_id: int, duration_seconds: int) -> bool:
+        """Check-and-set without awaiting."""
+        if self.get_local(user_id) is not None:
+            return False
+        self.put(user_id, time.time() + duration_seconds)
+        return True
+
+    def local_count(self) -> int:
+        """Count active cooldowns without awaiting."""
+        self.prune()
+        return len(self._expiries)
+
+    def get_local(self, user_id: int) -> Optional[float]:
+        """Get the expiry of an active cooldown without awaiting."""
+        self.prune()
+        return self._expiries.get(user_id)
+
+    def put(self, user_id: int, expiry: float, evict_at: Optional[float] = None) -> None:
+        """
+        Record a cooldown expiry.
+
+        Args:
+            user_id: Discord user ID
+            expiry: When the cooldown ends
+            evict_at: Forget the entry earlier than expiry (cache use)
+        """
+        self.prune()
+        self._expiries[user_id] = expiry
+        evict_at = expiry if evict_at is None else min(evict_at, expiry)
+        heapq.heappush(self._heap, (evict_at, user_id, expiry))
+
+        # Superseded entries stay in the heap until popped; drop them if
+        # they outnumber live ones so memory tracks the active count
+        if len(self._heap) > 2 * len(self._expiries) + 64:
+            self._heap = [
+                entry for entry in self._heap if self._expiries.get(entry[1]) == entry[2]
+            ]
+            heapq.heapify(self._heap)
+
+    def discard(self, user_id: int) -> bool:
+        """Forget a cooldown (its heap entry is skipped when popped)."""
+        self.prune()
+        return self._expiries.pop(user_id, None) is not None
+
+    def prune(self) -> int:
+        """Drop expired cooldowns from the top of the heap."""
+        now = time.time()
+        removed = 0
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _evict_at, user_id, expiry = heapq.heappop(heap)
+            if self._expiries.get(user_id) == expiry:
+                del self._expiries[user_id]
+                removed += 1
+        return removed
+
+
+# =============================================================================
+# Redis Backend
+# =============================================================================
+
+
+class RedisCooldownBackend(CooldownBackend):
+    """
+    Cooldowns shared across replicas and restarts.
+
+    One key per user with a TTL equal to the cooldown; acquire() runs
+    SET NX EX so two replicas racing on the same burst send one alert.
+    Known-active cooldowns are cached locally (for at most
+    LOCAL_CACHE_MAX_SECONDS) so further alerts for a cooled-down user are
+    rejected without a round trip. If Redis is unavailable the local
+    cache decides, so alerts keep flowing.
+    """
+
+    name = COOLDOWN_BACKEND_REDIS
+
+    def __init__(self, redis_manager: "RedisManager"):
+        """
+        Initialize RedisCooldownBackend.
+
+        Args:
+            redis_manager: Connected RedisManager
+        """
+        self._redis = redis_manager
+        self._local = MemoryCooldownBackend()
+
+        # Statistics
+        self.local_hits = 0
+        self.redis_calls = 0
+        self.redis_failures = 0
+
+        self._redis.register_script("cooldown_acquire", SCRIPT_COOLDOWN_ACQUIRE)
+
+    async def acquire(self, user_id: int, duration_seconds: int) -> bool:
+        """Start a cooldown only if none is active on any replica."""
+        if self._local.get_local(user_id) is not None:
+            self.local_hits += 1
+            return False
+
+        expiry = time.time() + duration_seconds
+        self.redis_calls += 1
+        result = await self._redis.run_script(
+            "cooldown_acquire",
+            [self._key(user_id)],
+            [f"{expiry:.3f}", int(duration_seconds)],
+        )
+        if not result:
+            self.redis_failures += 1
+            return self._local.acquire_local(user_id, duration_seconds)
+
+        acquired, stored = int(result[0]), self._parse_expiry(result[1], expiry)
+        self._cache(user_id, stored)
+        return bool(acquired)
+
+    async def set(self, user_id: int, duration_seconds: int) -> float:
+        """Start or restart a cooldown on every replica."""
+        expiry = time.time() + duration_seconds
+        self.redis_calls += 1
+        if not await self._redis.set(
+            self._key(user_id), f"{expiry:.3f}", ttl=int(duration_seconds)
+        ):
+            self.redis_failures += 1
+        self._cache(user_id, expiry)
+        return expiry
+
+    async def get_expiry(self, user_id: int) -> Optional[float]:
+        """Get the expiry of an active cooldown (local cache first)."""
+        expiry = self._local.get_local(user_id)
+        if expiry is not None:
+            self.local_hits += 1
+            return expiry
+
+        self.redis_calls += 1
+        raw = await self._redis.get(self._key(user_id))
+        if raw is None:
+            return None
+
+        expiry = self._parse_expiry(raw, None)
+        if expiry is None or expiry <= time.time():
+            return None
+        self._cache(user_id, expiry)
+        return expiry
+
+    async def clear(self, user_id: int) -> bool:
+        """Clear a cooldown on every replica (others' caches age out)."""
+        cleared = self._local.discard(user_id)
+        self.redis_calls += 1
+        return bool(await self._redis.delete(self._key(user_id))) or cleared
+
+    async def clear_all(self) -> int:
+        """Clear every cooldown (SCAN, admin use only)."""
+        local = await self._local.clear_all()
+        keys = await self._redis.scan_iter(f"{REDIS_KEY_PREFIX}*")
+        if not keys:
+            return local
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.delete(key)
+        return len(keys) if pipe.succeeded else local
+
+    async def active_count(self) -> int:
+        """Count active cooldowns across replicas (SCAN, admin use only)."""
+        if not self._redis.is_connected:
+            return self._local.local_count()
+
+        # Keys expire with their cooldown, so every key found is active
+        return len(await self._redis.scan_iter(f"{REDIS_KEY_PREFIX}*"))
+
+    async def snapshot(self) -> Dict[int, float]:
+        """Get active cooldowns across replicas (SCAN, admin use only)."""
+        if not self._redis.is_connected:
+            return await self._local.snapshot()
+
+        keys = await self._redis.scan_iter(f"{REDIS_KEY_PREFIX}*")
+        values = await self._redis.mget(keys) if keys else []
+        if values is None:
+            self.redis_failures += 1
+            return await self._local.snapshot()
+
+        now = time.time()
+        active: Dict[int, float] = {}
+        for key, raw in zip(keys, values):
+            user_id = key[len(REDIS_KEY_PREFIX):]
+            expiry = self._parse_expiry(raw, None)
+            if user_id.isdigit() and expiry is not None and expiry > now:
+                active[int(user_id)] = expiry
+        return active
+
+    def prune(self) -> int:
+        """Drop expired entries from the local cache."""
+        return self._local.prune()
+
+    def get_status(self) -> dict:
+        """Get backend status including cache effectiveness."""
+        status = super().get_status()
+        status.update({
+            "cached_cooldowns": self._local.local_count(),
+            "local_hits": self.local_hits,
+            "redis_calls": self.redis_calls,
+            "redis_failures": self.redis_failures,
+        })
+        return status
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _key(self, user_id: int) -> str:
+        """Get the Redis key for a user's cooldown."""
+        return f"{REDIS_KEY_PREFIX}{user_id}"
+
+    def _cache(self, user_id: int, expiry: float) -> None:
+        """Cache a known-active cooldown, capped at LOCAL_CACHE_MAX_SECONDS."""
+        self._local.put(user_id, expiry, evict_at=time.time() + LOCAL_CACHE_MAX_SECONDS)
+
+    @staticmethod
+    def _parse_expiry(raw, default: Optional[float]) -> Optional[float]:
+        """Parse a stored expiry timestamp."""
+        try:
+            return float(raw)
+        except (TypeError, ValueError):
+            return default
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "CooldownBackend",
+    "MemoryCooldownBackend",
+    "RedisCooldownBackend",
+    "COOLDOWN_BACKEND_MEMORY",
+    "COOLDOWN_BACKEND_REDIS",
+    "COOLDOWN_BACKENDS",
+]
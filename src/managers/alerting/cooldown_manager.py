@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Cooldown Manager for Ash-Bot Service
 ---
-FILE VERSION: v5.0-3-2.0-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-3-2.0-3
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 3 - Alert Dispatching
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -25,26 +25,39 @@ RESPONSIBILITIES:
 - Provide configurable cooldown duration
 - Auto-expire cooldowns after duration
 - Support manual cooldown clearing
+- Pluggable storage: Redis (shared, atomic) or in-memory (Phase 10)
 
 USAGE:
     from src.managers.alerting import create_cooldown_manager
 
-    cooldown = create_cooldown_manager(config_manager)
+    cooldown = create_cooldown_manager(config_manager, redis_manager)
 
-    if not cooldown.is_on_cooldown(user_id):
-        # Send alert
-        cooldown.set_cooldown(user_id)
+    # Atomic check-and-set: only one caller (on any replica) wins
+    if await cooldown.try_acquire(user_id):
+        sent = await send_alert()
+        if not sent:
+            await cooldown.release_cooldown(user_id)
 """
 
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import Dict, Optional, TYPE_CHECKING
 import logging
 
+from src.managers.alerting.cooldown_backends import (
+    COOLDOWN_BACKEND_MEMORY,
+    COOLDOWN_BACKEND_REDIS,
+    COOLDOWN_BACKENDS,
+    CooldownBackend,
+    MemoryCooldownBackend,
+    RedisCooldownBackend,
+)
+
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
+    from src.managers.storage.redis_manager import RedisManager
 
 # Module version
-__version__ = "v5.0-3-2.0-1"
+__version__ = "v5.0-3-2.0-3"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -60,69 +73,120 @@ class CooldownManager:
     Manages alert cooldowns to prevent spam.
 
     Prevents multiple alerts for the same user within a cooldown period.
-    Uses in-memory storage (resets on restart).
+    Storage is delegated to a backend (Phase 10): Redis when available,
+    so cooldowns are shared across replicas and survive restarts, or an
+    in-memory expiry heap.
 
     Attributes:
         config_manager: ConfigManager for cooldown duration
-        cooldowns: Dict mapping user_id to cooldown expiry time
+        backend: CooldownBackend holding cooldown expiries
 
     Example:
-        >>> cooldown = create_cooldown_manager(config_manager)
-        >>> if not cooldown.is_on_cooldown(user_id):
+        >>> cooldown = create_cooldown_manager(config_manager, redis_manager)
+        >>> if await cooldown.try_acquire(user_id):
         ...     await dispatch_alert(message, result)
-        ...     cooldown.set_cooldown(user_id)
     """
 
-    def __init__(self, config_manager: "ConfigManager"):
+    def __init__(
+        self,
+        config_manager: "ConfigManager",
+        redis_manager: Optional["RedisManager"] = None,
+    ):
         """
         Initialize CooldownManager.
 
         Args:
             config_manager: Configuration manager
+            redis_manager: Redis manager for the shared backend (optional)
 
         Note:
             Use create_cooldown_manager() factory function.
         """
         self._config = config_manager
-        self._cooldowns: Dict[int, datetime] = {}
 
         # Load cooldown duration (seconds)
         self._cooldown_seconds = self._config.get(
             "alerting", "cooldown_seconds", 300  # 5 minutes default
         )
 
+        # Phase 10: Pick the storage backend
+        self.backend = self._create_backend(redis_manager)
+
         logger.info(
-            f"✅ CooldownManager initialized ({self._cooldown_seconds}s cooldown)"
+            f"✅ CooldownManager initialized ({self._cooldown_seconds}s cooldown, "
+            f"backend={self.backend.name})"
         )
 
+    def _create_backend(
+        self,
+        redis_manager: Optional["RedisManager"],
+    ) -> CooldownBackend:
+        """Create the configured backend, falling back to in-memory."""
+        backend = str(
+            self._config.get("alerting", "cooldown_backend", COOLDOWN_BACKEND_REDIS)
+        ).lower()
+
+        if backend not in COOLDOWN_BACKENDS:
+            logger.warning(
+                f"⚠️ Unknown cooldown backend '{backend}', "
+                f"using '{COOLDOWN_BACKEND_MEMORY}'"
+            )
+            backend = COOLDOWN_BACKEND_MEMORY
+
+        if backend == COOLDOWN_BACKEND_REDIS:
+            if redis_manager is not None:
+                return RedisCooldownBackend(redis_manager)
+            logger.warning(
+                "⚠️ Redis not available, cooldowns will be in-memory "
+                "(not shared across replicas, reset on restart)"
+            )
+
+        return MemoryCooldownBackend()
+
     # =========================================================================
     # Cooldown Check Methods
     # =========================================================================
 
-    def is_on_cooldown(self, user_id: int) -> bool:
+    async def try_acquire(
+        self,
+        user_id: int,
+        duration_seconds: Optional[int] = None,
+    ) -> bool:
         """
-        Check if a user is on alert cooldown.
+        Start a cooldown if the user is not already on one (Phase 10).
+
+        Check and set happen atomically in the backend, so concurrent
+        alerts for the same user (on any replica) produce one winner.
 
         Args:
             user_id: Discord user ID
+            duration_seconds: Optional custom duration (uses default if None)
 
         Returns:
-            True if user is on cooldown
+            True if the caller may alert (cooldown now started)
         """
-        if user_id not in self._cooldowns:
-            return False
+        duration = duration_seconds or self._cooldown_seconds
+        if duration <= 0:
+            return True
 
-        expiry = self._cooldowns[user_id]
-        now = datetime.now(timezone.utc)
+        acquired = await self.backend.acquire(user_id, duration)
+        if acquired:
+            logger.debug(f"⏱️ Cooldown started for user {user_id} ({duration}s)")
+        return acquired
+
+    async def is_on_cooldown(self, user_id: int) -> bool:
+        """
+        Check if a user is on alert cooldown.
 
-        if now >= expiry:
-            # Cooldown expired, clean up
-            del self._cooldowns[user_id]
-            return False
+        Args:
+            user_id: Discord user ID
 
-        return True
+        Returns:
+            True if user is on cooldown
+        """
+        return await self.backend.get_expiry(user_id) is not None
 
-    def set_cooldown(self, user_id: int, duration_seconds: Optional[int] = None) -> None:
+    async def set_cooldown(self, user_id: int, duration_seconds: Optional[int] = None) -> None:
         """
         Set cooldown for a user.
 
@@ -131,14 +195,29 @@ class CooldownManager:
             duration_seconds: Optional custom duration (uses default if None)
         """
         duration = duration_seconds or self._cooldown_seconds
-        expiry = datetime.now(timezone.utc) + timedelta(seconds=duration)
-        self._cooldowns[user_id] = expiry
+        if duration <= 0:
+            return
+
+        expiry = await self.backend.set(user_id, duration)
 
         logger.debug(
-            f"⏱️ Cooldown set for user {user_id} until {expiry.isoformat()}"
+            f"⏱️ Cooldown set for user {user_id} until "
+            f"{datetime.fromtimestamp(expiry, timezone.utc).isoformat()}"
         )
 
-    def clear_cooldown(self, user_id: int) -> bool:
+    async def release_cooldown(self, user_id: int) -> None:
+        """
+        Give back a cooldown started by try_acquire() (Phase 10).
+
+        Used when the alert could not be sent, so the next message from
+        the user can still alert.
+
+        Args:
+            user_id: Discord user ID
+        """
+        await self.backend.clear(user_id)
+
+    async def clear_cooldown(self, user_id: int) -> bool:
         """
         Clear cooldown for a user (manual override).
 
@@ -148,13 +227,12 @@ class CooldownManager:
         Returns:
             True if cooldown was cleared
         """
-        if user_id in self._cooldowns:
-            del self._cooldowns[user_id]
+        if await self.backend.clear(user_id):
             logger.info(f"⏱️ Cooldown cleared for user {user_id}")
             return True
         return False
 
-    def get_remaining_cooldown(self, user_id: int) -> int:
+    async def get_remaining_cooldown(self, user_id: int) -> int:
         """
         Get remaining cooldown time in seconds.
 
@@ -164,20 +242,13 @@ class CooldownManager:
         Returns:
             Remaining seconds, or 0 if not on cooldown
         """
-        if user_id not in self._cooldowns:
-            return 0
-
-        expiry = self._cooldowns[user_id]
-        now = datetime.now(timezone.utc)
-
-        if now >= expiry:
-            # Cleanup expired
-            del self._cooldowns[user_id]
+        expiry = await self.get_expiry_time(user_id)
+        if expiry is None:
             return 0
 
-        return int((expiry - now).total_seconds())
+        return max(0, int((expiry - datetime.now(timezone.utc)).total_seconds()))
 
-    def get_expiry_time(self, user_id: int) -> Optional[datetime]:
+    async def get_expiry_time(self, user_id: int) -> Optional[datetime]:
         """
         Get the cooldown expiry time for a user.
 
@@ -187,17 +258,11 @@ class CooldownManager:
         Returns:
             Expiry datetime or None if not on cooldown
         """
-        if user_id not in self._cooldowns:
-            return None
-
-        expiry = self._cooldowns[user_id]
-        now = datetime.now(timezone.utc)
-
-        if now >= expiry:
-            del self._cooldowns[user_id]
+        expiry = await self.backend.get_expiry(user_id)
+        if expiry is None:
             return None
 
-        return expiry
+        return datetime.fromtimestamp(expiry, timezone.utc)
 
     # =========================================================================
     # Cleanup Methods
@@ -205,34 +270,50 @@ class CooldownManager:
 
     def cleanup_expired(self) -> int:
         """
-        Remove all expired cooldowns.
+        Remove expired cooldowns held in this process.
+
+        Expired entries are popped from the backend's expiry heap, so this
+        only touches cooldowns that have actually expired.
 
         Returns:
             Number of cooldowns cleaned up
         """
-        now = datetime.now(timezone.utc)
-        expired = [
-            user_id for user_id, expiry in self._cooldowns.items()
-            if now >= expiry
-        ]
+        removed = self.backend.prune()
+
+        if removed:
+            logger.debug(f"🧹 Cleaned up {removed} expired cooldowns")
+
+        return removed
+
+    async def get_active_count(self) -> int:
+        """
+        Get count of active cooldowns across all replicas.
 
-        for user_id in expired:
-            del self._cooldowns[user_id]
+        Returns:
+            Number of active cooldowns in the backend's store
+        """
+        return await self.backend.active_count()
 
-        if expired:
-            logger.debug(f"🧹 Cleaned up {len(expired)} expired cooldowns")
+    async def get_all_cooldowns(self) -> Dict[int, datetime]:
+        """
+        Get active cooldowns across all replicas (for debugging).
 
-        return len(expired)
+        Returns:
+            Mapping of user ID to cooldown expiry (UTC)
+        """
+        return {
+            user_id: datetime.fromtimestamp(expiry, timezone.utc)
+            for user_id, expiry in (await self.backend.snapshot()).items()
+        }
 
-    def clear_all(self) -> int:
+    async def clear_all(self) -> int:
         """
         Clear all cooldowns (admin function).
 
         Returns:
             Number of cooldowns cleared
         """
-        count = len(self._cooldowns)
-        self._cooldowns.clear()
+        count = await self.backend.clear_all()
 
         if count > 0:
             logger.info(f"🧹 Cleared all {count} cooldowns")
@@ -243,24 +324,11 @@ class CooldownManager:
     # Properties
     # =========================================================================
 
-    @property
-    def active_cooldown_count(self) -> int:
-        """Get count of active (non-expired) cooldowns."""
-        # Cleanup expired first
-        self.cleanup_expired()
-        return len(self._cooldowns)
-
     @property
     def cooldown_duration(self) -> int:
         """Get configured cooldown duration in seconds."""
         return self._cooldown_seconds
 
-    @property
-    def all_cooldowns(self) -> Dict[int, datetime]:
-        """Get copy of all active cooldowns (for debugging)."""
-        # Cleanup expired first
-        self.cleanup_expired()
-        return self._cooldowns.copy()
 
     # =========================================================================
     # Status Methods
@@ -273,18 +341,18 @@ class CooldownManager:
         Returns:
             Status dictionary for logging/debugging
         """
-        self.cleanup_expired()
-        return {
-            "active_cooldowns": len(self._cooldowns),
+        status = self.backend.get_status()
+        status.update({
             "cooldown_duration_seconds": self._cooldown_seconds,
             "cooldown_duration_minutes": self._cooldown_seconds / 60,
-        }
+        })
+        return status
 
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
             f"CooldownManager("
-            f"active={self.active_cooldown_count}, "
+            f"backend={self.backend.name}, "
             f"duration={self._cooldown_seconds}s)"
         )
 
@@ -296,6 +364,7 @@ class CooldownManager:
 
 def create_cooldown_manager(
     config_manager: "ConfigManager",
+    redis_manager: Optional["RedisManager"] = None,
 ) -> CooldownManager:
     """
     Factory function for CooldownManager.
@@ -305,17 +374,22 @@ def create_cooldown_manager(
 
     Args:
         config_manager: Configuration manager instance
+        redis_manager: Redis manager for the shared backend (optional,
+            falls back to in-memory cooldowns)
 
     Returns:
         Configured CooldownManager instance
 
     Example:
-        >>> cooldown = create_cooldown_manager(config_manager)
-        >>> if not cooldown.is_on_cooldown(user_id):
-        ...     cooldown.set_cooldown(user_id)
+        >>> cooldown = create_cooldown_manager(config_manager, redis_manager)
+        >>> if await cooldown.try_acquire(user_id):
+        ...     await send_alert()
     """
     logger.info("🏭 Creating CooldownManager")
-    return CooldownManager(config_manager=config_manager)
+    return CooldownManager(
+        config_manager=config_manager,
+        redis_manager=redis_manager,
+    )
 
 
 # =============================================================================
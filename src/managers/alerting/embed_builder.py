@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Embed Builder for Ash-Bot Service
 ---
-FILE VERSION: v5.0-7-2.0-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-7-2.0-4
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 7 - Core Safety & User Preferences
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -25,6 +25,7 @@ RESPONSIBILITIES:
 - Include relevant crisis information
 - Format message previews safely
 - Add jump links to original messages
+- Build alert storm digest embeds (Phase 10)
 
 USAGE:
     from src.managers.alerting import create_embed_builder
@@ -36,14 +37,15 @@ USAGE:
 
 import discord
 from datetime import datetime, timezone
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:
     from src.models.nlp_models import CrisisAnalysisResult
+    from src.managers.alerting.alert_storm import DigestEntry
 
 # Module version
-__version__ = "v5.0-7-2.0-1"
+__version__ = "v5.0-7-2.0-4"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -119,6 +121,7 @@ class EmbedBuilder:
         self,
         message: discord.Message,
         result: "CrisisAnalysisResult",
+        content: Optional[str] = None,
     ) -> discord.Embed:
         """
         Build a crisis alert embed.
@@ -126,6 +129,8 @@ class EmbedBuilder:
         Args:
             message: Original Discord message
             result: NLP analysis result
+            content: Optional preview text overriding message.content
+                (Phase 10: coalesced message bursts)
 
         Returns:
             Formatted Discord embed
@@ -148,7 +153,7 @@ class EmbedBuilder:
         self._add_author(embed, message)
 
         # Message preview
-        self._add_message_preview(embed, message)
+        self._add_message_preview(embed, message, content)
 
         # Crisis scores
         self._add_scores(embed, result)
@@ -190,9 +195,10 @@ class EmbedBuilder:
         self,
         embed: discord.Embed,
         message: discord.Message,
+        content: Optional[str] = None,
     ) -> None:
         """Add truncated message preview."""
-        content = message.content or "[No text content]"
+        content = content or message.content or "[No text content]"
 
         # Truncate if needed
         if len(content) > MAX_PREVIEW_LENGTH:
@@ -319,6 +325,7 @@ class EmbedBuilder:
         result: "CrisisAnalysisResult",
         history_count: int,
         trend: str,
+        trend_detail: Optional[str] = None,
     ) -> discord.Embed:
         """
         Build an escalation alert embed (when pattern detected).
@@ -328,6 +335,8 @@ class EmbedBuilder:
             result: NLP analysis result
             history_count: Number of messages in history
             trend: Trend direction (escalating, stable, etc.)
+            trend_detail: Optional extra line, e.g. score average and slope
+                from the local escalation tracker (Phase 10)
 
         Returns:
             Formatted Discord embed with escalation info
@@ -336,10 +345,13 @@ class EmbedBuilder:
         embed = self.build_crisis_embed(message, result)
 
         # Add escalation warning at the top (insert after author)
+        value = f"Pattern: **{trend.title()}** over {history_count} messages"
+        if trend_detail:
+            value += f"\n{trend_detail}"
         embed.insert_field_at(
             0,
             name="📈 ESCALATION DETECTED",
-            value=f"Pattern: **{trend.title()}** over {history_count} messages",
+            value=value,
             inline=False,
         )
 
@@ -381,6 +393,64 @@ class EmbedBuilder:
 
         return embed
 
+    # =========================================================================
+    # Alert Storm Digest (Phase 10)
+    # =========================================================================
+
+    def build_storm_digest_embed(
+        self,
+        entries: List["DigestEntry"],
+        total: int,
+        started_at: datetime,
+        interval_seconds: float,
+        ended: bool = False,
+    ) -> discord.Embed:
+        """
+        Build the digest embed that MEDIUM alerts fold into during a storm.
+
+        Args:
+            entries: Most recent folded alerts (oldest first)
+            total: Alerts folded since the storm started
+            started_at: When the digest was started
+            interval_seconds: How often the digest is updated
+            ended: Whether the storm has passed
+
+        Returns:
+            Formatted Discord embed
+        """
+        if ended:
+            title = "🌤️ Alert Storm Digest (ended)"
+            intro = "Alert volume is back to normal; alerts are posted individually again."
+            color = discord.Color.dark_grey()
+        else:
+            title = "🌩️ Alert Storm Digest"
+            intro = (
+                "High alert volume in this channel. MEDIUM alerts are grouped "
+                f"here and updated every {interval_seconds:.0f}s. HIGH and "
+                "CRITICAL alerts are still posted individually."
+            )
+            color = SEVERITY_COLORS["medium"]
+
+        lines = [
+            f"{SEVERITY_EMOJIS.get(entry.severity, '⚠️')} **{entry.user_name}** "
+            f"(`{entry.user_id}`) · score {entry.crisis_score:.2f} · "
+            f"<t:{int(entry.created_at.timestamp())}:R> · [Jump]({entry.jump_url})"
+            for entry in reversed(entries)
+        ]
+        if total > len(entries):
+            lines.append(f"*…and {total - len(entries)} earlier*")
+
+        embed = discord.Embed(
+            title=title,
+            description=intro + "\n\n" + "\n".join(lines),
+            color=color,
+            timestamp=datetime.now(timezone.utc),
+        )
+        embed.set_footer(
+            text=f"{total} alerts folded · started {started_at.strftime('%H:%M UTC')}"
+        )
+        return embed
+
     # =========================================================================
     # Simple Info Embeds
     # =========================================================================
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Ash AI Managers Package for Ash-Bot Service
 ---
-FILE VERSION: v5.0-7-2.0-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-7-2.0-4
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 7 - Core Safety & User Preferences
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,9 @@ MANAGERS:
 - ClaudeClientManager: Claude API client for AI responses
 - AshSessionManager: Conversation session lifecycle management
 - AshPersonalityManager: Ash personality and response generation
+- ReplyStream: Progressively edited Discord reply for streamed responses (Phase 10)
+- ContextWindowManager: Token-budgeted history with rolling summary (Phase 10)
+- ClaudeScheduler: Priority admission, backoff and token budget for Claude (Phase 10)
 
 USAGE:
     from src.managers.ash import (
@@ -54,7 +57,20 @@ USAGE:
 """
 
 # Module version
-__version__ = "v5.0-7-2.0-1"
+__version__ = "v5.0-7-2.0-4"
+
+# =============================================================================
+# Claude Scheduler (Phase 10)
+# =============================================================================
+
+from .claude_scheduler import (
+    ClaudeScheduler,
+    create_claude_scheduler,
+    PRIORITY_URGENT,
+    PRIORITY_NORMAL,
+    PRIORITY_FOLLOWUP,
+    PRIORITY_BACKGROUND,
+)
 
 # =============================================================================
 # Claude Client Manager
@@ -89,12 +105,40 @@ from .ash_personality_manager import (
     create_ash_personality_manager,
 )
 
+# =============================================================================
+# Reply Stream (Phase 10)
+# =============================================================================
+
+from .reply_stream import (
+    ReplyStream,
+    split_message,
+    DISCORD_MESSAGE_LIMIT,
+)
+
+# =============================================================================
+# Context Window Manager (Phase 10)
+# =============================================================================
+
+from .context_window_manager import (
+    ContextWindow,
+    ContextWindowManager,
+    create_context_window_manager,
+    estimate_tokens,
+)
+
 # =============================================================================
 # Public API
 # =============================================================================
 
 __all__ = [
     "__version__",
+    # Claude Scheduler (Phase 10)
+    "ClaudeScheduler",
+    "create_claude_scheduler",
+    "PRIORITY_URGENT",
+    "PRIORITY_NORMAL",
+    "PRIORITY_FOLLOWUP",
+    "PRIORITY_BACKGROUND",
     # Claude Client
     "ClaudeClientManager",
     "create_claude_client_manager",
@@ -110,4 +154,13 @@ __all__ = [
     # Personality Manager
     "AshPersonalityManager",
     "create_ash_personality_manager",
+    # Reply Stream (Phase 10)
+    "ReplyStream",
+    "split_message",
+    "DISCORD_MESSAGE_LIMIT",
+    # Context Window (Phase 10)
+    "ContextWindow",
+    "ContextWindowManager",
+    "create_context_window_manager",
+    "estimate_tokens",
 ]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Ash Personality Manager for Ash-Bot Service
 ---
-FILE VERSION: v5.0-4-5.0-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-4-5.0-6
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 4 - Ash AI Integration
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -27,6 +27,8 @@ RESPONSIBILITIES:
 - Check for safety triggers
 - Handle resource sharing
 - Manage conversation flow
+- Stream replies into progressively edited DMs (Phase 10)
+- Send a token-budgeted context window instead of the full history (Phase 10)
 
 USAGE:
     from src.managers.ash import create_ash_personality_manager
@@ -40,6 +42,14 @@ USAGE:
         message=discord_message,
         session=ash_session,
     )
+
+    # Phase 10: Stream the reply straight into the DM channel
+    await personality_manager.generate_response(
+        message=discord_message,
+        session=ash_session,
+        channel=discord_message.channel,
+        received_at=received_at,
+    )
 """
 
 import logging
@@ -57,13 +67,19 @@ from src.prompts import (
     get_closing_message,
 )
 
+from .claude_client_manager import ClaudeAPIError
+from .reply_stream import ReplyStream
+
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
+    from src.managers.discord.outbound_queue import OutboundQueue
+    from src.managers.metrics.metrics_manager import MetricsManager
     from .claude_client_manager import ClaudeClientManager
     from .ash_session_manager import AshSession
+    from .context_window_manager import ContextWindowManager
 
 # Module version
-__version__ = "v5.0-4-5.0-1"
+__version__ = "v5.0-4-5.0-6"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -97,6 +113,8 @@ class AshPersonalityManager:
         self,
         config_manager: "ConfigManager",
         claude_client: "ClaudeClientManager",
+        metrics_manager: Optional["MetricsManager"] = None,
+        context_window_manager: Optional["ContextWindowManager"] = None,
     ):
         """
         Initialize AshPersonalityManager.
@@ -104,16 +122,46 @@ class AshPersonalityManager:
         Args:
             config_manager: Configuration manager for settings
             claude_client: Claude client for API calls
+            metrics_manager: Optional metrics manager (Phase 10)
+            context_window_manager: Optional context window; without it the
+                full session history is sent (Phase 10)
         """
         self._config = config_manager
         self._claude = claude_client
+        self._metrics = metrics_manager
+        self._context_window = context_window_manager
+        self._outbound: Optional["OutboundQueue"] = None
         self._logger = logging.getLogger(__name__)
 
+        # Phase 10: Streamed replies
+        self._stream_responses = self._config.get("ash", "stream_responses", True)
+        self._stream_edit_interval = float(
+            self._config.get("ash", "stream_edit_interval_seconds", 1.0)
+        )
+
         # Statistics
         self._responses_generated = 0
         self._safety_triggers_detected = 0
+        self._responses_streamed = 0
+
+        self._logger.info(
+            f"🌸 AshPersonalityManager initialized "
+            f"(streaming: {self._stream_responses})"
+        )
+
+    def set_outbound_queue(
+        self,
+        outbound_queue: "OutboundQueue",
+    ) -> None:
+        """
+        Inject the outbound Discord queue (Phase 10).
 
-        self._logger.info("🌸 AshPersonalityManager initialized")
+        Streamed replies are sent, edited and deleted at DM priority.
+
+        Args:
+            outbound_queue: OutboundQueue instance
+        """
+        self._outbound = outbound_queue
 
     # =========================================================================
     # Response Generation
@@ -123,6 +171,9 @@ class AshPersonalityManager:
         self,
         message: discord.Message,
         session: "AshSession",
+        channel: Optional[discord.abc.Messageable] = None,
+        received_at: Optional[float] = None,
+        content: Optional[str] = None,
     ) -> str:
         """
         Generate Ash's response to a user message.
@@ -131,18 +182,23 @@ class AshPersonalityManager:
         1. Extract user content
         2. Check for safety triggers
         3. Add user message to session history
-        4. Call Claude API
+        4. Call Claude API (streamed into channel when given)
         5. Add assistant response to history
         6. Append resources if safety triggered
 
         Args:
             message: User's Discord message
             session: Active Ash session
+            channel: Channel to post the reply in (Phase 10). When given,
+                the reply is already posted when this returns.
+            received_at: time.monotonic() when the message arrived
+            content: Text of the user turn, when several DMs were merged
+                into one (Phase 10). Defaults to message.content.
 
         Returns:
             Ash's response text (may include crisis resources)
         """
-        user_content = message.content
+        user_content = content if content is not None else message.content
 
         self._logger.debug(
             f"📝 Generating response for session {session.session_id} "
@@ -161,15 +217,33 @@ class AshPersonalityManager:
         # Add user message to conversation history
         session.add_user_message(user_content)
 
-        # Build messages for Claude API
-        messages = session.messages.copy()
+        # Build messages for Claude API (Phase 10: within the token budget)
+        messages, context = self._build_context(session)
+
+        # Phase 10: Stream into the channel as tokens arrive
+        reply = None
+        if channel is not None:
+            reply = ReplyStream(
+                channel,
+                edit_interval=self._stream_edit_interval,
+                started_at=received_at,
+                metrics_manager=self._metrics,
+                outbound_queue=self._outbound,
+            )
 
         # Generate response using Claude
         try:
-            response = await self._claude.create_message_safe(
-                system_prompt=ASH_SYSTEM_PROMPT,
-                messages=messages,
-            )
+            if reply is not None and self._stream_responses:
+                response = await self._stream_response(
+                    messages, context, reply, session.priority
+                )
+            else:
+                response = await self._claude.create_message_safe(
+                    system_prompt=ASH_SYSTEM_PROMPT,
+                    messages=messages,
+                    context=context,
+                    priority=session.priority,
+                )
         except Exception as e:
             self._logger.error(f"Error generating response: {e}")
             response = self._get_fallback_response()
@@ -181,6 +255,10 @@ class AshPersonalityManager:
         if safety_triggered:
             response = self._append_crisis_resources(response)
 
+        # Resources (and any text the stream held back) land in the final render
+        if reply is not None:
+            await reply.finish(response)
+
         self._responses_generated += 1
 
         self._logger.debug(
@@ -190,6 +268,78 @@ class AshPersonalityManager:
 
         return response
 
+    def _build_context(
+        self,
+        session: "AshSession",
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Get the messages and summary context for a Claude request.
+
+        Args:
+            session: Active Ash session
+
+        Returns:
+            Tuple of (messages, context)
+        """
+        if self._context_window is None:
+            return session.messages.copy(), None
+
+        window = self._context_window.build(session, ASH_SYSTEM_PROMPT)
+        self._logger.debug(
+            f"🪟 Session {session.session_id} request: {len(window.messages)} "
+            f"of {session.message_count} messages, ~{window.estimated_tokens} tokens"
+        )
+        return window.messages, window.context
+
+    async def _stream_response(
+        self,
+        messages: List[Dict[str, str]],
+        context: Optional[str],
+        reply: ReplyStream,
+        priority: int,
+    ) -> str:
+        """
+        Stream a Claude response into a reply.
+
+        If the stream fails before anything is visible, the response is
+        requested again without streaming; if part of it is already
+        showing, that part is kept as the response.
+
+        Args:
+            messages: Conversation history for Claude
+            context: Summary context for the system prompt
+            reply: Reply to feed streamed text into
+            priority: Claude scheduler priority class
+
+        Returns:
+            Response text
+        """
+        try:
+            async for chunk in self._claude.stream_message(
+                system_prompt=ASH_SYSTEM_PROMPT,
+                messages=messages,
+                context=context,
+                priority=priority,
+            ):
+                reply.feed(chunk)
+
+        except ClaudeAPIError as e:
+            if not reply.posted:
+                self._logger.warning(f"⚠️ Streaming failed, retrying without streaming: {e}")
+                return await self._claude.create_message_safe(
+                    system_prompt=ASH_SYSTEM_PROMPT,
+                    messages=messages,
+                    context=context,
+                    priority=priority,
+                )
+            self._logger.warning(f"⚠️ Streaming interrupted, keeping partial reply: {e}")
+
+        if not reply.text.strip():
+            return self._claude.FALLBACK_RESPONSE
+
+        self._responses_streamed += 1
+        return reply.text.strip()
+
     async def generate_response_from_text(
         self,
         text: str,
@@ -217,10 +367,13 @@ class AshPersonalityManager:
         session.add_user_message(text)
 
         # Generate response
+        messages, context = self._build_context(session)
         try:
             response = await self._claude.create_message_safe(
                 system_prompt=ASH_SYSTEM_PROMPT,
-                messages=session.messages.copy(),
+                messages=messages,
+                context=context,
+                priority=session.priority,
             )
         except Exception as e:
             self._logger.error(f"Error generating response: {e}")
@@ -459,7 +612,12 @@ class AshPersonalityManager:
         return {
             "responses_generated": self._responses_generated,
             "safety_triggers_detected": self._safety_triggers_detected,
+            "responses_streamed": self._responses_streamed,
+            "stream_responses": self._stream_responses,
             "claude_stats": self._claude.get_stats(),
+            "context_window": (
+                self._context_window.get_stats() if self._context_window else None
+            ),
         }
 
     def __repr__(self) -> str:
@@ -479,6 +637,8 @@ class AshPersonalityManager:
 def create_ash_personality_manager(
     config_manager: "ConfigManager",
     claude_client: "ClaudeClientManager",
+    metrics_manager: Optional["MetricsManager"] = None,
+    context_window_manager: Optional["ContextWindowManager"] = None,
 ) -> AshPersonalityManager:
     """
     Factory function for AshPersonalityManager.
@@ -488,6 +648,8 @@ def create_ash_personality_manager(
     Args:
         config_manager: Configuration manager
         claude_client: Claude client for API calls
+        metrics_manager: Optional metrics manager (Phase 10)
+        context_window_manager: Optional context window (Phase 10)
 
     Returns:
         Configured AshPersonalityManager instance
@@ -499,6 +661,8 @@ def create_ash_personality_manager(
     return AshPersonalityManager(
         config_manager=config_manager,
         claude_client=claude_client,
+        metrics_manager=metrics_manager,
+        context_window_manager=context_window_manager,
     )
 
 
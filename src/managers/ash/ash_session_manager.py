@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Ash Session Manager for Ash-Bot Service
 ---
-FILE VERSION: v5.0-9-3.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-9-3.0-4
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 9 - CRT Workflow Enhancements (Step 9.3)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,8 @@ RESPONSIBILITIES:
 - Route DM messages to active sessions
 - Clean up ended sessions
 - Send welcome and closing messages
+- Hold the context window position and rolling summary per session (Phase 10)
+- Assign each session a Claude scheduler priority (Phase 10)
 
 USAGE:
     from src.managers.ash import create_ash_session_manager
@@ -54,6 +56,10 @@ PHASE 9.2 INTEGRATION:
 
     # Handoff detection happens automatically on DM messages
     # Session metadata is stored when sessions start/end
+
+PHASE 10 INTEGRATION:
+    # Expire sessions at their exact deadline instead of a 30s poll
+    session_manager.set_scheduler_manager(scheduler)
 """
 
 import asyncio
@@ -65,6 +71,8 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 import discord
 
+from .claude_scheduler import PRIORITY_NAMES, PRIORITY_NORMAL, PRIORITY_URGENT
+
 if TYPE_CHECKING:
     from discord.ext import commands
     from src.managers.config_manager import ConfigManager
@@ -72,9 +80,10 @@ if TYPE_CHECKING:
     from src.managers.session.handoff_manager import HandoffManager
     from src.managers.session.notes_manager import NotesManager
     from src.managers.session.followup_manager import FollowUpManager
+    from src.managers.scheduling.scheduler_manager import SchedulerManager
 
 # Module version
-__version__ = "v5.0-9-3.0-1"
+__version__ = "v5.0-9-3.0-4"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -125,6 +134,10 @@ class AshSession:
         trigger_severity: Original crisis severity
         is_active: Whether session is active
         messages: Conversation history for Claude API
+        window_start: Index of the first message sent to Claude (Phase 10)
+        summary: Rolling summary of messages before the window (Phase 10)
+        summary_upto: Number of leading messages folded into summary (Phase 10)
+        priority: Claude scheduler priority class (Phase 10)
 
     Example:
         >>> session = AshSession(
@@ -146,6 +159,14 @@ class AshSession:
     is_active: bool = True
     messages: List[Dict[str, str]] = field(default_factory=list)
 
+    # Phase 10: Token-budgeted context window
+    window_start: int = 0
+    summary: str = ""
+    summary_upto: int = 0
+
+    # Phase 10: Claude scheduler priority class
+    priority: int = PRIORITY_NORMAL
+
     def add_message(self, role: str, content: str) -> None:
         """
         Add a message to conversation history.
@@ -194,6 +215,9 @@ class AshSession:
             "duration_seconds": self.duration_seconds,
             "idle_seconds": self.idle_seconds,
             "message_count": self.message_count,
+            "window_start": self.window_start,
+            "summarized_messages": self.summary_upto,
+            "priority": PRIORITY_NAMES.get(self.priority, "normal"),
         }
 
     def __repr__(self) -> str:
@@ -232,6 +256,10 @@ class AshSessionManager:
         ...     session = session_manager.get_session(user_id)
     """
 
+    # Phase 10: Scheduler job for session expiry
+    CLEANUP_JOB_KEY = "ash_session_cleanup"
+    EXPIRY_GRACE_SECONDS = 0.5
+
     def __init__(
         self,
         config_manager: "ConfigManager",
@@ -271,6 +299,9 @@ class AshSessionManager:
         # Phase 9.3: Follow-up manager
         self._followup_manager: Optional["FollowUpManager"] = None
 
+        # Phase 10: Deadline scheduler for session expiry
+        self._scheduler: Optional["SchedulerManager"] = None
+
         self._logger.info(
             f"🤖 AshSessionManager initialized "
             f"(timeout: {self._session_timeout}s, max: {self._max_duration}s)"
@@ -341,6 +372,22 @@ class AshSessionManager:
         self._followup_manager = followup_manager
         self._logger.debug("FollowUpManager injected into AshSessionManager")
 
+    def set_scheduler_manager(
+        self,
+        scheduler: "SchedulerManager",
+    ) -> None:
+        """
+        Set the scheduler used to expire sessions at their deadline.
+
+        Replaces the 30 second cleanup poll in DiscordManager.
+
+        Args:
+            scheduler: SchedulerManager instance
+        """
+        self._scheduler = scheduler
+        self._logger.debug("SchedulerManager injected into AshSessionManager")
+        self._schedule_cleanup()
+
     async def is_user_opted_out(self, user_id: int) -> bool:
         """
         Check if a user has opted out of Ash AI interaction.
@@ -366,6 +413,7 @@ class AshSessionManager:
         trigger_severity: str,
         trigger_message: Optional[str] = None,
         check_opt_out: bool = True,
+        priority: Optional[int] = None,
     ) -> AshSession:
         """
         Start a new Ash session with a user.
@@ -377,6 +425,8 @@ class AshSessionManager:
             trigger_severity: Original crisis severity
             trigger_message: Optional context message (not stored)
             check_opt_out: Whether to check user's opt-out preference (default: True)
+            priority: Claude scheduler priority class (Phase 10). Defaults to
+                urgent for HIGH/CRITICAL triggers, normal otherwise.
 
         Returns:
             Created AshSession
@@ -412,6 +462,14 @@ class AshSessionManager:
         session_id = str(uuid.uuid4())[:8]
         now = datetime.now(timezone.utc)
 
+        # Phase 10: Sessions from HIGH/CRITICAL alerts go first for Claude
+        if priority is None:
+            priority = (
+                PRIORITY_URGENT
+                if trigger_severity.lower() in ("high", "critical")
+                else PRIORITY_NORMAL
+            )
+
         # Create session
         session = AshSession(
             session_id=session_id,
@@ -420,6 +478,7 @@ class AshSessionManager:
             started_at=now,
             last_activity=now,
             trigger_severity=trigger_severity.lower(),
+            priority=priority,
         )
 
         # Store session
@@ -445,6 +504,8 @@ class AshSessionManager:
             except Exception as e:
                 self._logger.warning(f"Failed to store session metadata: {e}")
 
+        self._schedule_cleanup()
+
         return session
 
     def get_session(self, user_id: int) -> Optional[AshSession]:
@@ -714,6 +775,51 @@ class AshSessionManager:
 
         return len(expired)
 
+    def _seconds_until_next_expiry(self) -> Optional[float]:
+        """
+        Get seconds until the earliest active session expires.
+
+        Activity only pushes idle deadlines later, so waking at this time
+        never misses an expiry; an early wake just re-evaluates.
+
+        Returns:
+            Seconds until the next expiry, or None if no sessions are active
+        """
+        remaining = [
+            min(
+                self._session_timeout - session.idle_seconds,
+                self._max_duration - session.duration_seconds,
+            )
+            for session in self._sessions.values()
+            if session.is_active
+        ]
+        if not remaining:
+            return None
+
+        # Expiry is strictly greater-than, so land just past the deadline
+        return max(0.0, min(remaining)) + self.EXPIRY_GRACE_SECONDS
+
+    def _schedule_cleanup(self) -> None:
+        """Schedule the expiry job for the earliest session deadline."""
+        if not self._scheduler:
+            return
+
+        delay = self._seconds_until_next_expiry()
+        if delay is None:
+            return
+
+        self._scheduler.schedule(
+            self.CLEANUP_JOB_KEY,
+            self._run_cleanup_job,
+            delay=delay,
+            keep_earlier=True,
+        )
+
+    async def _run_cleanup_job(self) -> Optional[float]:
+        """Scheduled job: end expired sessions and wait for the next deadline."""
+        await self.cleanup_expired_sessions()
+        return self._seconds_until_next_expiry()
+
     def remove_session(self, user_id: int) -> bool:
         """
         Remove a session from tracking (without sending closing message).
@@ -798,6 +904,11 @@ class AshSessionManager:
     # Properties and Statistics
     # =========================================================================
 
+    @property
+    def has_scheduler(self) -> bool:
+        """Check if session expiry runs on the shared scheduler."""
+        return self._scheduler is not None
+
     @property
     def active_session_count(self) -> int:
         """Get count of active sessions."""
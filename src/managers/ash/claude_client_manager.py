@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Claude Client Manager for Ash-Bot Service
 ---
-FILE VERSION: v5.0-4-3.0-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-4-3.0-7
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 4 - Ash AI Integration
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -23,9 +23,12 @@ Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alp
 RESPONSIBILITIES:
 - Initialize Anthropic client with API key from secrets
 - Send messages to Claude API
-- Handle streaming responses (optional)
+- Handle streaming responses, recording time to first token (Phase 10)
 - Implement error handling and retries
 - Token counting and limiting
+- Mark the system prompt and conversation prefix for prompt caching (Phase 10)
+- Track prompt cache read/write tokens (Phase 10)
+- Route requests through the shared Claude scheduler by priority (Phase 10)
 
 USAGE:
     from src.managers.ash import create_claude_client_manager
@@ -42,17 +45,23 @@ USAGE:
 """
 
 import asyncio
+import contextlib
 import logging
-from typing import Any, AsyncGenerator, Dict, List, Optional, TYPE_CHECKING
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import anthropic
 
+from .claude_scheduler import PRIORITY_NORMAL
+
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
     from src.managers.secrets_manager import SecretsManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+    from .claude_scheduler import ClaudeScheduler
 
 # Module version
-__version__ = "v5.0-4-3.0-1"
+__version__ = "v5.0-4-3.0-7"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -120,6 +129,9 @@ class ClaudeClientManager:
         self,
         config_manager: "ConfigManager",
         secrets_manager: "SecretsManager",
+        metrics_manager: Optional["MetricsManager"] = None,
+        client: Optional[Any] = None,
+        scheduler: Optional["ClaudeScheduler"] = None,
     ):
         """
         Initialize ClaudeClientManager.
@@ -127,38 +139,59 @@ class ClaudeClientManager:
         Args:
             config_manager: Configuration manager for settings
             secrets_manager: Secrets manager for API key
+            metrics_manager: Optional metrics manager (Phase 10)
+            client: Pre-built AsyncAnthropic-compatible client, e.g. a
+                stub in tests (Phase 10). No API key is needed when given.
+            scheduler: Optional shared request scheduler (Phase 10)
 
         Raises:
             ClaudeConfigError: If API key is not found
         """
         self._config = config_manager
         self._secrets = secrets_manager
+        self._metrics = metrics_manager
+        self._scheduler = scheduler
         self._logger = logging.getLogger(__name__)
 
         # Load configuration
         self._model = self._config.get("ash", "model", "claude-sonnet-4-20250514")
         self._max_tokens = self._config.get("ash", "max_tokens", 500)
+        self._prompt_caching = self._config.get("ash", "prompt_caching", True)
+
+        if client is None:
+            # Get API key
+            api_key = self._secrets.get_claude_api_token()
+            if not api_key:
+                raise ClaudeConfigError(
+                    "Claude API key not found in secrets.\n"
+                    "Please create: secrets/claude_api_token\n"
+                    "See secrets/README.md for instructions"
+                )
 
-        # Get API key
-        api_key = self._secrets.get_claude_api_token()
-        if not api_key:
-            raise ClaudeConfigError(
-                "Claude API key not found in secrets.\n"
-                "Please create: secrets/claude_api_token\n"
-                "See secrets/README.md for instructions"
-            )
+            # Initialize async client (Phase 10: the scheduler owns retries,
+            # so every 429 pauses all sessions rather than one request;
+            # connection errors and 5xx are retried there too)
+            if scheduler:
+                client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+            else:
+                client = anthropic.AsyncAnthropic(api_key=api_key)
 
-        # Initialize async client
-        self._client = anthropic.AsyncAnthropic(api_key=api_key)
+        self._client = client
 
         # Statistics
         self._request_count = 0
         self._error_count = 0
         self._total_tokens_used = 0
 
+        # Phase 10: Input and prompt cache token counts
+        self._input_tokens = 0
+        self._cache_read_tokens = 0
+        self._cache_write_tokens = 0
+
         self._logger.info(
             f"🤖 ClaudeClientManager initialized "
-            f"(model: {self._model}, max_tokens: {self._max_tokens})"
+            f"(model: {self._model}, max_tokens: {self._max_tokens}, "
+            f"prompt_caching: {self._prompt_caching})"
         )
 
     # =========================================================================
@@ -170,6 +203,8 @@ class ClaudeClientManager:
         system_prompt: str,
         messages: List[Dict[str, str]],
         max_tokens: Optional[int] = None,
+        context: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
     ) -> str:
         """
         Send a message to Claude and get response.
@@ -178,6 +213,9 @@ class ClaudeClientManager:
             system_prompt: System prompt for Ash personality
             messages: Conversation history [{"role": "user/assistant", "content": "..."}]
             max_tokens: Override default max tokens (optional)
+            context: Extra system text after the cached system prompt,
+                e.g. a conversation summary (Phase 10)
+            priority: Scheduler priority class (Phase 10)
 
         Returns:
             Claude's response text
@@ -193,22 +231,31 @@ class ClaudeClientManager:
             f"(messages: {len(messages)}, max_tokens: {tokens})"
         )
 
-        try:
-            response = await self._client.messages.create(
+        estimated = self._estimate_tokens(system_prompt, messages, context)
+        system, messages = self._build_request(system_prompt, messages, context)
+
+        async def call() -> Any:
+            return await self._client.messages.create(
                 model=self._model,
                 max_tokens=tokens,
-                system=system_prompt,
+                system=system,
                 messages=messages,
             )
 
+        try:
+            if self._scheduler:
+                response = await self._scheduler.run(call, priority, estimated)
+            else:
+                response = await call()
+
+            # Track token usage
+            if hasattr(response, "usage"):
+                self._record_usage(response.usage)
+
             # Extract text from response
             if response.content and len(response.content) > 0:
                 text = response.content[0].text
 
-                # Track token usage
-                if hasattr(response, "usage"):
-                    self._total_tokens_used += response.usage.output_tokens
-
                 self._logger.debug(
                     f"📥 Received response from Claude "
                     f"(length: {len(text)} chars)"
@@ -250,6 +297,8 @@ class ClaudeClientManager:
         system_prompt: str,
         messages: List[Dict[str, str]],
         max_tokens: Optional[int] = None,
+        context: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
     ) -> str:
         """
         Send a message to Claude with fallback on error.
@@ -261,6 +310,8 @@ class ClaudeClientManager:
             system_prompt: System prompt for Ash personality
             messages: Conversation history
             max_tokens: Override default max tokens (optional)
+            context: Extra system text, e.g. a conversation summary (Phase 10)
+            priority: Scheduler priority class (Phase 10)
 
         Returns:
             Claude's response text or fallback message
@@ -270,6 +321,8 @@ class ClaudeClientManager:
                 system_prompt=system_prompt,
                 messages=messages,
                 max_tokens=max_tokens,
+                context=context,
+                priority=priority,
             )
         except ClaudeAPIError as e:
             self._logger.warning(f"Claude API failed, using fallback: {e}")
@@ -280,6 +333,8 @@ class ClaudeClientManager:
         system_prompt: str,
         messages: List[Dict[str, str]],
         max_tokens: Optional[int] = None,
+        context: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
     ) -> AsyncGenerator[str, None]:
         """
         Stream a response from Claude.
@@ -291,6 +346,9 @@ class ClaudeClientManager:
             system_prompt: System prompt
             messages: Conversation history
             max_tokens: Override default max tokens (optional)
+            context: Extra system text, e.g. a conversation summary (Phase 10)
+            priority: Scheduler priority class (Phase 10). Streams hold a
+                slot until done and are not retried.
 
         Yields:
             Response text chunks
@@ -303,23 +361,167 @@ class ClaudeClientManager:
 
         self._logger.debug(f"📤 Starting streaming response from Claude")
 
-        try:
-            async with self._client.messages.stream(
-                model=self._model,
-                max_tokens=tokens,
-                system=system_prompt,
-                messages=messages,
-            ) as stream:
-                async for text in stream.text_stream:
-                    yield text
+        estimated = self._estimate_tokens(system_prompt, messages, context)
+        system, messages = self._build_request(system_prompt, messages, context)
 
-            self._logger.debug("📥 Streaming response complete")
+        if self._scheduler:
+            slot = self._scheduler.slot(priority, estimated)
+        else:
+            slot = contextlib.nullcontext()
+
+        try:
+            async with slot:
+                # Time to first token counts from admission, not queueing
+                started = time.monotonic()
+                first_token_seconds = None
+
+                async with self._client.messages.stream(
+                    model=self._model,
+                    max_tokens=tokens,
+                    system=system,
+                    messages=messages,
+                ) as stream:
+                    async for text in stream.text_stream:
+                        # Phase 10: Time to first token
+                        if first_token_seconds is None and text:
+                            first_token_seconds = time.monotonic() - started
+                            if self._metrics:
+                                self._metrics.observe_claude_first_token(first_token_seconds)
+                        yield text
+
+                    # Track token usage
+                    final_message = await stream.get_final_message()
+                    if hasattr(final_message, "usage"):
+                        self._record_usage(final_message.usage)
+
+            self._logger.debug(
+                f"📥 Streaming response complete "
+                f"(first token: {first_token_seconds or 0:.2f}s, "
+                f"total: {time.monotonic() - started:.2f}s)"
+            )
 
         except anthropic.APIError as e:
             self._error_count += 1
             self._logger.error(f"Claude streaming error: {e}")
             raise ClaudeAPIError(f"Streaming failed: {e}", e)
 
+    # =========================================================================
+    # Prompt Caching (Phase 10)
+    # =========================================================================
+
+    def _build_request(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, Any]],
+        context: Optional[str] = None,
+    ) -> Tuple[Any, List[Dict[str, Any]]]:
+        """
+        Add prompt cache breakpoints to a request.
+
+        The system prompt is identical for every Ash request, and each
+        turn's request starts with the previous turn's messages, so two
+        breakpoints cover the stable part:
+        - the system prompt
+        - the newest message, which makes the whole conversation so far
+          a prefix the next turn reads back from cache
+
+        Prefixes shorter than the model's minimum cacheable length are
+        simply not cached by the API. Context goes after the system prompt
+        breakpoint, so changing it leaves the system prompt cached.
+
+        Args:
+            system_prompt: System prompt
+            messages: Conversation history (not modified)
+            context: Extra system text (optional)
+
+        Returns:
+            Tuple of (system, messages) for the API call
+        """
+        if not self._prompt_caching:
+            if context:
+                return f"{system_prompt}\n\n{context}", messages
+            return system_prompt, messages
+
+        system = [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        if context:
+            system.append({"type": "text", "text": context})
+
+        if not messages:
+            return system, messages
+
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            blocks = [{"type": "text", "text": content}]
+        else:
+            blocks = [dict(block) for block in content]
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+
+        return system, messages[:-1] + [{"role": last["role"], "content": blocks}]
+
+    def _estimate_tokens(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, Any]],
+        context: Optional[str],
+    ) -> int:
+        """
+        Estimate input tokens of a request for the scheduler's budget.
+
+        Args:
+            system_prompt: System prompt
+            messages: Conversation history
+            context: Extra system text (optional)
+
+        Returns:
+            Estimated input tokens (0 without a scheduler)
+        """
+        if not self._scheduler:
+            return 0
+
+        # Imported here: context_window_manager imports this module
+        from .context_window_manager import estimate_message_tokens, estimate_tokens
+
+        return (
+            estimate_tokens(system_prompt)
+            + (estimate_tokens(context) if context else 0)
+            + sum(estimate_message_tokens(message) for message in messages)
+        )
+
+    def _record_usage(self, usage: Any) -> None:
+        """
+        Record token usage from a response's usage block.
+
+        Args:
+            usage: Anthropic usage object
+        """
+        output_tokens = getattr(usage, "output_tokens", 0) or 0
+        input_tokens = getattr(usage, "input_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+
+        self._total_tokens_used += output_tokens
+        self._input_tokens += input_tokens
+        self._cache_read_tokens += cache_read
+        self._cache_write_tokens += cache_write
+
+        if self._metrics:
+            self._metrics.inc_claude_tokens("output", output_tokens)
+            self._metrics.inc_claude_tokens("input", input_tokens)
+            self._metrics.inc_claude_tokens("cache_read", cache_read)
+            self._metrics.inc_claude_tokens("cache_write", cache_write)
+
+        self._logger.debug(
+            f"🧮 Claude usage: input={input_tokens}, output={output_tokens}, "
+            f"cache_read={cache_read}, cache_write={cache_write}"
+        )
+
     async def health_check(self) -> bool:
         """
         Check if Claude API is accessible.
@@ -380,12 +582,19 @@ class ClaudeClientManager:
         """Get total tokens used across all requests."""
         return self._total_tokens_used
 
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Get share of prompt tokens read from the prompt cache."""
+        prompt_tokens = self._input_tokens + self._cache_read_tokens + self._cache_write_tokens
+        return self._cache_read_tokens / prompt_tokens if prompt_tokens else 0.0
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get client statistics.
 
         Returns:
             Dictionary with request count, error count, tokens used
+            and prompt cache usage
         """
         return {
             "model": self._model,
@@ -393,6 +602,12 @@ class ClaudeClientManager:
             "request_count": self._request_count,
             "error_count": self._error_count,
             "total_tokens_used": self._total_tokens_used,
+            "prompt_caching": self._prompt_caching,
+            "input_tokens": self._input_tokens,
+            "cache_read_tokens": self._cache_read_tokens,
+            "cache_write_tokens": self._cache_write_tokens,
+            "cache_hit_ratio": round(self.cache_hit_ratio, 3),
+            "scheduler": self._scheduler.get_status() if self._scheduler else None,
             "error_rate": (
                 self._error_count / self._request_count
                 if self._request_count > 0
@@ -418,6 +633,9 @@ class ClaudeClientManager:
 def create_claude_client_manager(
     config_manager: "ConfigManager",
     secrets_manager: "SecretsManager",
+    metrics_manager: Optional["MetricsManager"] = None,
+    scheduler: Optional["ClaudeScheduler"] = None,
+    client: Optional[Any] = None,
 ) -> ClaudeClientManager:
     """
     Factory function for ClaudeClientManager.
@@ -427,6 +645,10 @@ def create_claude_client_manager(
     Args:
         config_manager: Configuration manager
         secrets_manager: Secrets manager for API key
+        metrics_manager: Optional metrics manager (Phase 10)
+        scheduler: Optional shared request scheduler (Phase 10)
+        client: Optional pre-built AsyncAnthropic-compatible client
+            (e.g. a stub in tests)
 
     Returns:
         Configured ClaudeClientManager instance
@@ -441,6 +663,9 @@ def create_claude_client_manager(
     return ClaudeClientManager(
         config_manager=config_manager,
         secrets_manager=secrets_manager,
+        metrics_manager=metrics_manager,
+        client=client,
+        scheduler=scheduler,
     )
 
 
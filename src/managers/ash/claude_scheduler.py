@@ -0,0 +1,624 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Claude Request Scheduler for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-25.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Cap concurrent Claude requests across all Ash sessions
+- Serve waiting requests strictly by priority class
+- Keep estimated input tokens within a per-minute budget
+- Pause all requests for Retry-After on 429/529 responses and retry
+- Retry connection errors, timeouts and 5xx responses with a backoff of
+  their own (the Anthropic client is created without SDK retries)
+- Report queueing delay per priority and retry counts
+
+PRIORITY CLASSES (highest first):
+    urgent:     sessions from HIGH/CRITICAL alerts and auto-initiated sessions
+    normal:     other Ash sessions
+    followup:   follow-up check-in mini-sessions
+    background: rolling conversation summaries
+
+    One slot is held back for urgent requests, so a surge of lower
+    priority conversations cannot occupy every slot.
+
+USAGE:
+    from src.managers.ash import create_claude_scheduler
+    from src.managers.ash.claude_scheduler import PRIORITY_URGENT
+
+    scheduler = create_claude_scheduler(config_manager, metrics_manager)
+
+    response = await scheduler.run(
+        lambda: client.messages.create(...),
+        priority=PRIORITY_URGENT,
+        estimated_tokens=1800,
+    )
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
+
+import anthropic
+
+from src.utils.retry import RetryConfig, calculate_delay
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+
+# Module version
+__version__ = "v5.0-10-25.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Priority classes, lower value is served first
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 1
+PRIORITY_FOLLOWUP = 2
+PRIORITY_BACKGROUND = 3
+
+PRIORITY_NAMES: Dict[int, str] = {
+    PRIORITY_URGENT: "urgent",
+    PRIORITY_NORMAL: "normal",
+    PRIORITY_FOLLOWUP: "followup",
+    PRIORITY_BACKGROUND: "background",
+}
+
+# Responses worth retrying: rate limited, overloaded
+RETRYABLE_STATUS: Dict[int, str] = {
+    429: "rate_limited",
+    529: "overloaded",
+}
+
+# Transient failures of a single request, retried without pausing others
+# (any other 5xx is retried as server_error)
+TRANSIENT_STATUS: Dict[int, str] = {
+    408: "timeout",
+    409: "conflict",
+}
+
+# Window for the tokens-per-minute budget
+TOKEN_WINDOW_SECONDS = 60.0
+
+
+# =============================================================================
+# Waiter
+# =============================================================================
+
+
+@dataclass
+class ClaudeWaiter:
+    """
+    A Claude request waiting for a slot.
+
+    Attributes:
+        priority: Priority class (PRIORITY_*)
+        tokens: Estimated input tokens
+        future: Resolved when the request may start
+        enqueued_at: Monotonic timestamp when the request was queued
+    """
+
+    priority: int
+    tokens: int
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+# =============================================================================
+# Claude Scheduler
+# =============================================================================
+
+
+class ClaudeScheduler:
+    """
+    Admission control for Claude API requests.
+
+    A request starts when a slot is free, the global Retry-After pause
+    has passed and the per-minute token budget has room for its
+    estimate; otherwise it waits behind higher priorities. There is no
+    background task: waiting requests are admitted whenever a slot is
+    released, and a timer wakes the queue when a pause or the token
+    window ends.
+
+    Example:
+        >>> scheduler = ClaudeScheduler(max_concurrent=4, tokens_per_minute=40000)
+        >>> text = await scheduler.run(call, PRIORITY_NORMAL, estimated_tokens=900)
+    """
+
+    DEFAULT_MAX_CONCURRENT = 4
+    DEFAULT_TOKENS_PER_MINUTE = 40000
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_MAX_BACKOFF_SECONDS = 30.0
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize ClaudeScheduler.
+
+        Args:
+            max_concurrent: Max concurrent Claude requests
+            tokens_per_minute: Estimated input tokens allowed per minute
+                (0 = unlimited)
+            max_retries: Retries of a request after 429/529 responses or
+                transient failures
+            max_backoff_seconds: Longest pause without a Retry-After header
+            metrics_manager: Optional metrics manager
+        """
+        self._max_concurrent = max(1, int(max_concurrent))
+        # Slots usable by anything below urgent
+        self._shared_slots = max(1, self._max_concurrent - 1)
+        self._tokens_per_minute = max(0, int(tokens_per_minute))
+        self._max_retries = max(0, int(max_retries))
+        self._backoff = RetryConfig(
+            base_delay=1.0,
+            max_delay=max(1.0, float(max_backoff_seconds)),
+        )
+        self._metrics = metrics_manager
+
+        self._queues: Dict[int, Deque[ClaudeWaiter]] = {
+            priority: deque() for priority in PRIORITY_NAMES
+        }
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._token_log: Deque[Tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Statistics
+        self._started = 0
+        self._retried = 0
+        self._max_delay: Dict[str, float] = {
+            name: 0.0 for name in PRIORITY_NAMES.values()
+        }
+
+        logger.info(
+            f"✅ ClaudeScheduler initialized "
+            f"(concurrent={self._max_concurrent}, "
+            f"tokens_per_minute={self._tokens_per_minute or 'unlimited'}, "
+            f"retries={self._max_retries})"
+        )
+
+    # =========================================================================
+    # Requests
+    # =========================================================================
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        priority: int = PRIORITY_NORMAL,
+        estimated_tokens: int = 0,
+    ) -> T:
+        """
+        Run a Claude request when admitted, retrying retryable failures.
+
+        429/529 responses pause every request for the Retry-After.
+        Connection errors, timeouts and other 5xx responses only back off
+        this request, outside its slot.
+
+        Args:
+            call: Zero-argument coroutine function performing the request
+            priority: Priority class (PRIORITY_*)
+            estimated_tokens: Estimated input tokens
+
+        Returns:
+            Whatever the call returns
+
+        Raises:
+            Whatever the call raises (after retries are exhausted)
+        """
+        attempt = 0
+        while True:
+            await self._acquire(priority, estimated_tokens)
+            try:
+                return await call()
+            except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+                if attempt >= self._max_retries:
+                    raise
+                delay = 0.0 if self._pause_for(e, attempt) else self._backoff_for(e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                self._retried += 1
+            finally:
+                self._release()
+
+            if delay:
+                await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: int = PRIORITY_NORMAL,
+        estimated_tokens: int = 0,
+    ) -> AsyncIterator[None]:
+        """
+        Hold a slot for a request that cannot be retried (e.g. a stream).
+
+        A 429/529 raised inside still pauses other requests.
+
+        Args:
+            priority: Priority class (PRIORITY_*)
+            estimated_tokens: Estimated input tokens
+        """
+        await self._acquire(priority, estimated_tokens)
+        try:
+            yield
+        except anthropic.APIStatusError as e:
+            self._pause_for(e, 0)
+            raise
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int, tokens: int) -> None:
+        """
+        Wait until a request may start.
+
+        Args:
+            priority: Priority class (PRIORITY_*)
+            tokens: Estimated input tokens
+        """
+        if priority not in self._queues:
+            priority = PRIORITY_NORMAL
+
+        waiter = ClaudeWaiter(
+            priority=priority,
+            tokens=max(0, int(tokens)),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._queues[priority].append(waiter)
+        self._admit()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the caller gave up
+                self._release()
+            elif waiter in self._queues[priority]:
+                self._queues[priority].remove(waiter)
+            raise
+
+        delay = time.monotonic() - waiter.enqueued_at
+        name = PRIORITY_NAMES[priority]
+        self._max_delay[name] = max(self._max_delay[name], delay)
+        if self._metrics:
+            self._metrics.observe_claude_queue_delay(name, delay)
+            self._metrics.set_claude_requests_in_flight(self._in_flight)
+
+    def _release(self) -> None:
+        """Free a slot and admit whoever is next."""
+        self._in_flight -= 1
+        if self._metrics:
+            self._metrics.set_claude_requests_in_flight(self._in_flight)
+        self._admit()
+
+    def _admit(self) -> None:
+        """Start waiting requests, highest priority first, while allowed."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        while True:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+
+            limit = (
+                self._max_concurrent
+                if waiter.priority == PRIORITY_URGENT
+                else self._shared_slots
+            )
+            if self._in_flight >= limit:
+                return
+
+            now = time.monotonic()
+            ready_at = max(self._paused_until, self._budget_ready_at(now, waiter.tokens))
+            if ready_at > now:
+                self._timer = asyncio.get_running_loop().call_later(
+                    ready_at - now, self._admit
+                )
+                return
+
+            self._queues[waiter.priority].popleft()
+            self._in_flight += 1
+            self._started += 1
+            if waiter.tokens and self._tokens_per_minute:
+                self._token_log.append((now, waiter.tokens))
+                self._tokens_in_window += waiter.tokens
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> Optional[ClaudeWaiter]:
+        """Get the highest-priority waiting request, dropping cancelled ones."""
+        for queue in self._queues.values():
+            while queue and queue[0].future.done():
+                queue.popleft()
+            if queue:
+                return queue[0]
+        return None
+
+    def _budget_ready_at(self, now: float, tokens: int) -> float:
+        """
+        Get when the token budget has room for a request.
+
+        A request larger than the whole budget still runs once the
+        window is empty.
+
+        Args:
+            now: Current monotonic time
+            tokens: Estimated input tokens of the request
+
+        Returns:
+            Monotonic time the request fits (now if it already does)
+        """
+        if not self._tokens_per_minute:
+            return now
+
+        while self._token_log and self._token_log[0][0] <= now - TOKEN_WINDOW_SECONDS:
+            self._tokens_in_window -= self._token_log.popleft()[1]
+
+        excess = self._tokens_in_window + tokens - self._tokens_per_minute
+        if excess <= 0 or not self._token_log:
+            return now
+
+        freed = 0
+        for started_at, used in self._token_log:
+            freed += used
+            if freed >= excess:
+                return started_at + TOKEN_WINDOW_SECONDS
+        return self._token_log[-1][0] + TOKEN_WINDOW_SECONDS
+
+    # =========================================================================
+    # Backoff
+    # =========================================================================
+
+    def _pause_for(self, error: "anthropic.APIError", attempt: int) -> bool:
+        """
+        Pause all requests after a rate limit or overload response.
+
+        Uses the Retry-After header when present, exponential backoff
+        otherwise.
+
+        Args:
+            error: API error from Claude
+            attempt: Retries of this request so far
+
+        Returns:
+            True if the error is retryable
+        """
+        reason = RETRYABLE_STATUS.get(getattr(error, "status_code", None))
+        if reason is None:
+            return False
+
+        delay = _retry_after(error)
+        if delay is None:
+            delay = calculate_delay(attempt, self._backoff)
+
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+        if self._metrics:
+            self._metrics.inc_claude_retries(reason)
+
+        logger.warning(
+            f"⏳ Claude {reason} ({error.status_code}), "
+            f"pausing requests for {delay:.1f}s"
+        )
+        return True
+
+    def _backoff_for(self, error: "anthropic.APIError", attempt: int) -> Optional[float]:
+        """
+        Get the backoff before retrying a request after a transient failure.
+
+        Args:
+            error: API error from Claude
+            attempt: Retries of this request so far
+
+        Returns:
+            Seconds to wait, or None if the error is not retryable
+        """
+        reason = _transient_reason(error)
+        if reason is None:
+            return None
+
+        delay = calculate_delay(attempt, self._backoff)
+
+        if self._metrics:
+            self._metrics.inc_claude_retries(reason)
+
+        logger.warning(f"⚠️ Claude {reason} ({error}), retrying in {delay:.1f}s")
+        return delay
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def depth(self) -> int:
+        """Get number of waiting requests."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def in_flight(self) -> int:
+        """Get number of running requests."""
+        return self._in_flight
+
+    @property
+    def is_paused(self) -> bool:
+        """Check if requests are held for a Retry-After."""
+        return time.monotonic() < self._paused_until
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> dict:
+        """
+        Get Claude scheduler status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "max_concurrent": self._max_concurrent,
+            "in_flight": self._in_flight,
+            "depth": self.depth,
+            "depth_by_priority": {
+                PRIORITY_NAMES[p]: len(q) for p, q in self._queues.items()
+            },
+            "tokens_per_minute": self._tokens_per_minute,
+            "tokens_in_window": self._tokens_in_window,
+            "paused_seconds": round(max(0.0, self._paused_until - time.monotonic()), 3),
+            "started": self._started,
+            "retried": self._retried,
+            "max_queue_delay_seconds": {
+                name: round(delay, 3) for name, delay in self._max_delay.items()
+            },
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"ClaudeScheduler(depth={self.depth}, in_flight={self._in_flight}/"
+            f"{self._max_concurrent}, retried={self._retried})"
+        )
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _transient_reason(error: Exception) -> Optional[str]:
+    """Get why a failure is worth retrying on its own, or None."""
+    if isinstance(error, anthropic.APITimeoutError):
+        return "timeout"
+    if isinstance(error, anthropic.APIConnectionError):
+        return "connection_error"
+
+    status = getattr(error, "status_code", None)
+    if status in TRANSIENT_STATUS:
+        return TRANSIENT_STATUS[status]
+    if isinstance(status, int) and status >= 500 and status not in RETRYABLE_STATUS:
+        return "server_error"
+    return None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Get Retry-After seconds from an API error, if it has the header."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_claude_scheduler(
+    config_manager: "ConfigManager",
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> Optional[ClaudeScheduler]:
+    """
+    Factory function for ClaudeScheduler.
+
+    Creates a ClaudeScheduler configured from the claude_scheduler section.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        metrics_manager: Optional metrics manager
+
+    Returns:
+        Configured ClaudeScheduler, or None if disabled
+
+    Example:
+        >>> scheduler = create_claude_scheduler(config, metrics)
+        >>> claude = create_claude_client_manager(config, secrets, metrics, scheduler)
+    """
+    logger.info("🏭 Creating ClaudeScheduler")
+
+    if not config_manager.get("claude_scheduler", "enabled", True):
+        logger.info("⏭️ Claude scheduler disabled, requests go straight to the API")
+        return None
+
+    return ClaudeScheduler(
+        max_concurrent=config_manager.get(
+            "claude_scheduler", "max_concurrent", ClaudeScheduler.DEFAULT_MAX_CONCURRENT
+        ),
+        tokens_per_minute=config_manager.get(
+            "claude_scheduler",
+            "tokens_per_minute",
+            ClaudeScheduler.DEFAULT_TOKENS_PER_MINUTE,
+        ),
+        max_retries=config_manager.get(
+            "claude_scheduler", "max_retries", ClaudeScheduler.DEFAULT_MAX_RETRIES
+        ),
+        max_backoff_seconds=config_manager.get(
+            "claude_scheduler",
+            "max_backoff_seconds",
+            ClaudeScheduler.DEFAULT_MAX_BACKOFF_SECONDS,
+        ),
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "ClaudeScheduler",
+    "create_claude_scheduler",
+    "PRIORITY_URGENT",
+    "PRIORITY_NORMAL",
+    "PRIORITY_FOLLOWUP",
+    "PRIORITY_BACKGROUND",
+    "PRIORITY_NAMES",
+]
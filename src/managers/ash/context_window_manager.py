@@ -0,0 +1,460 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Context Window Manager for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-23.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Estimate tokens per conversation message
+- Keep the most recent turns of an Ash session within a token budget
+- Fold turns that leave the window into a rolling summary, in the background
+- Export the estimated prompt size of each Claude request
+
+USAGE:
+    from src.managers.ash import create_context_window_manager
+
+    context_window = create_context_window_manager(
+        config_manager=config_manager,
+        claude_client=claude_client,
+        metrics_manager=metrics_manager,
+    )
+
+    window = context_window.build(session, ASH_SYSTEM_PROMPT)
+    response = await claude_client.create_message(
+        system_prompt=ASH_SYSTEM_PROMPT,
+        messages=window.messages,
+        context=window.context,
+    )
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from src.prompts import SUMMARY_SYSTEM_PROMPT, SUMMARY_CONTEXT_TEMPLATE
+
+from .claude_client_manager import ClaudeAPIError
+from .claude_scheduler import PRIORITY_BACKGROUND
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+    from .claude_client_manager import ClaudeClientManager
+    from .ash_session_manager import AshSession
+
+# Module version
+__version__ = "v5.0-10-23.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Token Estimation
+# =============================================================================
+
+# Rough characters per token for English text
+CHARS_PER_TOKEN = 4
+
+# Role and formatting tokens added per message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text.
+
+    A character-based heuristic: cheap enough to run on every message,
+    and close enough for budgeting.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated tokens
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def estimate_message_tokens(message: Dict[str, Any]) -> int:
+    """
+    Estimate the token count of one conversation message.
+
+    Args:
+        message: Message dict with role and content
+
+    Returns:
+        Estimated tokens, including per-message overhead
+    """
+    content = message.get("content", "")
+    if not isinstance(content, str):
+        content = "".join(block.get("text", "") for block in content)
+    return estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+
+
+# =============================================================================
+# Context Window
+# =============================================================================
+
+
+@dataclass
+class ContextWindow:
+    """
+    Conversation context for one Claude request.
+
+    Attributes:
+        messages: Recent messages sent verbatim
+        context: Rolling summary for the system prompt (None if none yet)
+        estimated_tokens: Estimated prompt size (system, summary, messages)
+    """
+
+    messages: List[Dict[str, str]]
+    context: Optional[str]
+    estimated_tokens: int
+
+
+class ContextWindowManager:
+    """
+    Keeps Ash requests within a token budget.
+
+    The window over a session's messages only moves when the recent
+    turns exceed the budget, and then drops to about half of it, so the
+    request prefix stays the same for several turns and keeps hitting
+    the prompt cache. Turns that leave the window are summarized by a
+    background Claude call; the reply never waits for it, and until it
+    lands those turns are simply left out.
+
+    Example:
+        >>> window = context_window.build(session, ASH_SYSTEM_PROMPT)
+        >>> len(window.messages), window.estimated_tokens
+        (6, 1840)
+    """
+
+    DEFAULT_TOKEN_BUDGET = 3000
+    DEFAULT_MIN_RECENT_MESSAGES = 6
+    DEFAULT_SUMMARY_MAX_TOKENS = 300
+
+    # Share of the budget kept when the window moves
+    SLIDE_TARGET_FRACTION = 0.5
+
+    def __init__(
+        self,
+        claude_client: "ClaudeClientManager",
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        min_recent_messages: int = DEFAULT_MIN_RECENT_MESSAGES,
+        summary_enabled: bool = True,
+        summary_max_tokens: int = DEFAULT_SUMMARY_MAX_TOKENS,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize ContextWindowManager.
+
+        Args:
+            claude_client: Claude client for summary requests
+            token_budget: Estimated tokens allowed for conversation history
+            min_recent_messages: Messages always kept verbatim
+            summary_enabled: Summarize turns that leave the window
+            summary_max_tokens: Maximum tokens per summary
+            metrics_manager: Optional metrics manager
+        """
+        self._claude = claude_client
+        self._token_budget = max(100, int(token_budget))
+        self._min_recent = max(1, int(min_recent_messages))
+        self._summary_enabled = summary_enabled
+        self._summary_max_tokens = int(summary_max_tokens)
+        self._metrics = metrics_manager
+
+        # Background summaries by session ID
+        self._summary_tasks: Dict[str, asyncio.Task] = {}
+
+        # Statistics
+        self._windows_built = 0
+        self._window_slides = 0
+        self._summaries_completed = 0
+        self._summaries_failed = 0
+
+        logger.info(
+            f"🪟 ContextWindowManager initialized "
+            f"(budget: {self._token_budget} tokens, "
+            f"min recent: {self._min_recent}, summary: {self._summary_enabled})"
+        )
+
+    # =========================================================================
+    # Window Building
+    # =========================================================================
+
+    def build(self, session: "AshSession", system_prompt: str) -> ContextWindow:
+        """
+        Build the context for the next Claude request of a session.
+
+        Moves the session's window forward if the recent turns exceed the
+        budget, and starts a background summary for turns that left it.
+
+        Args:
+            session: Ash session (its last message is the new user turn)
+            system_prompt: System prompt, for the token estimate
+
+        Returns:
+            ContextWindow for the request
+        """
+        messages = session.messages
+        start = min(session.window_start, len(messages))
+        costs = [estimate_message_tokens(message) for message in messages[start:]]
+
+        if sum(costs) > self._token_budget:
+            new_start = self._slide(session, costs)
+            costs = costs[new_start - start:]
+            start = session.window_start = new_start
+
+        if self._summary_enabled and session.summary_upto < session.window_start:
+            self._schedule_summary(session)
+
+        context = None
+        if session.summary:
+            context = SUMMARY_CONTEXT_TEMPLATE.format(summary=session.summary)
+
+        estimated = (
+            estimate_tokens(system_prompt)
+            + (estimate_tokens(context) if context else 0)
+            + sum(costs)
+        )
+
+        self._windows_built += 1
+        if self._metrics:
+            self._metrics.observe_claude_request_tokens(estimated)
+
+        return ContextWindow(
+            messages=list(messages[start:]),
+            context=context,
+            estimated_tokens=estimated,
+        )
+
+    def _slide(self, session: "AshSession", costs: List[int]) -> int:
+        """
+        Find the new window start for an over-budget session.
+
+        Keeps the newest messages that fit in SLIDE_TARGET_FRACTION of the
+        budget (never fewer than min_recent_messages), starting on a user
+        message as the Claude API requires.
+
+        Args:
+            session: Ash session
+            costs: Estimated tokens of each message in the current window
+
+        Returns:
+            Index of the new first message
+        """
+        messages = session.messages
+        target = self._token_budget * self.SLIDE_TARGET_FRACTION
+
+        kept = 0
+        total = 0
+        for cost in reversed(costs):
+            if kept >= self._min_recent and total + cost > target:
+                break
+            total += cost
+            kept += 1
+
+        start = len(messages) - kept
+        while start < len(messages) - 1 and messages[start]["role"] != "user":
+            start += 1
+
+        self._window_slides += 1
+        logger.debug(
+            f"🪟 Context window for session {session.session_id} moved "
+            f"{session.window_start} → {start} ({len(messages)} messages)"
+        )
+
+        return start
+
+    # =========================================================================
+    # Rolling Summary
+    # =========================================================================
+
+    def _schedule_summary(self, session: "AshSession") -> None:
+        """Start a background summary for the session unless one is running."""
+        if session.session_id in self._summary_tasks:
+            return
+
+        self._summary_tasks[session.session_id] = asyncio.create_task(
+            self._summarize(session, session.window_start),
+            name=f"ash-summary-{session.session_id}",
+        )
+
+    async def _summarize(self, session: "AshSession", upto: int) -> None:
+        """
+        Fold messages before upto into the session's rolling summary.
+
+        Failures only log: the turns stay out of the window, and the
+        next request retries.
+
+        Args:
+            session: Ash session
+            upto: Index of the first message to leave unsummarized
+        """
+        try:
+            folded = session.messages[session.summary_upto:upto]
+            transcript = "\n".join(
+                f"{'Ash' if message['role'] == 'assistant' else 'User'}: {message['content']}"
+                for message in folded
+            )
+            request = f"New messages:\n{transcript}"
+            if session.summary:
+                request = f"Summary so far:\n{session.summary}\n\n{request}"
+
+            summary = await self._claude.create_message(
+                system_prompt=SUMMARY_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": request}],
+                max_tokens=self._summary_max_tokens,
+                priority=PRIORITY_BACKGROUND,
+            )
+            if summary == self._claude.FALLBACK_RESPONSE:
+                raise ClaudeAPIError("Empty summary response")
+
+            session.summary = summary.strip()
+            session.summary_upto = upto
+
+            self._summaries_completed += 1
+            if self._metrics:
+                self._metrics.inc_context_summaries("completed")
+
+            logger.debug(
+                f"📝 Session {session.session_id} summary now covers "
+                f"{upto} messages ({estimate_tokens(session.summary)} tokens)"
+            )
+
+        except ClaudeAPIError as e:
+            self._summaries_failed += 1
+            if self._metrics:
+                self._metrics.inc_context_summaries("failed")
+            logger.warning(f"⚠️ Summary for session {session.session_id} failed: {e}")
+
+        finally:
+            self._summary_tasks.pop(session.session_id, None)
+
+    async def close(self) -> None:
+        """Cancel background summaries."""
+        tasks = list(self._summary_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._summary_tasks.clear()
+
+    # =========================================================================
+    # Properties and Statistics
+    # =========================================================================
+
+    @property
+    def token_budget(self) -> int:
+        """Get the conversation history token budget."""
+        return self._token_budget
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get context window statistics.
+
+        Returns:
+            Dictionary with window and summary statistics
+        """
+        return {
+            "token_budget": self._token_budget,
+            "min_recent_messages": self._min_recent,
+            "summary_enabled": self._summary_enabled,
+            "windows_built": self._windows_built,
+            "window_slides": self._window_slides,
+            "summaries_completed": self._summaries_completed,
+            "summaries_failed": self._summaries_failed,
+            "summaries_pending": len(self._summary_tasks),
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"ContextWindowManager("
+            f"budget={self._token_budget}, "
+            f"slides={self._window_slides}, "
+            f"summaries={self._summaries_completed})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_context_window_manager(
+    config_manager: "ConfigManager",
+    claude_client: "ClaudeClientManager",
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> Optional[ContextWindowManager]:
+    """
+    Factory function for ContextWindowManager.
+
+    Creates a ContextWindowManager configured from the ash section.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager
+        claude_client: Claude client for summary requests
+        metrics_manager: Optional metrics manager
+
+    Returns:
+        Configured ContextWindowManager, or None if disabled
+
+    Example:
+        >>> context_window = create_context_window_manager(config, claude, metrics)
+    """
+    logger.info("🏭 Creating ContextWindowManager")
+
+    if not config_manager.get("ash", "context_window_enabled", True):
+        logger.info("⏭️ Context window disabled, sending full session history")
+        return None
+
+    return ContextWindowManager(
+        claude_client=claude_client,
+        token_budget=config_manager.get(
+            "ash", "context_token_budget", ContextWindowManager.DEFAULT_TOKEN_BUDGET
+        ),
+        min_recent_messages=config_manager.get(
+            "ash",
+            "context_min_recent_messages",
+            ContextWindowManager.DEFAULT_MIN_RECENT_MESSAGES,
+        ),
+        summary_enabled=config_manager.get("ash", "context_summary_enabled", True),
+        summary_max_tokens=config_manager.get(
+            "ash",
+            "context_summary_max_tokens",
+            ContextWindowManager.DEFAULT_SUMMARY_MAX_TOKENS,
+        ),
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "ContextWindow",
+    "ContextWindowManager",
+    "create_context_window_manager",
+    "estimate_tokens",
+    "estimate_message_tokens",
+]
@@ -0,0 +1,358 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Reply Stream for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-21.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Post the first sentence of a streamed Ash reply as soon as it arrives
+- Grow the reply with coalesced edits, at most one per edit interval
+- Split replies at Discord's 2000-character message limit
+- Send, edit and delete through the outbound queue at DM priority, so
+  streamed replies share the per-channel rate-limit budget
+- Record time from the user's DM to the first visible reply text
+
+USAGE:
+    from src.managers.ash.reply_stream import ReplyStream
+
+    reply = ReplyStream(channel, edit_interval=1.0, outbound_queue=outbound_queue)
+    async for chunk in claude.stream_message(prompt, messages):
+        reply.feed(chunk)
+    await reply.finish(reply.text + resources)
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import List, Optional, TYPE_CHECKING
+
+import discord
+
+from src.managers.discord.outbound_queue import (
+    PRIORITY_DM,
+    ROUTE_DM,
+    delete_message,
+    edit_message,
+    send_message,
+)
+
+if TYPE_CHECKING:
+    from src.managers.discord.outbound_queue import OutboundQueue
+    from src.managers.metrics.metrics_manager import MetricsManager
+
+# Module version
+__version__ = "v5.0-10-21.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Discord's maximum message length
+DISCORD_MESSAGE_LIMIT = 2000
+
+# End of a sentence: punctuation (plus closing quotes/brackets) then
+# whitespace, or a line break
+_SENTENCE_END = re.compile(r"[.!?…][\"')\]]*\s|\n")
+
+# Post without waiting for a sentence end once this much text is pending
+FIRST_POST_MAX_CHARS = 160
+
+# Break points tried when splitting, best first
+_SPLIT_SEPARATORS = ("\n\n", "\n", ". ", " ")
+
+
+# =============================================================================
+# Splitting
+# =============================================================================
+
+
+def split_message(text: str, limit: int = DISCORD_MESSAGE_LIMIT) -> List[str]:
+    """
+    Split text into chunks that fit in one Discord message each.
+
+    Breaks at paragraph, line, sentence or word boundaries in the second
+    half of the limit, and hard-cuts only text without any of them.
+
+    Args:
+        text: Text to split
+        limit: Maximum characters per chunk
+
+    Returns:
+        List of chunks (empty if text is blank)
+    """
+    chunks: List[str] = []
+    remaining = text.strip()
+
+    while len(remaining) > limit:
+        cut = -1
+        for separator in _SPLIT_SEPARATORS:
+            index = remaining.rfind(separator, limit // 2, limit)
+            if index != -1:
+                cut = index + len(separator.rstrip())
+                break
+        if cut <= 0:
+            cut = limit
+
+        chunks.append(remaining[:cut].rstrip())
+        remaining = remaining[cut:].lstrip()
+
+    if remaining:
+        chunks.append(remaining)
+
+    return chunks
+
+
+# =============================================================================
+# Reply Stream
+# =============================================================================
+
+
+class ReplyStream:
+    """
+    Progressive Discord reply for a streamed response.
+
+    feed() only buffers text; a background task posts the first
+    sentence immediately and then renders the growing text into the
+    posted message(s) no more than once per edit_interval, so bursts of
+    tokens become a single edit. finish() renders the final text.
+
+    Only whole words are shown while streaming, and each message holds
+    at most max_length characters; longer replies continue in new
+    messages.
+
+    Example:
+        >>> reply = ReplyStream(channel)
+        >>> reply.feed("Hi there. ")
+        >>> await reply.finish("Hi there. I'm here with you.")
+    """
+
+    DEFAULT_EDIT_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        channel: discord.abc.Messageable,
+        edit_interval: float = DEFAULT_EDIT_INTERVAL,
+        max_length: int = DISCORD_MESSAGE_LIMIT,
+        started_at: Optional[float] = None,
+        metrics_manager: Optional["MetricsManager"] = None,
+        outbound_queue: Optional["OutboundQueue"] = None,
+    ):
+        """
+        Initialize ReplyStream.
+
+        Args:
+            channel: Channel to reply in
+            edit_interval: Minimum seconds between renders of one reply
+            max_length: Maximum characters per Discord message
+            started_at: time.monotonic() when the user's message arrived
+                (defaults to now)
+            metrics_manager: Optional metrics manager
+            outbound_queue: Optional outbound queue (None calls Discord
+                directly)
+        """
+        self._channel = channel
+        self._interval = max(0.0, float(edit_interval))
+        self._max_length = max(100, int(max_length))
+        self._started_at = started_at if started_at is not None else time.monotonic()
+        self._metrics = metrics_manager
+        self._outbound = outbound_queue
+
+        self._text = ""
+        self._messages: List[discord.Message] = []
+        self._shown: List[str] = []
+        self._dirty = asyncio.Event()
+        self._render_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Optional[asyncio.Future] = None
+        self._last_render = 0.0
+
+        # Statistics
+        self._edits = 0
+        self._first_visible_seconds: Optional[float] = None
+
+    # =========================================================================
+    # Streaming
+    # =========================================================================
+
+    def feed(self, chunk: str) -> None:
+        """
+        Add streamed text; it is shown by the next render.
+
+        Args:
+            chunk: Text chunk from the model
+        """
+        if not chunk:
+            return
+
+        self._text += chunk
+        if self._task is None:
+            self._task = asyncio.create_task(self._render_loop(), name="ash-reply-stream")
+        self._dirty.set()
+
+    async def _render_loop(self) -> None:
+        """Render pending text, coalescing chunks within the edit interval."""
+        try:
+            while True:
+                await self._dirty.wait()
+
+                if self._messages:
+                    wait = self._last_render + self._interval - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+
+                self._dirty.clear()
+                visible = self._visible_text()
+                if visible:
+                    # Shielded: stopping the loop must not abort a send
+                    # halfway and leave finish() unsure what was posted
+                    self._pending = asyncio.ensure_future(self._render(visible))
+                    await asyncio.shield(self._pending)
+
+        except asyncio.CancelledError:
+            pass
+
+        except discord.DiscordException as e:
+            # finish() still posts the complete reply
+            logger.warning(f"⚠️ Streamed reply update failed, waiting for full reply: {e}")
+
+    def _visible_text(self) -> str:
+        """Text to show now: first sentence(s) at first, then whole words."""
+        text = self._text
+
+        if not self._messages:
+            end = 0
+            for match in _SENTENCE_END.finditer(text):
+                end = match.end()
+            if end:
+                return text[:end].rstrip()
+            if len(text) < FIRST_POST_MAX_CHARS:
+                return ""
+
+        cut = max(text.rfind(" "), text.rfind("\n"))
+        return text[:cut].rstrip() if cut > 0 else ""
+
+    async def _render(self, text: str) -> None:
+        """Bring the posted messages in line with text."""
+        async with self._render_lock:
+            chunks = split_message(text, self._max_length)
+
+            for index, chunk in enumerate(chunks):
+                if index < len(self._messages):
+                    if self._shown[index] != chunk:
+                        await edit_message(
+                            self._outbound, self._messages[index], PRIORITY_DM, content=chunk
+                        )
+                        self._shown[index] = chunk
+                        self._edits += 1
+                    continue
+
+                message = await send_message(
+                    self._outbound, self._channel, PRIORITY_DM, chunk, route_kind=ROUTE_DM
+                )
+                if not self._messages:
+                    self._record_first_visible()
+                self._messages.append(message)
+                self._shown.append(chunk)
+
+            # Text can only shrink at the very end (e.g. trailing space)
+            for message in self._messages[len(chunks):]:
+                await delete_message(self._outbound, message, PRIORITY_DM)
+            del self._messages[len(chunks):]
+            del self._shown[len(chunks):]
+
+            self._last_render = time.monotonic()
+
+    def _record_first_visible(self) -> None:
+        """Record time from the user's message to the first posted text."""
+        self._first_visible_seconds = time.monotonic() - self._started_at
+        if self._metrics:
+            self._metrics.observe_reply_first_visible(self._first_visible_seconds)
+
+    async def finish(self, final_text: str) -> List[discord.Message]:
+        """
+        Stop streaming and show the final reply.
+
+        Args:
+            final_text: Complete reply (may extend the streamed text,
+                e.g. with crisis resources)
+
+        Returns:
+            Posted Discord messages
+
+        Raises:
+            discord.DiscordException: If the final text could not be posted
+        """
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._pending:
+            await asyncio.gather(self._pending, return_exceptions=True)
+            self._pending = None
+
+        await self._render(final_text)
+
+        logger.debug(
+            f"📤 Reply posted in {len(self._messages)} message(s) after "
+            f"{self._edits} edits (first visible: {self._first_visible_seconds})"
+        )
+
+        return list(self._messages)
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def text(self) -> str:
+        """Get all text fed so far."""
+        return self._text
+
+    @property
+    def posted(self) -> bool:
+        """Check if any part of the reply is visible."""
+        return bool(self._messages)
+
+    @property
+    def first_visible_seconds(self) -> Optional[float]:
+        """Get seconds from the user's message to the first visible text."""
+        return self._first_visible_seconds
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"ReplyStream(chars={len(self._text)}, "
+            f"messages={len(self._messages)}, edits={self._edits})"
+        )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "ReplyStream",
+    "split_message",
+    "DISCORD_MESSAGE_LIMIT",
+]
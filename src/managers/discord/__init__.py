@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Discord Managers Package for Ash-Bot Service
 ---
-FILE VERSION: v5.0-1-1.1-1
-LAST MODIFIED: 2026-01-03
+FILE VERSION: v5.0-1-1.1-9
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 1 - Discord Connectivity
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -23,16 +23,29 @@ Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alp
 This package contains Discord-related managers:
 - DiscordManager: Gateway connection and event handling
 - ChannelConfigManager: Channel whitelist and alert routing
+- AnalysisQueue: Bounded analysis queue with worker pool (Phase 10)
+- BurstCoalescer: Per-user burst coalescing before analysis (Phase 10)
+- DeferredAnalysisQueue: Redis-backed re-analysis after NLP outages (Phase 10)
+- OutboundQueue: Priority queue for bot-initiated REST calls (Phase 10)
+- DiscordResolver: Cached user/channel/message lookups (Phase 10)
+- DMInbox: Per-user Ash DM serialization and turn merging (Phase 10)
+- ElevatedUserTracker: Redis-backed elevated scheduling class (Phase 10)
 ============================================================================
 USAGE:
     from src.managers.discord import (
         create_discord_manager,
         create_channel_config_manager,
+        create_analysis_queue,
+        create_burst_coalescer,
+        create_deferred_analysis_queue,
+        create_outbound_queue,
+        create_discord_resolver,
+        create_dm_inbox,
     )
 """
 
 # Module version
-__version__ = "v5.0-1-1.1-1"
+__version__ = "v5.0-1-1.1-9"
 
 # =============================================================================
 # Discord Manager
@@ -50,6 +63,67 @@ from .channel_config_manager import (
     create_channel_config_manager,
 )
 
+# =============================================================================
+# Analysis Queue (Phase 10)
+# =============================================================================
+from .analysis_queue import (
+    AnalysisQueue,
+    create_analysis_queue,
+)
+
+# =============================================================================
+# Burst Coalescer (Phase 10)
+# =============================================================================
+from .burst_coalescer import (
+    BurstCoalescer,
+    MessageBurst,
+    create_burst_coalescer,
+)
+
+# =============================================================================
+# Deferred Analysis Queue (Phase 10)
+# =============================================================================
+from .deferred_queue import (
+    DeferredAnalysis,
+    DeferredAnalysisQueue,
+    DeferredReplayError,
+    create_deferred_analysis_queue,
+)
+
+# =============================================================================
+# Outbound Queue (Phase 10)
+# =============================================================================
+from .outbound_queue import (
+    OutboundQueue,
+    create_outbound_queue,
+    get_max_ratelimit_timeout,
+)
+
+# =============================================================================
+# Discord Resolver (Phase 10)
+# =============================================================================
+from .discord_resolver import (
+    DiscordResolver,
+    create_discord_resolver,
+)
+
+# =============================================================================
+# DM Inbox (Phase 10)
+# =============================================================================
+from .dm_inbox import (
+    DMInbox,
+    DMTurn,
+    create_dm_inbox,
+)
+
+# =============================================================================
+# Elevated User Tracker (Phase 10)
+# =============================================================================
+from .elevated_users import (
+    ElevatedUserTracker,
+    create_elevated_user_tracker,
+)
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -61,4 +135,30 @@ __all__ = [
     # Channel Config Manager
     "ChannelConfigManager",
     "create_channel_config_manager",
+    # Analysis Queue
+    "AnalysisQueue",
+    "create_analysis_queue",
+    # Burst Coalescer
+    "BurstCoalescer",
+    "MessageBurst",
+    "create_burst_coalescer",
+    # Deferred Analysis Queue
+    "DeferredAnalysis",
+    "DeferredAnalysisQueue",
+    "DeferredReplayError",
+    "create_deferred_analysis_queue",
+    # Outbound Queue
+    "OutboundQueue",
+    "create_outbound_queue",
+    "get_max_ratelimit_timeout",
+    # Discord Resolver
+    "DiscordResolver",
+    "create_discord_resolver",
+    # DM Inbox
+    "DMInbox",
+    "DMTurn",
+    "create_dm_inbox",
+    # Elevated User Tracker
+    "ElevatedUserTracker",
+    "create_elevated_user_tracker",
 ]
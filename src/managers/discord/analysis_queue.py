@@ -0,0 +1,679 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Analysis Queue for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-3.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Buffer message bursts in a bounded queue before NLP analysis
+- Process queued messages with a fixed-size worker pool
+- Schedule by priority class (high → elevated → normal) with weights
+- Round-robin across users within a class so no user starves others
+- Apply an explicit overflow policy when the queue is full
+- Report queue depth, per-class wait time, and drops to MetricsManager
+- Expose saturation state for readiness checks
+
+SCHEDULING:
+    Each burst is assigned a priority class by the classifier callback:
+    - high:     high-priority or high-sensitivity channels
+    - elevated: users with recent LOW+ history
+    - normal:   everything else
+
+    Classes are served weighted round-robin (default 8:4:1), so a backlog
+    of general chat never delays high-priority work by more than a few
+    slots, while normal traffic still makes progress. Within a class each
+    user has their own FIFO and users are served in turn.
+
+USAGE:
+    from src.managers.discord import create_analysis_queue
+
+    analysis_queue = create_analysis_queue(
+        config_manager=config_manager,
+        handler=discord_manager._analyze_and_process,
+        classifier=discord_manager._get_scheduling_class,
+        metrics_manager=metrics_manager,
+    )
+
+    analysis_queue.start()
+    analysis_queue.submit(burst)
+    await analysis_queue.stop()
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, TYPE_CHECKING
+
+from src.managers.discord.burst_coalescer import MessageBurst
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+
+# Module version
+__version__ = "v5.0-10-3.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Drop the oldest queued message to make room for the new one
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+
+# Reject the incoming message and keep the queue as-is
+OVERFLOW_DROP_NEWEST = "drop_newest"
+
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST)
+
+# Scheduling classes, highest priority first
+PRIORITY_HIGH = "high"
+PRIORITY_ELEVATED = "elevated"
+PRIORITY_NORMAL = "normal"
+
+PRIORITY_CLASSES = (PRIORITY_HIGH, PRIORITY_ELEVATED, PRIORITY_NORMAL)
+
+
+# =============================================================================
+# Analysis Job
+# =============================================================================
+
+
+@dataclass
+class AnalysisJob:
+    """
+    A message burst waiting for NLP analysis.
+
+    Attributes:
+        burst: Coalesced messages to analyze together
+        priority_class: Scheduling class (high, elevated, normal)
+        enqueued_at: Monotonic timestamp when the job was queued
+    """
+
+    burst: MessageBurst
+    priority_class: str = PRIORITY_NORMAL
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def user_id(self) -> int:
+        """Discord user ID that owns this job."""
+        return self.burst.anchor.author.id
+
+    @property
+    def wait_seconds(self) -> float:
+        """Seconds this job has spent waiting in the queue."""
+        return time.monotonic() - self.enqueued_at
+
+
+# =============================================================================
+# Analysis Queue
+# =============================================================================
+
+
+class AnalysisQueue:
+    """
+    Bounded, priority-aware work queue with a fixed worker pool.
+
+    Replaces unbounded fire-and-forget tasks so a message burst cannot
+    open an unlimited number of concurrent NLP requests. Pending work is
+    scheduled by priority class and round-robin across users. When the
+    queue is full, work from a lower class than the incoming burst is
+    evicted first; otherwise the overflow policy decides what is dropped.
+
+    Attributes:
+        max_size: Maximum number of queued bursts
+        worker_count: Number of concurrent analysis workers
+        overflow_policy: drop_oldest or drop_newest
+        saturation_threshold: Fill ratio (0-1) at which the queue is saturated
+        class_weights: Slots per scheduling round for each priority class
+
+    Example:
+        >>> queue = create_analysis_queue(config, handler, classifier, metrics)
+        >>> queue.start()
+        >>> queue.submit(burst)
+    """
+
+    # Default configuration
+    DEFAULT_MAX_SIZE = 500
+    DEFAULT_WORKER_COUNT = 4
+    DEFAULT_OVERFLOW_POLICY = OVERFLOW_DROP_OLDEST
+    DEFAULT_SATURATION_THRESHOLD = 0.9
+    DEFAULT_WEIGHT_HIGH = 8
+    DEFAULT_WEIGHT_ELEVATED = 4
+    DEFAULT_WEIGHT_NORMAL = 1
+
+    def __init__(
+        self,
+        handler: Callable[[MessageBurst], Awaitable[None]],
+        classifier: Optional[Callable[[MessageBurst], str]] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        worker_count: int = DEFAULT_WORKER_COUNT,
+        overflow_policy: str = DEFAULT_OVERFLOW_POLICY,
+        saturation_threshold: float = DEFAULT_SATURATION_THRESHOLD,
+        class_weights: Optional[Dict[str, int]] = None,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize AnalysisQueue.
+
+        Args:
+            handler: Coroutine function that analyzes a message burst
+            classifier: Returns the priority class for a burst
+                (None = everything is normal)
+            max_size: Maximum number of queued bursts
+            worker_count: Number of concurrent analysis workers
+            overflow_policy: Behavior when full (drop_oldest, drop_newest)
+            saturation_threshold: Fill ratio at which readiness should fail
+            class_weights: Slots per round for each priority class
+            metrics_manager: Optional metrics manager
+
+        Note:
+            Use create_analysis_queue() factory function.
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            logger.warning(
+                f"⚠️ Unknown overflow policy '{overflow_policy}', "
+                f"using {self.DEFAULT_OVERFLOW_POLICY}"
+            )
+            overflow_policy = self.DEFAULT_OVERFLOW_POLICY
+
+        self._handler = handler
+        self._classifier = classifier
+        self._max_size = max(1, max_size)
+        self._worker_count = max(1, worker_count)
+        self._overflow_policy = overflow_policy
+        self._saturation_threshold = min(max(saturation_threshold, 0.0), 1.0)
+        self._metrics = metrics_manager
+
+        weights = class_weights or {}
+        self._weights: Dict[str, int] = {
+            PRIORITY_HIGH: max(1, weights.get(PRIORITY_HIGH, self.DEFAULT_WEIGHT_HIGH)),
+            PRIORITY_ELEVATED: max(
+                1, weights.get(PRIORITY_ELEVATED, self.DEFAULT_WEIGHT_ELEVATED)
+            ),
+            PRIORITY_NORMAL: max(
+                1, weights.get(PRIORITY_NORMAL, self.DEFAULT_WEIGHT_NORMAL)
+            ),
+        }
+
+        # Per class: user_id -> FIFO of jobs, in round-robin order
+        self._classes: Dict[str, "OrderedDict[int, Deque[AnalysisJob]]"] = {
+            name: OrderedDict() for name in PRIORITY_CLASSES
+        }
+        self._class_sizes: Dict[str, int] = {name: 0 for name in PRIORITY_CLASSES}
+        self._credits: Dict[str, int] = dict(self._weights)
+        self._size = 0
+        self._not_empty = asyncio.Event()
+
+        self._workers: List[asyncio.Task] = []
+        self._busy_workers = 0
+
+        # Statistics
+        self._submitted = 0
+        self._processed = 0
+        self._dropped = 0
+        self._failed = 0
+
+        logger.info(
+            f"✅ AnalysisQueue initialized "
+            f"(max_size={self._max_size}, workers={self._worker_count}, "
+            f"overflow={self._overflow_policy}, weights={self._weights})"
+        )
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> bool:
+        """
+        Start the worker pool.
+
+        Safe to call more than once (e.g. when on_ready fires again
+        after a reconnect) - workers are only started if not running.
+
+        Returns:
+            True if workers were started, False if already running
+        """
+        if self.is_running:
+            logger.debug("Analysis workers already running")
+            return False
+
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"analysis-worker-{i}")
+            for i in range(self._worker_count)
+        ]
+
+        logger.info(f"🧵 Started {self._worker_count} analysis workers")
+        return True
+
+    async def stop(self) -> None:
+        """
+        Stop the worker pool.
+
+        Cancels all workers. Messages still waiting in the queue are
+        discarded and logged.
+        """
+        for task in self._workers:
+            task.cancel()
+
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        if self._size:
+            logger.warning(f"⚠️ Discarding {self._size} queued bursts on shutdown")
+            for users in self._classes.values():
+                users.clear()
+            self._class_sizes = {name: 0 for name in PRIORITY_CLASSES}
+            self._size = 0
+            self._not_empty.clear()
+
+        self._update_depth_metric()
+        logger.info("🧵 Analysis workers stopped")
+
+    # =========================================================================
+    # Submission
+    # =========================================================================
+
+    def submit(self, burst: MessageBurst) -> bool:
+        """
+        Queue a message burst for analysis.
+
+        Never blocks. If the queue is full, the oldest job from a lower
+        priority class is evicted first. If there is none, the overflow
+        policy is applied: drop_oldest evicts the oldest job in the
+        lowest non-empty class, drop_newest rejects this burst.
+
+        Args:
+            burst: Message burst to analyze
+
+        Returns:
+            True if the burst was queued, False if it was dropped
+        """
+        self._submitted += 1
+        priority_class = self._classify(burst)
+
+        if self._size >= self._max_size:
+            evicted = self._evict_below(priority_class)
+
+            if evicted is None:
+                if self._overflow_policy == OVERFLOW_DROP_NEWEST:
+                    self._record_drop(burst)
+                    return False
+                evicted = self._evict_below(None)
+
+            if evicted is not None:
+                self._record_drop(evicted.burst)
+
+        job = AnalysisJob(burst=burst, priority_class=priority_class)
+        users = self._classes[priority_class]
+        users.setdefault(job.user_id, deque()).append(job)
+        self._class_sizes[priority_class] += 1
+        self._size += 1
+        self._not_empty.set()
+
+        self._update_depth_metric()
+        return True
+
+    def _classify(self, burst: MessageBurst) -> str:
+        """
+        Determine the scheduling class for a burst.
+
+        Args:
+            burst: Message burst
+
+        Returns:
+            One of PRIORITY_CLASSES (normal if classification fails)
+        """
+        if self._classifier is None:
+            return PRIORITY_NORMAL
+
+        try:
+            priority_class = self._classifier(burst)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to classify burst priority: {e}")
+            return PRIORITY_NORMAL
+
+        return priority_class if priority_class in self._classes else PRIORITY_NORMAL
+
+    def _evict_below(self, priority_class: Optional[str]) -> Optional[AnalysisJob]:
+        """
+        Remove the oldest job from the lowest non-empty class.
+
+        Args:
+            priority_class: Only evict from classes strictly below this one
+                (None = any class)
+
+        Returns:
+            The evicted job, or None if nothing was eligible
+        """
+        floor = (
+            PRIORITY_CLASSES.index(priority_class)
+            if priority_class is not None
+            else -1
+        )
+
+        for name in reversed(PRIORITY_CLASSES):
+            if PRIORITY_CLASSES.index(name) <= floor:
+                break
+            users = self._classes[name]
+            if not users:
+                continue
+
+            # Oldest job is at the head of one of the per-user FIFOs
+            user_id = min(users, key=lambda uid: users[uid][0].enqueued_at)
+            return self._take(name, user_id, rotate=False)
+
+        return None
+
+    def _record_drop(self, burst: MessageBurst) -> None:
+        """
+        Record a burst dropped due to overflow.
+
+        Args:
+            burst: The burst that will not be analyzed
+        """
+        self._dropped += burst.size
+
+        if self._metrics:
+            self._metrics.inc_analysis_queue_dropped(self._overflow_policy, burst.size)
+
+        logger.warning(
+            f"⚠️ Analysis queue full ({self._max_size}), dropped {burst.size} "
+            f"message(s) from user {burst.anchor.author.id} ({self._overflow_policy})"
+        )
+
+    # =========================================================================
+    # Scheduling
+    # =========================================================================
+
+    def _take(
+        self,
+        priority_class: str,
+        user_id: int,
+        rotate: bool = True,
+    ) -> AnalysisJob:
+        """
+        Pop the next job for a user within a class.
+
+        Args:
+            priority_class: Scheduling class
+            user_id: Discord user ID
+            rotate: Move the user to the back of the rotation (False for
+                evictions, which should not affect fairness order)
+
+        Returns:
+            The removed job
+        """
+        users = self._classes[priority_class]
+        jobs = users[user_id]
+        job = jobs.popleft()
+
+        if jobs:
+            # User still has work - move to the back of the rotation
+            if rotate:
+                users.move_to_end(user_id)
+        else:
+            del users[user_id]
+
+        self._class_sizes[priority_class] -= 1
+        self._size -= 1
+        if self._size == 0:
+            self._not_empty.clear()
+
+        return job
+
+    def _next_job(self) -> Optional[AnalysisJob]:
+        """
+        Select the next job by weighted round-robin over classes.
+
+        Each class may take up to its weight in slots per round; when
+        every non-empty class has used its credits, a new round starts.
+
+        Returns:
+            Next job to process, or None if the queue is empty
+        """
+        if self._size == 0:
+            return None
+
+        for _ in range(2):
+            for name in PRIORITY_CLASSES:
+                users = self._classes[name]
+                if users and self._credits[name] > 0:
+                    self._credits[name] -= 1
+                    return self._take(name, next(iter(users)))
+
+            # Round exhausted - refill credits and try again
+            self._credits = dict(self._weights)
+
+        return None
+
+    # =========================================================================
+    # Workers
+    # =========================================================================
+
+    async def _worker(self, worker_id: int) -> None:
+        """
+        Process queued messages until cancelled.
+
+        Args:
+            worker_id: Worker index (for logging)
+        """
+        logger.debug(f"Analysis worker {worker_id} started")
+
+        while True:
+            await self._not_empty.wait()
+            job = self._next_job()
+            if job is None:
+                continue
+
+            self._busy_workers += 1
+            self._update_depth_metric()
+
+            try:
+                if self._metrics:
+                    self._metrics.observe_analysis_queue_wait(
+                        job.wait_seconds, job.priority_class
+                    )
+
+                await self._handler(job.burst)
+                self._processed += 1
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                self._failed += 1
+                logger.error(
+                    f"❌ Analysis worker {worker_id} failed on message "
+                    f"{job.burst.anchor.id}: {e}",
+                    exc_info=True,
+                )
+
+            finally:
+                self._busy_workers -= 1
+                self._update_depth_metric()
+
+    def _update_depth_metric(self) -> None:
+        """Push current queue depth and busy workers to metrics."""
+        if self._metrics:
+            self._metrics.set_analysis_queue_depth(self._size)
+            self._metrics.set_analysis_workers_busy(self._busy_workers)
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def is_running(self) -> bool:
+        """Check if any worker is still running."""
+        return any(not task.done() for task in self._workers)
+
+    @property
+    def depth(self) -> int:
+        """Get number of bursts waiting in the queue."""
+        return self._size
+
+    @property
+    def max_size(self) -> int:
+        """Get maximum queue size."""
+        return self._max_size
+
+    @property
+    def is_saturated(self) -> bool:
+        """Check if queue fill ratio has reached the saturation threshold."""
+        return self._size >= self._max_size * self._saturation_threshold
+
+    @property
+    def headroom(self) -> int:
+        """Get how many bursts can be added before saturation."""
+        return max(0, int(self._max_size * self._saturation_threshold) - self._size)
+
+    @property
+    def dropped(self) -> int:
+        """Get count of messages dropped due to overflow."""
+        return self._dropped
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> dict:
+        """
+        Get analysis queue status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "running": self.is_running,
+            "depth": self._size,
+            "depth_by_class": dict(self._class_sizes),
+            "max_size": self._max_size,
+            "saturated": self.is_saturated,
+            "saturation_threshold": self._saturation_threshold,
+            "workers": self._worker_count,
+            "busy_workers": self._busy_workers,
+            "overflow_policy": self._overflow_policy,
+            "class_weights": dict(self._weights),
+            "submitted": self._submitted,
+            "processed": self._processed,
+            "failed": self._failed,
+            "dropped": self._dropped,
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"AnalysisQueue(depth={self._size}/{self._max_size}, "
+            f"workers={self._worker_count}, dropped={self._dropped})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_analysis_queue(
+    config_manager: "ConfigManager",
+    handler: Callable[[MessageBurst], Awaitable[None]],
+    classifier: Optional[Callable[[MessageBurst], str]] = None,
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> AnalysisQueue:
+    """
+    Factory function for AnalysisQueue.
+
+    Creates an AnalysisQueue configured from the analysis_queue section.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        handler: Coroutine function that analyzes a message burst
+        classifier: Optional callback returning a burst's priority class
+        metrics_manager: Optional metrics manager
+
+    Returns:
+        Configured AnalysisQueue instance
+
+    Example:
+        >>> queue = create_analysis_queue(
+        ...     config_manager=config,
+        ...     handler=manager._analyze_and_process,
+        ...     classifier=manager._get_scheduling_class,
+        ...     metrics_manager=metrics,
+        ... )
+    """
+    logger.info("🏭 Creating AnalysisQueue")
+
+    return AnalysisQueue(
+        handler=handler,
+        classifier=classifier,
+        max_size=config_manager.get(
+            "analysis_queue", "max_size", AnalysisQueue.DEFAULT_MAX_SIZE
+        ),
+        worker_count=config_manager.get(
+            "analysis_queue", "worker_count", AnalysisQueue.DEFAULT_WORKER_COUNT
+        ),
+        overflow_policy=config_manager.get(
+            "analysis_queue", "overflow_policy", AnalysisQueue.DEFAULT_OVERFLOW_POLICY
+        ),
+        saturation_threshold=config_manager.get(
+            "analysis_queue",
+            "saturation_threshold",
+            AnalysisQueue.DEFAULT_SATURATION_THRESHOLD,
+        ),
+        class_weights={
+            PRIORITY_HIGH: config_manager.get(
+                "analysis_queue", "weight_high", AnalysisQueue.DEFAULT_WEIGHT_HIGH
+            ),
+            PRIORITY_ELEVATED: config_manager.get(
+                "analysis_queue",
+                "weight_elevated",
+                AnalysisQueue.DEFAULT_WEIGHT_ELEVATED,
+            ),
+            PRIORITY_NORMAL: config_manager.get(
+                "analysis_queue", "weight_normal", AnalysisQueue.DEFAULT_WEIGHT_NORMAL
+            ),
+        },
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "AnalysisQueue",
+    "AnalysisJob",
+    "create_analysis_queue",
+    "OVERFLOW_DROP_OLDEST",
+    "OVERFLOW_DROP_NEWEST",
+    "OVERFLOW_POLICIES",
+    "PRIORITY_HIGH",
+    "PRIORITY_ELEVATED",
+    "PRIORITY_NORMAL",
+    "PRIORITY_CLASSES",
+]
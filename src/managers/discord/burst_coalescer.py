@@ -0,0 +1,400 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Burst Coalescer for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-2.0-3
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Group rapid messages from the same user and channel into bursts
+- Flush a burst after a quiet window, a hard time cap, or a size cap
+- Hand each burst to the analysis queue as a single unit of work
+- Report coalescing metrics (burst size, messages merged)
+
+USAGE:
+    from src.managers.discord import create_burst_coalescer
+
+    coalescer = create_burst_coalescer(
+        config_manager=config_manager,
+        on_flush=analysis_queue.submit,
+        metrics_manager=metrics_manager,
+    )
+
+    coalescer.add(message)  # Flushed automatically when the burst ends
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.discord.deferred_queue import DeferredAnalysis
+    from src.managers.metrics.metrics_manager import MetricsManager
+
+# Module version
+__version__ = "v5.0-10-2.0-3"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Message Burst
+# =============================================================================
+
+
+@dataclass
+class MessageBurst:
+    """
+    One or more messages from the same user in the same channel.
+
+    The last message in the burst is the anchor: it is used for the
+    alert jump link and for guild/channel/author lookups.
+
+    Attributes:
+        messages: Messages in arrival order
+        started_at: Monotonic timestamp of the first message
+        text: Stored content to analyze instead of the messages' content
+            (set when replaying a deferred burst)
+        deferred: Deferred entry being replayed, carried through analysis
+            so it can be deferred again with its attempts and age
+    """
+
+    messages: List[discord.Message]
+    started_at: float = field(default_factory=time.monotonic)
+    text: Optional[str] = None
+    deferred: Optional["DeferredAnalysis"] = None
+
+    @property
+    def anchor(self) -> discord.Message:
+        """Get the most recent message in the burst."""
+        return self.messages[-1]
+
+    @property
+    def size(self) -> int:
+        """Get number of messages in the burst."""
+        return len(self.messages)
+
+    @property
+    def message_ids(self) -> List[str]:
+        """Get Discord message IDs in arrival order."""
+        return [str(m.id) for m in self.messages]
+
+    @property
+    def content(self) -> str:
+        """Get combined message content, one message per line."""
+        if self.text is not None:
+            return self.text
+        return "\n".join(m.content for m in self.messages if m.content)
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the first message in the burst arrived."""
+        return time.monotonic() - self.started_at
+
+
+# =============================================================================
+# Burst Coalescer
+# =============================================================================
+
+
+class BurstCoalescer:
+    """
+    Merges rapid messages from one user into a single analysis call.
+
+    People in distress often send several short messages in a few
+    seconds. Each (channel, user) pair gets a pending burst that is
+    flushed when no new message arrives within the quiet window, when
+    the burst reaches its maximum age, or when it hits the size cap.
+
+    Attributes:
+        enabled: Whether coalescing is active (False = flush immediately)
+        window_seconds: Quiet period that ends a burst
+        max_window_seconds: Maximum burst age before a forced flush
+        max_messages: Maximum messages per burst
+
+    Example:
+        >>> coalescer = create_burst_coalescer(config, queue.submit, metrics)
+        >>> coalescer.add(message)
+    """
+
+    # Default configuration
+    DEFAULT_ENABLED = True
+    DEFAULT_WINDOW_SECONDS = 2.0
+    DEFAULT_MAX_WINDOW_SECONDS = 6.0
+    DEFAULT_MAX_MESSAGES = 8
+
+    def __init__(
+        self,
+        on_flush: Callable[[MessageBurst], object],
+        enabled: bool = DEFAULT_ENABLED,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_window_seconds: float = DEFAULT_MAX_WINDOW_SECONDS,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize BurstCoalescer.
+
+        Args:
+            on_flush: Callback receiving each completed burst
+            enabled: Whether coalescing is active
+            window_seconds: Quiet period that ends a burst
+            max_window_seconds: Maximum burst age before a forced flush
+            max_messages: Maximum messages per burst
+            metrics_manager: Optional metrics manager
+
+        Note:
+            Use create_burst_coalescer() factory function.
+        """
+        self._on_flush = on_flush
+        self._enabled = enabled
+        self._window = max(0.0, window_seconds)
+        self._max_window = max(self._window, max_window_seconds)
+        self._max_messages = max(1, max_messages)
+        self._metrics = metrics_manager
+
+        # (channel_id, user_id) -> pending burst and its flush timer
+        self._pending: Dict[Tuple[int, int], MessageBurst] = {}
+        self._timers: Dict[Tuple[int, int], asyncio.TimerHandle] = {}
+
+        # Statistics
+        self._bursts_flushed = 0
+        self._messages_coalesced = 0
+
+        logger.info(
+            f"✅ BurstCoalescer initialized "
+            f"(enabled={self._enabled}, window={self._window}s, "
+            f"max_window={self._max_window}s, max_messages={self._max_messages})"
+        )
+
+    # =========================================================================
+    # Coalescing
+    # =========================================================================
+
+    def add(self, message: discord.Message) -> None:
+        """
+        Add a message to its user's pending burst.
+
+        Args:
+            message: Monitored Discord message
+        """
+        if not self._enabled or self._window == 0:
+            self._emit(MessageBurst(messages=[message]))
+            return
+
+        key = (message.channel.id, message.author.id)
+        burst = self._pending.get(key)
+
+        if burst is None:
+            burst = MessageBurst(messages=[message])
+            self._pending[key] = burst
+        else:
+            burst.messages.append(message)
+            self._timers.pop(key).cancel()
+
+        # Size or age cap reached - flush now
+        remaining = self._max_window - burst.age_seconds
+        if burst.size >= self._max_messages or remaining <= 0:
+            self._flush(key)
+            return
+
+        # Otherwise (re)arm the quiet-window timer, never past the age cap
+        loop = asyncio.get_running_loop()
+        self._timers[key] = loop.call_later(
+            min(self._window, remaining), self._flush, key
+        )
+
+    def _flush(self, key: Tuple[int, int]) -> None:
+        """
+        Flush the pending burst for a (channel, user) key.
+
+        Args:
+            key: (channel_id, user_id) tuple
+        """
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        burst = self._pending.pop(key, None)
+        if burst:
+            self._emit(burst)
+
+    def _emit(self, burst: MessageBurst) -> None:
+        """
+        Hand a completed burst to the flush callback.
+
+        Args:
+            burst: Completed message burst
+        """
+        self._bursts_flushed += 1
+        self._messages_coalesced += burst.size - 1
+
+        if self._metrics:
+            self._metrics.observe_burst_size(burst.size)
+            if burst.size > 1:
+                self._metrics.inc_messages_coalesced(burst.size - 1)
+
+        if burst.size > 1:
+            logger.debug(
+                f"📦 Coalesced {burst.size} messages from user "
+                f"{burst.anchor.author.id} in channel {burst.anchor.channel.id}"
+            )
+
+        try:
+            self._on_flush(burst)
+        except Exception as e:
+            logger.error(f"❌ Failed to hand off message burst: {e}", exc_info=True)
+
+    def flush_all(self) -> int:
+        """
+        Flush every pending burst immediately.
+
+        Returns:
+            Number of bursts flushed
+        """
+        keys = list(self._pending.keys())
+        for key in keys:
+            self._flush(key)
+        return len(keys)
+
+    def discard_all(self) -> int:
+        """
+        Drop every pending burst without analysis (used on shutdown).
+
+        Returns:
+            Number of bursts discarded
+        """
+        for timer in self._timers.values():
+            timer.cancel()
+
+        count = len(self._pending)
+        self._timers.clear()
+        self._pending.clear()
+        return count
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if coalescing is enabled."""
+        return self._enabled
+
+    @property
+    def pending_count(self) -> int:
+        """Get number of bursts waiting for their window to close."""
+        return len(self._pending)
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> dict:
+        """
+        Get burst coalescer status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "enabled": self._enabled,
+            "window_seconds": self._window,
+            "max_window_seconds": self._max_window,
+            "max_messages": self._max_messages,
+            "pending_bursts": len(self._pending),
+            "bursts_flushed": self._bursts_flushed,
+            "messages_coalesced": self._messages_coalesced,
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"BurstCoalescer(enabled={self._enabled}, "
+            f"pending={len(self._pending)}, coalesced={self._messages_coalesced})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_burst_coalescer(
+    config_manager: "ConfigManager",
+    on_flush: Callable[[MessageBurst], object],
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> BurstCoalescer:
+    """
+    Factory function for BurstCoalescer.
+
+    Creates a BurstCoalescer configured from the burst_coalescing section.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        on_flush: Callback receiving each completed burst
+        metrics_manager: Optional metrics manager
+
+    Returns:
+        Configured BurstCoalescer instance
+
+    Example:
+        >>> coalescer = create_burst_coalescer(
+        ...     config_manager=config,
+        ...     on_flush=analysis_queue.submit,
+        ...     metrics_manager=metrics,
+        ... )
+    """
+    logger.info("🏭 Creating BurstCoalescer")
+
+    return BurstCoalescer(
+        on_flush=on_flush,
+        enabled=config_manager.get(
+            "burst_coalescing", "enabled", BurstCoalescer.DEFAULT_ENABLED
+        ),
+        window_seconds=config_manager.get(
+            "burst_coalescing", "window_seconds", BurstCoalescer.DEFAULT_WINDOW_SECONDS
+        ),
+        max_window_seconds=config_manager.get(
+            "burst_coalescing",
+            "max_window_seconds",
+            BurstCoalescer.DEFAULT_MAX_WINDOW_SECONDS,
+        ),
+        max_messages=config_manager.get(
+            "burst_coalescing", "max_messages", BurstCoalescer.DEFAULT_MAX_MESSAGES
+        ),
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "BurstCoalescer",
+    "MessageBurst",
+    "create_burst_coalescer",
+]
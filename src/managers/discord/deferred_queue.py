@@ -0,0 +1,670 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Deferred Analysis Queue for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-7.0-3
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Park messages that could not be analyzed because Ash-NLP was unavailable
+- Persist them in Redis so they survive a restart
+- Drain them at a controlled rate once Ash-NLP recovers
+- Replay high-priority channels first, oldest message first within each
+- Keep entries whose replay hits a transient error and back off
+- Drop entries that are too old or have been retried too often
+
+REDIS KEYS:
+- ash:nlp:deferred:high    Sorted set, score = original message time
+- ash:nlp:deferred:normal  Sorted set, score = original message time
+  Member: JSON-encoded DeferredAnalysis
+
+USAGE:
+    from src.managers.discord import create_deferred_analysis_queue
+
+    deferred = create_deferred_analysis_queue(
+        config_manager=config_manager,
+        redis_manager=redis_manager,
+        replay=discord_manager.replay_deferred_analysis,
+        capacity=discord_manager.deferred_drain_capacity,
+        metrics_manager=metrics_manager,
+    )
+
+    await deferred.defer(DeferredAnalysis.from_burst(burst, priority="high"))
+    deferred.start()  # Background drain loop
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.storage.redis_manager import RedisManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+    from src.managers.discord.burst_coalescer import MessageBurst
+
+# Module version
+__version__ = "v5.0-10-7.0-3"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+KEY_PREFIX_DEFERRED = "ash:nlp:deferred"
+
+DEFERRED_PRIORITY_HIGH = "high"
+DEFERRED_PRIORITY_NORMAL = "normal"
+
+# Drain order: every high entry before any normal entry
+DEFERRED_PRIORITIES = (DEFERRED_PRIORITY_HIGH, DEFERRED_PRIORITY_NORMAL)
+
+# Drain pause after a transient replay failure (doubles per failure)
+REPLAY_BACKOFF_BASE_SECONDS = 1.0
+REPLAY_BACKOFF_MAX_SECONDS = 60.0
+
+
+# =============================================================================
+# Exceptions
+# =============================================================================
+
+
+class DeferredReplayError(Exception):
+    """Raised by the replay callback when an entry should be retried later."""
+    pass
+
+
+# =============================================================================
+# Deferred Analysis Entry
+# =============================================================================
+
+
+@dataclass
+class DeferredAnalysis:
+    """
+    A message burst waiting for Ash-NLP to come back.
+
+    Attributes:
+        message_ids: Discord message IDs in arrival order (last = anchor)
+        guild_id: Discord guild ID
+        channel_id: Discord channel ID
+        user_id: Discord user ID of the author
+        content: Combined message content at the time of deferral
+        priority: Drain priority (high, normal)
+        created_at: Unix timestamp of the anchor message
+        deferred_at: Unix timestamp when first deferred
+        attempts: Number of times this entry has been deferred or retried
+    """
+
+    message_ids: List[str]
+    guild_id: int
+    channel_id: int
+    user_id: int
+    content: str
+    priority: str = DEFERRED_PRIORITY_NORMAL
+    created_at: float = field(default_factory=time.time)
+    deferred_at: float = field(default_factory=time.time)
+    attempts: int = 1
+
+    @property
+    def anchor_id(self) -> str:
+        """Get the ID of the most recent message."""
+        return self.message_ids[-1]
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the anchor message was posted."""
+        return time.time() - self.created_at
+
+    def to_json(self) -> str:
+        """Serialize to a compact JSON string."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str) -> "DeferredAnalysis":
+        """
+        Deserialize from JSON.
+
+        Args:
+            data: JSON string produced by to_json()
+
+        Returns:
+            DeferredAnalysis instance
+        """
+        raw = json.loads(data)
+        return cls(
+            message_ids=[str(mid) for mid in raw.get("message_ids", [])],
+            guild_id=int(raw["guild_id"]),
+            channel_id=int(raw["channel_id"]),
+            user_id=int(raw["user_id"]),
+            content=raw.get("content", ""),
+            priority=raw.get("priority", DEFERRED_PRIORITY_NORMAL),
+            created_at=float(raw.get("created_at", time.time())),
+            deferred_at=float(raw.get("deferred_at", time.time())),
+            attempts=int(raw.get("attempts", 1)),
+        )
+
+    @classmethod
+    def from_burst(
+        cls,
+        burst: "MessageBurst",
+        priority: str = DEFERRED_PRIORITY_NORMAL,
+        attempts: int = 1,
+    ) -> "DeferredAnalysis":
+        """
+        Create an entry from a message burst.
+
+        Args:
+            burst: Burst that could not be analyzed
+            priority: Drain priority (high, normal)
+            attempts: Deferral count (carry over when re-deferring)
+
+        Returns:
+            DeferredAnalysis instance
+        """
+        anchor = burst.anchor
+        return cls(
+            message_ids=burst.message_ids,
+            guild_id=anchor.guild.id,
+            channel_id=anchor.channel.id,
+            user_id=anchor.author.id,
+            content=burst.content,
+            priority=priority,
+            created_at=anchor.created_at.timestamp(),
+            attempts=attempts,
+        )
+
+
+# =============================================================================
+# Deferred Analysis Queue
+# =============================================================================
+
+
+class DeferredAnalysisQueue:
+    """
+    Redis-backed holding area for messages missed during NLP outages.
+
+    Entries are kept in one sorted set per priority, scored by the
+    original message time. The drain loop runs every drain_interval
+    seconds and, while the capacity callback reports room, pops up to
+    drain_rate x drain_interval entries (high priority first, oldest
+    first) and hands each to the replay callback.
+
+    The replay callback is expected to re-run the normal analysis
+    pipeline, so crises found during catch-up still raise alerts. If
+    NLP fails again the pipeline simply defers the entry again.
+
+    The callback returns False only when the entry can never be replayed
+    (e.g. its messages were deleted). If it raises, the error is treated
+    as transient: the entry goes back with attempts + 1 and draining
+    pauses with exponential backoff. Entries are dropped once they exceed
+    max_attempts or max_age_seconds.
+
+    Attributes:
+        enabled: Whether deferral is active
+        max_size: Maximum entries kept per priority
+        max_age_seconds: Entries older than this are discarded
+        max_attempts: Deferrals plus failed replays before an entry is dropped
+        drain_rate: Entries replayed per second
+        drain_interval: Seconds between drain ticks
+    """
+
+    # Default configuration
+    DEFAULT_ENABLED = True
+    DEFAULT_MAX_SIZE = 5000
+    DEFAULT_MAX_AGE_SECONDS = 21600
+    DEFAULT_MAX_ATTEMPTS = 10
+    DEFAULT_DRAIN_RATE = 5.0
+    DEFAULT_DRAIN_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        redis_manager: "RedisManager",
+        replay: Callable[[DeferredAnalysis], Awaitable[bool]],
+        capacity: Callable[[], int],
+        enabled: bool = DEFAULT_ENABLED,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        drain_rate: float = DEFAULT_DRAIN_RATE,
+        drain_interval: float = DEFAULT_DRAIN_INTERVAL,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize DeferredAnalysisQueue.
+
+        Args:
+            redis_manager: Redis manager for persistence
+            replay: Async callback that re-submits an entry for analysis
+            capacity: Callback returning how many entries may be replayed now
+            enabled: Whether deferral is active
+            max_size: Maximum entries kept per priority
+            max_age_seconds: Entries older than this are discarded
+            max_attempts: Deferrals plus failed replays before an entry is dropped
+            drain_rate: Entries replayed per second
+            drain_interval: Seconds between drain ticks
+            metrics_manager: Optional metrics manager
+
+        Note:
+            Use create_deferred_analysis_queue() factory function.
+        """
+        self._redis = redis_manager
+        self._replay = replay
+        self._capacity = capacity
+        self._enabled = enabled
+        self._max_size = max(1, max_size)
+        self._max_age = max(60, max_age_seconds)
+        self._max_attempts = max(1, max_attempts)
+        self._drain_rate = max(0.1, drain_rate)
+        self._drain_interval = max(0.1, drain_interval)
+        self._metrics = metrics_manager
+
+        self._drain_task: Optional[asyncio.Task] = None
+        self._running = False
+        self._depth = 0
+
+        # Transient replay failures pause draining with backoff
+        self._replay_failures = 0
+        self._paused_until = 0.0
+
+        # Statistics
+        self._deferred = 0
+        self._replayed = 0
+        self._expired = 0
+        self._retried = 0
+        self._dropped = 0
+
+        logger.info(
+            f"✅ DeferredAnalysisQueue initialized "
+            f"(enabled={self._enabled}, max_size={self._max_size}, "
+            f"drain_rate={self._drain_rate}/s, max_age={self._max_age}s)"
+        )
+
+    # =========================================================================
+    # Deferral
+    # =========================================================================
+
+    @staticmethod
+    def _key(priority: str) -> str:
+        """Get the Redis key for a priority."""
+        if priority not in DEFERRED_PRIORITIES:
+            priority = DEFERRED_PRIORITY_NORMAL
+        return f"{KEY_PREFIX_DEFERRED}:{priority}"
+
+    async def defer(self, entry: DeferredAnalysis) -> bool:
+        """
+        Park an entry until Ash-NLP is available again.
+
+        Args:
+            entry: Message burst details to replay later
+
+        Returns:
+            True if the entry was stored
+        """
+        if not self._enabled:
+            return False
+
+        if entry.attempts > self._max_attempts:
+            self._record("dropped")
+            logger.error(
+                f"❌ Giving up on deferred analysis of message {entry.anchor_id} "
+                f"(user {entry.user_id}) after {entry.attempts - 1} attempts"
+            )
+            return False
+
+        # Add and trim the oldest beyond max_size in one round trip
+        trimmed = await self._redis.zadd_capped(
+            self._key(entry.priority),
+            entry.created_at,
+            entry.to_json(),
+            max_size=self._max_size,
+        )
+        if trimmed is None:
+            self._record("dropped")
+            logger.error(
+                f"❌ Could not defer analysis of message {entry.anchor_id} "
+                f"(user {entry.user_id}) - Redis unavailable"
+            )
+            return False
+
+        self._record("deferred")
+        logger.info(
+            f"⏸️ Deferred analysis of message {entry.anchor_id} "
+            f"(priority={entry.priority}, attempt={entry.attempts})"
+        )
+
+        if trimmed:
+            self._record("dropped", trimmed)
+            logger.warning(
+                f"⚠️ Deferred queue '{entry.priority}' full, "
+                f"dropped {trimmed} oldest entries"
+            )
+
+        return True
+
+    # =========================================================================
+    # Drain Loop
+    # =========================================================================
+
+    def start(self) -> bool:
+        """
+        Start the background drain loop.
+
+        Returns:
+            True if started, False if disabled or already running
+        """
+        if not self._enabled or self._running:
+            return False
+
+        self._running = True
+        self._drain_task = asyncio.create_task(
+            self._drain_loop(),
+            name="deferred-analysis-drain",
+        )
+        logger.info("🔄 Deferred analysis drain loop started")
+        return True
+
+    async def stop(self) -> None:
+        """Stop the drain loop. Pending entries stay in Redis."""
+        self._running = False
+
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+
+        logger.info("🛑 Deferred analysis drain loop stopped")
+
+    async def _drain_loop(self) -> None:
+        """Replay deferred entries at the configured rate."""
+        budget = 0.0
+
+        while self._running:
+            try:
+                await asyncio.sleep(self._drain_interval)
+
+                # Unused budget does not accumulate past one tick's worth
+                per_tick = self._drain_rate * self._drain_interval
+                budget = min(budget + per_tick, max(1.0, per_tick))
+                allowed = min(int(budget), max(0, self._capacity()))
+                if allowed > 0 and time.monotonic() >= self._paused_until:
+                    budget -= await self.drain(allowed)
+
+                await self._refresh_depth()
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"❌ Deferred analysis drain error: {e}", exc_info=True)
+
+    async def drain(self, limit: int) -> int:
+        """
+        Replay up to limit entries, high priority first, oldest first.
+
+        Stops early after a transient replay failure; the failed entry is
+        back in the queue and draining pauses with backoff.
+
+        Args:
+            limit: Maximum entries to pop
+
+        Returns:
+            Number of entries popped (replayed, retried, expired or unusable)
+        """
+        popped = 0
+
+        for priority in DEFERRED_PRIORITIES:
+            if popped >= limit:
+                break
+
+            # One at a time, so nothing is held outside Redis when we stop
+            while popped < limit:
+                items = await self._redis.zpopmin(self._key(priority), 1)
+                if not items:
+                    break
+                popped += 1
+                if not await self._replay_one(items[0][0]):
+                    return popped
+
+        return popped
+
+    async def _replay_one(self, member: str) -> bool:
+        """
+        Decode one popped entry and hand it to the replay callback.
+
+        Returns:
+            False if the replay failed transiently and draining should pause
+        """
+        try:
+            entry = DeferredAnalysis.from_json(member)
+        except (ValueError, KeyError, TypeError) as e:
+            self._record("dropped")
+            logger.warning(f"⚠️ Discarding unreadable deferred entry: {e}")
+            return True
+
+        if entry.age_seconds > self._max_age:
+            self._record("expired")
+            logger.warning(
+                f"⚠️ Deferred analysis of message {entry.anchor_id} expired "
+                f"after {entry.age_seconds / 3600:.1f}h (user {entry.user_id})"
+            )
+            return True
+
+        try:
+            replayed = await self._replay(entry)
+        except Exception as e:
+            await self._retry_later(entry, e)
+            return False
+
+        self._replay_failures = 0
+        if replayed:
+            self._record("replayed")
+            logger.info(
+                f"▶️ Replaying deferred analysis of message {entry.anchor_id} "
+                f"(waited {time.time() - entry.deferred_at:.0f}s)"
+            )
+        else:
+            self._record("dropped")
+        return True
+
+    async def _retry_later(self, entry: DeferredAnalysis, error: Exception) -> None:
+        """
+        Put an entry back after a transient replay failure and back off.
+
+        Args:
+            entry: Entry whose replay failed
+            error: Error raised by the replay callback
+        """
+        self._replay_failures += 1
+        backoff = min(
+            REPLAY_BACKOFF_MAX_SECONDS,
+            REPLAY_BACKOFF_BASE_SECONDS * 2 ** (self._replay_failures - 1),
+        )
+        self._paused_until = time.monotonic() + backoff
+
+        logger.warning(
+            f"⚠️ Replay of deferred message {entry.anchor_id} failed "
+            f"(attempt {entry.attempts}), retrying in {backoff:.0f}s: {error}"
+        )
+
+        entry.attempts += 1
+        if await self.defer(entry):
+            self._retried += 1
+
+    async def _refresh_depth(self) -> None:
+        """Refresh the depth gauge from Redis."""
+        depth = 0
+        for priority in DEFERRED_PRIORITIES:
+            depth += await self._redis.zcard(self._key(priority))
+        self._depth = depth
+        if self._metrics:
+            self._metrics.set_deferred_analysis_depth(depth)
+
+    def _record(self, outcome: str, count: int = 1) -> None:
+        """Update statistics and metrics for an outcome."""
+        if outcome == "deferred":
+            self._deferred += count
+        elif outcome == "replayed":
+            self._replayed += count
+        elif outcome == "expired":
+            self._expired += count
+        else:
+            self._dropped += count
+
+        if self._metrics:
+            self._metrics.inc_deferred_analyses(outcome, count)
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if deferral is enabled."""
+        return self._enabled
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the drain loop is running."""
+        return self._running
+
+    @property
+    def depth(self) -> int:
+        """Get last known number of deferred entries."""
+        return self._depth
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> dict:
+        """
+        Get deferred queue status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "enabled": self._enabled,
+            "running": self._running,
+            "depth": self._depth,
+            "max_size": self._max_size,
+            "max_age_seconds": self._max_age,
+            "max_attempts": self._max_attempts,
+            "drain_rate": self._drain_rate,
+            "paused_seconds": round(max(0.0, self._paused_until - time.monotonic()), 1),
+            "deferred": self._deferred,
+            "replayed": self._replayed,
+            "retried": self._retried,
+            "expired": self._expired,
+            "dropped": self._dropped,
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"DeferredAnalysisQueue(depth={self._depth}, "
+            f"deferred={self._deferred}, replayed={self._replayed})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_deferred_analysis_queue(
+    config_manager: "ConfigManager",
+    redis_manager: "RedisManager",
+    replay: Callable[[DeferredAnalysis], Awaitable[bool]],
+    capacity: Callable[[], int],
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> DeferredAnalysisQueue:
+    """
+    Factory function for DeferredAnalysisQueue.
+
+    Creates a DeferredAnalysisQueue configured from the deferred_analysis
+    section. Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        redis_manager: Redis manager for persistence
+        replay: Async callback that re-submits an entry for analysis
+        capacity: Callback returning how many entries may be replayed now
+        metrics_manager: Optional metrics manager
+
+    Returns:
+        Configured DeferredAnalysisQueue instance
+
+    Example:
+        >>> deferred = create_deferred_analysis_queue(
+        ...     config_manager=config,
+        ...     redis_manager=redis,
+        ...     replay=discord_manager.replay_deferred_analysis,
+        ...     capacity=discord_manager.deferred_drain_capacity,
+        ... )
+    """
+    logger.info("🏭 Creating DeferredAnalysisQueue")
+
+    return DeferredAnalysisQueue(
+        redis_manager=redis_manager,
+        replay=replay,
+        capacity=capacity,
+        enabled=config_manager.get(
+            "deferred_analysis", "enabled", DeferredAnalysisQueue.DEFAULT_ENABLED
+        ),
+        max_size=config_manager.get(
+            "deferred_analysis", "max_size", DeferredAnalysisQueue.DEFAULT_MAX_SIZE
+        ),
+        max_age_seconds=config_manager.get(
+            "deferred_analysis",
+            "max_age_seconds",
+            DeferredAnalysisQueue.DEFAULT_MAX_AGE_SECONDS,
+        ),
+        max_attempts=config_manager.get(
+            "deferred_analysis",
+            "max_attempts",
+            DeferredAnalysisQueue.DEFAULT_MAX_ATTEMPTS,
+        ),
+        drain_rate=config_manager.get(
+            "deferred_analysis", "drain_rate", DeferredAnalysisQueue.DEFAULT_DRAIN_RATE
+        ),
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "DeferredAnalysis",
+    "DeferredAnalysisQueue",
+    "DeferredReplayError",
+    "DEFERRED_PRIORITY_HIGH",
+    "DEFERRED_PRIORITY_NORMAL",
+    "create_deferred_analysis_queue",
+]
@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Discord Manager for Ash-Bot Service
 ---
-FILE VERSION: v5.0-9-1.0-1
-LAST MODIFIED: 2026-01-05
-PHASE: Phase 9 - CRT Workflow Enhancements (Step 9.1)
+FILE VERSION: v5.0-10-3.0-12
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -31,6 +31,10 @@ RESPONSIBILITIES:
 - Route DM messages to active Ash AI sessions (Phase 4)
 - Metrics collection for monitoring (Phase 5)
 - Enhanced error recovery and reconnection handling (Phase 5)
+- Bounded analysis queue with worker pool and backpressure (Phase 10)
+- Per-user burst coalescing before NLP analysis (Phase 10)
+- Channel- and history-aware scheduling of pending analyses (Phase 10)
+- Serialize Ash session DMs per user, merging rapid ones into one turn (Phase 10)
 
 USAGE:
     from src.managers.discord import create_discord_manager
@@ -53,6 +57,7 @@ USAGE:
 import asyncio
 import logging
 import signal
+import time
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
@@ -70,11 +75,33 @@ if TYPE_CHECKING:
     from src.managers.ash.ash_personality_manager import AshPersonalityManager
     from src.managers.metrics.metrics_manager import MetricsManager
     from src.managers.user.user_preferences_manager import UserPreferencesManager
-
+    from src.managers.discord.deferred_queue import DeferredAnalysisQueue
+    from src.managers.discord.outbound_queue import OutboundQueue
+
+from src.managers.discord.analysis_queue import (
+    PRIORITY_ELEVATED,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    create_analysis_queue,
+)
+from src.managers.discord.burst_coalescer import MessageBurst, create_burst_coalescer
+from src.managers.discord.dm_inbox import DMTurn, create_dm_inbox
+from src.managers.discord.elevated_users import (
+    ElevatedUserTracker,
+    create_elevated_user_tracker,
+)
+from src.managers.discord.deferred_queue import (
+    DEFERRED_PRIORITY_HIGH,
+    DEFERRED_PRIORITY_NORMAL,
+    DeferredAnalysis,
+    DeferredReplayError,
+)
+from src.managers.discord.discord_resolver import resolve_channel
+from src.managers.discord.outbound_queue import get_max_ratelimit_timeout
 from src.models.nlp_models import CrisisAnalysisResult
 
 # Module version
-__version__ = "v5.0-9-1.0-2"
+__version__ = "v5.0-10-3.0-12"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -171,11 +198,14 @@ class DiscordManager:
         self._last_disconnect_time: Optional[datetime] = None
 
         # Create bot with intents
+        # Phase 10: max_ratelimit_timeout makes long 429 waits raise
+        # discord.RateLimited, so the outbound queue can reschedule them
         intents = self._setup_intents()
         self.bot = commands.Bot(
             command_prefix="!",  # Not used (slash commands only)
             intents=intents,
             help_command=None,  # Disable default help
+            max_ratelimit_timeout=get_max_ratelimit_timeout(config_manager),
         )
 
         # Phase 4: Attach managers to bot for button callbacks
@@ -191,6 +221,40 @@ class DiscordManager:
         # Phase 4: Session cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
 
+        # Phase 10: Users with recent LOW+ history get elevated scheduling
+        # (process-local until a Redis-backed tracker is set)
+        self._elevated_users: ElevatedUserTracker = create_elevated_user_tracker(
+            config_manager=config_manager
+        )
+
+        # Phase 10: Bounded analysis queue (workers start in on_ready)
+        self._analysis_queue = create_analysis_queue(
+            config_manager=config_manager,
+            handler=self._analyze_and_process,
+            classifier=self._get_scheduling_class,
+            metrics_manager=metrics_manager,
+        )
+
+        # Phase 10: Merge rapid messages per user/channel before queueing
+        self._burst_coalescer = create_burst_coalescer(
+            config_manager=config_manager,
+            on_flush=self._analysis_queue.submit,
+            metrics_manager=metrics_manager,
+        )
+
+        # Phase 10: One Ash turn at a time per user, merging rapid DMs
+        self._dm_inbox = create_dm_inbox(
+            config_manager=config_manager,
+            on_turn=self._handle_ash_turn,
+            metrics_manager=metrics_manager,
+        )
+
+        # Phase 10: Deferred re-analysis during NLP outages (set via setter)
+        self._deferred_queue: Optional["DeferredAnalysisQueue"] = None
+
+        # Phase 10: Outbound queue, drained before the bot closes (set via setter)
+        self._outbound_queue: Optional["OutboundQueue"] = None
+
         logger.info("✅ DiscordManager initialized")
 
     # =========================================================================
@@ -356,6 +420,18 @@ class DiscordManager:
             except asyncio.CancelledError:
                 pass
 
+        # Phase 10: Drop pending bursts and stop analysis workers
+        # (deferred entries stay in Redis for the next start)
+        self._burst_coalescer.discard_all()
+        await self._dm_inbox.close()
+        await self._analysis_queue.stop()
+        if self._deferred_queue:
+            await self._deferred_queue.stop()
+
+        # Phase 10: Flush queued Discord calls while the connection is up
+        if self._outbound_queue:
+            await self._outbound_queue.stop()
+
         # Close the bot
         if self.bot and not self.bot.is_closed():
             await self.bot.close()
@@ -415,6 +491,11 @@ class DiscordManager:
         # Phase 5: Update guild count metric
         self._update_guild_metric()
 
+        # Phase 10: Start analysis workers (no-op if already running)
+        self._analysis_queue.start()
+        if self._deferred_queue:
+            self._deferred_queue.start()
+
         # Log monitoring status
         channel_count = self.channel_config.monitored_channel_count
         if channel_count > 0:
@@ -431,11 +512,16 @@ class DiscordManager:
         # Phase 4: Log Ash AI status
         if self.ash_session_manager and self.ash_personality_manager:
             logger.info("   🤖 Ash AI enabled")
-            # Start session cleanup task
-            self._cleanup_task = asyncio.create_task(
-                self._session_cleanup_loop(),
-                name="ash-session-cleanup",
-            )
+            # Phase 10: Session expiry runs on the shared scheduler when
+            # available; otherwise poll. on_ready fires again after every
+            # reconnect, so never start a second cleanup loop.
+            if self.ash_session_manager.has_scheduler:
+                logger.debug("   ⏲️ Session expiry handled by scheduler")
+            elif self._cleanup_task is None or self._cleanup_task.done():
+                self._cleanup_task = asyncio.create_task(
+                    self._session_cleanup_loop(),
+                    name="ash-session-cleanup",
+                )
         else:
             logger.warning("   ⚠️ Ash AI disabled or not configured")
 
@@ -508,7 +594,7 @@ class DiscordManager:
         2. Check if DM with active Ash session (Phase 4)
         3. Check if channel is monitored
         4. Check if guild is target guild
-        5. Send to NLP for analysis
+        5. Coalesce bursts and queue for NLP analysis (Phase 10)
         6. Store in history if LOW+ (Phase 2)
         7. Dispatch alerts if MEDIUM+ (Phase 3)
 
@@ -538,10 +624,8 @@ class DiscordManager:
             f"user={message.author.id}, length={len(message.content)}"
         )
 
-        # Analyze message (fire and forget)
-        asyncio.create_task(
-            self._analyze_and_process(message), name=f"analyze-{message.id}"
-        )
+        # Phase 10: Coalesce into a per-user burst, then queue for analysis
+        self._burst_coalescer.add(message)
 
     # =========================================================================
     # Phase 4: DM Message Handling
@@ -551,8 +635,8 @@ class DiscordManager:
         """
         Handle DM messages for Ash AI sessions.
 
-        If user has an active Ash session, route their message
-        to the personality manager for response.
+        If user has an active Ash session, queue their message in the
+        DM inbox (Phase 10), which answers one merged turn at a time.
 
         Args:
             message: Discord DM message
@@ -574,22 +658,33 @@ class DiscordManager:
 
         self._ash_messages_handled += 1
 
-        # Check for user ending the conversation
-        if self.ash_personality_manager.detect_end_request(message.content):
-            logger.info(f"👋 User {message.author.id} ending Ash session")
-            await self.ash_session_manager.end_session(
-                user_id=message.author.id,
-                reason="user_ended",
-                send_closing=True,
-            )
+        # Phase 10: Serialize per user; rapid DMs become one turn
+        self._dm_inbox.add(message)
+
+    async def _handle_ash_turn(self, turn: DMTurn) -> None:
+        """
+        Answer one merged turn of Ash session DMs (Phase 10).
+
+        Called by the DM inbox, never concurrently for the same user.
+
+        Args:
+            turn: DMs merged into one conversational turn
+        """
+        message = turn.anchor
+        personality = self.ash_personality_manager
+
+        # The session may have ended while the turn was queued
+        session = self.ash_session_manager.get_session(message.author.id)
+        if not session:
+            logger.debug(f"Dropping Ash turn for user {message.author.id}: session ended")
             return
 
         # Check for CRT request
-        if self.ash_personality_manager.detect_crt_request(message.content):
+        if any(personality.detect_crt_request(m.content) for m in turn.messages):
             logger.info(f"🆘 User {message.author.id} requesting human support")
 
             # Send handoff message
-            handoff_msg = self.ash_personality_manager.get_handoff_message()
+            handoff_msg = personality.get_handoff_message()
             await message.channel.send(handoff_msg)
 
             # End session with transfer reason
@@ -600,33 +695,52 @@ class DiscordManager:
             )
             return
 
-        # Show typing indicator while generating response
-        async with message.channel.typing():
-            try:
-                # Generate response
-                response = await self.ash_personality_manager.generate_response(
-                    message=message,
-                    session=session,
-                )
+        # Check for user ending the conversation; anything said alongside
+        # the goodbye still gets a reply first
+        end_requested = False
+        lines = []
+        for m in turn.messages:
+            if personality.detect_end_request(m.content):
+                end_requested = True
+            elif m.content:
+                lines.append(m.content)
+
+        if lines:
+            # Show typing indicator while generating response
+            async with message.channel.typing():
+                try:
+                    # Generate response (Phase 10: streamed into the DM as it arrives)
+                    await personality.generate_response(
+                        message=message,
+                        session=session,
+                        content="\n".join(lines),
+                        channel=message.channel,
+                        received_at=turn.received_at,
+                    )
 
-                # Send response
-                if response:
-                    await message.channel.send(response)
+                except Exception as e:
+                    logger.error(
+                        f"❌ Failed to generate Ash response: {e}",
+                        exc_info=True,
+                    )
+                    # Send fallback
+                    fallback = personality._get_fallback_response()
+                    await message.channel.send(fallback)
 
-            except Exception as e:
-                logger.error(
-                    f"❌ Failed to generate Ash response: {e}",
-                    exc_info=True,
-                )
-                # Send fallback
-                fallback = self.ash_personality_manager._get_fallback_response()
-                await message.channel.send(fallback)
+        if end_requested:
+            logger.info(f"👋 User {message.author.id} ending Ash session")
+            await self.ash_session_manager.end_session(
+                user_id=message.author.id,
+                reason="user_ended",
+                send_closing=True,
+            )
 
     async def _session_cleanup_loop(self) -> None:
         """
         Background task to cleanup expired Ash sessions.
 
         Runs every 30 seconds to check for and end expired sessions.
+        Only used when no SchedulerManager is injected (Phase 10).
         """
         logger.info("🧹 Ash session cleanup task started")
 
@@ -666,6 +780,119 @@ class DiscordManager:
         self._user_preferences = user_preferences
         logger.info("👤 User preferences manager set (Phase 7)")
 
+    def set_elevated_user_tracker(
+        self,
+        tracker: ElevatedUserTracker,
+    ) -> None:
+        """
+        Set the Redis-backed elevated user tracker (Phase 10).
+
+        Replaces the process-local tracker created at construction, so
+        elevated users survive restarts and are shared between replicas.
+
+        Args:
+            tracker: ElevatedUserTracker instance
+        """
+        self._elevated_users = tracker
+        logger.info("⬆️ Elevated user tracker set (Phase 10)")
+
+    def set_deferred_analysis_queue(
+        self,
+        deferred_queue: "DeferredAnalysisQueue",
+    ) -> None:
+        """
+        Set the deferred analysis queue for NLP outages (Phase 10).
+
+        Injected after construction because the queue needs Redis and
+        this manager's replay callbacks.
+
+        Args:
+            deferred_queue: DeferredAnalysisQueue instance
+        """
+        self._deferred_queue = deferred_queue
+        logger.info("⏸️ Deferred analysis queue set (Phase 10)")
+
+    def set_outbound_queue(self, outbound_queue: "OutboundQueue") -> None:
+        """
+        Set the outbound Discord queue (Phase 10).
+
+        disconnect() drains it while the bot can still send, so queued
+        alerts and edits are not lost on shutdown.
+
+        Args:
+            outbound_queue: OutboundQueue instance
+        """
+        self._outbound_queue = outbound_queue
+        logger.debug("OutboundQueue injected into DiscordManager")
+
+    async def replay_deferred_analysis(self, entry: DeferredAnalysis) -> bool:
+        """
+        Re-submit a deferred burst to the analysis queue.
+
+        The stored content is analyzed as-is. Only the newest message that
+        still exists is fetched, as the anchor the normal pipeline needs
+        (history, alerts, jump links).
+
+        Args:
+            entry: Deferred analysis entry
+
+        Returns:
+            True if the burst was queued for analysis, False if the
+            channel or all of its messages are gone
+
+        Raises:
+            discord.HTTPException: Transient Discord failure (entry is kept)
+            DeferredReplayError: Analysis queue full (entry is kept)
+        """
+        try:
+            channel = await resolve_channel(self.bot, entry.channel_id)
+        except (discord.NotFound, discord.Forbidden) as e:
+            logger.warning(
+                f"⚠️ Cannot replay deferred message {entry.anchor_id}: "
+                f"channel {entry.channel_id} unavailable ({e})"
+            )
+            return False
+
+        anchor = None
+        for message_id in reversed(entry.message_ids):
+            try:
+                anchor = await channel.fetch_message(int(message_id))
+                break
+            except (discord.NotFound, discord.Forbidden):
+                continue
+
+        if anchor is None:
+            logger.warning(
+                f"⚠️ Deferred messages ending {entry.anchor_id} no longer exist "
+                f"(user {entry.user_id}, channel {entry.channel_id}) - not re-analyzed"
+            )
+            return False
+
+        burst = MessageBurst(messages=[anchor], text=entry.content, deferred=entry)
+        if not self._analysis_queue.submit(burst):
+            raise DeferredReplayError("analysis queue full")
+        return True
+
+    def deferred_drain_capacity(self) -> int:
+        """
+        Get how many deferred entries may be replayed right now (Phase 10).
+
+        Zero while the NLP breaker is open and a single probe while it is
+        half-open (so recovery is detected even without live traffic);
+        otherwise the analysis queue's headroom below its saturation
+        threshold, so catch-up never crowds out live traffic.
+
+        Returns:
+            Number of entries the drain loop may replay
+        """
+        headroom = self._analysis_queue.headroom
+        state = self.nlp_client.circuit_state
+        if state == "open":
+            return 0
+        if state == "half_open":
+            return min(1, headroom)
+        return headroom
+
     def track_ash_welcome_message(
         self,
         message_id: int,
@@ -780,21 +1007,31 @@ class DiscordManager:
     # Message Analysis
     # =========================================================================
 
-    async def _analyze_and_process(self, message: discord.Message) -> None:
+    async def _analyze_and_process(self, burst: MessageBurst) -> None:
         """
-        Analyze a message and process the result.
+        Analyze a message burst and process the result.
 
-        This is a fire-and-forget task that:
+        Called by an analysis queue worker (Phase 10):
         1. Retrieves user message history for context (Phase 2)
-        2. Sends message to NLP API with history
-        3. Logs the analysis result
-        4. Stores message in history if LOW+ severity (Phase 2)
+        2. Sends the combined burst text to NLP API with history
+        3. Logs the analysis result for every message in the burst
+        4. Stores the burst in history if LOW+ severity (Phase 2)
         5. Dispatches alerts if MEDIUM+ severity (Phase 3)
         6. Updates metrics (Phase 5)
 
+        A burst of one message behaves exactly like a single message.
+
+        A replayed deferred burst is already out of Redis: unless its
+        analysis lands, it is deferred again on the way out, whatever
+        cut the run short.
+
         Args:
-            message: Discord message object
+            burst: Coalesced messages from one user in one channel
         """
+        # Anchor = most recent message (jump link, author, channel)
+        message = burst.anchor
+        replayed = burst.deferred
+
         try:
             # Phase 2: Get user history for context analysis
             message_history = None
@@ -814,14 +1051,39 @@ class DiscordManager:
                     logger.warning(f"⚠️ Failed to load history: {e}")
                     message_history = None
 
-            # Analyze message with history context
+            # Analyze combined burst text with history context
+            # Phase 10: High-priority channels may hedge across NLP replicas
             result = await self.nlp_client.analyze_message(
-                message=message.content,
+                message=burst.content,
                 user_id=str(message.author.id),
                 channel_id=str(message.channel.id),
                 message_history=message_history,
+                hedge=self.channel_config.get_channel_priority_class(
+                    message.channel.id
+                ) == "high",
             )
 
+            # Phase 10: NLP unavailable - park the burst for re-analysis
+            # instead of treating it as SAFE
+            if self._deferred_queue and self.nlp_client.is_deferrable(result):
+                if replayed is not None:
+                    entry, replayed = replayed, None
+                    entry.attempts += 1
+                else:
+                    entry = DeferredAnalysis.from_burst(
+                        burst,
+                        priority=(
+                            DEFERRED_PRIORITY_HIGH
+                            if self._get_scheduling_class(burst) == PRIORITY_HIGH
+                            else DEFERRED_PRIORITY_NORMAL
+                        ),
+                    )
+                await self._deferred_queue.defer(entry)
+                return
+
+            # Analysis landed; the replayed entry is done
+            replayed = None
+
             # Phase 7.3: Apply channel sensitivity modifier
             channel_sensitivity = self.channel_config.get_channel_sensitivity(
                 message.channel.id
@@ -844,42 +1106,73 @@ class DiscordManager:
                         channel_sensitivity,
                     )
 
-            # Update stats
-            self._messages_processed += 1
+            # Update stats (result applies to every message in the burst)
+            self._messages_processed += burst.size
             if result.crisis_detected:
                 self._crises_detected += 1
 
             # Phase 5: Update metrics
             if self._metrics:
-                self._metrics.inc_messages_processed()
+                self._metrics.inc_messages_processed(burst.size)
                 if result.severity != "safe":
-                    self._metrics.inc_messages_analyzed(result.severity)
+                    self._metrics.inc_messages_analyzed(result.severity, burst.size)
 
             # Log result
-            self._log_analysis_result(message, result)
+            self._log_analysis_result(burst, result)
 
-            # Phase 2: Store message in history (if LOW+ severity)
+            # Phase 2: Store burst in history (if LOW+ severity)
+            escalation = None
             if self.user_history:
                 try:
                     stored = await self.user_history.add_message(
                         guild_id=message.guild.id,
                         user_id=message.author.id,
-                        message=message.content,
+                        message=burst.content,
                         analysis_result=result,
                         message_id=str(message.id),
+                        burst_message_ids=(
+                            burst.message_ids if burst.size > 1 else None
+                        ),
                     )
                     if stored:
                         self._history_stores += 1
+                        await self._elevated_users.mark(message.author.id)
                 except Exception as e:
                     logger.warning(f"⚠️ Failed to store history: {e}")
 
+                # Phase 10: Local escalation trend (O(1), no history read)
+                try:
+                    escalation = await self.user_history.update_escalation(
+                        guild_id=message.guild.id,
+                        user_id=message.author.id,
+                        analysis_result=result,
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to update escalation state: {e}")
+
             # Phase 3: Dispatch alerts if MEDIUM+ severity
             if self.alert_dispatcher:
                 try:
-                    alert_msg = await self.alert_dispatcher.dispatch_alert(
-                        message=message,
-                        result=result,
-                    )
+                    alert_msg = None
+                    if escalation and escalation.triggered:
+                        # Phase 10: Start of a local escalation episode
+                        alert_msg = await self.alert_dispatcher.dispatch_escalation_alert(
+                            message=message,
+                            result=result,
+                            history_count=escalation.recent_count(time.time()),
+                            trend="escalating",
+                            channel_sensitivity=channel_sensitivity,
+                            trend_detail=(
+                                f"Average score {escalation.ewma:.2f}, "
+                                f"trend {escalation.slope:+.2f} per message"
+                            ),
+                        )
+                    if alert_msg is None:
+                        alert_msg = await self.alert_dispatcher.dispatch_alert(
+                            message=message,
+                            result=result,
+                            message_content=burst.content if burst.size > 1 else None,
+                        )
                     if alert_msg:
                         self._alerts_dispatched += 1
                         # Phase 5: Update alert metrics
@@ -896,18 +1189,59 @@ class DiscordManager:
                 f"❌ Failed to analyze message {message.id}: {e}", exc_info=True
             )
 
+        finally:
+            if replayed is not None and self._deferred_queue:
+                replayed.attempts += 1
+                logger.warning(
+                    f"⚠️ Replayed analysis of message {replayed.anchor_id} "
+                    "did not finish, deferring it again"
+                )
+                await self._deferred_queue.defer(replayed)
+
+    # =========================================================================
+    # Phase 10: Analysis Scheduling
+    # =========================================================================
+
+    def _get_scheduling_class(self, burst: MessageBurst) -> str:
+        """
+        Determine the analysis queue priority class for a burst.
+
+        - high: high-priority class or high-sensitivity channel
+        - elevated: author had a LOW+ message stored recently
+        - normal: everything else
+
+        Args:
+            burst: Message burst waiting for analysis
+
+        Returns:
+            Priority class name
+        """
+        channel_id = burst.anchor.channel.id
+        if (
+            self.channel_config.get_channel_priority_class(channel_id) == "high"
+            or self.channel_config.get_channel_sensitivity(channel_id) > 1.0
+        ):
+            return PRIORITY_HIGH
+
+        if self._elevated_users.is_elevated(burst.anchor.author.id):
+            return PRIORITY_ELEVATED
+
+        return PRIORITY_NORMAL
+
     def _log_analysis_result(
         self,
-        message: discord.Message,
+        burst: MessageBurst,
         result: CrisisAnalysisResult,
     ) -> None:
         """
         Log the analysis result with appropriate formatting.
 
         Args:
-            message: Original Discord message
+            burst: Analyzed message burst
             result: Analysis result from NLP
         """
+        message = burst.anchor
+
         # Format log based on severity
         severity_emoji = {
             "safe": "🟢",
@@ -920,8 +1254,9 @@ class DiscordManager:
         emoji = severity_emoji.get(result.severity, "⚪")
 
         # Truncate message for logging
-        content_preview = message.content[:50]
-        if len(message.content) > 50:
+        content = burst.content
+        content_preview = content[:50]
+        if len(content) > 50:
             content_preview += "..."
 
         # Build log message
@@ -935,6 +1270,10 @@ class DiscordManager:
             f"request_id={result.request_id}"
         )
 
+        # Phase 10: Attribute result to every message in the burst
+        if burst.size > 1:
+            log_msg += f" burst={burst.size} message_ids={','.join(burst.message_ids)}"
+
         # Log at appropriate level
         if result.severity in ("high", "critical"):
             logger.warning(log_msg)
@@ -1036,6 +1375,16 @@ class DiscordManager:
         """Check if metrics manager is configured (Phase 5)."""
         return self._metrics is not None
 
+    @property
+    def analysis_queue_depth(self) -> int:
+        """Get number of messages waiting for analysis (Phase 10)."""
+        return self._analysis_queue.depth
+
+    @property
+    def is_analysis_queue_saturated(self) -> bool:
+        """Check if the analysis queue is saturated (Phase 10)."""
+        return self._analysis_queue.is_saturated
+
     # =========================================================================
     # Status Methods
     # =========================================================================
@@ -1068,6 +1417,14 @@ class DiscordManager:
         if self.ash_session_manager:
             status["ash_active_sessions"] = self.ash_session_manager.active_session_count
 
+        # Phase 10: Add analysis queue and coalescing info
+        status["analysis_queue"] = self._analysis_queue.get_status()
+        status["burst_coalescing"] = self._burst_coalescer.get_status()
+        status["dm_inbox"] = self._dm_inbox.get_status()
+        status["deferred_analysis"] = (
+            self._deferred_queue.get_status() if self._deferred_queue else None
+        )
+
         return status
 
     def __repr__(self) -> str:
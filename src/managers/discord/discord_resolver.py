@@ -0,0 +1,528 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Discord Resolver for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-19.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Resolve users and channels from the gateway cache, then a bounded TTL
+  cache, then REST
+- Collapse concurrent misses for the same object into one REST call
+- Remember sent alert messages so later embed updates need no
+  fetch_message round trip
+- Build partial messages for edits by ID
+- Report gateway/cache hits, misses and REST calls
+
+The resolver is attached to the bot as bot.discord_resolver; the module
+helpers (resolve_user, resolve_channel) fall back to plain REST when it
+is not set, so views and managers can call them unconditionally.
+
+USAGE:
+    from src.managers.discord import create_discord_resolver
+    from src.managers.discord.discord_resolver import resolve_user
+
+    bot.discord_resolver = create_discord_resolver(config, bot, metrics)
+
+    user = await resolve_user(bot, user_id)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TYPE_CHECKING
+
+import discord
+
+from src.managers.discord.outbound_queue import PRIORITY_EDIT, fetch_message
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+    from src.managers.config_manager import ConfigManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+    from src.managers.discord.outbound_queue import OutboundQueue
+
+# Module version
+__version__ = "v5.0-10-19.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Object kinds (metric labels)
+KIND_USER = "user"
+KIND_CHANNEL = "channel"
+KIND_MESSAGE = "message"
+
+# Lookup results (metric labels)
+RESULT_GATEWAY = "gateway"
+RESULT_HIT = "hit"
+RESULT_MISS = "miss"
+RESULT_COALESCED = "coalesced"
+
+
+# =============================================================================
+# Discord Resolver
+# =============================================================================
+
+
+class DiscordResolver:
+    """
+    Read-through resolver for Discord users, channels and alert messages.
+
+    Users and channels share one LRU of (kind, id) entries that live for
+    ttl_seconds; alert messages have their own, smaller LRU with a
+    longer TTL (they are needed until the alert is handled).
+
+    Example:
+        >>> resolver = DiscordResolver(bot, ttl_seconds=300)
+        >>> user = await resolver.fetch_user(123)
+    """
+
+    DEFAULT_TTL_SECONDS = 300
+    DEFAULT_MAX_ENTRIES = 5000
+    DEFAULT_MESSAGE_TTL_SECONDS = 3600
+    DEFAULT_MAX_MESSAGES = 500
+
+    def __init__(
+        self,
+        bot: "commands.Bot",
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        message_ttl_seconds: float = DEFAULT_MESSAGE_TTL_SECONDS,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize DiscordResolver.
+
+        Args:
+            bot: Discord bot (gateway cache and REST client)
+            ttl_seconds: Seconds a resolved user/channel stays cached
+            max_entries: Maximum cached users and channels
+            message_ttl_seconds: Seconds a remembered alert message stays cached
+            max_messages: Maximum remembered alert messages
+            metrics_manager: Optional metrics manager
+        """
+        self._bot = bot
+        self._ttl = max(0.0, float(ttl_seconds))
+        self._max_entries = max(1, int(max_entries))
+        self._message_ttl = max(0.0, float(message_ttl_seconds))
+        self._max_messages = max(1, int(max_messages))
+        self._metrics = metrics_manager
+        self._outbound: Optional["OutboundQueue"] = None
+
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, Any]]" = OrderedDict()
+        self._messages: "OrderedDict[int, Tuple[float, discord.Message]]" = OrderedDict()
+
+        # Singleflight: one REST call per object, later callers await it
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        # Statistics per kind
+        self._counts: Dict[str, Dict[str, int]] = {
+            kind: {RESULT_GATEWAY: 0, RESULT_HIT: 0, RESULT_MISS: 0, RESULT_COALESCED: 0}
+            for kind in (KIND_USER, KIND_CHANNEL, KIND_MESSAGE)
+        }
+        self._rest_calls = 0
+        self._evictions = 0
+
+        logger.info(
+            f"✅ DiscordResolver initialized (ttl={self._ttl:.0f}s, "
+            f"max_entries={self._max_entries}, message_ttl={self._message_ttl:.0f}s)"
+        )
+
+    def set_outbound_queue(self, outbound_queue: "OutboundQueue") -> None:
+        """
+        Fetch messages through the outbound queue.
+
+        Args:
+            outbound_queue: OutboundQueue instance
+        """
+        self._outbound = outbound_queue
+        logger.debug("OutboundQueue injected into DiscordResolver")
+
+    # =========================================================================
+    # Users and Channels
+    # =========================================================================
+
+    async def fetch_user(self, user_id: int) -> discord.User:
+        """
+        Resolve a user: gateway cache, then TTL cache, then REST.
+
+        Raises:
+            discord.NotFound / discord.HTTPException like bot.fetch_user()
+        """
+        return await self._resolve(
+            KIND_USER,
+            user_id,
+            gateway=self._bot.get_user,
+            rest=self._bot.fetch_user,
+        )
+
+    async def fetch_channel(self, channel_id: int) -> Any:
+        """
+        Resolve a channel: gateway cache, then TTL cache, then REST.
+
+        Raises:
+            discord.NotFound / discord.HTTPException like bot.fetch_channel()
+        """
+        return await self._resolve(
+            KIND_CHANNEL,
+            channel_id,
+            gateway=self._bot.get_channel,
+            rest=self._bot.fetch_channel,
+        )
+
+    async def _resolve(
+        self,
+        kind: str,
+        object_id: int,
+        gateway: Callable[[int], Any],
+        rest: Callable[[int], Awaitable[Any]],
+    ) -> Any:
+        """Look up one object through the three tiers."""
+        value = gateway(object_id)
+        if value is not None:
+            self._record(kind, RESULT_GATEWAY)
+            return value
+
+        key = (kind, object_id)
+        cached = self._entries.get(key)
+        if cached is not None:
+            expires_at, value = cached
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self._record(kind, RESULT_HIT)
+                return value
+            del self._entries[key]
+
+        value = await self._singleflight(key, kind, lambda: rest(object_id))
+        self._store(key, value)
+        return value
+
+    async def _singleflight(
+        self,
+        key: Hashable,
+        kind: str,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run call once per key; concurrent callers share its result."""
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self._record(kind, RESULT_COALESCED)
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # The calling request was cancelled; fetch for ourselves
+                return await self._rest(kind, call)
+
+        self._record(kind, RESULT_MISS)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[key] = flight
+        try:
+            value = await self._rest(kind, call)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # Waiters re-raise it; avoid "exception never retrieved"
+            flight.exception()
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _rest(self, kind: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Make one REST call and count it."""
+        self._rest_calls += 1
+        if self._metrics:
+            self._metrics.inc_discord_rest_calls(kind)
+        return await call()
+
+    def _store(self, key: Tuple[str, int], value: Any) -> None:
+        """Cache a resolved object and evict down to max_entries."""
+        if self._ttl <= 0 or value is None:
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, kind: str, object_id: int) -> None:
+        """Drop a cached user or channel (e.g. after it changed)."""
+        self._entries.pop((kind, object_id), None)
+
+    # =========================================================================
+    # Alert Messages
+    # =========================================================================
+
+    def remember_message(self, message: discord.Message) -> None:
+        """
+        Keep a sent alert message so later updates can skip fetch_message.
+
+        Args:
+            message: Message returned by channel.send()
+        """
+        if self._message_ttl <= 0 or message is None:
+            return
+
+        self._messages[message.id] = (time.monotonic() + self._message_ttl, message)
+        self._messages.move_to_end(message.id)
+        while len(self._messages) > self._max_messages:
+            self._messages.popitem(last=False)
+            self._evictions += 1
+
+    def forget_message(self, message_id: int) -> None:
+        """Drop a remembered message (e.g. after it was deleted)."""
+        self._messages.pop(message_id, None)
+
+    def cached_message(self, message_id: int) -> Optional[discord.Message]:
+        """Get a remembered message without any REST call."""
+        cached = self._messages.get(message_id)
+        if cached is None:
+            return None
+
+        expires_at, message = cached
+        if time.monotonic() >= expires_at:
+            del self._messages[message_id]
+            return None
+
+        self._messages.move_to_end(message_id)
+        return message
+
+    async def fetch_message(
+        self,
+        channel_id: int,
+        message_id: int,
+        priority: int = PRIORITY_EDIT,
+    ) -> discord.Message:
+        """
+        Resolve a message: remembered copy first, then REST.
+
+        Raises:
+            discord.NotFound / discord.HTTPException like fetch_message()
+        """
+        message = self.cached_message(message_id)
+        if message is not None:
+            self._record(KIND_MESSAGE, RESULT_HIT)
+            return message
+
+        channel = self.partial_channel(channel_id)
+        message = await self._singleflight(
+            (KIND_MESSAGE, message_id),
+            KIND_MESSAGE,
+            lambda: fetch_message(self._outbound, channel, message_id, priority),
+        )
+        self.remember_message(message)
+        return message
+
+    def partial_channel(self, channel_id: int) -> Any:
+        """
+        Get a channel object usable for sends and fetches without REST.
+
+        Returns the gateway channel when cached, else a PartialMessageable.
+        """
+        return self._bot.get_channel(channel_id) or self._bot.get_partial_messageable(
+            channel_id
+        )
+
+    def partial_message(self, channel_id: int, message_id: int) -> discord.PartialMessage:
+        """
+        Get a message handle for edit/delete by ID, without fetch_message.
+
+        Args:
+            channel_id: Channel the message is in
+            message_id: Message ID
+
+        Returns:
+            discord.PartialMessage
+        """
+        return self._bot.get_partial_messageable(channel_id).get_partial_message(
+            message_id
+        )
+
+    # =========================================================================
+    # Metrics
+    # =========================================================================
+
+    def _record(self, kind: str, result: str) -> None:
+        """Count a lookup result."""
+        self._counts[kind][result] += 1
+        if self._metrics:
+            self._metrics.inc_discord_resolver_lookups(kind, result)
+
+    @property
+    def rest_calls(self) -> int:
+        """Get number of REST calls made."""
+        return self._rest_calls
+
+    @property
+    def hit_rate(self) -> float:
+        """Get fraction of lookups served without a REST call."""
+        served = total = 0
+        for counts in self._counts.values():
+            served += counts[RESULT_GATEWAY] + counts[RESULT_HIT] + counts[RESULT_COALESCED]
+            total += sum(counts.values())
+        return served / total if total else 0.0
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> dict:
+        """
+        Get resolver status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "ttl_seconds": self._ttl,
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "messages": len(self._messages),
+            "max_messages": self._max_messages,
+            "lookups": {kind: dict(counts) for kind, counts in self._counts.items()},
+            "rest_calls": self._rest_calls,
+            "evictions": self._evictions,
+            "inflight": len(self._inflight),
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"DiscordResolver(entries={len(self._entries)}, "
+            f"messages={len(self._messages)}, rest_calls={self._rest_calls})"
+        )
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def get_resolver(bot: Any) -> Optional[DiscordResolver]:
+    """Get the resolver attached to the bot (None if not set up)."""
+    return getattr(bot, "discord_resolver", None)
+
+
+async def resolve_user(bot: Any, user_id: int) -> discord.User:
+    """
+    Resolve a user through bot.discord_resolver, or REST if there is none.
+
+    Raises:
+        discord.NotFound / discord.HTTPException like bot.fetch_user()
+    """
+    resolver = get_resolver(bot)
+    if resolver is None:
+        return await bot.fetch_user(user_id)
+    return await resolver.fetch_user(user_id)
+
+
+async def resolve_channel(bot: Any, channel_id: int) -> Any:
+    """
+    Resolve a channel through bot.discord_resolver, or gateway then REST.
+
+    Raises:
+        discord.NotFound / discord.HTTPException like bot.fetch_channel()
+    """
+    resolver = get_resolver(bot)
+    if resolver is None:
+        return bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
+    return await resolver.fetch_channel(channel_id)
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_discord_resolver(
+    config_manager: "ConfigManager",
+    bot: "commands.Bot",
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> Optional[DiscordResolver]:
+    """
+    Factory function for DiscordResolver.
+
+    Creates a DiscordResolver configured from the discord_resolver section.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        bot: Discord bot instance
+        metrics_manager: Optional metrics manager
+
+    Returns:
+        Configured DiscordResolver, or None if disabled
+
+    Example:
+        >>> resolver = create_discord_resolver(config, bot, metrics)
+        >>> bot.discord_resolver = resolver
+    """
+    logger.info("🏭 Creating DiscordResolver")
+
+    if not config_manager.get("discord_resolver", "enabled", True):
+        logger.info("⏭️ Discord resolver cache disabled, resolving via REST")
+        return None
+
+    return DiscordResolver(
+        bot=bot,
+        ttl_seconds=config_manager.get(
+            "discord_resolver", "ttl_seconds", DiscordResolver.DEFAULT_TTL_SECONDS
+        ),
+        max_entries=config_manager.get(
+            "discord_resolver", "max_entries", DiscordResolver.DEFAULT_MAX_ENTRIES
+        ),
+        message_ttl_seconds=config_manager.get(
+            "discord_resolver",
+            "message_ttl_seconds",
+            DiscordResolver.DEFAULT_MESSAGE_TTL_SECONDS,
+        ),
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "DiscordResolver",
+    "create_discord_resolver",
+    "get_resolver",
+    "resolve_user",
+    "resolve_channel",
+    "KIND_USER",
+    "KIND_CHANNEL",
+    "KIND_MESSAGE",
+]
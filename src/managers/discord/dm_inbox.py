@@ -0,0 +1,391 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+DM Inbox for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-24.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Queue Ash session DMs per user with a single consumer each
+- Merge DMs sent within a debounce window into one conversational turn
+- Merge DMs that arrive while a reply is in flight into the next turn
+- Report turn sizes
+
+USAGE:
+    from src.managers.discord.dm_inbox import create_dm_inbox
+
+    inbox = create_dm_inbox(
+        config_manager=config_manager,
+        on_turn=handle_ash_turn,
+        metrics_manager=metrics_manager,
+    )
+
+    inbox.add(message)  # on_turn(DMTurn) runs once per merged turn
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+
+# Module version
+__version__ = "v5.0-10-24.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# DM Turn
+# =============================================================================
+
+
+@dataclass
+class DMTurn:
+    """
+    One or more DMs from a user answered as a single turn.
+
+    Attributes:
+        messages: Messages in arrival order
+        received_at: Monotonic timestamp of the first message
+        last_received_at: Monotonic timestamp of the latest message
+    """
+
+    messages: List[discord.Message]
+    received_at: float = field(default_factory=time.monotonic)
+    last_received_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def anchor(self) -> discord.Message:
+        """Get the most recent message in the turn."""
+        return self.messages[-1]
+
+    @property
+    def size(self) -> int:
+        """Get number of messages in the turn."""
+        return len(self.messages)
+
+    @property
+    def content(self) -> str:
+        """Get combined message content, one message per line."""
+        return "\n".join(m.content for m in self.messages if m.content)
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the first message in the turn arrived."""
+        return time.monotonic() - self.received_at
+
+
+# =============================================================================
+# DM Inbox
+# =============================================================================
+
+
+class DMInbox:
+    """
+    Serializes Ash session DMs per user.
+
+    Each user with pending DMs has one consumer task. It waits until no
+    new DM has arrived for the debounce window (capped by the maximum
+    wait and message count), then hands everything pending to on_turn
+    as one turn. DMs that arrive while on_turn is running wait for it to
+    finish and become the next turn, so session history never
+    interleaves and each turn costs one Claude call.
+
+    Example:
+        >>> inbox = create_dm_inbox(config, manager._handle_ash_turn, metrics)
+        >>> inbox.add(message)
+    """
+
+    # Default configuration
+    DEFAULT_DEBOUNCE_SECONDS = 1.5
+    DEFAULT_MAX_WAIT_SECONDS = 6.0
+    DEFAULT_MAX_MESSAGES = 10
+
+    def __init__(
+        self,
+        on_turn: Callable[[DMTurn], Awaitable[None]],
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize DMInbox.
+
+        Args:
+            on_turn: Coroutine handling each merged turn
+            debounce_seconds: Quiet period that ends a turn
+            max_wait_seconds: Maximum age of a turn before it is handled
+            max_messages: Maximum messages per turn
+            metrics_manager: Optional metrics manager
+
+        Note:
+            Use create_dm_inbox() factory function.
+        """
+        self._on_turn = on_turn
+        self._debounce = max(0.0, float(debounce_seconds))
+        self._max_wait = max(self._debounce, float(max_wait_seconds))
+        self._max_messages = max(1, int(max_messages))
+        self._metrics = metrics_manager
+
+        # user_id -> pending turn and its consumer
+        self._pending: Dict[int, DMTurn] = {}
+        self._consumers: Dict[int, asyncio.Task] = {}
+        self._arrived: Dict[int, asyncio.Event] = {}
+
+        # Statistics
+        self._turns_handled = 0
+        self._messages_merged = 0
+
+        logger.info(
+            f"✅ DMInbox initialized "
+            f"(debounce={self._debounce}s, max_wait={self._max_wait}s, "
+            f"max_messages={self._max_messages})"
+        )
+
+    # =========================================================================
+    # Inbox
+    # =========================================================================
+
+    def add(self, message: discord.Message) -> None:
+        """
+        Queue a DM for its user's next turn.
+
+        Args:
+            message: Discord DM message
+        """
+        user_id = message.author.id
+        now = time.monotonic()
+
+        turn = self._pending.get(user_id)
+        if turn is None:
+            self._pending[user_id] = DMTurn(
+                messages=[message], received_at=now, last_received_at=now
+            )
+        else:
+            turn.messages.append(message)
+            turn.last_received_at = now
+
+        if user_id in self._consumers:
+            self._arrived[user_id].set()
+            return
+
+        self._arrived[user_id] = asyncio.Event()
+        self._consumers[user_id] = asyncio.create_task(
+            self._consume(user_id), name=f"ash-dm-inbox-{user_id}"
+        )
+
+    async def _consume(self, user_id: int) -> None:
+        """
+        Hand one user's pending DMs to on_turn, one turn at a time.
+
+        Args:
+            user_id: Discord user ID
+        """
+        arrived = self._arrived[user_id]
+
+        try:
+            while user_id in self._pending:
+                await self._wait_for_quiet(user_id, arrived)
+
+                turn = self._pending.pop(user_id)
+                self._record(turn)
+
+                try:
+                    await self._on_turn(turn)
+                except Exception as e:
+                    logger.error(
+                        f"❌ Failed to handle Ash DM turn for user {user_id}: {e}",
+                        exc_info=True,
+                    )
+
+        finally:
+            # Nothing left (or cancelled) - the next DM starts a new consumer
+            self._consumers.pop(user_id, None)
+            self._arrived.pop(user_id, None)
+
+    async def _wait_for_quiet(self, user_id: int, arrived: asyncio.Event) -> None:
+        """
+        Wait until the pending turn is complete.
+
+        Args:
+            user_id: Discord user ID
+            arrived: Event set whenever a new DM is queued
+        """
+        while True:
+            turn = self._pending[user_id]
+            if turn.size >= self._max_messages:
+                return
+
+            now = time.monotonic()
+            wait = min(
+                turn.last_received_at + self._debounce,
+                turn.received_at + self._max_wait,
+            ) - now
+            if wait <= 0:
+                return
+
+            arrived.clear()
+            try:
+                await asyncio.wait_for(arrived.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                return
+
+    def _record(self, turn: DMTurn) -> None:
+        """
+        Record statistics for a turn about to be handled.
+
+        Args:
+            turn: Merged DM turn
+        """
+        self._turns_handled += 1
+        self._messages_merged += turn.size - 1
+
+        if self._metrics:
+            self._metrics.observe_dm_turn_size(turn.size)
+
+        if turn.size > 1:
+            logger.debug(
+                f"📦 Merged {turn.size} DMs from user {turn.anchor.author.id} "
+                f"into one turn"
+            )
+
+    async def close(self) -> int:
+        """
+        Drop pending DMs and stop all consumers (used on shutdown).
+
+        Returns:
+            Number of pending turns discarded
+        """
+        count = len(self._pending)
+        self._pending.clear()
+
+        consumers = list(self._consumers.values())
+        for task in consumers:
+            task.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+
+        return count
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def pending_count(self) -> int:
+        """Get number of users with DMs waiting for a turn."""
+        return len(self._pending)
+
+    def is_busy(self, user_id: int) -> bool:
+        """Check if a user's DMs are queued or being answered."""
+        return user_id in self._consumers
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> dict:
+        """
+        Get DM inbox status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "debounce_seconds": self._debounce,
+            "max_wait_seconds": self._max_wait,
+            "max_messages": self._max_messages,
+            "pending_turns": len(self._pending),
+            "active_consumers": len(self._consumers),
+            "turns_handled": self._turns_handled,
+            "messages_merged": self._messages_merged,
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"DMInbox(pending={len(self._pending)}, "
+            f"consumers={len(self._consumers)}, merged={self._messages_merged})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_dm_inbox(
+    config_manager: "ConfigManager",
+    on_turn: Callable[[DMTurn], Awaitable[None]],
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> DMInbox:
+    """
+    Factory function for DMInbox.
+
+    Creates a DMInbox configured from the ash section.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        on_turn: Coroutine handling each merged turn
+        metrics_manager: Optional metrics manager
+
+    Returns:
+        Configured DMInbox instance
+
+    Example:
+        >>> inbox = create_dm_inbox(
+        ...     config_manager=config,
+        ...     on_turn=manager._handle_ash_turn,
+        ...     metrics_manager=metrics,
+        ... )
+    """
+    logger.info("🏭 Creating DMInbox")
+
+    return DMInbox(
+        on_turn=on_turn,
+        debounce_seconds=config_manager.get(
+            "ash", "dm_debounce_seconds", DMInbox.DEFAULT_DEBOUNCE_SECONDS
+        ),
+        max_wait_seconds=config_manager.get(
+            "ash", "dm_max_wait_seconds", DMInbox.DEFAULT_MAX_WAIT_SECONDS
+        ),
+        max_messages=config_manager.get(
+            "ash", "dm_max_messages", DMInbox.DEFAULT_MAX_MESSAGES
+        ),
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "DMInbox",
+    "DMTurn",
+    "create_dm_inbox",
+]
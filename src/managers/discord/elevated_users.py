@@ -0,0 +1,327 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Elevated User Tracker for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-3.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Remember users who recently had a LOW+ message stored in history
+- Answer "is this user elevated?" synchronously for the analysis queue
+- Persist elevated users in Redis so they survive restarts
+- Share elevated users between replicas via periodic refresh
+
+REDIS KEYS:
+- ash:analysis:elevated  Sorted set, member = user ID, score = expiry (Unix)
+
+USAGE:
+    from src.managers.discord import create_elevated_user_tracker
+
+    tracker = create_elevated_user_tracker(
+        config_manager=config_manager,
+        redis_manager=redis_manager,
+    )
+
+    tracker.set_scheduler_manager(scheduler)  # Refresh from Redis periodically
+    await tracker.mark(user_id)      # After a LOW+ message is stored
+    tracker.is_elevated(user_id)     # From the (synchronous) classifier
+"""
+
+import logging
+import time
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.storage.redis_manager import RedisManager
+    from src.managers.scheduling.scheduler_manager import SchedulerManager
+
+# Module version
+__version__ = "v5.0-10-3.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+REDIS_KEY_ELEVATED = "ash:analysis:elevated"
+
+# Scheduler job key for the periodic refresh
+REFRESH_JOB_KEY = "elevated_user_refresh"
+
+# Local entries kept before expired ones are pruned
+LOCAL_PRUNE_THRESHOLD = 10000
+
+
+# =============================================================================
+# Elevated User Tracker
+# =============================================================================
+
+
+class ElevatedUserTracker:
+    """
+    Tracks users whose messages are scheduled ahead of general traffic.
+
+    Lookups are served from a local dict because the analysis queue
+    classifies bursts synchronously. Marks are written through to a
+    Redis sorted set scored by expiry, and refresh() replaces the local
+    view with the set, so elevation survives restarts and marks made by
+    other replicas are picked up on the next refresh.
+
+    Without Redis the tracker is process-local.
+
+    Example:
+        >>> tracker = create_elevated_user_tracker(config, redis)
+        >>> await tracker.mark(123)
+        >>> tracker.is_elevated(123)
+        True
+    """
+
+    DEFAULT_TTL_SECONDS = 21600
+    DEFAULT_REFRESH_SECONDS = 60.0
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        refresh_seconds: float = DEFAULT_REFRESH_SECONDS,
+        redis_manager: Optional["RedisManager"] = None,
+    ):
+        """
+        Initialize ElevatedUserTracker.
+
+        Args:
+            ttl_seconds: Seconds a user stays elevated after a mark
+            refresh_seconds: Interval between refreshes from Redis
+            redis_manager: Optional Redis manager for persistence
+
+        Note:
+            Use create_elevated_user_tracker() factory function.
+        """
+        self._ttl = max(0, int(ttl_seconds))
+        self._refresh_seconds = max(1.0, float(refresh_seconds))
+        self._redis = redis_manager
+
+        # user_id -> Unix expiry time
+        self._expiry: Dict[int, float] = {}
+
+        logger.info(
+            f"✅ ElevatedUserTracker initialized "
+            f"(ttl={self._ttl}s, persistent={redis_manager is not None})"
+        )
+
+    def set_scheduler_manager(
+        self,
+        scheduler: "SchedulerManager",
+    ) -> None:
+        """
+        Set the scheduler used to refresh elevated users from Redis.
+
+        The first refresh runs immediately, loading users elevated
+        before a restart.
+
+        Args:
+            scheduler: SchedulerManager instance
+        """
+        if not self._redis:
+            return
+
+        scheduler.schedule(
+            REFRESH_JOB_KEY,
+            self.refresh,
+            delay=0,
+            retry_after=self._refresh_seconds,
+        )
+        logger.debug("SchedulerManager injected into ElevatedUserTracker")
+
+    # =========================================================================
+    # Tracking
+    # =========================================================================
+
+    def is_elevated(self, user_id: int) -> bool:
+        """
+        Check if a user is currently elevated.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            True if the user was marked within the TTL
+        """
+        expiry = self._expiry.get(user_id)
+        if expiry is None:
+            return False
+        if expiry > time.time():
+            return True
+        del self._expiry[user_id]
+        return False
+
+    async def mark(self, user_id: int) -> None:
+        """
+        Elevate a user for the configured TTL.
+
+        Called after a LOW+ message is stored in history.
+
+        Args:
+            user_id: Discord user ID
+        """
+        if not self._ttl:
+            return
+
+        now = time.time()
+        expiry = now + self._ttl
+        self._expiry[user_id] = expiry
+
+        if len(self._expiry) > LOCAL_PRUNE_THRESHOLD:
+            self._expiry = {
+                uid: until for uid, until in self._expiry.items() if until > now
+            }
+
+        if self._redis:
+            await self._redis.zadd(REDIS_KEY_ELEVATED, expiry, str(user_id))
+
+    async def refresh(self) -> Optional[float]:
+        """
+        Replace the local view with the elevated users stored in Redis.
+
+        Expired members are removed from Redis first. Usable directly as
+        a scheduler job callback.
+
+        Returns:
+            Seconds until the next refresh (None without Redis)
+        """
+        if not self._redis:
+            return None
+        if not self._redis.is_connected:
+            # Keep the local view until Redis is back
+            return self._refresh_seconds
+
+        now = time.time()
+        try:
+            await self._redis.zremrangebyscore(REDIS_KEY_ELEVATED, "-inf", now)
+            members = await self._redis.zrangebyscore(
+                REDIS_KEY_ELEVATED, now, "+inf", withscores=True
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to refresh elevated users: {e}")
+            return self._refresh_seconds
+
+        refreshed = {int(uid): float(until) for uid, until in members}
+
+        # Keep local marks whose write may not have reached Redis
+        for uid, until in self._expiry.items():
+            if until > now and refreshed.get(uid, 0.0) < until:
+                refreshed[uid] = until
+        self._expiry = refreshed
+
+        logger.debug(f"🔄 Refreshed {len(self._expiry)} elevated users")
+        return self._refresh_seconds
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def count(self) -> int:
+        """Get number of tracked users (including not-yet-pruned expired)."""
+        return len(self._expiry)
+
+    @property
+    def refresh_seconds(self) -> float:
+        """Get the interval between refreshes from Redis."""
+        return self._refresh_seconds
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> dict:
+        """
+        Get elevated user tracker status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "ttl_seconds": self._ttl,
+            "refresh_seconds": self._refresh_seconds,
+            "persistent": self._redis is not None,
+            "tracked_users": len(self._expiry),
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"ElevatedUserTracker(users={len(self._expiry)}, "
+            f"persistent={self._redis is not None})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_elevated_user_tracker(
+    config_manager: "ConfigManager",
+    redis_manager: Optional["RedisManager"] = None,
+) -> ElevatedUserTracker:
+    """
+    Factory function for ElevatedUserTracker.
+
+    Creates an ElevatedUserTracker configured from the analysis_queue section.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        redis_manager: Optional Redis manager (process-local without it)
+
+    Returns:
+        Configured ElevatedUserTracker instance
+
+    Example:
+        >>> tracker = create_elevated_user_tracker(config, redis_manager)
+    """
+    logger.info("🏭 Creating ElevatedUserTracker")
+
+    return ElevatedUserTracker(
+        ttl_seconds=config_manager.get(
+            "analysis_queue",
+            "elevated_user_ttl_seconds",
+            ElevatedUserTracker.DEFAULT_TTL_SECONDS,
+        ),
+        refresh_seconds=config_manager.get(
+            "analysis_queue",
+            "elevated_user_refresh_seconds",
+            ElevatedUserTracker.DEFAULT_REFRESH_SECONDS,
+        ),
+        redis_manager=redis_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "ElevatedUserTracker",
+    "create_elevated_user_tracker",
+    "REDIS_KEY_ELEVATED",
+]
@@ -0,0 +1,868 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Outbound Discord Queue for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-17.0-3
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Funnel bot-initiated REST calls (sends, edits, deletes, fetches) through
+  one queue
+- Serve them strictly by priority class so background posts never delay
+  a crisis alert
+- Track a rate-limit bucket per route and a global bucket, and only
+  dispatch calls whose bucket has room (no head-of-line blocking)
+- Honour Retry-After on 429 responses and retry the call (the Discord
+  client is created with max_ratelimit_timeout so long waits reach us)
+- Never drop a critical call because its caller stopped waiting; calls
+  of other classes whose caller gave up are dropped and counted as
+  abandoned per priority
+- Report queueing delay, outcomes and per-route 429 counts
+
+PRIORITY CLASSES (highest first):
+    critical: HIGH/CRITICAL and escalation alerts
+    alert:    MEDIUM alerts and alert digests
+    edit:     embed edits and the fetches they need
+    summary:  session summaries and weekly reports
+    dm:       follow-up DMs and Ash replies
+
+    One in-flight slot is held back for critical calls, so a backlog of
+    slow report posts cannot occupy every slot when an alert arrives.
+
+USAGE:
+    from src.managers.discord import create_outbound_queue
+    from src.managers.discord.outbound_queue import (
+        PRIORITY_SUMMARY,
+        send_message,
+    )
+
+    outbound_queue = create_outbound_queue(config_manager, metrics_manager)
+    outbound_queue.start()
+
+    await send_message(outbound_queue, channel, PRIORITY_SUMMARY, embed=embed)
+
+    await outbound_queue.stop()
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+
+# Module version
+__version__ = "v5.0-10-17.0-3"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Priority classes, lower value is served first
+PRIORITY_CRITICAL = 0
+PRIORITY_ALERT = 1
+PRIORITY_EDIT = 2
+PRIORITY_SUMMARY = 3
+PRIORITY_DM = 4
+
+PRIORITY_NAMES: Dict[int, str] = {
+    PRIORITY_CRITICAL: "critical",
+    PRIORITY_ALERT: "alert",
+    PRIORITY_EDIT: "edit",
+    PRIORITY_SUMMARY: "summary",
+    PRIORITY_DM: "dm",
+}
+
+# Route kinds (route keys are "<kind>:<channel or user id>")
+ROUTE_SEND = "send"
+ROUTE_EDIT = "edit"
+ROUTE_FETCH = "fetch"
+ROUTE_DELETE = "delete"
+ROUTE_DM = "dm"
+
+# Retry-After used when a 429 carries no usable header
+DEFAULT_RETRY_AFTER = 1.0
+
+# Smallest max_ratelimit_timeout discord.py accepts. Longer waits are
+# raised as discord.RateLimited instead of being slept inside discord.py.
+MIN_RATELIMIT_TIMEOUT = 30.0
+
+# Routes listed individually in get_status()
+MAX_TRACKED_ROUTES = 50
+
+# Idle buckets are pruned once this many exist
+BUCKET_PRUNE_THRESHOLD = 500
+
+
+# =============================================================================
+# Rate Limit Bucket
+# =============================================================================
+
+
+class RouteBucket:
+    """
+    Sliding-window rate limit for one route.
+
+    Allows limit calls per period, and can be blocked outright until a
+    Retry-After deadline after a 429.
+    """
+
+    def __init__(self, limit: int, period: float):
+        """
+        Initialize RouteBucket.
+
+        Args:
+            limit: Calls allowed per period
+            period: Window length in seconds
+        """
+        self._limit = max(1, int(limit))
+        self._period = float(period)
+        self._calls: Deque[float] = deque()
+        self._blocked_until = 0.0
+
+    def ready_at(self, now: float) -> float:
+        """Get the monotonic time at which the next call may go out."""
+        while self._calls and self._calls[0] <= now - self._period:
+            self._calls.popleft()
+
+        ready = now
+        if len(self._calls) >= self._limit:
+            ready = self._calls[0] + self._period
+        return max(ready, self._blocked_until)
+
+    def consume(self, now: float) -> None:
+        """Record a call going out."""
+        self._calls.append(now)
+
+    def block(self, seconds: float) -> None:
+        """Hold all calls on this route for seconds (after a 429)."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def is_idle(self, now: float) -> bool:
+        """Check if the bucket holds no state worth keeping."""
+        return self.ready_at(now) <= now and not self._calls
+
+
+# =============================================================================
+# Outbound Job
+# =============================================================================
+
+
+@dataclass
+class OutboundJob:
+    """
+    A Discord REST call waiting for its turn.
+
+    Attributes:
+        route: Rate-limit route key (e.g. "send:123")
+        priority: Priority class (PRIORITY_*)
+        call: Zero-argument coroutine function performing the call
+        future: Resolved with the call's result or exception
+        enqueued_at: Monotonic timestamp when the job was queued
+        attempts: Number of 429 retries so far
+    """
+
+    route: str
+    priority: int
+    call: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+    @property
+    def kind(self) -> str:
+        """Route kind (send, edit, delete, fetch, dm)."""
+        return self.route.split(":", 1)[0]
+
+
+# =============================================================================
+# Outbound Queue
+# =============================================================================
+
+
+class OutboundQueue:
+    """
+    Priority queue for bot-initiated Discord REST calls.
+
+    Jobs are dispatched by a single scheduler task: it picks the
+    highest-priority job whose route bucket and the global bucket have
+    room, and runs it in the background up to max_in_flight at a time.
+    When the queue is not running, calls go straight to Discord.
+
+    Example:
+        >>> queue = OutboundQueue(max_in_flight=4)
+        >>> queue.start()
+        >>> msg = await queue.send(channel, PRIORITY_CRITICAL, embed=embed)
+    """
+
+    DEFAULT_MAX_IN_FLIGHT = 4
+    DEFAULT_ROUTE_LIMIT = 5
+    DEFAULT_ROUTE_PERIOD = 5.0
+    DEFAULT_GLOBAL_PER_SECOND = 45
+    DEFAULT_MAX_RETRIES = 3
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        route_limit: int = DEFAULT_ROUTE_LIMIT,
+        route_period_seconds: float = DEFAULT_ROUTE_PERIOD,
+        global_per_second: int = DEFAULT_GLOBAL_PER_SECOND,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize OutboundQueue.
+
+        Args:
+            max_in_flight: Max concurrent REST calls
+            route_limit: Calls allowed per route per period
+            route_period_seconds: Route bucket window in seconds
+            global_per_second: Calls allowed per second across all routes
+            max_retries: Retries of a call after 429 responses
+            metrics_manager: Optional metrics manager
+        """
+        self._max_in_flight = max(1, int(max_in_flight))
+        # Slots usable by anything below critical
+        self._shared_slots = max(1, self._max_in_flight - 1)
+        self._route_limit = int(route_limit)
+        self._route_period = float(route_period_seconds)
+        self._max_retries = max(0, int(max_retries))
+        self._metrics = metrics_manager
+
+        self._queues: Dict[int, Deque[OutboundJob]] = {
+            priority: deque() for priority in PRIORITY_NAMES
+        }
+        self._buckets: Dict[str, RouteBucket] = {}
+        self._global = RouteBucket(global_per_second, 1.0)
+
+        self._wakeup = asyncio.Event()
+        self._scheduler: Optional[asyncio.Task] = None
+        self._running: set = set()
+        self._in_flight = 0
+
+        # Statistics
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._abandoned: Dict[str, int] = {name: 0 for name in PRIORITY_NAMES.values()}
+        self._retried = 0
+        self._rate_limited = 0
+        self._route_429s: "OrderedDict[str, int]" = OrderedDict()
+        self._max_delay: Dict[str, float] = {name: 0.0 for name in PRIORITY_NAMES.values()}
+
+        logger.info(
+            f"✅ OutboundQueue initialized "
+            f"(in_flight={self._max_in_flight}, "
+            f"route={self._route_limit}/{self._route_period:.0f}s, "
+            f"global={global_per_second}/s)"
+        )
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> bool:
+        """
+        Start the scheduler task.
+
+        Returns:
+            True if started, False if already running
+        """
+        if self.is_running:
+            return False
+
+        self._scheduler = asyncio.create_task(
+            self._schedule_loop(), name="discord-outbound-queue"
+        )
+        logger.info("📤 Outbound Discord queue started")
+        return True
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """
+        Stop the scheduler.
+
+        Waits up to drain_timeout for queued calls to go out, then runs
+        anything left directly so no alert is lost on shutdown.
+
+        Args:
+            drain_timeout: Seconds to let the queue drain
+        """
+        if self._scheduler is None:
+            return
+
+        deadline = time.monotonic() + drain_timeout
+        while (self.depth or self._in_flight) and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+
+        self._scheduler.cancel()
+        await asyncio.gather(self._scheduler, return_exceptions=True)
+        self._scheduler = None
+
+        leftover = [job for queue in self._queues.values() for job in queue]
+        for queue in self._queues.values():
+            queue.clear()
+        if leftover:
+            logger.warning(f"⚠️ Sending {len(leftover)} queued Discord calls directly on shutdown")
+            for job in leftover:
+                if self._abandon(job):
+                    continue
+                self._in_flight += 1
+                await self._execute(job, requeue=False)
+
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+        self._update_depth_metric()
+        logger.info("📤 Outbound Discord queue stopped")
+
+    # =========================================================================
+    # Submission
+    # =========================================================================
+
+    async def submit(
+        self,
+        route: str,
+        priority: int,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Queue a REST call and wait for its result.
+
+        Args:
+            route: Rate-limit route key ("<kind>:<id>")
+            priority: Priority class (PRIORITY_*)
+            call: Zero-argument coroutine function performing the call
+
+        Returns:
+            Whatever the call returns
+
+        Raises:
+            Whatever the call raises (after 429 retries are exhausted)
+        """
+        if not self.is_running:
+            return await call()
+
+        if priority not in self._queues:
+            priority = PRIORITY_DM
+
+        future = asyncio.get_running_loop().create_future()
+        self._queues[priority].append(
+            OutboundJob(route=route, priority=priority, call=call, future=future)
+        )
+        self._submitted += 1
+        self._update_depth_metric()
+        self._wakeup.set()
+
+        return await future
+
+    async def send(
+        self,
+        target: Any,
+        priority: int,
+        *args: Any,
+        route_kind: str = ROUTE_SEND,
+        **kwargs: Any,
+    ) -> Any:
+        """Queue target.send(*args, **kwargs) on the target's send route."""
+        route = f"{route_kind}:{getattr(target, 'id', 0)}"
+        return await self.submit(route, priority, lambda: target.send(*args, **kwargs))
+
+    async def edit(self, message: Any, priority: int, **kwargs: Any) -> Any:
+        """Queue message.edit(**kwargs) on the channel's edit route."""
+        route = f"{ROUTE_EDIT}:{_channel_id(message)}"
+        return await self.submit(route, priority, lambda: message.edit(**kwargs))
+
+    async def delete(self, message: Any, priority: int) -> None:
+        """Queue message.delete() on the channel's delete route."""
+        route = f"{ROUTE_DELETE}:{_channel_id(message)}"
+        return await self.submit(route, priority, message.delete)
+
+    async def fetch_message(self, channel: Any, message_id: int, priority: int) -> Any:
+        """Queue channel.fetch_message(message_id) on the channel's fetch route."""
+        route = f"{ROUTE_FETCH}:{getattr(channel, 'id', 0)}"
+        return await self.submit(route, priority, lambda: channel.fetch_message(message_id))
+
+    # =========================================================================
+    # Scheduling
+    # =========================================================================
+
+    async def _schedule_loop(self) -> None:
+        """Dispatch jobs as slots and rate-limit buckets allow."""
+        try:
+            while True:
+                job = await self._wait_for_job()
+                task = asyncio.create_task(self._execute(job))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+        except asyncio.CancelledError:
+            pass
+
+    async def _wait_for_job(self) -> OutboundJob:
+        """Wait until a job can be dispatched and take it."""
+        while True:
+            # Cleared before scanning so a submit during the wait is not lost
+            self._wakeup.clear()
+            job, wait = self._next_job(time.monotonic())
+            if job is not None:
+                return job
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def _next_job(self, now: float):
+        """
+        Take the highest-priority job that may go out now.
+
+        Returns:
+            Tuple of (job or None, seconds until something may become
+            ready or None to wait for the next submit/completion)
+        """
+        if self._in_flight >= self._max_in_flight:
+            return None, None
+
+        global_ready = self._global.ready_at(now)
+        if global_ready > now:
+            return None, global_ready - now
+
+        earliest: Optional[float] = None
+        for priority, queue in self._queues.items():
+            if priority != PRIORITY_CRITICAL and self._in_flight >= self._shared_slots:
+                break
+
+            blocked = set()
+            index = 0
+            while index < len(queue):
+                job = queue[index]
+                if self._abandon(job):
+                    del queue[index]
+                    continue
+
+                if job.route in blocked:
+                    index += 1
+                    continue
+
+                bucket = self._bucket(job.route)
+                ready = bucket.ready_at(now)
+                if ready <= now:
+                    del queue[index]
+                    bucket.consume(now)
+                    self._global.consume(now)
+                    # Slot is taken now, before the task gets to run
+                    self._in_flight += 1
+                    return job, None
+
+                blocked.add(job.route)
+                earliest = ready if earliest is None else min(earliest, ready)
+                index += 1
+
+        if len(self._buckets) > BUCKET_PRUNE_THRESHOLD:
+            self._prune_buckets(now)
+
+        return None, (earliest - now) if earliest is not None else None
+
+    def _abandon(self, job: OutboundJob) -> bool:
+        """
+        Check if a queued job should be dropped because its caller gave up.
+
+        Critical calls are still sent: the caller timing out does not make
+        the alert any less needed. Anything else is counted as abandoned.
+
+        Returns:
+            True if the job should be dropped
+        """
+        if not job.future.done() or job.priority == PRIORITY_CRITICAL:
+            return False
+
+        name = PRIORITY_NAMES[job.priority]
+        self._abandoned[name] += 1
+        if self._metrics:
+            self._metrics.inc_outbound_sends(name, "abandoned")
+        logger.debug(f"Dropping {name} call on {job.route}, caller gave up")
+        return True
+
+    def _bucket(self, route: str) -> RouteBucket:
+        """Get or create the bucket for a route."""
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            bucket = RouteBucket(self._route_limit, self._route_period)
+            self._buckets[route] = bucket
+        return bucket
+
+    def _prune_buckets(self, now: float) -> None:
+        """Drop buckets with no recent calls and no block."""
+        queued = {job.route for queue in self._queues.values() for job in queue}
+        for route in [
+            r for r, b in self._buckets.items() if r not in queued and b.is_idle(now)
+        ]:
+            del self._buckets[route]
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    async def _execute(self, job: OutboundJob, requeue: bool = True) -> None:
+        """
+        Run one job and resolve its future (or requeue it after a 429).
+
+        The caller has already counted the job in _in_flight; the slot is
+        released here.
+        """
+        name = PRIORITY_NAMES[job.priority]
+        if job.attempts == 0:
+            delay = time.monotonic() - job.enqueued_at
+            self._max_delay[name] = max(self._max_delay[name], delay)
+            if self._metrics:
+                self._metrics.observe_outbound_queue_delay(delay, name)
+
+        try:
+            result = await job.call()
+
+        except asyncio.CancelledError:
+            if not job.future.done():
+                job.future.cancel()
+            raise
+
+        except Exception as e:
+            retry_after = _retry_after(e)
+            if retry_after is not None:
+                self._record_rate_limit(job, e, retry_after)
+                if requeue and job.attempts < self._max_retries:
+                    job.attempts += 1
+                    self._retried += 1
+                    # Front of its class so it keeps its place once unblocked
+                    self._queues[job.priority].appendleft(job)
+                    return
+
+            self._failed += 1
+            if self._metrics:
+                self._metrics.inc_outbound_sends(name, "failed")
+            if not job.future.done():
+                job.future.set_exception(e)
+
+        else:
+            self._completed += 1
+            if self._metrics:
+                self._metrics.inc_outbound_sends(name, "sent")
+            if not job.future.done():
+                job.future.set_result(result)
+
+        finally:
+            self._in_flight -= 1
+            self._update_depth_metric()
+            self._wakeup.set()
+
+    def _record_rate_limit(self, job: OutboundJob, error: Exception, retry_after: float) -> None:
+        """Block the route (or everything, for a global limit) and count the 429."""
+        if _is_global(error):
+            self._global.block(retry_after)
+        else:
+            self._bucket(job.route).block(retry_after)
+
+        self._rate_limited += 1
+        self._route_429s[job.route] = self._route_429s.pop(job.route, 0) + 1
+        while len(self._route_429s) > MAX_TRACKED_ROUTES:
+            self._route_429s.popitem(last=False)
+
+        if self._metrics:
+            self._metrics.inc_discord_rate_limited(job.kind)
+
+        logger.warning(
+            f"⏳ Discord rate limit on {job.route} "
+            f"({PRIORITY_NAMES[job.priority]}), retry after {retry_after:.2f}s"
+        )
+
+    def _update_depth_metric(self) -> None:
+        """Push current queue depth to metrics."""
+        if self._metrics:
+            self._metrics.set_outbound_queue_depth(self.depth)
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the scheduler is running."""
+        return self._scheduler is not None and not self._scheduler.done()
+
+    @property
+    def depth(self) -> int:
+        """Get number of calls waiting in the queue."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def rate_limited(self) -> int:
+        """Get count of 429 responses seen."""
+        return self._rate_limited
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> dict:
+        """
+        Get outbound queue status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "running": self.is_running,
+            "depth": self.depth,
+            "depth_by_priority": {
+                PRIORITY_NAMES[p]: len(q) for p, q in self._queues.items()
+            },
+            "in_flight": self._in_flight,
+            "max_in_flight": self._max_in_flight,
+            "route_limit": self._route_limit,
+            "route_period_seconds": self._route_period,
+            "tracked_buckets": len(self._buckets),
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "abandoned_by_priority": dict(self._abandoned),
+            "retried": self._retried,
+            "rate_limited": self._rate_limited,
+            "rate_limited_by_route": dict(self._route_429s),
+            "max_queue_delay_seconds": {
+                name: round(delay, 3) for name, delay in self._max_delay.items()
+            },
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"OutboundQueue(depth={self.depth}, in_flight={self._in_flight}/"
+            f"{self._max_in_flight}, rate_limited={self._rate_limited})"
+        )
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _channel_id(message: Any) -> int:
+    """Get the channel ID of a message (0 if unknown)."""
+    channel = getattr(message, "channel", None)
+    return getattr(channel, "id", 0) or 0
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Get Retry-After seconds if error is a 429, else None."""
+    rate_limited = getattr(discord, "RateLimited", None)
+    if isinstance(rate_limited, type) and isinstance(error, rate_limited):
+        return float(getattr(error, "retry_after", DEFAULT_RETRY_AFTER))
+
+    if isinstance(error, discord.HTTPException) and getattr(error, "status", None) == 429:
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        try:
+            return float(headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+        except (TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER
+
+    return None
+
+
+def _is_global(error: Exception) -> bool:
+    """Check if a 429 applies to the whole bot rather than one route."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    return str(headers.get("X-RateLimit-Global", "")).lower() == "true"
+
+
+async def send_message(
+    queue: Optional[OutboundQueue],
+    target: Any,
+    priority: int,
+    *args: Any,
+    route_kind: str = ROUTE_SEND,
+    **kwargs: Any,
+) -> Any:
+    """
+    Send through the outbound queue, or directly if there is none.
+
+    Args:
+        queue: Outbound queue (None sends directly)
+        target: Channel, DM channel or user to send to
+        priority: Priority class (PRIORITY_*)
+        route_kind: Route kind for rate-limit accounting
+        *args, **kwargs: Passed to target.send()
+
+    Returns:
+        The sent discord.Message
+    """
+    if queue is None:
+        return await target.send(*args, **kwargs)
+    return await queue.send(target, priority, *args, route_kind=route_kind, **kwargs)
+
+
+async def edit_message(
+    queue: Optional[OutboundQueue],
+    message: Any,
+    priority: int,
+    **kwargs: Any,
+) -> Any:
+    """Edit through the outbound queue, or directly if there is none."""
+    if queue is None:
+        return await message.edit(**kwargs)
+    return await queue.edit(message, priority, **kwargs)
+
+
+async def delete_message(
+    queue: Optional[OutboundQueue],
+    message: Any,
+    priority: int,
+) -> None:
+    """Delete through the outbound queue, or directly if there is none."""
+    if queue is None:
+        return await message.delete()
+    return await queue.delete(message, priority)
+
+
+async def fetch_message(
+    queue: Optional[OutboundQueue],
+    channel: Any,
+    message_id: int,
+    priority: int,
+) -> Any:
+    """Fetch a message through the outbound queue, or directly if there is none."""
+    if queue is None:
+        return await channel.fetch_message(message_id)
+    return await queue.fetch_message(channel, message_id, priority)
+
+
+def get_max_ratelimit_timeout(config_manager: "ConfigManager") -> Optional[float]:
+    """
+    Get the max_ratelimit_timeout to create the Discord client with.
+
+    discord.py sleeps through 429s internally unless this is set, so the
+    queue would never see them. With the queue disabled, None keeps
+    discord.py's default of waiting out every limit.
+
+    Args:
+        config_manager: Configuration manager instance
+
+    Returns:
+        Seconds (at least MIN_RATELIMIT_TIMEOUT), or None
+    """
+    if not config_manager.get("discord_outbound", "enabled", True):
+        return None
+
+    try:
+        timeout = float(config_manager.get(
+            "discord_outbound", "max_ratelimit_timeout_seconds", MIN_RATELIMIT_TIMEOUT
+        ))
+    except (TypeError, ValueError):
+        logger.warning(
+            f"⚠️ Invalid max_ratelimit_timeout_seconds, using {MIN_RATELIMIT_TIMEOUT}"
+        )
+        timeout = MIN_RATELIMIT_TIMEOUT
+    return max(MIN_RATELIMIT_TIMEOUT, timeout)
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_outbound_queue(
+    config_manager: "ConfigManager",
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> Optional[OutboundQueue]:
+    """
+    Factory function for OutboundQueue.
+
+    Creates an OutboundQueue configured from the discord_outbound section.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        metrics_manager: Optional metrics manager
+
+    Returns:
+        Configured OutboundQueue, or None if disabled
+
+    Example:
+        >>> outbound_queue = create_outbound_queue(config, metrics)
+        >>> outbound_queue.start()
+    """
+    logger.info("🏭 Creating OutboundQueue")
+
+    if not config_manager.get("discord_outbound", "enabled", True):
+        logger.info("⏭️ Outbound Discord queue disabled, sending directly")
+        return None
+
+    return OutboundQueue(
+        max_in_flight=config_manager.get(
+            "discord_outbound", "max_in_flight", OutboundQueue.DEFAULT_MAX_IN_FLIGHT
+        ),
+        route_limit=config_manager.get(
+            "discord_outbound", "route_limit", OutboundQueue.DEFAULT_ROUTE_LIMIT
+        ),
+        route_period_seconds=config_manager.get(
+            "discord_outbound", "route_period_seconds", OutboundQueue.DEFAULT_ROUTE_PERIOD
+        ),
+        global_per_second=config_manager.get(
+            "discord_outbound", "global_per_second", OutboundQueue.DEFAULT_GLOBAL_PER_SECOND
+        ),
+        max_retries=config_manager.get(
+            "discord_outbound", "max_retries", OutboundQueue.DEFAULT_MAX_RETRIES
+        ),
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "OutboundQueue",
+    "OutboundJob",
+    "RouteBucket",
+    "create_outbound_queue",
+    "get_max_ratelimit_timeout",
+    "send_message",
+    "edit_message",
+    "delete_message",
+    "fetch_message",
+    "PRIORITY_CRITICAL",
+    "PRIORITY_ALERT",
+    "PRIORITY_EDIT",
+    "PRIORITY_SUMMARY",
+    "PRIORITY_DM",
+    "PRIORITY_NAMES",
+    "ROUTE_SEND",
+    "ROUTE_EDIT",
+    "ROUTE_FETCH",
+    "ROUTE_DELETE",
+    "ROUTE_DM",
+]
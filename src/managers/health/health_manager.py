@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Health Manager for Ash-Bot Service
 ---
-FILE VERSION: v5.0-6-6.4-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-6-6.4-3
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 5 - Production Hardening
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,10 @@ RESPONSIBILITIES:
 - Track degradation reasons and recovery
 - Provide health check data for endpoints
 
+LEASES (Phase 10):
+- Background job lease state (leader/standby per job family) is reported
+  as the "leases" component when a LeaseManager is provided
+
 HEALTH STATES:
 - HEALTHY: All systems operational
 - DEGRADED: Some non-critical systems unavailable
@@ -53,7 +57,7 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
 # Module version
-__version__ = "v5.0-6-6.4-1"
+__version__ = "v5.0-6-6.4-3"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -64,6 +68,7 @@ if TYPE_CHECKING:
     from src.managers.nlp import NLPClientManager
     from src.managers.storage import RedisManager
     from src.managers.ash import AshSessionManager, AshPersonalityManager
+    from src.managers.scheduling import LeaseManager
     from src.managers.metrics import MetricsManager
 
 
@@ -211,6 +216,7 @@ class HealthManager:
         ash_personality_manager: Optional["AshPersonalityManager"] = None,
         metrics_manager: Optional["MetricsManager"] = None,
         version: str = "5.0.0",
+        lease_manager: Optional["LeaseManager"] = None,
     ):
         """
         Initialize HealthManager with component references.
@@ -223,6 +229,7 @@ class HealthManager:
             ash_personality_manager: Ash personality/Claude manager
             metrics_manager: Metrics collection manager
             version: Application version string
+            lease_manager: Background job lease manager (Phase 10)
         """
         self._discord = discord_manager
         self._nlp = nlp_client
@@ -230,6 +237,7 @@ class HealthManager:
         self._ash = ash_session_manager
         self._ash_personality = ash_personality_manager
         self._metrics = metrics_manager
+        self._leases = lease_manager
         self._version = version
         self._start_time = time.time()
 
@@ -285,6 +293,8 @@ class HealthManager:
             ("redis", self._check_redis_health()),
             ("ash", self._check_ash_health()),
         ]
+        if self._leases is not None:
+            check_tasks.append(("leases", self._check_lease_health()))
 
         for name, coro in check_tasks:
             try:
@@ -335,14 +345,31 @@ class HealthManager:
         Check if bot is ready to serve.
 
         A bot is ready if Discord is connected, which is
-        the minimum requirement for operation.
+        the minimum requirement for operation, and the analysis
+        queue is not saturated (Phase 10).
 
         Returns:
             True if ready to accept traffic
         """
         # Check Discord connection (minimum requirement)
         discord_health = await self._check_discord_health()
-        return discord_health.status == ComponentStatus.UP
+        if discord_health.status != ComponentStatus.UP:
+            return False
+
+        # Phase 10: Not ready while analysis backlog is saturated
+        return not self.is_analysis_queue_saturated()
+
+    def is_analysis_queue_saturated(self) -> bool:
+        """
+        Check if the Discord analysis queue is saturated (Phase 10).
+
+        Returns:
+            True if the queue fill ratio is at or above its threshold
+        """
+        if self._discord is None:
+            return False
+
+        return bool(getattr(self._discord, "is_analysis_queue_saturated", False))
 
     # =========================================================================
     # Individual Component Health Checks
@@ -391,7 +418,13 @@ class HealthManager:
                     message="Connected and ready",
                     last_check=datetime.utcnow(),
                     latency_ms=latency_ms,
-                    details={"guilds": guilds},
+                    details={
+                        "guilds": guilds,
+                        "analysis_queue_depth": getattr(
+                            self._discord, "analysis_queue_depth", 0
+                        ),
+                        "analysis_queue_saturated": self.is_analysis_queue_saturated(),
+                    },
                 )
             elif connected:
                 return ComponentHealth(
@@ -657,6 +690,48 @@ class HealthManager:
                 last_check=datetime.utcnow(),
             )
 
+    async def _check_lease_health(self) -> ComponentHealth:
+        """
+        Report background job lease state (Phase 10).
+
+        Standby is a normal state for a replica, so only losing contact
+        with Redis degrades this component.
+
+        Returns:
+            ComponentHealth for leases with per-lease details
+        """
+        status = self._leases.get_status()
+
+        if not status["enabled"]:
+            return ComponentHealth(
+                name="leases",
+                status=ComponentStatus.UP,
+                message="Lease coordination disabled (single replica)",
+                last_check=datetime.utcnow(),
+                details=status,
+            )
+
+        states = [lease["state"] for lease in status["leases"].values()]
+        leading = states.count("leader")
+
+        if "unreachable" in states:
+            mode = "running all jobs" if status["fail_open"] else "pausing unleased jobs"
+            return ComponentHealth(
+                name="leases",
+                status=ComponentStatus.DEGRADED,
+                message=f"Redis unreachable for leases, {mode}",
+                last_check=datetime.utcnow(),
+                details=status,
+            )
+
+        return ComponentHealth(
+            name="leases",
+            status=ComponentStatus.UP,
+            message=f"Leader for {leading} of {len(states)} job leases",
+            last_check=datetime.utcnow(),
+            details=status,
+        )
+
     # =========================================================================
     # Status Determination
     # =========================================================================
@@ -743,6 +818,7 @@ def create_health_manager(
     ash_personality_manager: Optional["AshPersonalityManager"] = None,
     metrics_manager: Optional["MetricsManager"] = None,
     version: str = "5.0.0",
+    lease_manager: Optional["LeaseManager"] = None,
 ) -> HealthManager:
     """
     Factory function for HealthManager.
@@ -758,6 +834,7 @@ def create_health_manager(
         ash_personality_manager: Ash personality/Claude manager
         metrics_manager: Metrics collection manager
         version: Application version string
+        lease_manager: Background job lease manager (Phase 10)
 
     Returns:
         Configured HealthManager instance
@@ -779,6 +856,7 @@ def create_health_manager(
         ash_personality_manager=ash_personality_manager,
         metrics_manager=metrics_manager,
         version=version,
+        lease_manager=lease_manager,
     )
 
 
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Metrics Package for Ash-Bot Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-1.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-8-1.0-2
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,7 @@ PACKAGE CONTENTS:
 - Gauge: Metric that can increase or decrease
 - Histogram: Distribution tracking metric
 - LabeledCounter: Counter with label dimensions
+- LabeledHistogram: Histogram with label dimensions (Phase 10)
 - ResponseMetricsManager: Tracks alert response times (Phase 8)
 - AlertMetrics: Data model for individual alert metrics (Phase 8)
 - DailyAggregate: Data model for daily aggregated metrics (Phase 8)
@@ -44,7 +45,7 @@ USAGE:
 """
 
 # Module version
-__version__ = "v5.0-8-1.0-1"
+__version__ = "v5.0-8-1.0-2"
 
 # Operational metrics (Phase 5)
 from .metrics_manager import (
@@ -53,6 +54,7 @@ from .metrics_manager import (
     Gauge,
     Histogram,
     LabeledCounter,
+    LabeledHistogram,
     create_metrics_manager,
 )
 
@@ -78,6 +80,7 @@ __all__ = [
     "Gauge",
     "Histogram",
     "LabeledCounter",
+    "LabeledHistogram",
     "create_metrics_manager",
     # Response time tracking (Phase 8)
     "ResponseMetricsManager",
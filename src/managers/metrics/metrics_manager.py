@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Metrics Manager for Ash-Bot Service
 ---
-FILE VERSION: v5.0-7-3.0-1
-LAST MODIFIED: 2026-01-05
-PHASE: Phase 7 - Core Safety & User Preferences
+FILE VERSION: v5.0-10-3.0-17
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -23,6 +23,7 @@ Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alp
 RESPONSIBILITIES:
 - Collect operational metrics across all components
 - Provide metric types: Counter, Gauge, Histogram
+- Provide labeled metric types: LabeledCounter, LabeledHistogram
 - Export metrics in Prometheus format
 - Export metrics as JSON for health endpoints
 - Thread-safe metric updates
@@ -39,6 +40,48 @@ METRICS COLLECTED:
 - redis_errors_total: Redis errors
 - discord_reconnects_total: Discord reconnection count
 - sensitivity_adjustments_total: Channel sensitivity adjustments (Phase 7)
+- analysis_queue_depth: Messages waiting for NLP analysis (Phase 10)
+- analysis_workers_busy: Analysis workers currently processing (Phase 10)
+- analysis_queue_wait_seconds: Time messages spend queued (Phase 10)
+- analysis_queue_class_wait_seconds: Queue wait by priority class (Phase 10)
+- analysis_queue_dropped_total: Messages dropped on overflow (Phase 10)
+- messages_coalesced_total: Messages merged into an earlier burst (Phase 10)
+- message_burst_size: Messages per analyzed burst (Phase 10)
+- nlp_batch_size: Messages per NLP batch request (Phase 10)
+- nlp_batch_fallbacks_total: Messages sent singly because batching was unavailable (Phase 10)
+- nlp_hedged_requests_total: NLP requests duplicated to a second replica (Phase 10)
+- nlp_hedge_wins_total: Hedged requests answered first by the second replica (Phase 10)
+- nlp_concurrency_limit: Current adaptive NLP concurrency limit (Phase 10)
+- nlp_requests_in_flight: NLP requests holding a concurrency slot (Phase 10)
+- nlp_request_timeout_seconds: Latency-derived per-attempt NLP timeout (Phase 10)
+- nlp_limiter_queue_seconds: Time NLP requests wait for a concurrency slot (Phase 10)
+- nlp_limiter_rejections_total: NLP requests shed by the concurrency limiter (Phase 10)
+- deferred_analyses_total: Deferred re-analysis entries by outcome (Phase 10)
+- deferred_analysis_depth: Entries waiting for re-analysis after an NLP outage (Phase 10)
+- history_cache_requests_total: History cache lookups by result (Phase 10)
+- history_cache_entries: Users held in the history cache (Phase 10)
+- history_cache_bytes: Estimated history cache memory (Phase 10)
+- scheduler_job_runs_total: Scheduled job runs by job and outcome (Phase 10)
+- scheduler_jobs_pending: Jobs registered with the scheduler (Phase 10)
+- scheduler_job_duration_seconds: Scheduled job run time by job (Phase 10)
+- scheduler_job_lateness_seconds: Delay between job deadline and start (Phase 10)
+- lease_events_total: Background job lease acquisitions, losses and releases (Phase 10)
+- leases_held: Background job leases held by this replica (Phase 10)
+- discord_outbound_total: Outbound calls by priority and outcome (Phase 10)
+- discord_rate_limited_total: 429 responses by route kind (Phase 10)
+- discord_outbound_queue_depth: Calls waiting in the outbound queue (Phase 10)
+- discord_outbound_queue_delay_seconds: Outbound queueing delay by priority (Phase 10)
+- discord_resolver_requests_total: Discord object lookups by kind and result (Phase 10)
+- discord_rest_calls_total: Discord REST fetches by object kind (Phase 10)
+- claude_time_to_first_token_seconds: Time to the first streamed Claude text (Phase 10)
+- reply_first_visible_seconds: Time from a DM to the first visible Ash reply (Phase 10)
+- claude_tokens_total: Claude tokens by type, including prompt cache reads and writes (Phase 10)
+- context_summaries_total: Rolling Ash conversation summaries by result (Phase 10)
+- claude_request_tokens_estimate: Estimated prompt tokens per Ash request (Phase 10)
+- dm_turn_messages: DMs merged into each Ash turn (Phase 10)
+- claude_retries_total: Claude retries by reason (rate_limited, overloaded) (Phase 10)
+- claude_requests_in_flight: Claude requests currently running (Phase 10)
+- claude_queue_delay_seconds: Claude scheduler wait by priority (Phase 10)
 
 USAGE:
     from src.managers.metrics import create_metrics_manager
@@ -62,7 +105,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 # Module version
-__version__ = "v5.0-7-3.0-1"
+__version__ = "v5.0-10-3.0-17"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -301,6 +344,47 @@ class LabeledCounterValue:
         self._parent.inc(self._label_values, amount)
 
 
+class LabeledHistogram:
+    """
+    Histogram with label support for multiple dimensions.
+
+    Each distinct set of label values gets its own Histogram with
+    the shared bucket layout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str = "",
+        label_names: Tuple[str, ...] = (),
+        buckets: Optional[Tuple[float, ...]] = None,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._buckets = buckets
+        self._histograms: Dict[Tuple[str, ...], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **kwargs: str) -> Histogram:
+        """Get histogram for specific label values (created on first use)."""
+        label_values = tuple(kwargs.get(name, "") for name in self.label_names)
+        with self._lock:
+            histogram = self._histograms.get(label_values)
+            if histogram is None:
+                if self._buckets:
+                    histogram = Histogram(name=self.name, buckets=self._buckets)
+                else:
+                    histogram = Histogram(name=self.name)
+                self._histograms[label_values] = histogram
+            return histogram
+
+    def get_all(self) -> Dict[Tuple[str, ...], Histogram]:
+        """Get all histograms by label values."""
+        with self._lock:
+            return dict(self._histograms)
+
+
 # =============================================================================
 # Metrics Manager
 # =============================================================================
@@ -399,6 +483,115 @@ class MetricsManager:
             label_names=("channel",),
         )
 
+        # Phase 10: Analysis queue overflow
+        self._analysis_queue_dropped = LabeledCounter(
+            name="ash_analysis_queue_dropped_total",
+            help_text="Messages dropped because the analysis queue was full",
+            label_names=("policy",),
+        )
+
+        # Phase 10: Burst coalescing
+        self._messages_coalesced = Counter(
+            name="ash_messages_coalesced_total",
+            help_text="Messages merged into an earlier burst instead of their own NLP call",
+        )
+
+        # Phase 10: NLP micro-batching
+        self._nlp_batch_fallbacks = Counter(
+            name="ash_nlp_batch_fallbacks_total",
+            help_text="Messages sent as single /analyze calls because batching was unavailable",
+        )
+
+        # Phase 10: NLP hedged requests
+        self._nlp_hedged_requests = Counter(
+            name="ash_nlp_hedged_requests_total",
+            help_text="NLP requests duplicated to a second replica after exceeding p95",
+        )
+
+        self._nlp_hedge_wins = Counter(
+            name="ash_nlp_hedge_wins_total",
+            help_text="Hedged NLP requests where the second replica answered first",
+        )
+
+        # Phase 10: NLP adaptive concurrency
+        self._nlp_limiter_rejections = Counter(
+            name="ash_nlp_limiter_rejections_total",
+            help_text="NLP requests shed after waiting too long for a concurrency slot",
+        )
+
+        # Phase 10: Deferred re-analysis during NLP outages
+        self._deferred_analyses = LabeledCounter(
+            name="ash_deferred_analyses_total",
+            help_text="Deferred re-analysis entries by outcome",
+            label_names=("outcome",),
+        )
+
+        # Phase 10: User history cache
+        self._history_cache_requests = LabeledCounter(
+            name="ash_history_cache_requests_total",
+            help_text="User history cache lookups by result",
+            label_names=("result",),
+        )
+
+        # Phase 10: Background job scheduler
+        self._scheduler_job_runs = LabeledCounter(
+            name="ash_scheduler_job_runs_total",
+            help_text="Scheduled background job runs by job and outcome",
+            label_names=("job", "outcome"),
+        )
+
+        # Phase 10: Background job leases
+        self._lease_events = LabeledCounter(
+            name="ash_lease_events_total",
+            help_text="Background job lease events by lease and event",
+            label_names=("lease", "event"),
+        )
+
+        # Phase 10: Outbound Discord queue
+        self._outbound_sends = LabeledCounter(
+            name="ash_discord_outbound_total",
+            help_text="Bot-initiated Discord REST calls by priority class and outcome",
+            label_names=("priority", "outcome"),
+        )
+        self._discord_rate_limited = LabeledCounter(
+            name="ash_discord_rate_limited_total",
+            help_text="Discord 429 responses by route kind",
+            label_names=("route",),
+        )
+
+        # Phase 10: Discord resolver cache
+        self._discord_resolver_lookups = LabeledCounter(
+            name="ash_discord_resolver_requests_total",
+            help_text="Discord user/channel/message lookups by kind and result",
+            label_names=("kind", "result"),
+        )
+        self._discord_rest_calls = LabeledCounter(
+            name="ash_discord_rest_calls_total",
+            help_text="Discord REST fetches made by the resolver by kind",
+            label_names=("kind",),
+        )
+
+        # Phase 10: Claude token usage and prompt cache
+        self._claude_tokens = LabeledCounter(
+            name="ash_claude_tokens_total",
+            help_text="Claude tokens by type (input, output, cache_read, cache_write)",
+            label_names=("type",),
+        )
+
+        # Phase 10: Ash context window
+        self._context_summaries = LabeledCounter(
+            name="ash_context_summaries_total",
+            help_text="Rolling conversation summaries by result",
+            label_names=("result",),
+        )
+
+        # Phase 10: Claude request scheduler
+        self._claude_retries = LabeledCounter(
+            name="ash_claude_retries_total",
+            help_text="Claude requests retried after 429/529 responses by reason",
+            label_names=("reason",),
+        )
+
         # =================================================================
         # Gauges
         # =================================================================
@@ -419,6 +612,74 @@ class MetricsManager:
             label_names=("breaker",),
         )
 
+        # Phase 10: Analysis queue
+        self._analysis_queue_depth = Gauge(
+            name="ash_analysis_queue_depth",
+            help_text="Messages waiting in the analysis queue",
+        )
+
+        self._analysis_workers_busy = Gauge(
+            name="ash_analysis_workers_busy",
+            help_text="Analysis workers currently processing a message",
+        )
+
+        # Phase 10: NLP adaptive concurrency
+        self._nlp_concurrency_limit = Gauge(
+            name="ash_nlp_concurrency_limit",
+            help_text="Current adaptive concurrency limit for NLP requests",
+        )
+
+        self._nlp_requests_in_flight = Gauge(
+            name="ash_nlp_requests_in_flight",
+            help_text="NLP requests currently holding a concurrency slot",
+        )
+
+        self._nlp_request_timeout = Gauge(
+            name="ash_nlp_request_timeout_seconds",
+            help_text="Latency-derived timeout applied to the latest NLP attempt",
+        )
+
+        # Phase 10: Deferred re-analysis backlog
+        self._deferred_analysis_depth = Gauge(
+            name="ash_deferred_analysis_depth",
+            help_text="Messages waiting for re-analysis after an NLP outage",
+        )
+
+        # Phase 10: User history cache size
+        self._history_cache_entries = Gauge(
+            name="ash_history_cache_entries",
+            help_text="Users whose history is held in the in-process cache",
+        )
+
+        self._history_cache_bytes = Gauge(
+            name="ash_history_cache_bytes",
+            help_text="Estimated memory used by the user history cache",
+        )
+
+        # Phase 10: Background job scheduler
+        self._scheduler_jobs_pending = Gauge(
+            name="ash_scheduler_jobs_pending",
+            help_text="Jobs registered with the background scheduler",
+        )
+
+        # Phase 10: Background job leases
+        self._leases_held = Gauge(
+            name="ash_leases_held",
+            help_text="Background job leases held by this replica",
+        )
+
+        # Phase 10: Outbound Discord queue
+        self._outbound_queue_depth = Gauge(
+            name="ash_discord_outbound_queue_depth",
+            help_text="Discord REST calls waiting in the outbound queue",
+        )
+
+        # Phase 10: Claude request scheduler
+        self._claude_in_flight = Gauge(
+            name="ash_claude_requests_in_flight",
+            help_text="Claude requests currently running",
+        )
+
         # =================================================================
         # Histograms
         # =================================================================
@@ -441,6 +702,99 @@ class MetricsManager:
             buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
         )
 
+        # Phase 10: Analysis queue wait time
+        self._analysis_queue_wait = Histogram(
+            name="ash_analysis_queue_wait_seconds",
+            help_text="Time messages spend in the analysis queue before processing",
+            buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+        )
+
+        self._analysis_queue_class_wait = LabeledHistogram(
+            name="ash_analysis_queue_class_wait_seconds",
+            help_text="Analysis queue wait time by scheduling priority class",
+            label_names=("priority_class",),
+            buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+        )
+
+        # Phase 10: Burst coalescing
+        self._burst_size = Histogram(
+            name="ash_message_burst_size",
+            help_text="Number of messages per analyzed burst",
+            buckets=(1, 2, 3, 4, 5, 6, 8, 10, 15, 20),
+        )
+
+        # Phase 10: NLP micro-batching
+        self._nlp_batch_size = Histogram(
+            name="ash_nlp_batch_size",
+            help_text="Number of messages per NLP batch request",
+            buckets=(1, 2, 4, 8, 16, 32, 64),
+        )
+
+        # Phase 10: NLP adaptive concurrency
+        self._nlp_limiter_wait = Histogram(
+            name="ash_nlp_limiter_queue_seconds",
+            help_text="Time NLP requests wait for a concurrency slot",
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+        )
+
+        # Phase 10: Background job scheduler
+        self._scheduler_job_duration = LabeledHistogram(
+            name="ash_scheduler_job_duration_seconds",
+            help_text="Scheduled background job run time by job",
+            label_names=("job",),
+            buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+        )
+
+        self._scheduler_job_lateness = LabeledHistogram(
+            name="ash_scheduler_job_lateness_seconds",
+            help_text="Delay between a scheduled job's deadline and its start",
+            label_names=("job",),
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+        )
+
+        # Phase 10: Outbound Discord queue
+        self._outbound_queue_delay = LabeledHistogram(
+            name="ash_discord_outbound_queue_delay_seconds",
+            help_text="Time Discord REST calls wait in the outbound queue by priority class",
+            label_names=("priority",),
+            buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+        )
+
+        # Phase 10: Streamed Ash replies
+        self._claude_first_token = Histogram(
+            name="ash_claude_time_to_first_token_seconds",
+            help_text="Time from a streamed Claude request to its first text chunk",
+            buckets=(0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0),
+        )
+
+        self._reply_first_visible = Histogram(
+            name="ash_reply_first_visible_seconds",
+            help_text="Time from a user's DM to the first visible Ash reply text",
+            buckets=(0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 20.0),
+        )
+
+        # Phase 10: Ash context window
+        self._claude_request_tokens = Histogram(
+            name="ash_claude_request_tokens_estimate",
+            help_text="Estimated prompt tokens per Ash Claude request",
+            buckets=(250, 500, 1000, 1500, 2000, 3000, 4000, 6000, 8000, 12000),
+        )
+
+        # Phase 10: Ash DM inbox
+        self._dm_turn_size = Histogram(
+            name="ash_dm_turn_messages",
+            help_text="DMs merged into each Ash conversational turn",
+            buckets=(1, 2, 3, 4, 5, 7, 10),
+        )
+
+        # Phase 10: Claude request scheduler
+        self._claude_queue_delay = LabeledHistogram(
+            name="ash_claude_queue_delay_seconds",
+            help_text="Time Claude requests waited for a slot by priority",
+            label_names=("priority",),
+            buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+        )
+
     # =========================================================================
     # Message Metrics
     # =========================================================================
@@ -583,6 +937,301 @@ class MetricsManager:
             f"📊 Sensitivity adjustment recorded: {channel_name} ({sensitivity})"
         )
 
+    # =========================================================================
+    # Phase 10: Analysis Queue Metrics
+    # =========================================================================
+
+    def set_analysis_queue_depth(self, depth: int) -> None:
+        """Set analysis queue depth gauge."""
+        self._analysis_queue_depth.set(float(depth))
+
+    def set_analysis_workers_busy(self, count: int) -> None:
+        """Set busy analysis workers gauge."""
+        self._analysis_workers_busy.set(float(count))
+
+    def observe_analysis_queue_wait(
+        self,
+        wait_seconds: float,
+        priority_class: Optional[str] = None,
+    ) -> None:
+        """
+        Record time a message waited in the analysis queue.
+
+        Args:
+            wait_seconds: Time spent queued
+            priority_class: Scheduling class (high, elevated, normal)
+        """
+        self._analysis_queue_wait.observe(wait_seconds)
+        if priority_class:
+            self._analysis_queue_class_wait.labels(
+                priority_class=priority_class.lower()
+            ).observe(wait_seconds)
+
+    def inc_analysis_queue_dropped(self, policy: str, count: int = 1) -> None:
+        """
+        Increment analysis queue dropped counter.
+
+        Args:
+            policy: Overflow policy that caused the drop
+            count: Number to increment by
+        """
+        self._analysis_queue_dropped.labels(policy=policy.lower()).inc(count)
+
+    def inc_messages_coalesced(self, count: int = 1) -> None:
+        """Increment messages merged into an earlier burst."""
+        self._messages_coalesced.inc(count)
+
+    def observe_burst_size(self, size: int) -> None:
+        """Record number of messages in an analyzed burst."""
+        self._burst_size.observe(float(size))
+
+    def observe_nlp_batch_size(self, size: int) -> None:
+        """Record number of messages sent in one NLP batch."""
+        self._nlp_batch_size.observe(float(size))
+
+    def inc_nlp_batch_fallbacks(self, count: int = 1) -> None:
+        """Increment messages analyzed singly because batching was unavailable."""
+        self._nlp_batch_fallbacks.inc(count)
+
+    def inc_nlp_hedged_requests(self, count: int = 1) -> None:
+        """Increment NLP requests duplicated to a second replica."""
+        self._nlp_hedged_requests.inc(count)
+
+    def inc_nlp_hedge_wins(self, count: int = 1) -> None:
+        """Increment hedged requests won by the second replica."""
+        self._nlp_hedge_wins.inc(count)
+
+    def set_nlp_concurrency(self, limit: int, in_flight: int) -> None:
+        """
+        Set NLP adaptive concurrency gauges.
+
+        Args:
+            limit: Current concurrency limit
+            in_flight: Requests currently holding a slot
+        """
+        self._nlp_concurrency_limit.set(float(limit))
+        self._nlp_requests_in_flight.set(float(in_flight))
+
+    def set_nlp_request_timeout(self, seconds: float) -> None:
+        """Set latency-derived NLP attempt timeout gauge."""
+        self._nlp_request_timeout.set(seconds)
+
+    def observe_nlp_limiter_wait(self, wait_seconds: float) -> None:
+        """Record time an NLP request waited for a concurrency slot."""
+        self._nlp_limiter_wait.observe(wait_seconds)
+
+    def inc_nlp_limiter_rejections(self, count: int = 1) -> None:
+        """Increment NLP requests shed by the concurrency limiter."""
+        self._nlp_limiter_rejections.inc(count)
+
+    def inc_deferred_analyses(self, outcome: str, count: int = 1) -> None:
+        """
+        Increment deferred re-analysis counter.
+
+        Args:
+            outcome: deferred, replayed, expired or dropped
+            count: Number to increment by
+        """
+        self._deferred_analyses.labels(outcome=outcome.lower()).inc(count)
+
+    def set_deferred_analysis_depth(self, depth: int) -> None:
+        """Set number of entries waiting for re-analysis."""
+        self._deferred_analysis_depth.set(float(depth))
+
+    def inc_history_cache_requests(self, result: str, count: int = 1) -> None:
+        """
+        Increment history cache lookup counter.
+
+        Args:
+            result: hit, negative_hit, miss, coalesced or bypass
+            count: Number to increment by
+        """
+        self._history_cache_requests.labels(result=result.lower()).inc(count)
+
+    def set_history_cache_size(self, entries: int, size_bytes: int) -> None:
+        """Set history cache entry count and estimated size."""
+        self._history_cache_entries.set(float(entries))
+        self._history_cache_bytes.set(float(size_bytes))
+
+    # =========================================================================
+    # Phase 10: Scheduler Metrics
+    # =========================================================================
+
+    def observe_scheduler_job(
+        self, job: str, duration_seconds: float, lateness_seconds: float, outcome: str
+    ) -> None:
+        """
+        Record one scheduled job run.
+
+        Args:
+            job: Job name
+            duration_seconds: Callback run time
+            lateness_seconds: Delay between deadline and start
+            outcome: success or error
+        """
+        self._scheduler_job_runs.labels(job=job, outcome=outcome).inc()
+        self._scheduler_job_duration.labels(job=job).observe(duration_seconds)
+        self._scheduler_job_lateness.labels(job=job).observe(lateness_seconds)
+
+    def set_scheduler_jobs(self, count: int) -> None:
+        """Set number of jobs registered with the scheduler."""
+        self._scheduler_jobs_pending.set(float(count))
+
+    def inc_lease_events(self, lease: str, event: str, count: int = 1) -> None:
+        """
+        Increment lease event counter.
+
+        Args:
+            lease: Lease name
+            event: acquired, lost, released or renew_failed
+            count: Number to increment by
+        """
+        self._lease_events.labels(lease=lease, event=event).inc(count)
+
+    def set_leases_held(self, count: int) -> None:
+        """Set number of leases held by this replica."""
+        self._leases_held.set(float(count))
+
+    # =========================================================================
+    # Phase 10: Outbound Discord Queue Metrics
+    # =========================================================================
+
+    def observe_outbound_queue_delay(self, delay_seconds: float, priority: str) -> None:
+        """
+        Record time a Discord call waited in the outbound queue.
+
+        Args:
+            delay_seconds: Time spent queued
+            priority: Priority class (critical, alert, edit, summary, dm)
+        """
+        self._outbound_queue_delay.labels(priority=priority).observe(delay_seconds)
+
+    def inc_outbound_sends(self, priority: str, outcome: str) -> None:
+        """
+        Increment outbound Discord calls counter.
+
+        Args:
+            priority: Priority class
+            outcome: sent, failed or abandoned
+        """
+        self._outbound_sends.labels(priority=priority, outcome=outcome).inc()
+
+    def inc_discord_rate_limited(self, route: str) -> None:
+        """
+        Increment Discord 429 counter.
+
+        Args:
+            route: Route kind (send, edit, fetch, dm)
+        """
+        self._discord_rate_limited.labels(route=route).inc()
+
+    def set_outbound_queue_depth(self, depth: int) -> None:
+        """Set outbound queue depth gauge."""
+        self._outbound_queue_depth.set(float(depth))
+
+    # =========================================================================
+    # Phase 10: Discord Resolver Metrics
+    # =========================================================================
+
+    def inc_discord_resolver_lookups(self, kind: str, result: str) -> None:
+        """
+        Increment Discord resolver lookup counter.
+
+        Args:
+            kind: Object kind (user, channel, message)
+            result: gateway, hit, miss or coalesced
+        """
+        self._discord_resolver_lookups.labels(kind=kind, result=result).inc()
+
+    def inc_discord_rest_calls(self, kind: str) -> None:
+        """
+        Increment Discord REST fetch counter.
+
+        Args:
+            kind: Object kind (user, channel, message)
+        """
+        self._discord_rest_calls.labels(kind=kind).inc()
+
+    # =========================================================================
+    # Phase 10: Streamed Reply Metrics
+    # =========================================================================
+
+    def observe_claude_first_token(self, seconds: float) -> None:
+        """Record time from a streamed Claude request to its first text."""
+        self._claude_first_token.observe(seconds)
+
+    def observe_reply_first_visible(self, seconds: float) -> None:
+        """Record time from a user's DM to the first visible reply text."""
+        self._reply_first_visible.observe(seconds)
+
+    # =========================================================================
+    # Phase 10: Claude Token Metrics
+    # =========================================================================
+
+    def inc_claude_tokens(self, token_type: str, count: int) -> None:
+        """
+        Increment Claude token counter.
+
+        Args:
+            token_type: input, output, cache_read or cache_write
+            count: Number of tokens
+        """
+        if count > 0:
+            self._claude_tokens.labels(type=token_type).inc(count)
+
+    # =========================================================================
+    # Phase 10: Context Window Metrics
+    # =========================================================================
+
+    def observe_claude_request_tokens(self, tokens: int) -> None:
+        """Record the estimated prompt tokens of an Ash Claude request."""
+        self._claude_request_tokens.observe(tokens)
+
+    def inc_context_summaries(self, result: str) -> None:
+        """
+        Increment rolling summary counter.
+
+        Args:
+            result: completed or failed
+        """
+        self._context_summaries.labels(result=result).inc()
+
+    # =========================================================================
+    # Phase 10: DM Inbox Metrics
+    # =========================================================================
+
+    def observe_dm_turn_size(self, size: int) -> None:
+        """Record the number of DMs merged into one Ash turn."""
+        self._dm_turn_size.observe(size)
+
+    # =========================================================================
+    # Phase 10: Claude Scheduler Metrics
+    # =========================================================================
+
+    def observe_claude_queue_delay(self, priority: str, seconds: float) -> None:
+        """
+        Record time a Claude request waited for a slot.
+
+        Args:
+            priority: Priority class name (urgent, normal, followup, background)
+            seconds: Queue delay in seconds
+        """
+        self._claude_queue_delay.labels(priority=priority).observe(seconds)
+
+    def inc_claude_retries(self, reason: str) -> None:
+        """
+        Increment Claude retry counter.
+
+        Args:
+            reason: rate_limited, overloaded, timeout, conflict,
+                server_error or connection_error
+        """
+        self._claude_retries.labels(reason=reason).inc()
+
+    def set_claude_requests_in_flight(self, count: int) -> None:
+        """Set number of running Claude requests."""
+        self._claude_in_flight.set(float(count))
+
     # =========================================================================
     # Export Methods
     # =========================================================================
@@ -668,6 +1317,41 @@ class MetricsManager:
             self._claude_errors.get(),
         )
 
+        add_metric(
+            self._messages_coalesced.name,
+            self._messages_coalesced.help_text,
+            "counter",
+            self._messages_coalesced.get(),
+        )
+
+        add_metric(
+            self._nlp_batch_fallbacks.name,
+            self._nlp_batch_fallbacks.help_text,
+            "counter",
+            self._nlp_batch_fallbacks.get(),
+        )
+
+        add_metric(
+            self._nlp_hedged_requests.name,
+            self._nlp_hedged_requests.help_text,
+            "counter",
+            self._nlp_hedged_requests.get(),
+        )
+
+        add_metric(
+            self._nlp_hedge_wins.name,
+            self._nlp_hedge_wins.help_text,
+            "counter",
+            self._nlp_hedge_wins.get(),
+        )
+
+        add_metric(
+            self._nlp_limiter_rejections.name,
+            self._nlp_limiter_rejections.help_text,
+            "counter",
+            self._nlp_limiter_rejections.get(),
+        )
+
         # Gauges
         add_metric(
             self._active_ash_sessions.name,
@@ -683,6 +1367,97 @@ class MetricsManager:
             self._connected_guilds.get(),
         )
 
+        # Phase 10: Analysis queue gauges
+        add_metric(
+            self._analysis_queue_depth.name,
+            self._analysis_queue_depth.help_text,
+            "gauge",
+            self._analysis_queue_depth.get(),
+        )
+
+        add_metric(
+            self._analysis_workers_busy.name,
+            self._analysis_workers_busy.help_text,
+            "gauge",
+            self._analysis_workers_busy.get(),
+        )
+
+        # Phase 10: NLP adaptive concurrency gauges
+        add_metric(
+            self._nlp_concurrency_limit.name,
+            self._nlp_concurrency_limit.help_text,
+            "gauge",
+            self._nlp_concurrency_limit.get(),
+        )
+
+        add_metric(
+            self._nlp_requests_in_flight.name,
+            self._nlp_requests_in_flight.help_text,
+            "gauge",
+            self._nlp_requests_in_flight.get(),
+        )
+
+        add_metric(
+            self._nlp_request_timeout.name,
+            self._nlp_request_timeout.help_text,
+            "gauge",
+            self._nlp_request_timeout.get(),
+        )
+
+        # Phase 10: Deferred re-analysis backlog
+        add_metric(
+            self._deferred_analysis_depth.name,
+            self._deferred_analysis_depth.help_text,
+            "gauge",
+            self._deferred_analysis_depth.get(),
+        )
+
+        # Phase 10: User history cache size
+        add_metric(
+            self._history_cache_entries.name,
+            self._history_cache_entries.help_text,
+            "gauge",
+            self._history_cache_entries.get(),
+        )
+        add_metric(
+            self._history_cache_bytes.name,
+            self._history_cache_bytes.help_text,
+            "gauge",
+            self._history_cache_bytes.get(),
+        )
+
+        # Phase 10: Background job scheduler
+        add_metric(
+            self._scheduler_jobs_pending.name,
+            self._scheduler_jobs_pending.help_text,
+            "gauge",
+            self._scheduler_jobs_pending.get(),
+        )
+
+        # Phase 10: Background job leases
+        add_metric(
+            self._leases_held.name,
+            self._leases_held.help_text,
+            "gauge",
+            self._leases_held.get(),
+        )
+
+        # Phase 10: Outbound Discord queue
+        add_metric(
+            self._outbound_queue_depth.name,
+            self._outbound_queue_depth.help_text,
+            "gauge",
+            self._outbound_queue_depth.get(),
+        )
+
+        # Phase 10: Claude request scheduler
+        add_metric(
+            self._claude_in_flight.name,
+            self._claude_in_flight.help_text,
+            "gauge",
+            self._claude_in_flight.get(),
+        )
+
         # Labeled counters
         lines.append(f"# HELP {self._messages_analyzed.name} {self._messages_analyzed.help_text}")
         lines.append(f"# TYPE {self._messages_analyzed.name} counter")
@@ -709,8 +1484,104 @@ class MetricsManager:
             label_str = f'{{channel="{labels[0]}"}}'
             lines.append(f"{self._sensitivity_adjustments.name}{label_str} {value}")
 
+        # Phase 10: Analysis queue drops
+        lines.append(f"# HELP {self._analysis_queue_dropped.name} {self._analysis_queue_dropped.help_text}")
+        lines.append(f"# TYPE {self._analysis_queue_dropped.name} counter")
+        for labels, value in self._analysis_queue_dropped.get_all().items():
+            label_str = f'{{policy="{labels[0]}"}}'
+            lines.append(f"{self._analysis_queue_dropped.name}{label_str} {value}")
+
+        # Phase 10: Deferred re-analysis outcomes
+        lines.append(f"# HELP {self._deferred_analyses.name} {self._deferred_analyses.help_text}")
+        lines.append(f"# TYPE {self._deferred_analyses.name} counter")
+        for labels, value in self._deferred_analyses.get_all().items():
+            label_str = f'{{outcome="{labels[0]}"}}'
+            lines.append(f"{self._deferred_analyses.name}{label_str} {value}")
+
+        # Phase 10: History cache lookups
+        lines.append(f"# HELP {self._history_cache_requests.name} {self._history_cache_requests.help_text}")
+        lines.append(f"# TYPE {self._history_cache_requests.name} counter")
+        for labels, value in self._history_cache_requests.get_all().items():
+            label_str = f'{{result="{labels[0]}"}}'
+            lines.append(f"{self._history_cache_requests.name}{label_str} {value}")
+
+        # Phase 10: Scheduled job runs
+        lines.append(f"# HELP {self._scheduler_job_runs.name} {self._scheduler_job_runs.help_text}")
+        lines.append(f"# TYPE {self._scheduler_job_runs.name} counter")
+        for labels, value in self._scheduler_job_runs.get_all().items():
+            label_str = f'{{job="{labels[0]}",outcome="{labels[1]}"}}'
+            lines.append(f"{self._scheduler_job_runs.name}{label_str} {value}")
+
+        # Phase 10: Lease events
+        lines.append(f"# HELP {self._lease_events.name} {self._lease_events.help_text}")
+        lines.append(f"# TYPE {self._lease_events.name} counter")
+        for labels, value in self._lease_events.get_all().items():
+            label_str = f'{{lease="{labels[0]}",event="{labels[1]}"}}'
+            lines.append(f"{self._lease_events.name}{label_str} {value}")
+
+        # Phase 10: Outbound Discord queue
+        lines.append(f"# HELP {self._outbound_sends.name} {self._outbound_sends.help_text}")
+        lines.append(f"# TYPE {self._outbound_sends.name} counter")
+        for labels, value in self._outbound_sends.get_all().items():
+            label_str = f'{{priority="{labels[0]}",outcome="{labels[1]}"}}'
+            lines.append(f"{self._outbound_sends.name}{label_str} {value}")
+
+        # Phase 10: Outbound Discord queue
+        lines.append(f"# HELP {self._discord_rate_limited.name} {self._discord_rate_limited.help_text}")
+        lines.append(f"# TYPE {self._discord_rate_limited.name} counter")
+        for labels, value in self._discord_rate_limited.get_all().items():
+            label_str = f'{{route="{labels[0]}"}}'
+            lines.append(f"{self._discord_rate_limited.name}{label_str} {value}")
+
+        # Phase 10: Discord resolver cache
+        lines.append(f"# HELP {self._discord_resolver_lookups.name} {self._discord_resolver_lookups.help_text}")
+        lines.append(f"# TYPE {self._discord_resolver_lookups.name} counter")
+        for labels, value in self._discord_resolver_lookups.get_all().items():
+            label_str = f'{{kind="{labels[0]}",result="{labels[1]}"}}'
+            lines.append(f"{self._discord_resolver_lookups.name}{label_str} {value}")
+
+        # Phase 10: Discord resolver cache
+        lines.append(f"# HELP {self._discord_rest_calls.name} {self._discord_rest_calls.help_text}")
+        lines.append(f"# TYPE {self._discord_rest_calls.name} counter")
+        for labels, value in self._discord_rest_calls.get_all().items():
+            label_str = f'{{kind="{labels[0]}"}}'
+            lines.append(f"{self._discord_rest_calls.name}{label_str} {value}")
+
+        # Phase 10: Claude token usage and prompt cache
+        lines.append(f"# HELP {self._claude_tokens.name} {self._claude_tokens.help_text}")
+        lines.append(f"# TYPE {self._claude_tokens.name} counter")
+        for labels, value in self._claude_tokens.get_all().items():
+            label_str = f'{{type="{labels[0]}"}}'
+            lines.append(f"{self._claude_tokens.name}{label_str} {value}")
+
+        # Phase 10: Ash context window
+        lines.append(f"# HELP {self._context_summaries.name} {self._context_summaries.help_text}")
+        lines.append(f"# TYPE {self._context_summaries.name} counter")
+        for labels, value in self._context_summaries.get_all().items():
+            label_str = f'{{result="{labels[0]}"}}'
+            lines.append(f"{self._context_summaries.name}{label_str} {value}")
+
+        # Phase 10: Claude request scheduler
+        lines.append(f"# HELP {self._claude_retries.name} {self._claude_retries.help_text}")
+        lines.append(f"# TYPE {self._claude_retries.name} counter")
+        for labels, value in self._claude_retries.get_all().items():
+            label_str = f'{{reason="{labels[0]}"}}'
+            lines.append(f"{self._claude_retries.name}{label_str} {value}")
+
         # Histograms
-        for histogram in [self._nlp_duration, self._claude_duration, self._redis_duration]:
+        for histogram in [
+            self._nlp_duration,
+            self._claude_duration,
+            self._redis_duration,
+            self._analysis_queue_wait,
+            self._burst_size,
+            self._nlp_batch_size,
+            self._nlp_limiter_wait,
+            self._claude_first_token,
+            self._reply_first_visible,
+            self._claude_request_tokens,
+            self._dm_turn_size,
+        ]:
             lines.append(f"# HELP {histogram.name} {histogram.help_text}")
             lines.append(f"# TYPE {histogram.name} histogram")
             
@@ -725,6 +1596,33 @@ class MetricsManager:
             lines.append(f"{histogram.name}_sum {histogram.sum}")
             lines.append(f"{histogram.name}_count {histogram.count}")
 
+        # Labeled histograms
+        for labeled in [
+            self._analysis_queue_class_wait,
+            self._scheduler_job_duration,
+            self._scheduler_job_lateness,
+            self._outbound_queue_delay,
+            self._claude_queue_delay,
+        ]:
+            lines.append(f"# HELP {labeled.name} {labeled.help_text}")
+            lines.append(f"# TYPE {labeled.name} histogram")
+
+            for label_values, histogram in labeled.get_all().items():
+                label_str = ",".join(
+                    f'{k}="{v}"' for k, v in zip(labeled.label_names, label_values)
+                )
+
+                # Bucket counts are already cumulative (see Histogram.observe)
+                for bucket in sorted(histogram.bucket_counts.keys()):
+                    le = "+Inf" if bucket == float("inf") else str(bucket)
+                    lines.append(
+                        f'{labeled.name}_bucket{{{label_str},le="{le}"}} '
+                        f"{histogram.bucket_counts[bucket]}"
+                    )
+
+                lines.append(f"{labeled.name}_sum{{{label_str}}} {histogram.sum}")
+                lines.append(f"{labeled.name}_count{{{label_str}}} {histogram.count}")
+
         return "\n".join(lines)
 
     def export_json(self) -> Dict[str, Any]:
@@ -754,15 +1652,99 @@ class MetricsManager:
                 "claude_requests": self._claude_requests.get(),
                 "claude_errors": self._claude_errors.get(),
                 "sensitivity_adjustments": dict(self._sensitivity_adjustments.get_all()),
+                "analysis_queue_dropped": dict(self._analysis_queue_dropped.get_all()),
+                "messages_coalesced": self._messages_coalesced.get(),
+                "nlp_batch_fallbacks": self._nlp_batch_fallbacks.get(),
+                "nlp_hedged_requests": self._nlp_hedged_requests.get(),
+                "nlp_hedge_wins": self._nlp_hedge_wins.get(),
+                "nlp_limiter_rejections": self._nlp_limiter_rejections.get(),
+                "deferred_analyses": dict(self._deferred_analyses.get_all()),
+                "history_cache_requests": dict(self._history_cache_requests.get_all()),
+                "scheduler_job_runs": {
+                    f"{k[0]}_{k[1]}": v
+                    for k, v in self._scheduler_job_runs.get_all().items()
+                },
+                "lease_events": {
+                    f"{k[0]}_{k[1]}": v
+                    for k, v in self._lease_events.get_all().items()
+                },
+                "outbound_sends": {
+                    f"{k[0]}_{k[1]}": v
+                    for k, v in self._outbound_sends.get_all().items()
+                },
+                "discord_rate_limited": {
+                    f"{k[0]}": v
+                    for k, v in self._discord_rate_limited.get_all().items()
+                },
+                "discord_resolver_lookups": {
+                    f"{k[0]}_{k[1]}": v
+                    for k, v in self._discord_resolver_lookups.get_all().items()
+                },
+                "discord_rest_calls": {
+                    f"{k[0]}": v
+                    for k, v in self._discord_rest_calls.get_all().items()
+                },
+                "claude_tokens": {
+                    f"{k[0]}": v
+                    for k, v in self._claude_tokens.get_all().items()
+                },
+                "context_summaries": {
+                    f"{k[0]}": v
+                    for k, v in self._context_summaries.get_all().items()
+                },
+                "claude_retries": {
+                    f"{k[0]}": v
+                    for k, v in self._claude_retries.get_all().items()
+                },
             },
             "gauges": {
                 "active_ash_sessions": self._active_ash_sessions.get(),
                 "connected_guilds": self._connected_guilds.get(),
+                "analysis_queue_depth": self._analysis_queue_depth.get(),
+                "analysis_workers_busy": self._analysis_workers_busy.get(),
+                "nlp_concurrency_limit": self._nlp_concurrency_limit.get(),
+                "nlp_requests_in_flight": self._nlp_requests_in_flight.get(),
+                "nlp_request_timeout_seconds": self._nlp_request_timeout.get(),
+                "deferred_analysis_depth": self._deferred_analysis_depth.get(),
+                "history_cache_entries": self._history_cache_entries.get(),
+                "history_cache_bytes": self._history_cache_bytes.get(),
+                "scheduler_jobs_pending": self._scheduler_jobs_pending.get(),
+                "leases_held": self._leases_held.get(),
+                "outbound_queue_depth": self._outbound_queue_depth.get(),
+                "claude_in_flight": self._claude_in_flight.get(),
             },
             "histograms": {
                 "nlp_duration": self._nlp_duration.get_stats(),
                 "claude_duration": self._claude_duration.get_stats(),
                 "redis_duration": self._redis_duration.get_stats(),
+                "analysis_queue_wait": self._analysis_queue_wait.get_stats(),
+                "burst_size": self._burst_size.get_stats(),
+                "nlp_batch_size": self._nlp_batch_size.get_stats(),
+                "nlp_limiter_wait": self._nlp_limiter_wait.get_stats(),
+                "claude_first_token": self._claude_first_token.get_stats(),
+                "reply_first_visible": self._reply_first_visible.get_stats(),
+                "claude_request_tokens": self._claude_request_tokens.get_stats(),
+                "dm_turn_size": self._dm_turn_size.get_stats(),
+                "analysis_queue_class_wait": {
+                    k[0]: v.get_stats()
+                    for k, v in self._analysis_queue_class_wait.get_all().items()
+                },
+                "scheduler_job_duration": {
+                    k[0]: v.get_stats()
+                    for k, v in self._scheduler_job_duration.get_all().items()
+                },
+                "scheduler_job_lateness": {
+                    k[0]: v.get_stats()
+                    for k, v in self._scheduler_job_lateness.get_all().items()
+                },
+                "outbound_queue_delay": {
+                    k[0]: v.get_stats()
+                    for k, v in self._outbound_queue_delay.get_all().items()
+                },
+                "claude_queue_delay": {
+                    k[0]: v.get_stats()
+                    for k, v in self._claude_queue_delay.get_all().items()
+                },
             },
         }
 
@@ -809,5 +1791,6 @@ __all__ = [
     "Gauge",
     "Histogram",
     "LabeledCounter",
+    "LabeledHistogram",
     "create_metrics_manager",
 ]
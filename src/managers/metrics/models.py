@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Metrics Data Models for Response Time Tracking
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-1.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-8-1.0-2
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -45,7 +45,7 @@ from datetime import datetime, date
 from typing import Any, Dict, List, Optional
 
 # Module version
-__version__ = "v5.0-8-1.0-1"
+__version__ = "v5.0-8-1.0-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -88,6 +88,11 @@ class AlertMetrics:
         was_auto_initiated: Whether Ash was auto-initiated
         user_opted_out: Whether user opted out of Ash
 
+        time_to_first_alert_seconds: Dispatch to first alert channel send
+        alert_channel_ids: Alert channels that received the alert
+        failed_channel_ids: Alert channels the send failed for
+        mirror_message_ids: Alert messages in the other alert channels
+
     Example:
         >>> metrics = AlertMetrics(
         ...     alert_id="alert_abc123",
@@ -130,6 +135,12 @@ class AlertMetrics:
     was_auto_initiated: bool = False
     user_opted_out: bool = False
 
+    # Phase 10: Multi-channel delivery (one record per alert, not per message)
+    time_to_first_alert_seconds: Optional[float] = None
+    alert_channel_ids: List[int] = field(default_factory=list)
+    failed_channel_ids: List[int] = field(default_factory=list)
+    mirror_message_ids: List[int] = field(default_factory=list)
+
     def __post_init__(self):
         """Set creation timestamp if not provided."""
         if self.alert_created_at is None:
@@ -222,6 +233,24 @@ class AlertMetrics:
         self.user_opted_out = True
         logger.debug(f"Alert {self.alert_id} user opted out")
 
+    def record_delivery(
+        self,
+        mirror_message_ids: List[int],
+        alert_channel_ids: List[int],
+        failed_channel_ids: List[int],
+    ) -> None:
+        """
+        Record the outcome of sending the alert to all its channels.
+
+        Args:
+            mirror_message_ids: Alert messages besides alert_message_id
+            alert_channel_ids: Channels that received the alert
+            failed_channel_ids: Channels the send failed for
+        """
+        self.mirror_message_ids = list(mirror_message_ids)
+        self.alert_channel_ids = list(alert_channel_ids)
+        self.failed_channel_ids = list(failed_channel_ids)
+
     def record_resolved(self) -> None:
         """Record when alert was resolved."""
         self.resolved_at = datetime.utcnow().isoformat() + "Z"
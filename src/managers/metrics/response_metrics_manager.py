@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Response Metrics Manager for Alert Response Time Tracking
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-1.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-8-1.0-3
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,8 @@ RESPONSIBILITIES:
 - Maintain daily aggregates for efficient reporting
 - Provide query methods for weekly summaries
 - Apply TTL to stored data for automatic cleanup
+- Batch related writes and reads into single Redis round trips (Phase 10)
+- Keep one record per alert across mirror alert channels (Phase 10)
 
 REDIS KEY PATTERNS:
 - ash:metrics:alert:{alert_id}     → Individual alert metrics (TTL: 90 days)
@@ -59,16 +61,16 @@ USAGE:
 import logging
 import uuid
 from datetime import datetime, timedelta, date
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from src.managers.metrics.models import AlertMetrics, DailyAggregate, WeeklySummary
 
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
-    from src.managers.storage.redis_manager import RedisManager
+    from src.managers.storage.redis_manager import RedisManager, RedisPipeline
 
 # Module version
-__version__ = "v5.0-8-1.0-1"
+__version__ = "v5.0-8-1.0-3"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -195,11 +197,14 @@ class ResponseMetricsManager:
         channel_id: int,
         severity: str,
         channel_sensitivity: float = 1.0,
+        time_to_first_alert_seconds: Optional[float] = None,
     ) -> Optional[AlertMetrics]:
         """
         Record when an alert is created.
 
-        Creates a new AlertMetrics record and stores it in Redis.
+        Creates a new AlertMetrics record and stores it in Redis. With
+        several alert channels this is called once, for the first send
+        to land; the other channels are added by record_alert_delivery().
 
         Args:
             alert_id: Unique alert identifier
@@ -208,6 +213,7 @@ class ResponseMetricsManager:
             channel_id: Source channel ID
             severity: Crisis severity level
             channel_sensitivity: Channel sensitivity modifier
+            time_to_first_alert_seconds: Dispatch to first send (Phase 10)
 
         Returns:
             Created AlertMetrics object, or None if disabled/failed
@@ -225,18 +231,23 @@ class ResponseMetricsManager:
                 channel_id=channel_id,
                 severity=severity.lower(),
                 channel_sensitivity=channel_sensitivity,
+                time_to_first_alert_seconds=time_to_first_alert_seconds,
             )
 
-            # Store in Redis with TTL
-            key = self._alert_key(alert_id)
+            # Store metrics and the message ID -> alert ID lookup
+            # in one round trip (Phase 10)
             ttl_seconds = self._alert_retention_days * SECONDS_PER_DAY
+            async with self._redis.pipeline() as pipe:
+                self._queue_store(
+                    pipe, self._alert_key(alert_id), metrics.to_json(), ttl_seconds
+                )
+                self._queue_store(
+                    pipe, self._lookup_key(alert_message_id), alert_id, ttl_seconds
+                )
 
-            # Use Redis SET with JSON (we'll add this as a simple string operation)
-            await self._store_metrics(key, metrics.to_json(), ttl_seconds)
-
-            # Create lookup from message ID to alert ID
-            lookup_key = self._lookup_key(alert_message_id)
-            await self._store_metrics(lookup_key, alert_id, ttl_seconds)
+            if not pipe.succeeded:
+                logger.error(f"❌ Failed to store metrics for alert {alert_id}")
+                return None
 
             self._alerts_tracked += 1
 
@@ -251,6 +262,61 @@ class ResponseMetricsManager:
             logger.error(f"❌ Failed to record alert creation: {e}")
             return None
 
+    async def record_alert_delivery(
+        self,
+        alert_id: str,
+        mirror_message_ids: List[int],
+        alert_channel_ids: List[int],
+        failed_channel_ids: List[int],
+    ) -> bool:
+        """
+        Record the per-channel outcome of a multi-channel alert (Phase 10).
+
+        Adds message ID lookups for the mirror alert messages, so buttons
+        on any copy of the alert update the same record.
+
+        Args:
+            alert_id: Alert identifier
+            mirror_message_ids: Alert messages besides the first one
+            alert_channel_ids: Channels that received the alert
+            failed_channel_ids: Channels the send failed for
+
+        Returns:
+            True if recorded successfully
+        """
+        if not self._enabled:
+            return False
+
+        try:
+            metrics = await self.get_alert_metrics(alert_id)
+            if metrics is None:
+                logger.warning(f"Alert {alert_id} not found for delivery update")
+                return False
+
+            metrics.record_delivery(
+                mirror_message_ids, alert_channel_ids, failed_channel_ids
+            )
+
+            ttl_seconds = self._alert_retention_days * SECONDS_PER_DAY
+            async with self._redis.pipeline() as pipe:
+                self._queue_store(
+                    pipe, self._alert_key(alert_id), metrics.to_json(), ttl_seconds
+                )
+                for message_id in mirror_message_ids:
+                    self._queue_store(
+                        pipe, self._lookup_key(message_id), alert_id, ttl_seconds
+                    )
+
+            if not pipe.succeeded:
+                logger.error(f"❌ Failed to store delivery for alert {alert_id}")
+                return False
+
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Failed to record alert delivery: {e}")
+            return False
+
     async def record_acknowledged(
         self,
         alert_id: str,
@@ -279,15 +345,9 @@ class ResponseMetricsManager:
             # Record acknowledgment
             metrics.record_acknowledged(acknowledged_by)
 
-            # Update in Redis
-            await self._store_metrics(
-                self._alert_key(alert_id),
-                metrics.to_json(),
-                self._alert_retention_days * SECONDS_PER_DAY,
-            )
-
-            # Update daily aggregate
-            await self._update_daily_aggregate(metrics)
+            # Store alert and daily aggregate together
+            if not await self._save_alert(metrics):
+                return False
 
             self._acknowledgments_recorded += 1
 
@@ -355,14 +415,9 @@ class ResponseMetricsManager:
 
             metrics.record_ash_contacted(initiated_by, was_auto_initiated)
 
-            await self._store_metrics(
-                self._alert_key(alert_id),
-                metrics.to_json(),
-                self._alert_retention_days * SECONDS_PER_DAY,
-            )
-
-            # Update daily aggregate
-            await self._update_daily_aggregate(metrics)
+            # Store alert and daily aggregate together
+            if not await self._save_alert(metrics):
+                return False
 
             logger.info(
                 f"📊 Ash contact recorded: {alert_id} "
@@ -423,14 +478,9 @@ class ResponseMetricsManager:
 
             metrics.record_user_opted_out()
 
-            await self._store_metrics(
-                self._alert_key(alert_id),
-                metrics.to_json(),
-                self._alert_retention_days * SECONDS_PER_DAY,
-            )
-
-            # Update daily aggregate
-            await self._update_daily_aggregate(metrics)
+            # Store alert and daily aggregate together
+            if not await self._save_alert(metrics):
+                return False
 
             logger.debug(f"📊 User opt-out recorded: {alert_id}")
             return True
@@ -479,11 +529,8 @@ class ResponseMetricsManager:
 
             metrics.record_first_response(responder_id)
 
-            await self._store_metrics(
-                self._alert_key(alert_id),
-                metrics.to_json(),
-                self._alert_retention_days * SECONDS_PER_DAY,
-            )
+            if not await self._save_alert(metrics, update_aggregate=False):
+                return False
 
             logger.debug(
                 f"📊 First response recorded: {alert_id} "
@@ -571,15 +618,21 @@ class ResponseMetricsManager:
 
         start_date = end_date - timedelta(days=6)
 
-        # Collect daily aggregates
+        # Collect daily aggregates in one round trip (Phase 10)
         aggregates: List[DailyAggregate] = []
 
-        current = start_date
-        while current <= end_date:
-            aggregate = await self.get_daily_aggregate(current)
-            if aggregate is not None:
-                aggregates.append(aggregate)
-            current += timedelta(days=1)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for offset in range(7):
+                day = start_date + timedelta(days=offset)
+                pipe.zrange(self._daily_key(day.strftime("%Y-%m-%d")), 0, 0, desc=True)
+
+        for results in pipe.results or []:
+            if not results:
+                continue
+            try:
+                aggregates.append(DailyAggregate.from_json(results[0]))
+            except Exception as e:
+                logger.error(f"❌ Failed to parse daily aggregate: {e}")
 
         # Build summary
         return WeeklySummary.from_aggregates(
@@ -592,35 +645,75 @@ class ResponseMetricsManager:
     # Internal Storage Methods
     # =========================================================================
 
-    async def _store_metrics(
+    def _queue_store(
         self,
+        pipe: "RedisPipeline",
         key: str,
         value: str,
         ttl_seconds: int,
-    ) -> bool:
+    ) -> None:
         """
-        Store metrics data in Redis with TTL.
+        Queue a metrics write on a pipeline.
+
+        Each key is a sorted set scored by write time whose newest member
+        is the current value. Older members are trimmed in the same
+        round trip so the set does not grow with every update (Phase 10).
 
         Args:
+            pipe: Pipeline from RedisManager.pipeline()
             key: Redis key
             value: JSON string to store
             ttl_seconds: TTL in seconds
+        """
+        score = datetime.utcnow().timestamp()
+        pipe.zadd(key, score, value)
+        pipe.zremrangebyrank(key, 0, -2)
+        pipe.expire(key, ttl_seconds)
+
+    async def _save_alert(
+        self,
+        metrics: AlertMetrics,
+        update_aggregate: bool = True,
+    ) -> bool:
+        """
+        Store alert metrics and its updated daily aggregate together.
+
+        Args:
+            metrics: AlertMetrics to store
+            update_aggregate: Also fold the alert into its daily aggregate
 
         Returns:
             True if stored successfully
         """
-        try:
-            # Use zadd with score as timestamp for consistent storage
-            # This allows us to use existing Redis methods
-            score = datetime.utcnow().timestamp()
-            await self._redis.zadd(key, score, value)
-            await self._redis.expire(key, ttl_seconds)
-            return True
+        aggregate_key = None
+        aggregate = None
+        if update_aggregate:
+            aggregate_key, aggregate = await self._build_daily_aggregate(metrics)
 
-        except Exception as e:
-            logger.error(f"❌ Failed to store metrics at {key}: {e}")
+        async with self._redis.pipeline() as pipe:
+            self._queue_store(
+                pipe,
+                self._alert_key(metrics.alert_id),
+                metrics.to_json(),
+                self._alert_retention_days * SECONDS_PER_DAY,
+            )
+            if aggregate is not None:
+                self._queue_store(
+                    pipe,
+                    aggregate_key,
+                    aggregate.to_json(),
+                    self._aggregate_retention_days * SECONDS_PER_DAY,
+                )
+
+        if not pipe.succeeded:
+            logger.error(f"❌ Failed to store metrics for alert {metrics.alert_id}")
             return False
 
+        if aggregate is not None:
+            logger.debug(f"📊 Daily aggregate updated: {aggregate.date}")
+
+        return True
+
     async def _get_metrics(self, key: str) -> Optional[str]:
         """
         Get metrics data from Redis.
@@ -657,28 +750,32 @@ class ResponseMetricsManager:
         key = self._lookup_key(message_id)
         return await self._get_metrics(key)
 
-    async def _update_daily_aggregate(
+    async def _build_daily_aggregate(
         self,
         metrics: AlertMetrics,
-    ) -> None:
+    ) -> Tuple[str, Optional[DailyAggregate]]:
         """
-        Update daily aggregate with alert metrics.
+        Load the alert's daily aggregate and add the alert to it.
 
         Args:
             metrics: AlertMetrics to aggregate
+
+        Returns:
+            Tuple of (aggregate key, updated aggregate or None on failure)
         """
-        try:
-            # Get date from alert creation
-            if metrics.alert_created_at:
-                alert_dt = datetime.fromisoformat(
-                    metrics.alert_created_at.replace("Z", "+00:00")
-                )
-                date_str = alert_dt.strftime("%Y-%m-%d")
-            else:
-                date_str = date.today().strftime("%Y-%m-%d")
+        # Get date from alert creation
+        if metrics.alert_created_at:
+            alert_dt = datetime.fromisoformat(
+                metrics.alert_created_at.replace("Z", "+00:00")
+            )
+            date_str = alert_dt.strftime("%Y-%m-%d")
+        else:
+            date_str = date.today().strftime("%Y-%m-%d")
+
+        key = self._daily_key(date_str)
 
+        try:
             # Load or create aggregate
-            key = self._daily_key(date_str)
             existing_data = await self._get_metrics(key)
 
             if existing_data:
@@ -697,14 +794,11 @@ class ResponseMetricsManager:
                 acknowledged_by=metrics.acknowledged_by,
             )
 
-            # Store updated aggregate
-            ttl_seconds = self._aggregate_retention_days * SECONDS_PER_DAY
-            await self._store_metrics(key, aggregate.to_json(), ttl_seconds)
-
-            logger.debug(f"📊 Daily aggregate updated: {date_str}")
+            return key, aggregate
 
         except Exception as e:
             logger.error(f"❌ Failed to update daily aggregate: {e}")
+            return key, None
 
     # =========================================================================
     # Properties and Status
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 NLP Managers Package for Ash-Bot Service
 ---
-FILE VERSION: v5.0-1-1.1-1
-LAST MODIFIED: 2026-01-03
+FILE VERSION: v5.0-1-1.1-4
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 1 - Discord Connectivity
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -22,6 +22,7 @@ Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alp
 ============================================================================
 This package contains NLP-related managers:
 - NLPClientManager: Async HTTP client for Ash-NLP API
+- EndpointPool: Ash-NLP replica routing with per-replica breakers (Phase 10)
 
 USAGE:
     from src.managers.nlp import create_nlp_client_manager
@@ -31,7 +32,7 @@ USAGE:
 """
 
 # Module version
-__version__ = "v5.0-1-1.1-1"
+__version__ = "v5.0-1-1.1-4"
 
 # =============================================================================
 # NLP Client Manager
@@ -42,9 +43,16 @@ from .nlp_client_manager import (
     NLPConnectionError,
     NLPTimeoutError,
     NLPValidationError,
+    NLPOverloadedError,
+    NLPBatchUnsupportedError,
     create_nlp_client_manager,
 )
 
+from .endpoint_pool import (
+    EndpointPool,
+    NLPEndpoint,
+)
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -56,5 +64,10 @@ __all__ = [
     "NLPConnectionError",
     "NLPTimeoutError",
     "NLPValidationError",
+    "NLPOverloadedError",
+    "NLPBatchUnsupportedError",
     "create_nlp_client_manager",
+    # Endpoint Pool (Phase 10)
+    "EndpointPool",
+    "NLPEndpoint",
 ]
@@ -0,0 +1,339 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+NLP Endpoint Pool for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-5.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Track each Ash-NLP replica with its own circuit breaker
+- Track outstanding requests and latency per replica
+- Pick the best replica by least-outstanding or latency-EWMA routing
+- Report per-replica health for status endpoints
+
+USAGE:
+    from src.managers.nlp.endpoint_pool import EndpointPool
+
+    pool = EndpointPool(
+        urls=["http://ash-nlp-1:30880", "http://ash-nlp-2:30880"],
+        strategy="latency_ewma",
+        breaker_config=CircuitBreakerConfig(failure_threshold=5),
+    )
+
+    endpoint = pool.select()
+    with endpoint.track() as outcome:
+        ...  # send request to endpoint.url
+        outcome.latency = elapsed
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
+from src.utils.latency_tracker import LatencyTracker
+
+# Module version
+__version__ = "v5.0-10-5.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Routing Strategies
+# =============================================================================
+
+ROUTING_LEAST_OUTSTANDING = "least_outstanding"
+ROUTING_LATENCY_EWMA = "latency_ewma"
+ROUTING_STRATEGIES = (ROUTING_LEAST_OUTSTANDING, ROUTING_LATENCY_EWMA)
+
+
+# =============================================================================
+# NLP Endpoint
+# =============================================================================
+
+
+class _RequestOutcome:
+    """Mutable holder used by NLPEndpoint.track() to record latency."""
+
+    __slots__ = ("latency",)
+
+    def __init__(self) -> None:
+        self.latency: Optional[float] = None
+
+
+class NLPEndpoint:
+    """
+    One Ash-NLP replica.
+
+    Attributes:
+        url: Base URL of the replica
+        breaker: Circuit breaker dedicated to this replica
+        latency: Rolling latency statistics for this replica
+        outstanding: Requests currently in flight to this replica
+    """
+
+    def __init__(
+        self,
+        url: str,
+        breaker_config: CircuitBreakerConfig,
+        latency_window: int = LatencyTracker.DEFAULT_WINDOW_SIZE,
+        ewma_alpha: float = LatencyTracker.DEFAULT_EWMA_ALPHA,
+    ):
+        """
+        Initialize NLPEndpoint.
+
+        Args:
+            url: Base URL of the replica
+            breaker_config: Circuit breaker configuration
+            latency_window: Samples kept for latency percentiles
+            ewma_alpha: EWMA smoothing factor
+        """
+        self.url = url.rstrip("/")
+        self.breaker = CircuitBreaker(name=f"nlp_api[{self.url}]", config=breaker_config)
+        self.latency = LatencyTracker(window_size=latency_window, ewma_alpha=ewma_alpha)
+        self.outstanding = 0
+        self.client: Any = None
+
+        # Statistics
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def is_available(self) -> bool:
+        """Check if the replica's breaker will accept a request."""
+        return self.breaker.state != CircuitState.OPEN
+
+    def score(self, strategy: str) -> float:
+        """
+        Get routing score for this replica (lower is better).
+
+        least_outstanding uses the in-flight count alone. latency_ewma
+        multiplies the smoothed latency by (outstanding + 1) so a fast
+        replica that is already busy does not attract every request.
+
+        Args:
+            strategy: Routing strategy name
+
+        Returns:
+            Routing score
+        """
+        if strategy == ROUTING_LATENCY_EWMA:
+            ewma = self.latency.ewma
+            if ewma is None:
+                # Unmeasured replicas get tried first
+                return 0.0
+            return ewma * (self.outstanding + 1)
+        return float(self.outstanding)
+
+    @contextmanager
+    def track(self) -> Iterator[_RequestOutcome]:
+        """
+        Count a request as outstanding for the duration of the block.
+
+        Set outcome.latency inside the block to record a successful
+        request's latency; leave it unset for failures.
+        """
+        outcome = _RequestOutcome()
+        self.outstanding += 1
+        self.requests += 1
+        try:
+            yield outcome
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.outstanding -= 1
+            if outcome.latency is not None:
+                self.latency.observe(outcome.latency)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get replica status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "url": self.url,
+            "circuit_state": self.breaker.state.value,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "latency": self.latency.get_stats(),
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"NLPEndpoint(url='{self.url}', circuit={self.breaker.state.value}, "
+            f"outstanding={self.outstanding})"
+        )
+
+
+# =============================================================================
+# Endpoint Pool
+# =============================================================================
+
+
+class EndpointPool:
+    """
+    Set of Ash-NLP replicas with health-aware routing.
+
+    Replicas whose breaker is open are skipped until the breaker moves
+    to half-open. Ties are broken round-robin so equal replicas share
+    load evenly.
+
+    Attributes:
+        strategy: Routing strategy (least_outstanding, latency_ewma)
+        endpoints: Replicas in configuration order
+    """
+
+    DEFAULT_STRATEGY = ROUTING_LATENCY_EWMA
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        breaker_config: CircuitBreakerConfig,
+        strategy: str = DEFAULT_STRATEGY,
+        latency_window: int = LatencyTracker.DEFAULT_WINDOW_SIZE,
+        ewma_alpha: float = LatencyTracker.DEFAULT_EWMA_ALPHA,
+    ):
+        """
+        Initialize EndpointPool.
+
+        Args:
+            urls: Replica base URLs (duplicates are ignored)
+            breaker_config: Circuit breaker configuration per replica
+            strategy: Routing strategy (least_outstanding, latency_ewma)
+            latency_window: Samples kept for latency percentiles
+            ewma_alpha: EWMA smoothing factor
+
+        Raises:
+            ValueError: If no URLs are given
+        """
+        unique_urls: List[str] = []
+        for url in urls:
+            url = url.strip().rstrip("/")
+            if url and url not in unique_urls:
+                unique_urls.append(url)
+
+        if not unique_urls:
+            raise ValueError("EndpointPool needs at least one URL")
+
+        if strategy not in ROUTING_STRATEGIES:
+            logger.warning(
+                f"⚠️ Unknown NLP routing strategy '{strategy}', "
+                f"using '{self.DEFAULT_STRATEGY}'"
+            )
+            strategy = self.DEFAULT_STRATEGY
+
+        self.strategy = strategy
+        self.endpoints: List[NLPEndpoint] = [
+            NLPEndpoint(
+                url=url,
+                breaker_config=breaker_config,
+                latency_window=latency_window,
+                ewma_alpha=ewma_alpha,
+            )
+            for url in unique_urls
+        ]
+
+        # Pool-wide latency, used when a replica has too few samples
+        self.latency = LatencyTracker(window_size=latency_window, ewma_alpha=ewma_alpha)
+        self._cursor = 0
+
+        logger.info(
+            f"✅ EndpointPool initialized "
+            f"(endpoints={len(self.endpoints)}, strategy={self.strategy})"
+        )
+
+    def select(self, exclude: Sequence[NLPEndpoint] = ()) -> Optional[NLPEndpoint]:
+        """
+        Pick the best available replica.
+
+        Args:
+            exclude: Replicas not to consider (e.g. the hedged primary)
+
+        Returns:
+            Chosen replica, or None if every replica is excluded or open
+        """
+        count = len(self.endpoints)
+        self._cursor = (self._cursor + 1) % count
+
+        best: Optional[NLPEndpoint] = None
+        best_score = 0.0
+        for offset in range(count):
+            endpoint = self.endpoints[(self._cursor + offset) % count]
+            if endpoint in exclude or not endpoint.is_available:
+                continue
+            score = endpoint.score(self.strategy)
+            if best is None or score < best_score:
+                best, best_score = endpoint, score
+
+        return best
+
+    def observe(self, seconds: float) -> None:
+        """Record a pool-wide latency sample."""
+        self.latency.observe(seconds)
+
+    @property
+    def primary(self) -> NLPEndpoint:
+        """Get the first configured replica."""
+        return self.endpoints[0]
+
+    @property
+    def available_count(self) -> int:
+        """Get number of replicas whose breaker is not open."""
+        return sum(1 for endpoint in self.endpoints if endpoint.is_available)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get pool status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "strategy": self.strategy,
+            "available": self.available_count,
+            "total": len(self.endpoints),
+            "latency": self.latency.get_stats(),
+            "endpoints": [endpoint.get_status() for endpoint in self.endpoints],
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"EndpointPool(endpoints={len(self.endpoints)}, "
+            f"available={self.available_count}, strategy={self.strategy})"
+        )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "EndpointPool",
+    "NLPEndpoint",
+    "ROUTING_LEAST_OUTSTANDING",
+    "ROUTING_LATENCY_EWMA",
+    "ROUTING_STRATEGIES",
+]
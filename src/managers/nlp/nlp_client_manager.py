@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 NLP Client Manager for Ash-Bot Service
 ---
-FILE VERSION: v5.0-5-5.5-2
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-5-5.5-9
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 5 - Production Hardening
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -28,6 +28,10 @@ RESPONSIBILITIES:
 - Response parsing and validation
 - Circuit breaker integration (Phase 5)
 - Metrics collection (Phase 5)
+- Micro-batching of concurrent analyses via /analyze/batch (Phase 10)
+- Multi-replica routing with per-replica circuit breakers (Phase 10)
+- Hedged requests for high-priority channels (Phase 10)
+- Adaptive concurrency limit and latency-derived timeouts (Phase 10)
 
 USAGE:
     from src.managers.nlp import create_nlp_client_manager
@@ -39,16 +43,50 @@ USAGE:
         if result.is_actionable:
             # Handle crisis
             pass
+
+        # Several messages in one request (falls back to per-message
+        # calls when the server does not advertise batch support)
+        results = await nlp_client.analyze_batch([
+            AnalysisRequest(message="first"),
+            AnalysisRequest(message="second"),
+        ])
+
+BATCH PROTOCOL (Phase 10):
+    GET  /status          → {"capabilities": {"batch": true, "max_batch_size": 32}}
+    POST /analyze/batch   ← {"requests": [<analyze body>, ...]}
+                          → {"results": [<analyze response>, ...]}  (same order)
+
+    A result item containing only {"error": "..."} fails that message alone.
+    Point BOT_NLP_BASE_URL at a local stand-in server to exercise either path.
+
+MULTIPLE REPLICAS (Phase 10):
+    BOT_NLP_BASE_URLS=http://ash-nlp-1:30880,http://ash-nlp-2:30880
+
+    Each attempt goes to the best available replica (least outstanding
+    requests, or latency EWMA x outstanding). A replica whose own breaker
+    opens is skipped; the global "nlp_api" breaker only sees failures
+    that survived every retry. With hedging enabled, analyze_message(...,
+    hedge=True) sends a duplicate to a second replica once the first has
+    been pending longer than the observed p95.
+
+ADAPTIVE CONCURRENCY (Phase 10):
+    Every attempt takes a slot from an AIMD limiter. The limit grows while
+    latency stays near its baseline and shrinks on 429/5xx, timeouts, or
+    latency spikes. Callers queue FIFO for up to concurrency_max_wait_seconds
+    and are then rejected with NLPOverloadedError (not retried). Per-attempt
+    timeouts follow timeout_multiplier x the rolling p99, bounded by
+    min_timeout_ms and timeout_seconds.
 """
 
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
 import httpx
 
 from src.models.nlp_models import (
+    AnalysisRequest,
     CrisisAnalysisResult,
     MessageHistoryItem,
 )
@@ -57,13 +95,18 @@ from src.utils.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitOpenError,
 )
+from src.utils.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitExceeded,
+)
+from src.managers.nlp.endpoint_pool import EndpointPool, NLPEndpoint
 
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
     from src.managers.metrics.metrics_manager import MetricsManager
 
 # Module version
-__version__ = "v5.0-5-5.5-2"
+__version__ = "v5.0-5-5.5-9"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -117,6 +160,16 @@ class NLPCircuitOpenError(NLPClientError):
     pass
 
 
+class NLPOverloadedError(NLPClientError):
+    """Raised when the adaptive concurrency limit sheds a request."""
+    pass
+
+
+class NLPBatchUnsupportedError(NLPClientError):
+    """Raised when the server has no /analyze/batch endpoint (404/405/501)."""
+    pass
+
+
 # =============================================================================
 # NLP Client Manager
 # =============================================================================
@@ -139,6 +192,37 @@ class NLPClientManager:
     DEFAULT_CB_SUCCESS_THRESHOLD = 2
     DEFAULT_CB_TIMEOUT = 30.0
 
+    # Phase 10: Micro-batching
+    DEFAULT_BATCH_ENABLED = True
+    DEFAULT_BATCH_WINDOW_MS = 5
+    DEFAULT_BATCH_MAX_SIZE = 16
+    BATCH_ENDPOINT = "/analyze/batch"
+    BATCH_CAPABILITY_TTL = 300.0
+    BATCH_PROBE_RETRY_SECONDS = 30.0
+    BATCH_UNSUPPORTED_STATUS = (404, 405, 501)
+
+    # Phase 10: Multi-replica routing and hedging
+    DEFAULT_ROUTING_STRATEGY = EndpointPool.DEFAULT_STRATEGY
+    DEFAULT_HEDGE_ENABLED = False
+    DEFAULT_HEDGE_MIN_DELAY_MS = 50
+    DEFAULT_HEDGE_MIN_SAMPLES = 20
+    HEDGE_PERCENTILE = 0.95
+
+    # Phase 10: Adaptive concurrency and timeouts
+    DEFAULT_CONCURRENCY_INITIAL_LIMIT = AdaptiveConcurrencyLimiter.DEFAULT_INITIAL_LIMIT
+    DEFAULT_CONCURRENCY_MIN_LIMIT = AdaptiveConcurrencyLimiter.DEFAULT_MIN_LIMIT
+    DEFAULT_CONCURRENCY_MAX_LIMIT = AdaptiveConcurrencyLimiter.DEFAULT_MAX_LIMIT
+    DEFAULT_CONCURRENCY_MAX_WAIT = AdaptiveConcurrencyLimiter.DEFAULT_MAX_QUEUE_WAIT
+    DEFAULT_ADAPTIVE_TIMEOUT_ENABLED = True
+    DEFAULT_TIMEOUT_PERCENTILE = 0.99
+    DEFAULT_TIMEOUT_MULTIPLIER = 3.0
+    DEFAULT_MIN_TIMEOUT_MS = 500
+    TIMEOUT_MIN_SAMPLES = 20
+    OVERLOAD_STATUS = 429
+
+    # Phase 10: Error results worth retrying later (see is_deferrable)
+    DEFERRABLE_REQUEST_IDS = ("circuit_open", "circuit_blocked", "overloaded")
+
     def __init__(
         self,
         config_manager: "ConfigManager",
@@ -155,51 +239,146 @@ class NLPClientManager:
         self.retry_attempts = int(nlp_config.get("retry_attempts", self.DEFAULT_RETRY_ATTEMPTS))
         self.retry_delay = float(nlp_config.get("retry_delay_seconds", self.DEFAULT_RETRY_DELAY))
 
+        # Phase 10: Micro-batching config
+        self.batch_enabled = bool(nlp_config.get("batch_enabled", self.DEFAULT_BATCH_ENABLED))
+        self.batch_window = int(nlp_config.get("batch_window_ms", self.DEFAULT_BATCH_WINDOW_MS)) / 1000.0
+        self.batch_max_size = max(1, int(nlp_config.get("batch_max_size", self.DEFAULT_BATCH_MAX_SIZE)))
+
+        # Phase 10: Replica and hedging config
+        base_urls = [u for u in str(nlp_config.get("base_urls") or "").split(",") if u.strip()]
+        self.routing_strategy = nlp_config.get("routing_strategy", self.DEFAULT_ROUTING_STRATEGY)
+        self.hedge_enabled = bool(nlp_config.get("hedge_enabled", self.DEFAULT_HEDGE_ENABLED))
+        self.hedge_min_delay = int(nlp_config.get("hedge_min_delay_ms", self.DEFAULT_HEDGE_MIN_DELAY_MS)) / 1000.0
+        self.hedge_min_samples = int(nlp_config.get("hedge_min_samples", self.DEFAULT_HEDGE_MIN_SAMPLES))
+
+        # Phase 10: Adaptive timeout config (timeout_seconds becomes the ceiling)
+        self.adaptive_timeout_enabled = bool(
+            nlp_config.get("adaptive_timeout_enabled", self.DEFAULT_ADAPTIVE_TIMEOUT_ENABLED)
+        )
+        self.timeout_percentile = float(nlp_config.get("timeout_percentile", self.DEFAULT_TIMEOUT_PERCENTILE))
+        self.timeout_multiplier = float(nlp_config.get("timeout_multiplier", self.DEFAULT_TIMEOUT_MULTIPLIER))
+        self.min_timeout = min(
+            self.timeout,
+            int(nlp_config.get("min_timeout_ms", self.DEFAULT_MIN_TIMEOUT_MS)) / 1000.0,
+        )
+
         # Circuit breaker config
         cb_config = config_manager.get_section("circuit_breaker")
         cb_failure_threshold = int(cb_config.get("nlp_failure_threshold", self.DEFAULT_CB_FAILURE_THRESHOLD))
         cb_success_threshold = int(cb_config.get("nlp_success_threshold", self.DEFAULT_CB_SUCCESS_THRESHOLD))
         cb_timeout = float(cb_config.get("nlp_timeout_seconds", self.DEFAULT_CB_TIMEOUT))
 
-        # Initialize circuit breaker
+        # Initialize circuit breaker. Load shedding by the concurrency
+        # limiter is not an NLP failure and must not open the breaker.
         self._circuit_breaker = CircuitBreaker(
             name="nlp_api",
             config=CircuitBreakerConfig(
                 failure_threshold=cb_failure_threshold,
                 success_threshold=cb_success_threshold,
                 timeout_seconds=cb_timeout,
+                excluded_exceptions=(NLPOverloadedError, NLPBatchUnsupportedError),
             ),
         )
 
-        self._client: Optional[httpx.AsyncClient] = None
+        # Phase 10: Adaptive concurrency limiter shared by all replicas
+        self._limiter = AdaptiveConcurrencyLimiter(
+            name="nlp_api",
+            initial_limit=int(nlp_config.get(
+                "concurrency_initial_limit", self.DEFAULT_CONCURRENCY_INITIAL_LIMIT
+            )),
+            min_limit=int(nlp_config.get(
+                "concurrency_min_limit", self.DEFAULT_CONCURRENCY_MIN_LIMIT
+            )),
+            max_limit=int(nlp_config.get(
+                "concurrency_max_limit", self.DEFAULT_CONCURRENCY_MAX_LIMIT
+            )),
+            max_queue_wait=float(nlp_config.get(
+                "concurrency_max_wait_seconds", self.DEFAULT_CONCURRENCY_MAX_WAIT
+            )),
+        )
+
+        # Phase 10: Replica pool, one breaker per replica. Validation
+        # errors are the caller's fault and do not count against a replica,
+        # nor does an older server lacking the batch endpoint.
+        self._pool = EndpointPool(
+            urls=base_urls or [self.base_url],
+            strategy=self.routing_strategy,
+            breaker_config=CircuitBreakerConfig(
+                failure_threshold=cb_failure_threshold,
+                success_threshold=cb_success_threshold,
+                timeout_seconds=cb_timeout,
+                excluded_exceptions=(NLPValidationError, NLPBatchUnsupportedError),
+            ),
+        )
+        self.base_url = self._pool.primary.url
+        self._hedged_requests = 0
+        self._hedge_wins = 0
+
         self._closed = False
         self._consecutive_failures = 0
 
+        # Phase 10: Micro-batcher state
+        self._batch_pending: List[Tuple[AnalysisRequest, asyncio.Future]] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._batch_supported: Optional[bool] = None
+        self._batch_checked_at = 0.0
+        self._batch_rejected_at: Optional[float] = None
+        self._batch_server_max: Optional[int] = None
+        self._batch_probe_lock: Optional[asyncio.Lock] = None
+        self._batch_probe_task: Optional[asyncio.Task] = None
+        self._batches_sent = 0
+        self._batched_messages = 0
+
         logger.info(
             f"✅ NLPClientManager initialized (url={self.base_url}, "
-            f"cb_failures={cb_failure_threshold})"
+            f"endpoints={len(self._pool.endpoints)}, "
+            f"cb_failures={cb_failure_threshold}, batching={self.batch_enabled}, "
+            f"hedging={self.hedge_enabled})"
         )
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+    async def _get_client(self, replica: Optional[NLPEndpoint] = None) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client for a replica.
+
+        Without a replica, the best available one (or the primary) is used.
+        """
         if self._closed:
             raise NLPClientError("NLP client has been closed")
 
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
+        if replica is None:
+            replica = self._pool.select() or self._pool.primary
+
+        if replica.client is None:
+            replica.client = httpx.AsyncClient(
+                base_url=replica.url,
                 timeout=httpx.Timeout(self.timeout),
                 headers={"Content-Type": "application/json", "Accept": "application/json"},
             )
-        return self._client
+        return replica.client
 
     async def close(self) -> None:
         """Close the HTTP client connection pool."""
         if self._closed:
             return
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+
+        # Fail anything still waiting on the micro-batcher
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        for _, future in self._batch_pending:
+            if not future.done():
+                future.set_exception(NLPClientError("NLP client has been closed"))
+        self._batch_pending = []
+        for task in list(self._batch_tasks):
+            task.cancel()
+        if self._batch_probe_task is not None:
+            self._batch_probe_task.cancel()
+
+        for replica in self._pool.endpoints:
+            if replica.client is not None:
+                await replica.client.aclose()
+                replica.client = None
         self._closed = True
         logger.debug("HTTP client closed")
 
@@ -218,8 +397,64 @@ class NLPClientManager:
         user_timezone: Optional[str] = None,
         include_explanation: bool = True,
         verbosity: str = "standard",
+        hedge: bool = False,
+    ) -> CrisisAnalysisResult:
+        """
+        Analyze a message for crisis signals with circuit breaker protection.
+
+        Set hedge=True for high-priority channels. When hedging is enabled
+        and more than one replica is configured, the request skips the
+        micro-batcher and may be duplicated to a second replica.
+        """
+        request = AnalysisRequest(
+            message=message,
+            user_id=user_id,
+            channel_id=channel_id,
+            message_history=message_history,
+            user_timezone=user_timezone,
+            include_explanation=include_explanation,
+            verbosity=verbosity,
+        )
+        hedge = hedge and self.hedge_enabled and len(self._pool.endpoints) > 1
+        return await self._analyze(
+            request,
+            use_batcher=self.batch_enabled and not hedge,
+            hedge=hedge,
+        )
+
+    async def analyze_batch(
+        self,
+        requests: List[AnalysisRequest],
+    ) -> List[CrisisAnalysisResult]:
+        """
+        Analyze several messages, batched when the server supports it.
+
+        Requests go through the micro-batcher regardless of batch_enabled,
+        so they are split into chunks of at most batch_max_size. Servers
+        without batch support get one /analyze call per request.
+
+        Args:
+            requests: Analysis requests
+
+        Returns:
+            One result per request, in the same order. Failures are
+            returned as error results, as with analyze_message().
+        """
+        if not requests:
+            return []
+        return list(
+            await asyncio.gather(
+                *(self._analyze(request, use_batcher=True) for request in requests)
+            )
+        )
+
+    async def _analyze(
+        self,
+        request: AnalysisRequest,
+        use_batcher: bool,
+        hedge: bool = False,
     ) -> CrisisAnalysisResult:
-        """Analyze a message for crisis signals with circuit breaker protection."""
+        """Run one analysis, directly or via the micro-batcher."""
         start_time = time.monotonic()
 
         # Check circuit breaker
@@ -233,30 +468,15 @@ class NLPClientManager:
                     request_id="circuit_open",
                 )
 
-        # Build request
-        request_body: Dict[str, Any] = {
-            "message": message,
-            "include_explanation": include_explanation,
-            "verbosity": verbosity,
-        }
-        if user_id:
-            request_body["user_id"] = str(user_id)
-        if channel_id:
-            request_body["channel_id"] = str(channel_id)
-        if message_history:
-            request_body["message_history"] = [item.to_dict() for item in message_history]
-        if user_timezone:
-            request_body["user_timezone"] = user_timezone
-
         try:
-            response_data = await self._circuit_breaker.call(
-                self._make_request_with_retry,
-                method="POST",
-                endpoint="/analyze",
-                json_data=request_body,
-            )
+            if use_batcher and await self._batch_available():
+                result = await self._submit_to_batcher(request)
+            else:
+                if use_batcher and self._metrics:
+                    self._metrics.inc_nlp_batch_fallbacks()
+                result = await self._request_single(request, hedge=hedge)
+
             self._consecutive_failures = 0
-            result = CrisisAnalysisResult.from_api_response(response_data)
             elapsed_ms = (time.monotonic() - start_time) * 1000
 
             if self._metrics:
@@ -276,6 +496,14 @@ class NLPClientManager:
                 request_id="circuit_blocked",
             )
 
+        except NLPOverloadedError as e:
+            if self._metrics:
+                self._metrics.inc_nlp_errors()
+            return CrisisAnalysisResult.create_error_result(
+                error_message=str(e),
+                request_id="overloaded",
+            )
+
         except NLPClientError as e:
             self._consecutive_failures += 1
             if self._metrics:
@@ -287,6 +515,208 @@ class NLPClientManager:
                 request_id=getattr(e, "request_id", "error"),
             )
 
+    async def _request_single(
+        self,
+        request: AnalysisRequest,
+        hedge: bool = False,
+    ) -> CrisisAnalysisResult:
+        """Send one POST /analyze through the circuit breaker."""
+        response_data = await self._circuit_breaker.call(
+            self._make_request_with_retry,
+            method="POST",
+            endpoint="/analyze",
+            json_data=request.to_dict(),
+            hedge=hedge,
+        )
+        return CrisisAnalysisResult.from_api_response(response_data)
+
+    # =========================================================================
+    # Phase 10: Micro-batching
+    # =========================================================================
+
+    async def _batch_available(self) -> bool:
+        """
+        Check whether the server advertises batch support.
+
+        The first call waits for a GET /status probe. After that the cached
+        answer is returned and refreshed in the background once stale.
+        """
+        if self._batch_supported is None:
+            if self._batch_probe_lock is None:
+                self._batch_probe_lock = asyncio.Lock()
+            async with self._batch_probe_lock:
+                if self._batch_supported is None:
+                    await self._probe_batch_support()
+            return bool(self._batch_supported)
+
+        ttl = (
+            self.BATCH_CAPABILITY_TTL
+            if self._batch_supported
+            else self.BATCH_PROBE_RETRY_SECONDS
+        )
+        stale = time.monotonic() - self._batch_checked_at >= ttl
+        if stale and (self._batch_probe_task is None or self._batch_probe_task.done()):
+            self._batch_probe_task = asyncio.create_task(self._probe_batch_support())
+
+        return self._batch_supported
+
+    async def _probe_batch_support(self) -> None:
+        """Read batch capability from GET /status."""
+        status = await self.get_status()
+        capabilities = (status or {}).get("capabilities") or {}
+        supported = bool(capabilities.get("batch", False))
+
+        # A server that rejected the endpoint stays unsupported for the
+        # capability TTL, even if /status still advertises batching
+        if (
+            supported
+            and self._batch_rejected_at is not None
+            and time.monotonic() - self._batch_rejected_at < self.BATCH_CAPABILITY_TTL
+        ):
+            supported = False
+
+        server_max = capabilities.get("max_batch_size")
+        try:
+            self._batch_server_max = int(server_max) if server_max else None
+        except (TypeError, ValueError):
+            self._batch_server_max = None
+
+        if supported != self._batch_supported:
+            if supported:
+                logger.info(
+                    f"📦 Ash-NLP batch analysis available "
+                    f"(max_size={self.effective_batch_size})"
+                )
+            else:
+                logger.info("📦 Ash-NLP batch analysis not advertised - using per-message calls")
+
+        self._batch_supported = supported
+        self._batch_checked_at = time.monotonic()
+
+    def _mark_batch_unsupported(self) -> None:
+        """Stop batching for the capability TTL after the server rejects it."""
+        self._batch_supported = False
+        self._batch_checked_at = self._batch_rejected_at = time.monotonic()
+        logger.warning(
+            f"⚠️ {self.BATCH_ENDPOINT} rejected - falling back to per-message calls"
+        )
+
+    def _submit_to_batcher(self, request: AnalysisRequest) -> asyncio.Future:
+        """
+        Queue a request for the next batch.
+
+        The batch is flushed when it reaches the effective batch size or
+        when the collection window expires, whichever comes first.
+
+        Returns:
+            Future resolving to the CrisisAnalysisResult
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._batch_pending.append((request, future))
+
+        if len(self._batch_pending) >= self.effective_batch_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(self.batch_window, self._flush_batch)
+
+        return future
+
+    def _flush_batch(self) -> None:
+        """Send everything collected so far as one batch."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+
+        pending, self._batch_pending = self._batch_pending, []
+        if not pending:
+            return
+
+        task = asyncio.create_task(self._send_batch(pending))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(
+        self,
+        pending: List[Tuple[AnalysisRequest, asyncio.Future]],
+    ) -> None:
+        """Send one batch and fan results back out to the waiting callers."""
+        requests = [request for request, _ in pending]
+        outcomes: List[Union[CrisisAnalysisResult, BaseException]]
+
+        self._batches_sent += 1
+        self._batched_messages += len(requests)
+        if self._metrics:
+            self._metrics.observe_nlp_batch_size(len(requests))
+
+        try:
+            if len(requests) == 1:
+                outcomes = [await self._request_single(requests[0])]
+            else:
+                outcomes = await self._request_batch(requests)
+
+        except NLPBatchUnsupportedError:
+            self._mark_batch_unsupported()
+            if self._metrics:
+                self._metrics.inc_nlp_batch_fallbacks(len(requests))
+            outcomes = await asyncio.gather(
+                *(self._request_single(request) for request in requests),
+                return_exceptions=True,
+            )
+
+        except asyncio.CancelledError:
+            # close() cancelled the batch; its callers must not hang
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(NLPClientError("NLP client has been closed"))
+            raise
+
+        except Exception as e:
+            outcomes = [e] * len(requests)
+
+        for (_, future), outcome in zip(pending, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _request_batch(
+        self,
+        requests: List[AnalysisRequest],
+    ) -> List[Union[CrisisAnalysisResult, NLPClientError]]:
+        """Send one POST /analyze/batch through the circuit breaker."""
+        response_data = await self._circuit_breaker.call(
+            self._make_request_with_retry,
+            method="POST",
+            endpoint=self.BATCH_ENDPOINT,
+            json_data={"requests": [request.to_dict() for request in requests]},
+        )
+
+        items = response_data.get("results")
+        if not isinstance(items, list) or len(items) != len(requests):
+            raise NLPClientError(
+                message=(
+                    f"Batch response malformed: expected {len(requests)} results, "
+                    f"got {len(items) if isinstance(items, list) else 'none'}"
+                ),
+                request_id=response_data.get("request_id"),
+            )
+
+        results: List[Union[CrisisAnalysisResult, NLPClientError]] = []
+        for item in items:
+            if isinstance(item, dict) and "error" in item and "severity" not in item:
+                results.append(
+                    NLPClientError(
+                        message=f"Batch item failed: {item.get('error')}",
+                        request_id=item.get("request_id"),
+                    )
+                )
+            else:
+                results.append(CrisisAnalysisResult.from_api_response(item))
+        return results
+
     async def check_health(self) -> bool:
         """Check if Ash-NLP API is healthy (bypasses circuit breaker)."""
         try:
@@ -322,38 +752,28 @@ class NLPClientManager:
         method: str,
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
+        hedge: bool = False,
     ) -> Dict[str, Any]:
-        """Make HTTP request with exponential backoff retry."""
-        client = await self._get_client()
+        """Make HTTP request with exponential backoff retry, one replica per attempt."""
         last_error: Optional[Exception] = None
 
         for attempt in range(self.retry_attempts + 1):
             try:
-                if method.upper() == "POST":
-                    response = await client.post(endpoint, json=json_data)
-                else:
-                    response = await client.get(endpoint)
-
-                if response.status_code >= 400:
-                    error_detail = self._extract_error_detail(response)
-                    if 400 <= response.status_code < 500:
-                        raise NLPValidationError(
-                            message=f"Validation error: {error_detail}",
-                            status_code=response.status_code,
-                        )
-                    raise NLPClientError(
-                        message=f"Server error: {error_detail}",
-                        status_code=response.status_code,
-                    )
-                return response.json()
+                if hedge:
+                    return await self._request_hedged(method, endpoint, json_data)
 
-            except httpx.TimeoutException as e:
-                last_error = NLPTimeoutError(f"Request timed out: {e}")
+                replica = self._pool.select()
+                if replica is None:
+                    raise NLPConnectionError("No NLP endpoint available (all replica circuits open)")
+                return await self._request_once(replica, method, endpoint, json_data)
+
+            except NLPTimeoutError as e:
+                last_error = e
                 logger.warning(f"⚠️ NLP timeout (attempt {attempt + 1}/{self.retry_attempts + 1})")
-            except httpx.ConnectError as e:
-                last_error = NLPConnectionError(f"Connection failed: {e}")
+            except NLPConnectionError as e:
+                last_error = e
                 logger.warning(f"⚠️ NLP connection error (attempt {attempt + 1}): {e}")
-            except NLPValidationError:
+            except (NLPValidationError, NLPOverloadedError, NLPBatchUnsupportedError):
                 raise
             except NLPClientError as e:
                 last_error = e
@@ -368,6 +788,219 @@ class NLPClientManager:
 
         raise last_error or NLPClientError("Unknown error after retries")
 
+    async def _request_once(
+        self,
+        replica: NLPEndpoint,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make one HTTP request to one replica.
+
+        The attempt holds an adaptive concurrency slot and goes through the
+        replica's circuit breaker, with a timeout derived from recent latency.
+        Batch round-trips grow with batch size, so their latency is kept out
+        of the limiter and the latency trackers that single calls rely on.
+        """
+        client = await self._get_client(replica)
+
+        try:
+            queue_wait = await self._limiter.acquire()
+        except ConcurrencyLimitExceeded as e:
+            if self._metrics:
+                self._metrics.inc_nlp_limiter_rejections()
+            logger.warning(f"⚠️ NLP request shed by concurrency limiter: {e}")
+            raise NLPOverloadedError(str(e))
+
+        timeout = self._attempt_timeout(replica, endpoint)
+        if self._metrics:
+            self._metrics.observe_nlp_limiter_wait(queue_wait)
+            self._metrics.set_nlp_concurrency(self._limiter.limit, self._limiter.in_flight)
+            self._metrics.set_nlp_request_timeout(timeout)
+
+        start_time = time.monotonic()
+        latency: Optional[float] = None
+        overloaded = False
+        try:
+            with replica.track() as outcome:
+                try:
+                    response_data = await replica.breaker.call(
+                        self._send_request, client, method, endpoint, json_data, timeout
+                    )
+                except CircuitOpenError as e:
+                    raise NLPConnectionError(f"NLP endpoint unavailable: {e}")
+                if endpoint != self.BATCH_ENDPOINT:
+                    latency = outcome.latency = time.monotonic() - start_time
+
+        except NLPTimeoutError:
+            overloaded = True
+            raise
+        except NLPBatchUnsupportedError:
+            raise
+        except NLPClientError as e:
+            overloaded = e.status_code is not None and (
+                e.status_code == self.OVERLOAD_STATUS or e.status_code >= 500
+            )
+            raise
+        finally:
+            self._limiter.release(latency=latency, overloaded=overloaded)
+            if self._metrics:
+                self._metrics.set_nlp_concurrency(self._limiter.limit, self._limiter.in_flight)
+
+        if latency is not None:
+            self._pool.observe(latency)
+        return response_data
+
+    def _attempt_timeout(self, replica: NLPEndpoint, endpoint: str) -> float:
+        """
+        Get the timeout for one attempt.
+
+        timeout_multiplier x the rolling percentile of the replica (or the
+        pool, until the replica is warmed up), clamped to
+        [min_timeout, timeout_seconds]. Batch requests always get the ceiling.
+        """
+        if not self.adaptive_timeout_enabled or endpoint == self.BATCH_ENDPOINT:
+            return self.timeout
+
+        tracker = replica.latency
+        if tracker.sample_count < self.TIMEOUT_MIN_SAMPLES:
+            tracker = self._pool.latency
+        if tracker.sample_count < self.TIMEOUT_MIN_SAMPLES:
+            return self.timeout
+
+        observed = tracker.percentile(self.timeout_percentile) or 0.0
+        return min(self.timeout, max(self.min_timeout, observed * self.timeout_multiplier))
+
+    async def _send_request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send an HTTP request and map failures to NLP exceptions."""
+        request_timeout = httpx.Timeout(timeout or self.timeout)
+        try:
+            if method.upper() == "POST":
+                response = await client.post(endpoint, json=json_data, timeout=request_timeout)
+            else:
+                response = await client.get(endpoint, timeout=request_timeout)
+        except httpx.TimeoutException as e:
+            raise NLPTimeoutError(f"Request timed out: {e}")
+        except httpx.ConnectError as e:
+            raise NLPConnectionError(f"Connection failed: {e}")
+
+        if response.status_code >= 400:
+            error_detail = self._extract_error_detail(response)
+            if (
+                endpoint == self.BATCH_ENDPOINT
+                and response.status_code in self.BATCH_UNSUPPORTED_STATUS
+            ):
+                raise NLPBatchUnsupportedError(
+                    message=f"Batch endpoint not supported: {error_detail}",
+                    status_code=response.status_code,
+                )
+            if response.status_code == self.OVERLOAD_STATUS:
+                # Rate limited: retryable, and a back-off signal for the limiter
+                raise NLPClientError(
+                    message=f"Rate limited: {error_detail}",
+                    status_code=response.status_code,
+                )
+            if 400 <= response.status_code < 500:
+                raise NLPValidationError(
+                    message=f"Validation error: {error_detail}",
+                    status_code=response.status_code,
+                )
+            raise NLPClientError(
+                message=f"Server error: {error_detail}",
+                status_code=response.status_code,
+            )
+        return response.json()
+
+    async def _request_hedged(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send to the best replica and hedge to a second one if it is slow.
+
+        The duplicate goes out once the primary has been pending longer
+        than the observed p95. The first successful response wins and the
+        other request is cancelled.
+        """
+        primary = self._pool.select()
+        if primary is None:
+            raise NLPConnectionError("No NLP endpoint available (all replica circuits open)")
+
+        first = asyncio.create_task(self._request_once(primary, method, endpoint, json_data))
+        pending = {first}
+        try:
+            delay = self._hedge_delay(primary)
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                # Never hedge into a saturated limiter - that only adds load
+                secondary = (
+                    None
+                    if done or not self._limiter.has_capacity
+                    else self._pool.select(exclude=(primary,))
+                )
+            else:
+                secondary = None
+
+            if secondary is None:
+                return await first
+
+            self._hedged_requests += 1
+            if self._metrics:
+                self._metrics.inc_nlp_hedged_requests()
+            logger.debug(
+                f"🔀 Hedging NLP request to {secondary.url} "
+                f"(primary {primary.url} pending > {delay * 1000:.0f}ms)"
+            )
+
+            second = asyncio.create_task(
+                self._request_once(secondary, method, endpoint, json_data)
+            )
+            pending.add(second)
+            last_error: Optional[BaseException] = None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self._hedge_wins += 1
+                            if self._metrics:
+                                self._metrics.inc_nlp_hedge_wins()
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error or NLPClientError("Hedged request failed")
+
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+
+    def _hedge_delay(self, replica: NLPEndpoint) -> Optional[float]:
+        """
+        Get how long to wait before hedging away from a replica.
+
+        Uses the replica's own p95 when it has enough samples, otherwise the
+        pool-wide p95. Returns None (no hedge) until either is warmed up.
+        """
+        tracker = replica.latency
+        if tracker.sample_count < self.hedge_min_samples:
+            tracker = self._pool.latency
+        if tracker.sample_count < self.hedge_min_samples:
+            return None
+
+        p95 = tracker.percentile(self.HEDGE_PERCENTILE) or 0.0
+        return max(self.hedge_min_delay, p95)
+
     def _extract_error_detail(self, response: httpx.Response) -> str:
         """Extract error detail from response."""
         try:
@@ -410,6 +1043,22 @@ class NLPClientManager:
             logger.warning(f"NLP health check failed: {e}")
             return False
 
+    def is_deferrable(self, result: CrisisAnalysisResult) -> bool:
+        """
+        Check if an error result came from NLP being unavailable.
+
+        True when the global breaker rejected the call or the concurrency
+        limiter shed it - the message was never classified and should be
+        retried later rather than treated as SAFE.
+
+        Args:
+            result: Result returned by analyze_message()
+
+        Returns:
+            True if the message should be re-analyzed later
+        """
+        return result.is_degraded and result.request_id in self.DEFERRABLE_REQUEST_IDS
+
     @property
     def circuit_state(self) -> str:
         return self._circuit_breaker.state.value
@@ -432,15 +1081,54 @@ class NLPClientManager:
     def consecutive_failures(self) -> int:
         return self._consecutive_failures
 
+    @property
+    def effective_batch_size(self) -> int:
+        """Batch size cap after applying the server's advertised maximum."""
+        if self._batch_server_max:
+            return max(1, min(self.batch_max_size, self._batch_server_max))
+        return self.batch_max_size
+
+    @property
+    def endpoint_pool(self) -> EndpointPool:
+        """Get the NLP replica pool."""
+        return self._pool
+
     def get_stats(self) -> Dict[str, Any]:
         return {
             "base_url": self.base_url,
             "circuit_state": self.circuit_state,
             "consecutive_failures": self._consecutive_failures,
+            "endpoints": self._pool.get_status(),
+            "concurrency": self._limiter.get_status(),
+            "adaptive_timeout": {
+                "enabled": self.adaptive_timeout_enabled,
+                "percentile": self.timeout_percentile,
+                "multiplier": self.timeout_multiplier,
+                "min_ms": int(self.min_timeout * 1000),
+                "max_ms": int(self.timeout * 1000),
+            },
+            "hedging": {
+                "enabled": self.hedge_enabled,
+                "min_delay_ms": int(self.hedge_min_delay * 1000),
+                "hedged_requests": self._hedged_requests,
+                "hedge_wins": self._hedge_wins,
+            },
+            "batching": {
+                "enabled": self.batch_enabled,
+                "server_supported": self._batch_supported,
+                "window_ms": int(self.batch_window * 1000),
+                "max_size": self.effective_batch_size,
+                "pending": len(self._batch_pending),
+                "batches_sent": self._batches_sent,
+                "batched_messages": self._batched_messages,
+            },
         }
 
     def __repr__(self) -> str:
-        return f"NLPClientManager(url='{self.base_url}', circuit={self.circuit_state})"
+        return (
+            f"NLPClientManager(url='{self.base_url}', "
+            f"endpoints={len(self._pool.endpoints)}, circuit={self.circuit_state})"
+        )
 
 
 def create_nlp_client_manager(
@@ -462,5 +1150,7 @@ __all__ = [
     "NLPTimeoutError",
     "NLPValidationError",
     "NLPCircuitOpenError",
+    "NLPOverloadedError",
+    "NLPBatchUnsupportedError",
     "create_nlp_client_manager",
 ]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Weekly Report Manager for Automated CRT Reports
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-2.0-2
-LAST MODIFIED: 2026-01-06
+FILE VERSION: v5.0-8-2.0-6
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,9 @@ RESPONSIBILITIES:
 - Format reports with detailed metrics and statistics
 - Post reports to configurable Discord channel
 - Handle edge cases (empty weeks, missing config)
+- Wake exactly at report time via the shared scheduler (Phase 10)
+- Post from one replica only when a LeaseManager is set (Phase 10)
+- Post at low priority through the outbound queue when one is set (Phase 10)
 
 REPORT SECTIONS:
 - Alert Summary (total and by severity)
@@ -43,6 +46,12 @@ USAGE:
         bot=discord_bot,
     )
 
+    # Optional: run on the shared deadline scheduler (Phase 10)
+    report_mgr.set_scheduler_manager(scheduler)
+
+    # Optional: only the lease holder posts (Phase 10)
+    report_mgr.set_lease_manager(lease_manager)
+
     # Start scheduled reporting
     await report_mgr.start()
 
@@ -60,14 +69,20 @@ import calendar
 
 import discord
 
+from src.managers.discord.discord_resolver import resolve_channel
+from src.managers.discord.outbound_queue import PRIORITY_SUMMARY, send_message
+
 if TYPE_CHECKING:
     from discord import Bot, TextChannel
     from src.managers.config_manager import ConfigManager
     from src.managers.metrics.response_metrics_manager import ResponseMetricsManager
     from src.managers.metrics.models import WeeklySummary
+    from src.managers.scheduling.scheduler_manager import SchedulerManager
+    from src.managers.scheduling.lease_manager import LeaseManager
+    from src.managers.discord.outbound_queue import OutboundQueue
 
 # Module version
-__version__ = "v5.0-8-2.0-2"
+__version__ = "v5.0-8-2.0-6"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -101,6 +116,14 @@ BOX_TOP = "═" * 59
 BOX_DIVIDER = "─" * 60
 BOX_SECTION_DIVIDER = "────────────────────────────────────────────────────────────"
 
+# Phase 10: Scheduler job key, late-start posting window, and retry delay
+SCHEDULER_JOB_KEY = "weekly_report"
+REPORT_WINDOW_MINUTES = 5
+SCHEDULER_RETRY_SECONDS = 60
+
+# Phase 10: Lease so the report is posted by one replica
+LEASE_NAME = "weekly_report"
+
 
 # =============================================================================
 # Weekly Report Manager
@@ -176,6 +199,9 @@ class WeeklyReportManager:
 
         # Background task management
         self._task: Optional[asyncio.Task] = None
+        self._scheduler: Optional["SchedulerManager"] = None
+        self._leases: Optional["LeaseManager"] = None
+        self._outbound: Optional["OutboundQueue"] = None
         self._running = False
 
         # Statistics
@@ -253,6 +279,44 @@ class WeeklyReportManager:
     # Lifecycle Methods
     # =========================================================================
 
+    def set_scheduler_manager(self, scheduler: "SchedulerManager") -> None:
+        """
+        Set the shared scheduler (Phase 10).
+
+        When set, start() registers a job at the next report time
+        instead of running the once-a-minute check loop.
+
+        Args:
+            scheduler: SchedulerManager instance
+        """
+        self._scheduler = scheduler
+        logger.debug("SchedulerManager injected into WeeklyReportManager")
+
+    def set_lease_manager(self, lease_manager: "LeaseManager") -> None:
+        """
+        Set the lease manager (Phase 10).
+
+        When set, the scheduled report is only posted by the replica
+        holding the weekly_report lease. Manual reports are not affected.
+
+        Args:
+            lease_manager: LeaseManager instance
+        """
+        self._leases = lease_manager
+        logger.debug("LeaseManager injected into WeeklyReportManager")
+
+    def set_outbound_queue(self, outbound_queue: "OutboundQueue") -> None:
+        """
+        Set the outbound Discord queue (Phase 10).
+
+        Reports are posted at summary priority, behind alerts and edits.
+
+        Args:
+            outbound_queue: OutboundQueue instance
+        """
+        self._outbound = outbound_queue
+        logger.debug("OutboundQueue injected into WeeklyReportManager")
+
     async def start(self) -> bool:
         """
         Start the weekly report scheduler.
@@ -276,10 +340,18 @@ class WeeklyReportManager:
             return True
 
         self._running = True
-        self._task = asyncio.create_task(
-            self._scheduler_loop(),
-            name="weekly_report_scheduler",
-        )
+        if self._scheduler:
+            self._scheduler.schedule(
+                SCHEDULER_JOB_KEY,
+                self._run_report_job,
+                delay=self._seconds_until_next_report(),
+                retry_after=SCHEDULER_RETRY_SECONDS,
+            )
+        else:
+            self._task = asyncio.create_task(
+                self._scheduler_loop(),
+                name="weekly_report_scheduler",
+            )
 
         logger.info("📊 Weekly report scheduler started")
         return True
@@ -288,6 +360,9 @@ class WeeklyReportManager:
         """Stop the weekly report scheduler."""
         self._running = False
 
+        if self._scheduler:
+            self._scheduler.cancel(SCHEDULER_JOB_KEY)
+
         if self._task:
             self._task.cancel()
             try:
@@ -302,7 +377,8 @@ class WeeklyReportManager:
         """
         Background loop that checks for report time.
 
-        Runs every minute to check if it's time to post.
+        Runs every minute to check if it's time to post. Only used when
+        no SchedulerManager is injected (Phase 10).
         """
         while self._running:
             try:
@@ -312,12 +388,12 @@ class WeeklyReportManager:
                 if (
                     now.weekday() == self._report_day
                     and now.hour == self._report_hour
-                    and now.minute < 5  # 5-minute window
+                    and now.minute < REPORT_WINDOW_MINUTES
                 ):
                     # Check we haven't posted today
-                    if self._should_post_today(now):
+                    if self._should_post_today(now) and await self._has_lease():
                         logger.info("📊 Scheduled report time reached")
-                        await self._generate_and_post()
+                        await self._generate_and_post(fenced=True)
                         self._last_report_time = now
 
                 # Sleep for 60 seconds before next check
@@ -345,6 +421,64 @@ class WeeklyReportManager:
         # Check if last post was on a different day
         return self._last_report_time.date() != now.date()
 
+    async def _run_report_job(self) -> float:
+        """
+        Scheduled job: post the report if it is due, then wait a week.
+
+        Returns:
+            Seconds until the next report time
+        """
+        if self._seconds_until_next_report() == 0:
+            if not await self._has_lease():
+                # Standby: keep checking through the window in case the holder dies
+                return SCHEDULER_RETRY_SECONDS
+            logger.info("📊 Scheduled report time reached")
+            await self._generate_and_post(fenced=True)
+            self._last_report_time = datetime.utcnow()
+
+        return self._seconds_until_next_report()
+
+    async def _has_lease(self) -> bool:
+        """Check this replica should post the scheduled report."""
+        if not self._leases:
+            return True
+
+        if await self._leases.ensure(LEASE_NAME):
+            return True
+
+        logger.debug("Skipping scheduled report (weekly_report lease held elsewhere)")
+        return False
+
+    def _seconds_until_next_report(self) -> float:
+        """
+        Get seconds until the report should next be posted.
+
+        Like the check loop, a start within the first few minutes of the
+        report hour posts immediately unless a report went out today.
+
+        Returns:
+            0 if the report is due now, otherwise seconds until the next
+            report time
+        """
+        now = datetime.utcnow()
+        if (
+            now.weekday() == self._report_day
+            and now.hour == self._report_hour
+            and now.minute < REPORT_WINDOW_MINUTES
+            and self._should_post_today(now)
+        ):
+            return 0
+
+        days_until_report = (self._report_day - now.weekday()) % 7
+        next_report = datetime.combine(
+            now.date() + timedelta(days=days_until_report),
+            time(self._report_hour, 0),
+        )
+        if next_report <= now:
+            next_report += timedelta(days=7)
+
+        return (next_report - now).total_seconds()
+
     # =========================================================================
     # Report Generation
     # =========================================================================
@@ -619,11 +753,8 @@ class WeeklyReportManager:
 
         for channel_id in target_channel_ids:
             try:
-                channel = self._bot.get_channel(channel_id)
-
-                if channel is None:
-                    # Try fetching if not in cache
-                    channel = await self._bot.fetch_channel(channel_id)
+                # Gateway cache, then resolver cache, then REST
+                channel = await resolve_channel(self._bot, channel_id)
 
                 if channel is None:
                     logger.error(f"❌ Could not find channel {channel_id}")
@@ -637,7 +768,9 @@ class WeeklyReportManager:
                 embed = self._create_report_embed(report_content)
 
                 # Send the report
-                await channel.send(embed=embed)
+                await send_message(
+                    self._outbound, channel, PRIORITY_SUMMARY, embed=embed
+                )
 
                 success_count += 1
                 logger.info(
@@ -686,15 +819,26 @@ class WeeklyReportManager:
 
         return embed
 
-    async def _generate_and_post(self) -> bool:
+    async def _generate_and_post(self, fenced: bool = False) -> bool:
         """
         Generate and post the weekly report.
 
+        Args:
+            fenced: Re-check the lease fencing token before posting, so a
+                replica that lost the lease while generating does not post
+
         Returns:
             True if successful
         """
+        token = self._leases.token(LEASE_NAME) if fenced and self._leases else None
+
         try:
             report_content = await self.generate_report()
+
+            if fenced and self._leases and not await self._leases.is_current(LEASE_NAME, token):
+                logger.warning("⚠️ Lost weekly_report lease while generating, not posting")
+                return False
+
             return await self.post_report(report_content)
         except Exception as e:
             logger.error(f"❌ Failed to generate and post report: {e}")
@@ -785,6 +929,7 @@ class WeeklyReportManager:
         return {
             "enabled": self._enabled,
             "running": self._running,
+            "scheduled_by": "scheduler" if self._scheduler else "poll",
             "channel_ids": self._channel_ids,
             "report_day": list(DAY_NAME_TO_WEEKDAY.keys())[self._report_day],
             "report_hour": self._report_hour,
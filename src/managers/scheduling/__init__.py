@@ -0,0 +1,66 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Scheduling Package for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-13.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+PACKAGE CONTENTS:
+- SchedulerManager: Deadline heap that runs all timed background jobs
+- ScheduledJob: Registered job dataclass
+- JobStats: Per-job run statistics dataclass
+- LeaseManager: Redis leases so each job family runs on one replica
+- LeaseState: Local lease state dataclass
+
+USAGE:
+    from src.managers.scheduling import create_scheduler_manager
+
+    scheduler = create_scheduler_manager(config_manager, metrics_manager)
+    scheduler.start()
+    scheduler.schedule("session_cleanup", cleanup, delay=30)
+
+    leases = create_lease_manager(config_manager, redis_manager, metrics_manager)
+    if await leases.ensure("data_retention"):
+        await run_cleanup()
+"""
+
+# Module version
+__version__ = "v5.0-10-13.0-2"
+
+from .scheduler_manager import (
+    SchedulerManager,
+    ScheduledJob,
+    JobStats,
+    create_scheduler_manager,
+)
+from .lease_manager import (
+    LeaseManager,
+    LeaseState,
+    create_lease_manager,
+)
+
+__all__ = [
+    "__version__",
+    "SchedulerManager",
+    "ScheduledJob",
+    "JobStats",
+    "create_scheduler_manager",
+    "LeaseManager",
+    "LeaseState",
+    "create_lease_manager",
+]
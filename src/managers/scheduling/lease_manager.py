@@ -0,0 +1,652 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Lease Manager for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-14.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Elect one replica per background job family using Redis leases
+- Issue a fencing token on every acquisition
+- Renew held leases before they expire and detect lost leases
+- Release leases on shutdown so a standby can take over at once
+- Report lease state for /health/detailed
+
+LEASES:
+    Each job family ("data_retention", "weekly_report", "followup",
+    "auto_initiate") has its own lease, so work can spread across replicas.
+
+    ash:lease:{name}        → holder ID, SET NX PX with the lease TTL
+    ash:lease:{name}:fence  → counter incremented on every new acquisition
+
+    A replica believes it holds a lease only until its local deadline,
+    which is the TTL minus a safety margin measured from *before* the
+    acquire request. So a paused or partitioned replica stops working
+    before Redis hands the lease to someone else.
+
+    Before an irreversible action (posting a report, sending a DM), call
+    is_current() with the token read when the work started. It fails if
+    the lease changed hands in the meantime.
+
+REDIS UNAVAILABLE:
+    Without Redis there is no coordination. With fail_open (default) every
+    replica acts as holder: a duplicate check-in is better than a crisis
+    outreach that never happens.
+
+USAGE:
+    from src.managers.scheduling import create_lease_manager
+
+    leases = create_lease_manager(config_manager, redis_manager, metrics_manager)
+    leases.set_scheduler_manager(scheduler)
+    await leases.start()
+
+    if await leases.ensure("weekly_report"):
+        token = leases.token("weekly_report")
+        report = await build_report()
+        if await leases.is_current("weekly_report", token):
+            await post(report)
+
+    await leases.stop()
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.storage.redis_manager import RedisManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+    from src.managers.scheduling.scheduler_manager import SchedulerManager
+
+# Module version
+__version__ = "v5.0-10-14.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Redis key prefix for leases (fence counter at {prefix}{name}:fence)
+REDIS_KEY_PREFIX = "ash:lease:"
+
+# Scheduler job that renews held leases
+RENEW_JOB_KEY = "lease_renewal"
+
+# Acquire or renew. Returns {token, holder, pttl}; token is 0 when another
+# replica holds the lease.
+#   KEYS[1] = lease key, KEYS[2] = fence counter key
+#   ARGV    = holder_id, ttl_ms
+SCRIPT_LEASE_ACQUIRE = """
+local holder = redis.call('GET', KEYS[1])
+if holder == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return {tonumber(redis.call('GET', KEYS[2]) or '0'), holder, tonumber(ARGV[2])}
+end
+if holder then
+    return {0, holder, redis.call('PTTL', KEYS[1])}
+end
+redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2])
+return {redis.call('INCR', KEYS[2]), ARGV[1], tonumber(ARGV[2])}
+"""
+
+# Extend a lease only if still held with the same token. Returns 1 or 0.
+#   KEYS[1] = lease key, KEYS[2] = fence counter key
+#   ARGV    = holder_id, token, ttl_ms
+SCRIPT_LEASE_RENEW = """
+if redis.call('GET', KEYS[1]) == ARGV[1] and redis.call('GET', KEYS[2]) == ARGV[2] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# Check a fencing token is still the current holder's. Returns 1 or 0.
+#   KEYS[1] = lease key, KEYS[2] = fence counter key
+#   ARGV    = holder_id, token
+SCRIPT_LEASE_CHECK = """
+if redis.call('GET', KEYS[1]) == ARGV[1] and redis.call('GET', KEYS[2]) == ARGV[2] then
+    return 1
+end
+return 0
+"""
+
+# Delete a lease only if we hold it. Returns 1 or 0.
+#   KEYS[1] = lease key
+#   ARGV    = holder_id
+SCRIPT_LEASE_RELEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+
+@dataclass
+class LeaseState:
+    """
+    Local view of one lease.
+
+    Attributes:
+        name: Lease name (job family)
+        token: Fencing token of our current hold (None if not held)
+        holder: Last known holder ID
+        valid_until: Local monotonic deadline of our hold
+        acquired_at: When we last acquired the lease
+        renewed_at: When we last renewed the lease
+        acquisitions: Times we acquired the lease
+        losses: Times we lost the lease while holding it
+        unreachable: Whether the last Redis call failed
+    """
+
+    name: str
+    token: Optional[int] = None
+    holder: Optional[str] = None
+    valid_until: float = 0.0
+    acquired_at: Optional[datetime] = None
+    renewed_at: Optional[datetime] = None
+    acquisitions: int = 0
+    losses: int = 0
+    unreachable: bool = False
+
+    @property
+    def is_held(self) -> bool:
+        """Check the hold has not passed its local deadline."""
+        return self.token is not None and time.monotonic() < self.valid_until
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for status output."""
+        held = self.is_held
+        return {
+            "state": "leader" if held else ("unreachable" if self.unreachable else "standby"),
+            "token": self.token if held else None,
+            "holder": self.holder,
+            "expires_in_seconds": (
+                round(self.valid_until - time.monotonic(), 1) if held else None
+            ),
+            "acquired_at": self.acquired_at.isoformat() if self.acquired_at else None,
+            "renewed_at": self.renewed_at.isoformat() if self.renewed_at else None,
+            "acquisitions": self.acquisitions,
+            "losses": self.losses,
+        }
+
+
+# =============================================================================
+# Lease Manager
+# =============================================================================
+
+
+class LeaseManager:
+    """
+    Redis lease coordination for background jobs.
+
+    Leases are acquired lazily by ensure(): a job asks before doing its
+    work, so a standby tries to take over on its own schedule. Held
+    leases are renewed by a scheduler job (or a small loop) every
+    renew_interval seconds.
+
+    Attributes:
+        holder_id: Unique ID for this process
+        _leases: Local state per lease name
+
+    Example:
+        >>> leases = create_lease_manager(config, redis, metrics)
+        >>> await leases.start()
+        >>> if await leases.ensure("data_retention"):
+        ...     await run_cleanup()
+    """
+
+    # Defaults
+    DEFAULT_TTL_SECONDS = 30
+    DEFAULT_RENEW_INTERVAL_SECONDS = 10
+    # Fraction of the TTL we stop trusting a hold early (clock drift, GC pauses)
+    SAFETY_MARGIN = 0.2
+
+    def __init__(
+        self,
+        config_manager: "ConfigManager",
+        redis_manager: Optional["RedisManager"],
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize LeaseManager.
+
+        Args:
+            config_manager: Configuration manager instance
+            redis_manager: Redis manager for the leases
+            metrics_manager: Optional metrics manager for lease events
+
+        Note:
+            Use create_lease_manager() factory function.
+        """
+        self._config = config_manager
+        self._redis = redis_manager
+        self._metrics = metrics_manager
+
+        self._enabled = config_manager.get("leases", "enabled", True)
+        self._ttl = float(
+            config_manager.get("leases", "ttl_seconds", self.DEFAULT_TTL_SECONDS)
+        )
+        self._renew_interval = float(
+            config_manager.get(
+                "leases", "renew_interval_seconds", self.DEFAULT_RENEW_INTERVAL_SECONDS
+            )
+        )
+        self._fail_open = config_manager.get("leases", "fail_open", True)
+
+        # Renewal must happen well inside the trusted part of the TTL
+        self._renew_interval = min(self._renew_interval, self._ttl * (1 - self.SAFETY_MARGIN) / 2)
+
+        self.holder_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._leases: Dict[str, LeaseState] = {}
+
+        self._scheduler: Optional["SchedulerManager"] = None
+        self._renew_task: Optional[asyncio.Task] = None
+        self._running = False
+
+        if self._redis:
+            self._redis.register_script("lease_acquire", SCRIPT_LEASE_ACQUIRE)
+            self._redis.register_script("lease_renew", SCRIPT_LEASE_RENEW)
+            self._redis.register_script("lease_check", SCRIPT_LEASE_CHECK)
+            self._redis.register_script("lease_release", SCRIPT_LEASE_RELEASE)
+
+        logger.info(
+            f"✅ LeaseManager initialized "
+            f"(enabled={self._enabled}, ttl={self._ttl:.0f}s, "
+            f"renew={self._renew_interval:.0f}s, holder={self.holder_id})"
+        )
+
+    def set_scheduler_manager(self, scheduler: "SchedulerManager") -> None:
+        """
+        Set the shared scheduler used for lease renewal.
+
+        Args:
+            scheduler: SchedulerManager instance
+        """
+        self._scheduler = scheduler
+        logger.debug("SchedulerManager injected into LeaseManager")
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Start renewing held leases."""
+        if not self._enabled or self._running:
+            return
+
+        self._running = True
+        if self._scheduler:
+            self._scheduler.schedule(
+                RENEW_JOB_KEY,
+                self._run_renew_job,
+                delay=self._renew_interval,
+                retry_after=self._renew_interval,
+            )
+        else:
+            self._renew_task = asyncio.create_task(
+                self._renew_loop(), name="lease-renewal"
+            )
+
+        logger.info("🚀 Lease renewal started")
+
+    async def stop(self) -> None:
+        """Stop renewal and release held leases so a standby can take over."""
+        self._running = False
+
+        if self._scheduler:
+            self._scheduler.cancel(RENEW_JOB_KEY)
+
+        if self._renew_task:
+            self._renew_task.cancel()
+            try:
+                await self._renew_task
+            except asyncio.CancelledError:
+                pass
+            self._renew_task = None
+
+        for name in list(self._leases):
+            await self.release(name)
+
+        logger.info("🛑 Lease renewal stopped")
+
+    async def _renew_loop(self) -> None:
+        """Renew held leases (used when no SchedulerManager is injected)."""
+        while self._running:
+            try:
+                await asyncio.sleep(self._renew_interval)
+                await self._renew_all()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"❌ Lease renewal error: {e}")
+
+    async def _run_renew_job(self) -> float:
+        """Scheduled job: renew held leases."""
+        await self._renew_all()
+        return self._renew_interval
+
+    async def _renew_all(self) -> None:
+        """Renew every lease we currently hold."""
+        for state in list(self._leases.values()):
+            if state.token is not None:
+                await self._renew(state)
+
+    # =========================================================================
+    # Lease Operations
+    # =========================================================================
+
+    async def ensure(self, name: str) -> bool:
+        """
+        Check we hold a lease, acquiring it if it is free.
+
+        Args:
+            name: Lease name
+
+        Returns:
+            True if this replica should do the work now
+        """
+        if not self._enabled:
+            return True
+
+        state = self._state(name)
+        if state.is_held:
+            return True
+
+        return await self._acquire(state)
+
+    def holds(self, name: str) -> bool:
+        """
+        Check we hold a lease without contacting Redis.
+
+        Args:
+            name: Lease name
+
+        Returns:
+            True if held (or leasing is disabled, or fail-open applies)
+        """
+        if not self._enabled:
+            return True
+
+        state = self._leases.get(name)
+        if state is None:
+            return False
+        return state.is_held or (state.unreachable and self._fail_open)
+
+    def token(self, name: str) -> Optional[int]:
+        """
+        Get the fencing token of our current hold.
+
+        Args:
+            name: Lease name
+
+        Returns:
+            Token, or None if not held
+        """
+        state = self._leases.get(name)
+        return state.token if state and state.is_held else None
+
+    async def is_current(self, name: str, token: Optional[int]) -> bool:
+        """
+        Check a fencing token still belongs to the current hold.
+
+        Call before an irreversible action with the token read when the
+        work started; fails if the lease expired or changed hands since.
+
+        Args:
+            name: Lease name
+            token: Token from token() at the start of the work
+
+        Returns:
+            True if the action may proceed
+        """
+        if not self._enabled:
+            return True
+
+        state = self._state(name)
+        if token is None:
+            return state.unreachable and self._fail_open
+        if not state.is_held or state.token != token:
+            return False
+
+        result = await self._redis.run_script(
+            "lease_check", self._keys(name), [self.holder_id, token]
+        )
+        if result is None:
+            return self._fail_open
+
+        if not result:
+            self._mark_lost(state, "fence check failed")
+            return False
+        return True
+
+    async def release(self, name: str) -> None:
+        """
+        Release a lease if we hold it.
+
+        Args:
+            name: Lease name
+        """
+        state = self._leases.get(name)
+        if state is None or state.token is None:
+            return
+
+        state.token = None
+        state.valid_until = 0.0
+        if self._redis:
+            await self._redis.run_script(
+                "lease_release", [self._key(name)], [self.holder_id]
+            )
+        self._record_event(name, "released")
+        logger.info(f"🔓 Released lease '{name}'")
+
+    async def _acquire(self, state: LeaseState) -> bool:
+        """Try to take (or re-confirm) a lease."""
+        if not self._redis:
+            state.unreachable = True
+            return self._fail_open
+
+        started = time.monotonic()
+        result = await self._redis.run_script(
+            "lease_acquire",
+            self._keys(state.name),
+            [self.holder_id, int(self._ttl * 1000)],
+        )
+        if not result:
+            state.unreachable = True
+            return self._fail_open
+
+        state.unreachable = False
+        token, holder = int(result[0]), result[1]
+        state.holder = holder
+
+        if token == 0:
+            if state.token is not None:
+                self._mark_lost(state, f"held by {holder}")
+            return False
+
+        is_new = state.token != token
+        state.token = token
+        state.valid_until = started + self._ttl * (1 - self.SAFETY_MARGIN)
+        state.renewed_at = datetime.now(timezone.utc)
+        if is_new:
+            state.acquisitions += 1
+            state.acquired_at = state.renewed_at
+            self._record_event(state.name, "acquired")
+            logger.info(f"🔐 Acquired lease '{state.name}' (token {token})")
+        return True
+
+    async def _renew(self, state: LeaseState) -> None:
+        """Extend a held lease, or drop it if it was lost."""
+        started = time.monotonic()
+        result = await self._redis.run_script(
+            "lease_renew",
+            self._keys(state.name),
+            [self.holder_id, state.token, int(self._ttl * 1000)],
+        )
+        if result is None:
+            # Keep the hold until its local deadline; Redis may come back
+            state.unreachable = True
+            self._record_event(state.name, "renew_failed")
+            logger.warning(f"⚠️ Could not renew lease '{state.name}' (Redis unavailable)")
+            return
+
+        state.unreachable = False
+        if not result:
+            self._mark_lost(state, "expired before renewal")
+            return
+
+        state.valid_until = started + self._ttl * (1 - self.SAFETY_MARGIN)
+        state.renewed_at = datetime.now(timezone.utc)
+
+    def _mark_lost(self, state: LeaseState, reason: str) -> None:
+        """Forget a hold that Redis no longer honours."""
+        state.token = None
+        state.valid_until = 0.0
+        state.losses += 1
+        self._record_event(state.name, "lost")
+        logger.warning(f"⚠️ Lost lease '{state.name}' ({reason})")
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _state(self, name: str) -> LeaseState:
+        """Get or create local state for a lease."""
+        state = self._leases.get(name)
+        if state is None:
+            state = self._leases[name] = LeaseState(name=name)
+        return state
+
+    def _key(self, name: str) -> str:
+        """Get the Redis key for a lease."""
+        return f"{REDIS_KEY_PREFIX}{name}"
+
+    def _keys(self, name: str) -> List[str]:
+        """Get the lease and fence counter keys."""
+        return [self._key(name), f"{self._key(name)}:fence"]
+
+    def _record_event(self, name: str, event: str) -> None:
+        """Publish a lease event and the held-lease gauge."""
+        if self._metrics:
+            self._metrics.inc_lease_events(name, event)
+            self._metrics.set_leases_held(
+                sum(1 for state in self._leases.values() if state.is_held)
+            )
+
+    # =========================================================================
+    # Properties and Status
+    # =========================================================================
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if lease coordination is enabled."""
+        return self._enabled
+
+    @property
+    def fail_open(self) -> bool:
+        """Check if work proceeds when Redis is unreachable."""
+        return self._fail_open
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get lease status for health checks.
+
+        Returns:
+            Status dictionary with per-lease state
+        """
+        return {
+            "enabled": self._enabled,
+            "running": self._running,
+            "holder_id": self.holder_id,
+            "ttl_seconds": self._ttl,
+            "renew_interval_seconds": self._renew_interval,
+            "fail_open": self._fail_open,
+            "leases": {
+                name: state.to_dict()
+                for name, state in sorted(self._leases.items())
+            },
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        held = sum(1 for state in self._leases.values() if state.is_held)
+        return f"LeaseManager(enabled={self._enabled}, held={held}/{len(self._leases)})"
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_lease_manager(
+    config_manager: "ConfigManager",
+    redis_manager: Optional["RedisManager"],
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> LeaseManager:
+    """
+    Factory function for LeaseManager.
+
+    Creates the lease coordinator that background managers consult so
+    each job family runs on exactly one replica.
+    Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        redis_manager: Redis manager for the leases
+        metrics_manager: Optional metrics manager for lease events
+
+    Returns:
+        Configured LeaseManager instance
+
+    Example:
+        >>> leases = create_lease_manager(config, redis, metrics)
+        >>> await leases.start()
+    """
+    logger.info("🏭 Creating LeaseManager")
+
+    return LeaseManager(
+        config_manager=config_manager,
+        redis_manager=redis_manager,
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "LeaseManager",
+    "LeaseState",
+    "create_lease_manager",
+]
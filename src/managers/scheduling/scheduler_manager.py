@@ -0,0 +1,531 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Scheduler Manager for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-13.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Run all timed background work from one task and one deadline heap
+- Wake exactly at the earliest deadline instead of polling
+- Key jobs so re-registering replaces rather than duplicates them
+- Cancel jobs by key or by name (e.g. an acknowledged alert)
+- Record per-job run time, lateness and failures
+
+JOBS:
+    A job is an async callback registered under a unique key. The value it
+    returns decides what happens next:
+        float → run again that many seconds from now
+        None  → done (one-shot)
+    The job name groups keys for metrics and bulk cancellation, so
+    per-item keys ("auto_initiate:1234") share one name ("auto_initiate").
+
+USAGE:
+    from src.managers.scheduling import create_scheduler_manager
+
+    scheduler = create_scheduler_manager(config_manager, metrics_manager)
+    scheduler.start()
+
+    async def cleanup() -> Optional[float]:
+        await do_cleanup()
+        return seconds_until_next_cleanup()
+
+    scheduler.schedule("session_cleanup", cleanup, delay=30)
+    scheduler.schedule("auto_initiate:1234", fire, at=expires_at, name="auto_initiate")
+    scheduler.cancel("auto_initiate:1234")
+
+    await scheduler.stop()
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.managers.config_manager import ConfigManager
+    from src.managers.metrics.metrics_manager import MetricsManager
+
+# Module version
+__version__ = "v5.0-10-13.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Job callback: returns seconds until the next run, or None when done
+JobCallback = Callable[[], Awaitable[Optional[float]]]
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+
+@dataclass
+class ScheduledJob:
+    """
+    One registered job.
+
+    Attributes:
+        key: Unique key (re-scheduling the same key replaces the job)
+        name: Job name used for metrics and bulk cancellation
+        callback: Async callable run at the deadline
+        due: Deadline on the event loop clock
+        run_at: Deadline as UTC wall-clock time (for status output)
+        retry_after: Seconds to wait before re-running a failed callback
+            (None drops the job on failure)
+        running: Whether the callback is currently executing
+        rerun_due: Earliest deadline requested while running
+    """
+
+    key: str
+    name: str
+    callback: JobCallback
+    due: float
+    run_at: datetime
+    retry_after: Optional[float] = None
+    running: bool = False
+    rerun_due: Optional[float] = None
+
+
+@dataclass
+class JobStats:
+    """
+    Run statistics for one job name.
+
+    Attributes:
+        runs: Completed runs
+        failures: Runs that raised
+        total_seconds: Total run time
+        max_seconds: Longest run
+        max_lateness: Largest delay between deadline and start
+        last_run_at: When the last run started
+    """
+
+    runs: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    max_lateness: float = 0.0
+    last_run_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for status output."""
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "avg_ms": (
+                round(self.total_seconds / self.runs * 1000, 1) if self.runs else None
+            ),
+            "max_ms": round(self.max_seconds * 1000, 1),
+            "max_lateness_ms": round(self.max_lateness * 1000, 1),
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+
+
+# =============================================================================
+# Scheduler Manager
+# =============================================================================
+
+
+class SchedulerManager:
+    """
+    Deadline scheduler for background jobs.
+
+    Deadlines live in a min-heap. One task sleeps until the earliest
+    deadline (or until an earlier job is added) and launches due jobs as
+    their own tasks, so a slow job never delays another job's deadline.
+    Replaced or cancelled jobs are skipped lazily when they reach the top
+    of the heap.
+
+    A job never overlaps with itself: it is rescheduled only after its
+    callback returns, and only if its key was not replaced or cancelled
+    meanwhile. A job registered under a key whose callback is still
+    running is held back until that run finishes.
+
+    Attributes:
+        _jobs: Current job per key
+        _running: Job per key whose callback is executing
+        _heap: (due, sequence, job) entries, possibly stale
+        _stats: Run statistics per job name
+
+    Example:
+        >>> scheduler = create_scheduler_manager(config, metrics)
+        >>> scheduler.start()
+        >>> scheduler.schedule("weekly_report", post_report, at=next_monday)
+    """
+
+    def __init__(
+        self,
+        config_manager: "ConfigManager",
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize SchedulerManager.
+
+        Args:
+            config_manager: Configuration manager instance
+            metrics_manager: Optional metrics manager for job metrics
+
+        Note:
+            Use create_scheduler_manager() factory function.
+        """
+        self._config = config_manager
+        self._metrics = metrics_manager
+
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._running: Dict[str, ScheduledJob] = {}
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._sequence = itertools.count()
+        self._stats: Dict[str, JobStats] = {}
+
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._job_tasks: Set[asyncio.Task] = set()
+
+        logger.info("✅ SchedulerManager initialized")
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the scheduler task (no-op if already running)."""
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run(), name="ash-scheduler")
+        logger.info(f"🚀 Scheduler started ({len(self._jobs)} jobs)")
+
+    async def stop(self) -> None:
+        """Stop the scheduler and cancel any running jobs."""
+        tasks = [t for t in [self._task, *self._job_tasks] if t and not t.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._task = None
+        self._job_tasks.clear()
+        self._running.clear()
+        logger.info("🛑 Scheduler stopped")
+
+    # =========================================================================
+    # Job Registration
+    # =========================================================================
+
+    def schedule(
+        self,
+        key: str,
+        callback: JobCallback,
+        delay: Optional[float] = None,
+        at: Optional[datetime] = None,
+        name: Optional[str] = None,
+        keep_earlier: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> datetime:
+        """
+        Register a job, replacing any job with the same key.
+
+        With keep_earlier the existing job is kept if it is due sooner; if
+        it is running, it is re-run no later than the requested time.
+        Without it, a replacement for a running job waits for that run to
+        finish before it can start.
+
+        Args:
+            key: Unique job key
+            callback: Async callable; returns seconds until next run or None
+            delay: Seconds from now (ignored if at is given)
+            at: Wall-clock deadline (naive values are treated as UTC)
+            name: Job name for metrics and cancel_name() (defaults to key)
+            keep_earlier: Merge with the existing job instead of replacing it
+            retry_after: Re-run a failed callback after this many seconds
+
+        Returns:
+            UTC time the job will run
+        """
+        if at is not None:
+            if at.tzinfo is None:
+                at = at.replace(tzinfo=timezone.utc)
+            delay = (at - datetime.now(timezone.utc)).total_seconds()
+        delay = max(0.0, delay or 0.0)
+
+        loop = asyncio.get_running_loop()
+        due = loop.time() + delay
+
+        run_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+        existing = self._jobs.get(key)
+        if keep_earlier and existing:
+            if existing.running:
+                existing.rerun_due = min(existing.rerun_due or due, due)
+                return run_at
+            if existing.due <= due:
+                return existing.run_at
+
+        job = ScheduledJob(
+            key=key,
+            name=name or key,
+            callback=callback,
+            due=due,
+            run_at=run_at,
+            retry_after=retry_after,
+        )
+        self._jobs[key] = job
+        if key in self._running:
+            # Pushed by _execute() once the in-flight run returns
+            self._set_pending_gauge()
+        else:
+            self._push(job)
+
+        logger.debug(f"⏲️ Job '{key}' scheduled in {delay:.1f}s")
+        return job.run_at
+
+    def cancel(self, key: str) -> bool:
+        """
+        Cancel a job by key.
+
+        A callback that is already running finishes, but is not rescheduled.
+
+        Args:
+            key: Job key
+
+        Returns:
+            True if a job was registered under the key
+        """
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return False
+
+        self._set_pending_gauge()
+        logger.debug(f"⏹️ Job '{key}' cancelled")
+        return True
+
+    def cancel_name(self, name: str) -> int:
+        """
+        Cancel every job registered under a job name.
+
+        Args:
+            name: Job name
+
+        Returns:
+            Number of jobs cancelled
+        """
+        keys = [key for key, job in self._jobs.items() if job.name == name]
+        for key in keys:
+            self.cancel(key)
+        return len(keys)
+
+    def is_scheduled(self, key: str) -> bool:
+        """Check if a job is registered under a key."""
+        return key in self._jobs
+
+    def next_run(self, key: str) -> Optional[datetime]:
+        """Get the next UTC run time for a key (None if not scheduled)."""
+        job = self._jobs.get(key)
+        return job.run_at if job else None
+
+    def _push(self, job: ScheduledJob) -> None:
+        """Add a heap entry and wake the loop if it is the new earliest."""
+        heapq.heappush(self._heap, (job.due, next(self._sequence), job))
+        if self._heap[0][2] is job:
+            self._wakeup.set()
+        self._set_pending_gauge()
+
+    # =========================================================================
+    # Scheduler Loop
+    # =========================================================================
+
+    async def _run(self) -> None:
+        """Sleep until the earliest deadline and launch due jobs."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Drop entries for replaced, cancelled or running jobs
+            while self._heap and not self._is_current(self._heap[0][2]):
+                heapq.heappop(self._heap)
+
+            if not self._heap:
+                timeout = None
+            else:
+                timeout = self._heap[0][0] - loop.time()
+
+            if timeout is None or timeout > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, job = heapq.heappop(self._heap)
+            job.running = True
+            self._running[job.key] = job
+            task = asyncio.create_task(self._execute(job), name=f"job:{job.key}")
+            self._job_tasks.add(task)
+            task.add_done_callback(self._job_tasks.discard)
+
+    def _is_current(self, job: ScheduledJob) -> bool:
+        """Check a heap entry still belongs to a live, idle job."""
+        return self._jobs.get(job.key) is job and not job.running
+
+    async def _execute(self, job: ScheduledJob) -> None:
+        """Run one job and reschedule it if it asks to run again."""
+        loop = asyncio.get_running_loop()
+        stats = self._stats.setdefault(job.name, JobStats())
+        lateness = max(0.0, loop.time() - job.due)
+        stats.last_run_at = datetime.now(timezone.utc)
+
+        start = time.perf_counter()
+        next_delay: Optional[float] = None
+        outcome = "success"
+        try:
+            next_delay = await job.callback()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            outcome = "error"
+            stats.failures += 1
+            next_delay = job.retry_after
+            logger.error(f"❌ Scheduled job '{job.key}' failed: {e}")
+        finally:
+            job.running = False
+            self._running.pop(job.key, None)
+
+        elapsed = time.perf_counter() - start
+        stats.runs += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        stats.max_lateness = max(stats.max_lateness, lateness)
+        if self._metrics:
+            self._metrics.observe_scheduler_job(job.name, elapsed, lateness, outcome)
+
+        # Replaced or cancelled while running: start the held-back replacement
+        current = self._jobs.get(job.key)
+        if current is not job:
+            if current is not None:
+                self._push(current)
+            return
+
+        # A wake requested during the run can only pull the next run earlier
+        now = loop.time()
+        due = None if next_delay is None else now + max(0.0, next_delay)
+        if job.rerun_due is not None:
+            due = job.rerun_due if due is None else min(due, job.rerun_due)
+            job.rerun_due = None
+
+        if due is None:
+            del self._jobs[job.key]
+            self._set_pending_gauge()
+            return
+
+        job.due = due
+        job.run_at = datetime.now(timezone.utc) + timedelta(seconds=max(0.0, due - now))
+        self._push(job)
+
+    def _set_pending_gauge(self) -> None:
+        """Publish the number of registered jobs."""
+        if self._metrics:
+            self._metrics.set_scheduler_jobs(len(self._jobs))
+
+    # =========================================================================
+    # Properties and Status
+    # =========================================================================
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the scheduler task is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def job_count(self) -> int:
+        """Get number of registered jobs."""
+        return len(self._jobs)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get scheduler status.
+
+        Returns:
+            Status dictionary with upcoming jobs and per-name statistics
+        """
+        upcoming = sorted(self._jobs.values(), key=lambda job: job.due)
+        return {
+            "running": self.is_running,
+            "jobs": len(self._jobs),
+            "jobs_running": sum(1 for job in self._jobs.values() if job.running),
+            "next": [
+                {"key": job.key, "run_at": job.run_at.isoformat(), "running": job.running}
+                for job in upcoming[:10]
+            ],
+            "stats": {name: stats.to_dict() for name, stats in self._stats.items()},
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"SchedulerManager(running={self.is_running}, jobs={len(self._jobs)})"
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_scheduler_manager(
+    config_manager: "ConfigManager",
+    metrics_manager: Optional["MetricsManager"] = None,
+) -> SchedulerManager:
+    """
+    Factory function for SchedulerManager.
+
+    Creates the shared scheduler that background managers register their
+    deadlines with. Following Clean Architecture v5.1 Rule #1: Factory Functions.
+
+    Args:
+        config_manager: Configuration manager instance
+        metrics_manager: Optional metrics manager for job metrics
+
+    Returns:
+        Configured SchedulerManager instance
+
+    Example:
+        >>> scheduler = create_scheduler_manager(config, metrics)
+        >>> scheduler.start()
+    """
+    logger.info("🏭 Creating SchedulerManager")
+
+    return SchedulerManager(
+        config_manager=config_manager,
+        metrics_manager=metrics_manager,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "SchedulerManager",
+    "ScheduledJob",
+    "JobStats",
+    "create_scheduler_manager",
+]
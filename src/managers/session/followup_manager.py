@@ -17,8 +17,8 @@ Schedules and sends automated follow-up check-in DMs after Ash sessions
 complete. Uses message variations to avoid robotic feel. Respects user
 opt-out preferences and enforces eligibility conditions.
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-9-3.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-9-3.0-9
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 9 - CRT Workflow Enhancements (Step 9.3)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -30,6 +30,10 @@ RESPONSIBILITIES:
 - Send varied check-in messages to avoid robotic feel
 - Handle user responses to start mini-sessions
 - Track follow-up metrics
+- Index pending follow-ups by due time so each tick only reads due items
+- Wake on the shared scheduler at the next due time instead of polling
+- Send from one replica only when a LeaseManager is set (Phase 10)
+- Send check-in DMs at lowest priority through the outbound queue (Phase 10)
 
 USAGE:
     from src.managers.session import create_followup_manager
@@ -40,6 +44,12 @@ USAGE:
         user_preferences_manager=user_preferences_manager,
     )
 
+    # Optional: run on the shared deadline scheduler (Phase 10)
+    followup_manager.set_scheduler_manager(scheduler)
+
+    # Optional: only the lease holder sends due follow-ups (Phase 10)
+    followup_manager.set_lease_manager(lease_manager)
+
     # Start the scheduler
     await followup_manager.start()
 
@@ -72,10 +82,13 @@ import random
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import discord
 
+from src.managers.discord.discord_resolver import resolve_user
+from src.managers.discord.outbound_queue import PRIORITY_DM, ROUTE_DM, send_message
+
 if TYPE_CHECKING:
     from discord.ext import commands
     from src.managers.config_manager import ConfigManager
@@ -83,9 +96,12 @@ if TYPE_CHECKING:
     from src.managers.user.user_preferences_manager import UserPreferencesManager
     from src.managers.ash.ash_personality_manager import AshPersonalityManager
     from src.managers.ash.ash_session_manager import AshSessionManager
+    from src.managers.scheduling.scheduler_manager import SchedulerManager
+    from src.managers.scheduling.lease_manager import LeaseManager
+    from src.managers.discord.outbound_queue import OutboundQueue
 
 # Module version
-__version__ = "v5.0-9-3.0-1"
+__version__ = "v5.0-9-3.0-9"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -100,6 +116,29 @@ REDIS_KEY_SCHEDULED = "ash:followup:scheduled"
 REDIS_KEY_USER_LAST = "ash:followup:last"
 REDIS_KEY_PENDING_RESPONSE = "ash:followup:pending"
 
+# Phase 10: Due-time index (member = followup_id, score = scheduled_for)
+REDIS_KEY_DUE = "ash:followup:due"
+
+# Phase 10: Set (NX) by the replica that backfills the due index, so the
+# SCAN runs once per deployment rather than on every start
+REDIS_KEY_DUE_BACKFILL = "ash:migration:followup_due_index:v1"
+
+# Follow-ups claimed from the due index per round trip
+DUE_BATCH_SIZE = 50
+
+# Delay before retrying a follow-up that failed for a transient reason
+RETRY_DELAY_SECONDS = 60
+
+# Phase 10: Scheduler job key, and the longest the job sleeps between index
+# reads (picks up follow-ups indexed by other instances)
+DUE_JOB_KEY = "followup_due"
+MAX_DUE_WAIT_SECONDS = 900
+
+# Phase 10: Lease so due follow-ups are sent by one replica, and how often a
+# standby replica checks whether it should take over
+LEASE_NAME = "followup"
+LEASE_RETRY_SECONDS = 30
+
 # Severity level ordering for comparison
 SEVERITY_ORDER = {
     "safe": 0,
@@ -328,6 +367,16 @@ class FollowUpManager:
         self._scheduler_task: Optional[asyncio.Task] = None
         self._running = False
 
+        # Phase 10: Shared deadline scheduler (replaces the 60s poll)
+        self._scheduler: Optional["SchedulerManager"] = None
+        self._index_backfilled = False
+
+        # Phase 10: Optional lease (one replica sends due follow-ups)
+        self._leases: Optional["LeaseManager"] = None
+
+        # Phase 10: Optional outbound queue (check-ins yield to alerts)
+        self._outbound: Optional["OutboundQueue"] = None
+
         # Bot and session managers (set via setters for dependency injection)
         self._bot: Optional["commands.Bot"] = None
         self._ash_session_manager: Optional["AshSessionManager"] = None
@@ -378,6 +427,45 @@ class FollowUpManager:
         self._ash_personality_manager = ash_personality_manager
         logger.debug("Ash managers injected into FollowUpManager")
 
+    def set_scheduler_manager(self, scheduler: "SchedulerManager") -> None:
+        """
+        Set the shared scheduler (Phase 10).
+
+        When set, start() registers a job that wakes at the next due
+        follow-up instead of running the 60 second poll loop.
+
+        Args:
+            scheduler: SchedulerManager instance
+        """
+        self._scheduler = scheduler
+        logger.debug("SchedulerManager injected into FollowUpManager")
+
+    def set_lease_manager(self, lease_manager: "LeaseManager") -> None:
+        """
+        Set the lease manager (Phase 10).
+
+        When set, due follow-ups are only claimed and sent by the replica
+        holding the followup lease; other replicas stay on standby.
+
+        Args:
+            lease_manager: LeaseManager instance
+        """
+        self._leases = lease_manager
+        logger.debug("LeaseManager injected into FollowUpManager")
+
+    def set_outbound_queue(self, outbound_queue: "OutboundQueue") -> None:
+        """
+        Set the outbound Discord queue (Phase 10).
+
+        Check-in DMs go out at the lowest priority, after alerts, embed
+        edits and summaries.
+
+        Args:
+            outbound_queue: OutboundQueue instance
+        """
+        self._outbound = outbound_queue
+        logger.debug("OutboundQueue injected into FollowUpManager")
+
     # =========================================================================
     # Lifecycle Management
     # =========================================================================
@@ -397,13 +485,24 @@ class FollowUpManager:
             return
 
         self._running = True
-        self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+        if self._scheduler:
+            self._scheduler.schedule(
+                DUE_JOB_KEY,
+                self._run_due_job,
+                delay=0,
+                retry_after=RETRY_DELAY_SECONDS,
+            )
+        else:
+            self._scheduler_task = asyncio.create_task(self._scheduler_loop())
         logger.info("🚀 Follow-up scheduler started")
 
     async def stop(self) -> None:
         """Stop the follow-up scheduler."""
         self._running = False
 
+        if self._scheduler:
+            self._scheduler.cancel(DUE_JOB_KEY)
+
         if self._scheduler_task:
             self._scheduler_task.cancel()
             try:
@@ -418,14 +517,17 @@ class FollowUpManager:
         """
         Background task that processes scheduled follow-ups.
 
-        Runs every minute to check for follow-ups that are due.
+        Runs every minute to check for follow-ups that are due. Only used
+        when no SchedulerManager is injected (Phase 10).
         """
         logger.debug("Scheduler loop started")
 
         while self._running:
             try:
-                # Process due follow-ups
-                await self._process_due_followups()
+                # Process due follow-ups (lease holder only)
+                if await self._has_lease():
+                    await self._ensure_backfilled()
+                    await self._process_due_followups()
 
                 # Wait before next check (60 seconds)
                 await asyncio.sleep(60)
@@ -439,52 +541,181 @@ class FollowUpManager:
 
         logger.debug("Scheduler loop ended")
 
-    async def _process_due_followups(self) -> None:
-        """Process all follow-ups that are due to be sent."""
-        if not self._redis:
+    async def _run_due_job(self) -> Optional[float]:
+        """
+        Scheduled job: send due follow-ups, then sleep until the next one.
+
+        Returns:
+            Seconds until the next due follow-up (capped at
+            MAX_DUE_WAIT_SECONDS), or LEASE_RETRY_SECONDS on a standby
+            replica
+        """
+        if not await self._has_lease():
+            return LEASE_RETRY_SECONDS
+
+        await self._ensure_backfilled()
+        await self._process_due_followups()
+        return await self._seconds_until_next_due()
+
+    async def _has_lease(self) -> bool:
+        """Check this replica should send due follow-ups."""
+        if not self._leases:
+            return True
+        return await self._leases.ensure(LEASE_NAME)
+
+    async def _ensure_backfilled(self) -> None:
+        """
+        Index follow-ups scheduled before the due index existed.
+
+        Runs once per deployment: the first replica to claim the Redis
+        migration marker does the SCAN; everyone else (and every later
+        restart) skips it. The marker is released if the backfill fails.
+        """
+        if self._index_backfilled or not (self._redis and self._redis.is_connected):
             return
+        self._index_backfilled = True
 
-        now = datetime.now(timezone.utc)
+        claimed = await self._redis.set(
+            REDIS_KEY_DUE_BACKFILL,
+            datetime.now(timezone.utc).isoformat(),
+            nx=True,
+        )
+        if not claimed:
+            return
 
         try:
-            # Get all scheduled follow-ups
-            pattern = f"{REDIS_KEY_SCHEDULED}:*"
-            keys = await self._redis.keys(pattern)
+            await self._backfill_due_index()
+        except Exception as e:
+            logger.warning(f"⚠️ Follow-up due index backfill failed: {e}")
+            await self._redis.delete(REDIS_KEY_DUE_BACKFILL)
 
-            for key in keys:
-                try:
-                    raw = await self._redis.get(key)
-                    if not raw:
-                        continue
+    async def _seconds_until_next_due(self) -> float:
+        """Get seconds until the earliest indexed follow-up is due."""
+        head = await self._redis.zrangebyscore(
+            REDIS_KEY_DUE, "-inf", "+inf", count=1, withscores=True
+        )
+        if not head:
+            return MAX_DUE_WAIT_SECONDS
+
+        _followup_id, due_at = head[0]
+        wait = due_at - datetime.now(timezone.utc).timestamp()
+        return min(max(0.0, wait), MAX_DUE_WAIT_SECONDS)
+
+    def _wake_at(self, due_at: datetime) -> None:
+        """Pull the scheduler job forward to a newly indexed due time."""
+        if self._scheduler and self._running:
+            self._scheduler.schedule(
+                DUE_JOB_KEY,
+                self._run_due_job,
+                at=due_at,
+                keep_earlier=True,
+                retry_after=RETRY_DELAY_SECONDS,
+            )
+
+    async def _process_due_followups(self) -> None:
+        """
+        Process all follow-ups that are due to be sent.
+
+        Due follow-ups are claimed from the due-time index in batches; the
+        claim removes them from the index atomically, so the cost of a tick
+        depends on how many follow-ups are due, not on the keyspace.
+        """
+        if not self._redis:
+            return
 
-                    if isinstance(raw, bytes):
-                        raw = raw.decode("utf-8")
+        while True:
+            now = datetime.now(timezone.utc)
+            followup_ids = await self._redis.zpop_due(
+                REDIS_KEY_DUE, now.timestamp(), DUE_BATCH_SIZE
+            )
+            if not followup_ids:
+                return
 
-                    data = json.loads(raw)
-                    followup = ScheduledFollowup.from_dict(data)
+            keys = [f"{REDIS_KEY_SCHEDULED}:{followup_id}" for followup_id in followup_ids]
+            raws = await self._redis.mget(keys)
+            if raws is None:
+                # Records unreadable right now: put the claims back
+                retry_at = now + timedelta(seconds=RETRY_DELAY_SECONDS)
+                await self._requeue_followups(followup_ids, retry_at)
+                return
 
+            for key, followup in self._parse_followups(keys, raws):
+                try:
                     # Skip if already sent
                     if followup.is_sent:
                         continue
 
-                    # Check if due
-                    if now >= followup.scheduled_for:
-                        # Check if not too old
-                        if followup.hours_since_session <= self._max_hours:
-                            await self._send_followup(followup)
-                        else:
-                            # Too old, skip and clean up
-                            logger.info(
-                                f"⏭️ Skipping stale follow-up {followup.followup_id} "
-                                f"({followup.hours_since_session:.1f}h since session)"
-                            )
-                            await self._delete_followup(followup.followup_id)
+                    # Check if not too old
+                    if followup.hours_since_session <= self._max_hours:
+                        await self._send_followup(followup)
+                    else:
+                        # Too old, skip and clean up
+                        logger.info(
+                            f"⏭️ Skipping stale follow-up {followup.followup_id} "
+                            f"({followup.hours_since_session:.1f}h since session)"
+                        )
+                        await self._delete_followup(followup.followup_id)
 
                 except Exception as e:
                     logger.error(f"Error processing follow-up from {key}: {e}")
 
-        except Exception as e:
-            logger.error(f"Error retrieving scheduled follow-ups: {e}")
+            if len(followup_ids) < DUE_BATCH_SIZE:
+                return
+
+    async def _requeue_followups(
+        self,
+        followup_ids: List[str],
+        due_at: datetime,
+    ) -> None:
+        """
+        Put claimed follow-ups back on the due index.
+
+        Args:
+            followup_ids: Follow-up IDs to re-index
+            due_at: When they should next be claimed
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for followup_id in followup_ids:
+                pipe.zadd(REDIS_KEY_DUE, due_at.timestamp(), followup_id)
+
+        if not pipe.succeeded:
+            logger.error(
+                f"❌ Failed to re-index {len(followup_ids)} follow-ups; "
+                "they will be picked up by the next startup backfill"
+            )
+            return
+
+        self._wake_at(due_at)
+
+    async def _backfill_due_index(self) -> None:
+        """
+        Add unsent follow-ups that are missing from the due index.
+
+        Follow-ups scheduled before the index existed only have their
+        record key. Uses SCAN so it never blocks Redis.
+        """
+        keys = await self._redis.scan_iter(f"{REDIS_KEY_SCHEDULED}:*")
+        if not keys:
+            return
+
+        indexed = set(await self._redis.zrange(REDIS_KEY_DUE, 0, -1, desc=False))
+        missing = [
+            followup
+            for _key, followup in await self._load_followups(keys)
+            if not followup.is_sent and followup.followup_id not in indexed
+        ]
+        if not missing:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for followup in missing:
+                pipe.zadd(
+                    REDIS_KEY_DUE, followup.scheduled_for.timestamp(), followup.followup_id
+                )
+            pipe.expire(REDIS_KEY_DUE, self._ttl_seconds)
+
+        if pipe.succeeded:
+            logger.info(f"📇 Indexed {len(missing)} existing follow-ups by due time")
 
     # =========================================================================
     # Follow-Up Scheduling
@@ -551,14 +782,11 @@ class FollowUpManager:
             scheduled_for=scheduled_for,
         )
 
-        # Store in Redis
-        if not await self._store_followup(followup):
+        # Store record and user's last follow-up marker in one round trip
+        if not await self._store_followup(followup, mark_user_last=True):
             logger.warning(f"Failed to store follow-up {followup_id}")
             return None
 
-        # Update user's last follow-up timestamp
-        await self._update_user_last_followup(user_id)
-
         self._total_scheduled += 1
 
         logger.info(
@@ -645,31 +873,6 @@ class FollowUpManager:
             logger.warning(f"Error checking recent follow-up: {e}")
             return False
 
-    async def _update_user_last_followup(self, user_id: int) -> None:
-        """
-        Update the user's last follow-up timestamp.
-
-        Sets a key with 24-hour TTL to track recent follow-ups.
-
-        Args:
-            user_id: Discord user ID
-        """
-        if not self._redis:
-            return
-
-        try:
-            key = f"{REDIS_KEY_USER_LAST}:{user_id}"
-            data = {
-                "user_id": user_id,
-                "scheduled_at": datetime.now(timezone.utc).isoformat(),
-            }
-
-            # TTL of 24 hours to prevent spam
-            await self._redis.set(key, json.dumps(data), ttl=86400)
-
-        except Exception as e:
-            logger.warning(f"Error updating user last follow-up: {e}")
-
     # =========================================================================
     # Follow-Up Sending
     # =========================================================================
@@ -686,6 +889,7 @@ class FollowUpManager:
         """
         if not self._bot:
             logger.warning("Bot not set, cannot send follow-up")
+            await self._retry_later(followup)
             return False
 
         # CRITICAL: Re-check opt-out status before sending
@@ -701,10 +905,11 @@ class FollowUpManager:
                 return False
 
         try:
-            # Get user
-            user = await self._bot.fetch_user(followup.user_id)
+            # Get user (gateway/resolver cache before REST)
+            user = await resolve_user(self._bot, followup.user_id)
             if not user:
                 logger.warning(f"Could not find user {followup.user_id}")
+                await self._retry_later(followup)
                 return False
 
             # Generate message
@@ -716,7 +921,13 @@ class FollowUpManager:
             # Send DM
             try:
                 dm_channel = await user.create_dm()
-                await dm_channel.send(message_text)
+                await send_message(
+                    self._outbound,
+                    dm_channel,
+                    PRIORITY_DM,
+                    message_text,
+                    route_kind=ROUTE_DM,
+                )
 
             except discord.Forbidden:
                 logger.warning(
@@ -728,10 +939,9 @@ class FollowUpManager:
             # Update follow-up record
             followup.sent_at = datetime.now(timezone.utc)
             followup.message_variation = variation_index
-            await self._store_followup(followup)
 
-            # Store pending response record
-            await self._store_pending_response(followup)
+            # Store record and pending response marker together
+            await self._store_followup(followup, pending_response=True)
 
             self._total_sent += 1
 
@@ -744,8 +954,17 @@ class FollowUpManager:
 
         except Exception as e:
             logger.error(f"Error sending follow-up {followup.followup_id}: {e}")
+            await self._retry_later(followup)
             return False
 
+    async def _retry_later(self, followup: ScheduledFollowup) -> None:
+        """Re-index a claimed follow-up after a transient send failure."""
+        if followup.hours_since_session > self._max_hours:
+            return
+
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=RETRY_DELAY_SECONDS)
+        await self._requeue_followups([followup.followup_id], retry_at)
+
     def _generate_message(
         self,
         user_name: str,
@@ -851,10 +1070,9 @@ class FollowUpManager:
 
             # Update response timestamp
             followup.responded_at = datetime.now(timezone.utc)
-            await self._store_followup(followup)
 
-            # Clear pending response
-            await self._redis.delete(key)
+            # Store record and clear pending response together
+            await self._store_followup(followup, clear_pending_key=key)
 
             self._total_responses += 1
 
@@ -902,11 +1120,15 @@ class FollowUpManager:
                 logger.debug(f"User {user.id} already has active session")
                 return
 
+            from src.managers.ash import PRIORITY_FOLLOWUP
+
             # Start session with lower severity (it's a check-in)
+            # Phase 10: Check-ins yield to alert sessions for Claude
             session = await self._ash_session_manager.start_session(
                 user=user,
                 trigger_severity="medium",  # Check-in sessions use medium
                 check_opt_out=True,  # Still respect opt-out
+                priority=PRIORITY_FOLLOWUP,
             )
 
             # Add context about this being a follow-up response
@@ -918,20 +1140,15 @@ class FollowUpManager:
 
             # Get Ash's response
             if self._ash_personality_manager:
-                # Generate response with follow-up context
-                response = await self._ash_personality_manager.get_response(
+                # Generate response (adds both turns to session history)
+                response = await self._ash_personality_manager.generate_response_from_text(
+                    text=initial_message,
                     session=session,
-                    user_message=initial_message,
-                    is_followup_response=True,
                 )
 
                 # Send response
                 await channel.send(response)
 
-                # Add to session history
-                session.add_user_message(initial_message)
-                session.add_assistant_message(response)
-
             logger.info(
                 f"🤖 Started follow-up mini-session with user {user.id}"
             )
@@ -951,17 +1168,77 @@ class FollowUpManager:
     # Redis Storage Operations
     # =========================================================================
 
-    async def _store_followup(self, followup: ScheduledFollowup) -> bool:
-        """Store follow-up record in Redis."""
+    async def _store_followup(
+        self,
+        followup: ScheduledFollowup,
+        mark_user_last: bool = False,
+        pending_response: bool = False,
+        clear_pending_key: Optional[str] = None,
+    ) -> bool:
+        """
+        Store follow-up record in Redis.
+
+        Related markers and the due-time index entry are written in the
+        same MULTI/EXEC round trip so they cannot drift from the record
+        (Phase 10). Only unsent follow-ups are indexed.
+
+        Args:
+            followup: Follow-up to store
+            mark_user_last: Also set the user's 24h "recent follow-up" key
+            pending_response: Also set the user's 48h pending response key
+            clear_pending_key: Pending response key to delete
+
+        Returns:
+            True if stored successfully
+        """
         if not self._redis:
             return False
 
         try:
-            key = f"{REDIS_KEY_SCHEDULED}:{followup.followup_id}"
             data = json.dumps(followup.to_dict())
 
-            await self._redis.set(key, data, ttl=self._ttl_seconds)
-            return True
+            async with self._redis.pipeline() as pipe:
+                pipe.set(
+                    f"{REDIS_KEY_SCHEDULED}:{followup.followup_id}",
+                    data,
+                    ttl=self._ttl_seconds,
+                )
+
+                if not followup.is_sent:
+                    pipe.zadd(
+                        REDIS_KEY_DUE,
+                        followup.scheduled_for.timestamp(),
+                        followup.followup_id,
+                    )
+                    pipe.expire(REDIS_KEY_DUE, self._ttl_seconds)
+
+                if mark_user_last:
+                    # TTL of 24 hours to prevent spam
+                    last = {
+                        "user_id": followup.user_id,
+                        "scheduled_at": datetime.now(timezone.utc).isoformat(),
+                    }
+                    pipe.set(
+                        f"{REDIS_KEY_USER_LAST}:{followup.user_id}",
+                        json.dumps(last),
+                        ttl=86400,
+                    )
+
+                if pending_response:
+                    # TTL of 48 hours - after that, response doesn't count
+                    pipe.set(
+                        f"{REDIS_KEY_PENDING_RESPONSE}:{followup.user_id}",
+                        data,
+                        ttl=172800,
+                    )
+
+                if clear_pending_key:
+                    pipe.delete(clear_pending_key)
+
+            if pipe.succeeded and not followup.is_sent:
+                self._wake_at(followup.scheduled_for)
+
+            return pipe.succeeded
 
         except Exception as e:
             logger.error(f"Error storing follow-up: {e}")
@@ -973,28 +1250,67 @@ class FollowUpManager:
             return False
 
         try:
-            key = f"{REDIS_KEY_SCHEDULED}:{followup_id}"
-            await self._redis.delete(key)
-            return True
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.delete(f"{REDIS_KEY_SCHEDULED}:{followup_id}")
+                pipe.zrem(REDIS_KEY_DUE, followup_id)
+            return pipe.succeeded
 
         except Exception as e:
             logger.error(f"Error deleting follow-up: {e}")
             return False
 
-    async def _store_pending_response(self, followup: ScheduledFollowup) -> None:
-        """Store pending response record for follow-up detection."""
-        if not self._redis:
-            return
+    async def _load_followups(
+        self,
+        keys: List[str],
+    ) -> List[Tuple[str, ScheduledFollowup]]:
+        """
+        Load follow-up records for keys with one pipelined round trip.
 
-        try:
-            key = f"{REDIS_KEY_PENDING_RESPONSE}:{followup.user_id}"
-            data = json.dumps(followup.to_dict())
+        Args:
+            keys: Scheduled follow-up keys
 
-            # TTL of 48 hours - after that, response doesn't count
-            await self._redis.set(key, data, ttl=172800)
+        Returns:
+            List of (key, ScheduledFollowup) for records that still exist
+        """
+        if not keys:
+            return []
 
-        except Exception as e:
-            logger.warning(f"Error storing pending response: {e}")
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+
+        return self._parse_followups(keys, pipe.results or [])
+
+    def _parse_followups(
+        self,
+        keys: List[str],
+        raws: List[Optional[str]],
+    ) -> List[Tuple[str, ScheduledFollowup]]:
+        """
+        Parse raw follow-up records, skipping missing or invalid ones.
+
+        Args:
+            keys: Scheduled follow-up keys
+            raws: Raw JSON per key (None if the key no longer exists)
+
+        Returns:
+            List of (key, ScheduledFollowup)
+        """
+        loaded = []
+        for key, raw in zip(keys, raws):
+            if not raw:
+                continue
+
+            try:
+                if isinstance(raw, bytes):
+                    raw = raw.decode("utf-8")
+
+                loaded.append((key, ScheduledFollowup.from_dict(json.loads(raw))))
+
+            except Exception as e:
+                logger.warning(f"Error parsing follow-up from {key}: {e}")
+
+        return loaded
 
     async def get_pending_followups(self) -> List[ScheduledFollowup]:
         """
@@ -1009,26 +1325,13 @@ class FollowUpManager:
         pending = []
 
         try:
-            pattern = f"{REDIS_KEY_SCHEDULED}:*"
-            keys = await self._redis.keys(pattern)
-
-            for key in keys:
-                try:
-                    raw = await self._redis.get(key)
-                    if not raw:
-                        continue
+            # Unsent follow-ups are exactly the members of the due index
+            followup_ids = await self._redis.zrange(REDIS_KEY_DUE, 0, -1, desc=False)
+            keys = [f"{REDIS_KEY_SCHEDULED}:{followup_id}" for followup_id in followup_ids]
 
-                    if isinstance(raw, bytes):
-                        raw = raw.decode("utf-8")
-
-                    data = json.loads(raw)
-                    followup = ScheduledFollowup.from_dict(data)
-
-                    if not followup.is_sent:
-                        pending.append(followup)
-
-                except Exception as e:
-                    logger.warning(f"Error parsing follow-up from {key}: {e}")
+            for _key, followup in await self._load_followups(keys):
+                if not followup.is_sent:
+                    pending.append(followup)
 
         except Exception as e:
             logger.error(f"Error retrieving pending follow-ups: {e}")
@@ -1074,6 +1377,7 @@ class FollowUpManager:
         return {
             "enabled": self._enabled,
             "running": self._running,
+            "scheduled_by": "scheduler" if self._scheduler else "poll",
             "delay_hours": self._delay_hours,
             "max_hours": self._max_hours,
             "min_severity": self._min_severity,
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Notes Manager for Ash-Bot Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-9-2.0-2
-LAST MODIFIED: 2026-01-06
+FILE VERSION: v5.0-9-2.0-4
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 9 - CRT Workflow Enhancements (Step 9.2)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -25,6 +25,7 @@ RESPONSIBILITIES:
 - Retrieve notes for sessions
 - Post session summaries to notes channel
 - Generate formatted note embeds
+- Post summaries through the outbound queue when one is set (Phase 10)
 
 USAGE:
     from src.managers.session import create_notes_manager
@@ -57,13 +58,17 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 import discord
 
+from src.managers.discord.discord_resolver import resolve_channel
+from src.managers.discord.outbound_queue import PRIORITY_SUMMARY, send_message
+
 if TYPE_CHECKING:
     from discord.ext import commands
     from src.managers.config_manager import ConfigManager
     from src.managers.storage.redis_manager import RedisManager
+    from src.managers.discord.outbound_queue import OutboundQueue
 
 # Module version
-__version__ = "v5.0-9-2.0-2"
+__version__ = "v5.0-9-2.0-4"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -218,6 +223,7 @@ class NotesManager:
         """
         self._config = config_manager
         self._redis = redis_manager
+        self._outbound: Optional["OutboundQueue"] = None
 
         # Load configuration
         self._notes_channel_ids = self._parse_channel_ids(
@@ -578,9 +584,7 @@ class NotesManager:
 
         for channel_id in self._notes_channel_ids:
             try:
-                channel = bot.get_channel(channel_id)
-                if not channel:
-                    channel = await bot.fetch_channel(channel_id)
+                channel = await resolve_channel(bot, channel_id)
 
                 if not channel:
                     logger.error(f"Could not find notes channel {channel_id}")
@@ -590,7 +594,9 @@ class NotesManager:
                 embed = self._build_summary_embed(summary)
 
                 # Send to channel
-                message = await channel.send(embed=embed)
+                message = await send_message(
+                    self._outbound, channel, PRIORITY_SUMMARY, embed=embed
+                )
 
                 if first_message is None:
                     first_message = message
@@ -709,6 +715,20 @@ class NotesManager:
             minutes = int((seconds % 3600) // 60)
             return f"{hours}h {minutes}m"
 
+    # =========================================================================
+    # Outbound Queue Integration (Phase 10)
+    # =========================================================================
+
+    def set_outbound_queue(self, outbound_queue: "OutboundQueue") -> None:
+        """
+        Post session summaries through the outbound queue.
+
+        Args:
+            outbound_queue: OutboundQueue instance
+        """
+        self._outbound = outbound_queue
+        logger.debug("OutboundQueue injected into NotesManager")
+
     # =========================================================================
     # Notes Channel Configuration
     # =========================================================================
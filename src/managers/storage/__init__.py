@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Storage Managers Package for Ash-Bot Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-3.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-8-3.0-3
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting (Step 8.3)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,7 @@ This package contains storage managers for Ash-Bot:
 MANAGERS:
 - RedisManager: Redis connection and low-level operations
 - UserHistoryManager: User message history storage and retrieval
+- HistoryCache: In-process read-through cache of user history (Phase 10)
 - DataRetentionManager: Automated data cleanup and retention (Phase 8.3)
 
 USAGE:
@@ -52,7 +53,7 @@ USAGE:
 """
 
 # Module version
-__version__ = "v5.0-8-3.0-1"
+__version__ = "v5.0-8-3.0-3"
 
 # =============================================================================
 # Redis Manager
@@ -60,6 +61,7 @@ __version__ = "v5.0-8-3.0-1"
 
 from .redis_manager import (
     RedisManager,
+    RedisPipeline,
     create_redis_manager,
 )
 
@@ -67,6 +69,7 @@ from .redis_manager import (
 # User History Manager
 # =============================================================================
 
+from .history_cache import HistoryCache
 from .user_history_manager import (
     UserHistoryManager,
     create_user_history_manager,
@@ -98,11 +101,13 @@ __all__ = [
     "__version__",
     # Redis
     "RedisManager",
+    "RedisPipeline",
     "create_redis_manager",
     # User History
     "UserHistoryManager",
     "create_user_history_manager",
     "STORABLE_SEVERITIES",
+    "HistoryCache",
     # Data Retention (Phase 8.3)
     "DataRetentionManager",
     "create_data_retention_manager",
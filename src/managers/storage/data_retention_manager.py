@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Data Retention Manager for Automated Data Cleanup
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-3.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-8-3.0-4
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting (Step 8.3)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,9 @@ RESPONSIBILITIES:
 - Track cleanup statistics and provide storage reports
 - Graceful degradation if Redis unavailable
 - Log cleanup operations for auditing
+- Check and delete keys in pipelined batches (Phase 10)
+- Wake exactly at the cleanup hour via the shared scheduler (Phase 10)
+- Run on one replica only when a LeaseManager is set (Phase 10)
 
 DATA CATEGORIES:
 - Alert metrics (individual): 90 days default
@@ -48,6 +51,12 @@ USAGE:
         redis_manager=redis,
     )
 
+    # Optional: run on the shared deadline scheduler (Phase 10)
+    retention_mgr.set_scheduler_manager(scheduler)
+
+    # Optional: only the lease holder cleans up (Phase 10)
+    retention_mgr.set_lease_manager(lease_manager)
+
     # Start the background cleanup scheduler
     await retention_mgr.start()
 
@@ -70,9 +79,11 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Any
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
     from src.managers.storage.redis_manager import RedisManager
+    from src.managers.scheduling.scheduler_manager import SchedulerManager
+    from src.managers.scheduling.lease_manager import LeaseManager
 
 # Module version
-__version__ = "v5.0-8-3.0-1"
+__version__ = "v5.0-8-3.0-4"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -99,9 +110,19 @@ DEFAULT_SESSION_DATA_DAYS = 30
 # Default cleanup hour (UTC)
 DEFAULT_CLEANUP_HOUR = 3
 
+# Phase 10: Scheduler job key, and retry delay after a failed run
+SCHEDULER_JOB_KEY = "data_retention"
+SCHEDULER_RETRY_SECONDS = 60
+
+# Phase 10: Lease so cleanup runs on one replica
+LEASE_NAME = "data_retention"
+
 # Seconds per day for TTL calculations
 SECONDS_PER_DAY = 86400
 
+# Keys checked per pipelined round trip (Phase 10)
+PIPELINE_BATCH_SIZE = 500
+
 
 # =============================================================================
 # Data Classes
@@ -277,6 +298,8 @@ class DataRetentionManager:
 
         # Background task state
         self._scheduler_task: Optional[asyncio.Task] = None
+        self._scheduler: Optional["SchedulerManager"] = None
+        self._leases: Optional["LeaseManager"] = None
         self._running = False
         self._last_cleanup_stats: Optional[CleanupStats] = None
         self._last_cleanup_time: Optional[datetime] = None
@@ -299,12 +322,39 @@ class DataRetentionManager:
     # Lifecycle Methods
     # =========================================================================
 
+    def set_scheduler_manager(self, scheduler: "SchedulerManager") -> None:
+        """
+        Set the shared scheduler (Phase 10).
+
+        When set, start() registers a job at the next cleanup time
+        instead of running the once-a-minute check loop.
+
+        Args:
+            scheduler: SchedulerManager instance
+        """
+        self._scheduler = scheduler
+        logger.debug("SchedulerManager injected into DataRetentionManager")
+
+    def set_lease_manager(self, lease_manager: "LeaseManager") -> None:
+        """
+        Set the lease manager (Phase 10).
+
+        When set, scheduled cleanup only runs on the replica holding the
+        data_retention lease. Manual cleanup is not affected.
+
+        Args:
+            lease_manager: LeaseManager instance
+        """
+        self._leases = lease_manager
+        logger.debug("LeaseManager injected into DataRetentionManager")
+
     async def start(self) -> None:
         """
         Start the background cleanup scheduler.
 
-        Creates an asyncio task that checks hourly and runs
-        cleanup when the configured hour is reached.
+        Registers a scheduler job at the next cleanup time, or (without a
+        SchedulerManager) creates an asyncio task that checks every minute
+        and runs cleanup when the configured hour is reached.
         """
         if not self._enabled:
             logger.info("ℹ️ Data retention disabled, scheduler not started")
@@ -315,10 +365,18 @@ class DataRetentionManager:
             return
 
         self._running = True
-        self._scheduler_task = asyncio.create_task(
-            self._scheduler_loop(),
-            name="data-retention-scheduler",
-        )
+        if self._scheduler:
+            self._scheduler.schedule(
+                SCHEDULER_JOB_KEY,
+                self._run_cleanup_job,
+                delay=self._seconds_until_next_cleanup(),
+                retry_after=SCHEDULER_RETRY_SECONDS,
+            )
+        else:
+            self._scheduler_task = asyncio.create_task(
+                self._scheduler_loop(),
+                name="data-retention-scheduler",
+            )
 
         logger.info(
             f"🕐 Data retention scheduler started "
@@ -333,6 +391,9 @@ class DataRetentionManager:
         """
         self._running = False
 
+        if self._scheduler:
+            self._scheduler.cancel(SCHEDULER_JOB_KEY)
+
         if self._scheduler_task is not None:
             self._scheduler_task.cancel()
             try:
@@ -348,7 +409,8 @@ class DataRetentionManager:
         Background scheduler loop.
 
         Checks every minute if it's time to run cleanup.
-        Runs cleanup once at the configured hour each day.
+        Runs cleanup once at the configured hour each day. Only used
+        when no SchedulerManager is injected (Phase 10).
         """
         last_cleanup_date: Optional[date] = None
 
@@ -364,22 +426,8 @@ class DataRetentionManager:
                     last_cleanup_date != current_date
                 )
 
-                if should_cleanup:
-                    logger.info("🧹 Starting scheduled data cleanup...")
-                    stats = await self.run_cleanup()
-
-                    if stats.success:
-                        logger.info(
-                            f"✅ Scheduled cleanup complete: "
-                            f"{stats.total_keys_removed} keys removed "
-                            f"in {stats.duration_seconds:.2f}s"
-                        )
-                    else:
-                        logger.warning(
-                            f"⚠️ Scheduled cleanup completed with errors: "
-                            f"{', '.join(stats.errors)}"
-                        )
-
+                if should_cleanup and await self._has_lease():
+                    await self._run_scheduled_cleanup()
                     last_cleanup_date = current_date
 
                 # Sleep for 1 minute before next check
@@ -392,6 +440,76 @@ class DataRetentionManager:
                 # Continue running despite errors
                 await asyncio.sleep(60)
 
+    async def _run_cleanup_job(self) -> float:
+        """
+        Scheduled job: run cleanup if it is due, then wait for the next one.
+
+        Returns:
+            Seconds until the next cleanup
+        """
+        if self._seconds_until_next_cleanup() == 0:
+            if not await self._has_lease():
+                # Standby: keep checking through the hour in case the holder dies
+                return SCHEDULER_RETRY_SECONDS
+            await self._run_scheduled_cleanup()
+
+        return self._seconds_until_next_cleanup()
+
+    async def _has_lease(self) -> bool:
+        """Check this replica should run scheduled cleanup."""
+        if not self._leases:
+            return True
+
+        if await self._leases.ensure(LEASE_NAME):
+            return True
+
+        logger.debug("Skipping scheduled cleanup (data_retention lease held elsewhere)")
+        return False
+
+    async def _run_scheduled_cleanup(self) -> None:
+        """Run a scheduled cleanup and log the outcome."""
+        logger.info("🧹 Starting scheduled data cleanup...")
+        stats = await self.run_cleanup()
+
+        if stats.success:
+            logger.info(
+                f"✅ Scheduled cleanup complete: "
+                f"{stats.total_keys_removed} keys removed "
+                f"in {stats.duration_seconds:.2f}s"
+            )
+        else:
+            logger.warning(
+                f"⚠️ Scheduled cleanup completed with errors: "
+                f"{', '.join(stats.errors)}"
+            )
+
+    def _seconds_until_next_cleanup(self) -> float:
+        """
+        Get seconds until cleanup should next run.
+
+        Like the check loop, a start during the cleanup hour runs cleanup
+        immediately unless it already ran today.
+
+        Returns:
+            0 if cleanup is due now, otherwise seconds until the next
+            cleanup hour
+        """
+        now = datetime.now(timezone.utc)
+        ran_today = (
+            self._last_cleanup_time is not None
+            and self._last_cleanup_time.date() == now.date()
+        )
+        if now.hour == self._cleanup_hour and not ran_today:
+            return 0
+
+        next_cleanup = now.replace(
+            hour=self._cleanup_hour, minute=0, second=0, microsecond=0
+        )
+        if next_cleanup <= now:
+            next_cleanup += timedelta(days=1)
+
+        return (next_cleanup - now).total_seconds()
+
     # =========================================================================
     # Cleanup Operations
     # =========================================================================
@@ -496,23 +614,23 @@ class DataRetentionManager:
             pattern = f"{prefix}:*"
             keys = await self._scan_keys(pattern)
 
-            for key in keys:
-                try:
-                    # Check if key has expired based on score (timestamp)
-                    # Get the data and check timestamp
-                    result = await self._redis.zrange(key, 0, 0, desc=True, withscores=True)
-
-                    if result:
-                        _, score = result[0]
-                        if score < cutoff_timestamp:
-                            # Delete expired key
-                            deleted = await self._redis.delete(key)
-                            if deleted:
-                                removed += 1
-                except Exception as e:
-                    logger.debug(f"Error checking key {key}: {e}")
+            for batch in self._batches(keys):
+                # Newest score (timestamp) of every key in one round trip
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key in batch:
+                        pipe.zrange(key, 0, 0, desc=True, withscores=True)
+
+                if not pipe.succeeded:
+                    logger.debug(f"Error checking {len(batch)} {category} keys")
                     continue
 
+                expired = [
+                    key
+                    for key, result in zip(batch, pipe.results)
+                    if result and result[0][1] < cutoff_timestamp
+                ]
+                removed += await self._delete_keys(expired)
+
             logger.debug(f"🧹 Cleaned {removed} {category}")
 
         except Exception as e:
@@ -544,24 +662,20 @@ class DataRetentionManager:
             pattern = f"{KEY_PREFIX_DAILY_AGGREGATE}:*"
             keys = await self._scan_keys(pattern)
 
+            expired = []
             for key in keys:
-                try:
-                    # Extract date from key: ash:metrics:daily:YYYY-MM-DD
-                    parts = key.split(":")
-                    if len(parts) >= 4:
-                        date_str = parts[-1]
-                        try:
-                            key_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                            if key_date < cutoff_date:
-                                deleted = await self._redis.delete(key)
-                                if deleted:
-                                    removed += 1
-                        except ValueError:
-                            # Invalid date format, skip
-                            continue
-                except Exception as e:
-                    logger.debug(f"Error checking aggregate key {key}: {e}")
-                    continue
+                # Extract date from key: ash:metrics:daily:YYYY-MM-DD
+                parts = key.split(":")
+                if len(parts) >= 4:
+                    try:
+                        key_date = datetime.strptime(parts[-1], "%Y-%m-%d").date()
+                    except ValueError:
+                        # Invalid date format, skip
+                        continue
+                    if key_date < cutoff_date:
+                        expired.append(key)
+
+            removed = await self._delete_keys(expired)
 
             logger.debug(f"🧹 Cleaned {removed} daily aggregates")
 
@@ -578,7 +692,8 @@ class DataRetentionManager:
         Clean up user history entries older than retention period.
 
         History is stored as sorted sets with timestamp scores.
-        Uses ZREMRANGEBYSCORE to efficiently remove old entries.
+        Uses ZREMRANGEBYSCORE to efficiently remove old entries; Redis
+        deletes a sorted set automatically once it is empty.
 
         Args:
             retention_days: Days to retain history
@@ -596,25 +711,18 @@ class DataRetentionManager:
             pattern = f"{KEY_PREFIX_USER_HISTORY}:*"
             keys = await self._scan_keys(pattern)
 
-            for key in keys:
-                try:
-                    # Remove entries with score (timestamp) before cutoff
-                    count = await self._redis.zremrangebyscore(
-                        key,
-                        min_score=0,
-                        max_score=cutoff_timestamp,
-                    )
-                    removed += count
-
-                    # Check if key is now empty and delete if so
-                    remaining = await self._redis.zcard(key)
-                    if remaining == 0:
-                        await self._redis.delete(key)
-
-                except Exception as e:
-                    logger.debug(f"Error cleaning history key {key}: {e}")
+            for batch in self._batches(keys):
+                # Remove entries with score (timestamp) before cutoff
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key in batch:
+                        pipe.zremrangebyscore(key, 0, cutoff_timestamp)
+
+                if not pipe.succeeded:
+                    logger.debug(f"Error cleaning {len(batch)} history keys")
                     continue
 
+                removed += sum(pipe.results)
+
             logger.debug(f"🧹 Cleaned {removed} history entries")
 
         except Exception as e:
@@ -645,21 +753,22 @@ class DataRetentionManager:
             pattern = f"{prefix}:*"
             keys = await self._scan_keys(pattern)
 
-            for key in keys:
-                try:
-                    # Check TTL - if -2, key doesn't exist; if -1, no expiry set
-                    ttl = await self._redis.ttl(key)
+            for batch in self._batches(keys):
+                # Check TTL - if -2, key doesn't exist; if -1, no expiry set
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key in batch:
+                        pipe.ttl(key)
+
+                if not pipe.succeeded:
+                    logger.debug(f"Error checking TTL for {len(batch)} keys")
+                    continue
 
-                    # Remove keys with no TTL set (shouldn't happen, but clean up)
+                for key, ttl in zip(batch, pipe.results):
                     if ttl == -1:
                         # Key exists but has no TTL - this shouldn't happen
                         # but we'll leave it for now as it may be intentional
                         logger.debug(f"Key {key} has no TTL set")
 
-                except Exception as e:
-                    logger.debug(f"Error checking TTL for {key}: {e}")
-                    continue
-
             logger.debug(f"🧹 Cleaned {removed} {category}")
 
         except Exception as e:
@@ -677,28 +786,38 @@ class DataRetentionManager:
         Returns:
             List of matching keys
         """
-        keys = []
+        return await self._redis.scan_iter(pattern, count=100)
+
+    @staticmethod
+    def _batches(keys: List[str]) -> List[List[str]]:
+        """Split keys into pipeline-sized batches."""
+        return [
+            keys[i : i + PIPELINE_BATCH_SIZE]
+            for i in range(0, len(keys), PIPELINE_BATCH_SIZE)
+        ]
 
-        try:
-            if not self._redis._client:
-                return keys
-
-            cursor = 0
-            while True:
-                cursor, batch = await self._redis._client.scan(
-                    cursor=cursor,
-                    match=pattern,
-                    count=100,
-                )
-                keys.extend(batch)
+    async def _delete_keys(self, keys: List[str]) -> int:
+        """
+        Delete keys in pipelined batches.
 
-                if cursor == 0:
-                    break
+        Args:
+            keys: Keys to delete
 
-        except Exception as e:
-            logger.error(f"❌ Error scanning keys with pattern {pattern}: {e}")
+        Returns:
+            Number of keys deleted
+        """
+        deleted = 0
+
+        for batch in self._batches(keys):
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.delete(*batch)
+
+            if pipe.succeeded:
+                deleted += pipe.results[0]
+            else:
+                logger.debug(f"Error deleting {len(batch)} keys")
 
-        return keys
+        return deleted
 
     def _log_cleanup_report(self, stats: CleanupStats) -> None:
         """
@@ -875,6 +994,7 @@ class DataRetentionManager:
         return {
             "enabled": self._enabled,
             "running": self._running,
+            "scheduled_by": "scheduler" if self._scheduler else "poll",
             "cleanup_hour": f"{self._cleanup_hour:02d}:00 UTC",
             "retention_days": self._retention_days,
             "total_cleanups": self._total_cleanups,
@@ -0,0 +1,453 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+History Cache for Ash-Bot Service
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-10-10.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+
+RESPONSIBILITIES:
+- Keep parsed recent history per (guild, user) in a bounded LRU
+- Cache "no history" results with a short TTL (negative caching)
+- Collapse concurrent loads for the same user into one Redis read
+- Apply local writes (add/clear) so cached entries stay current
+- Report hit rate, entry count and estimated memory
+
+USAGE:
+    from src.managers.storage.history_cache import HistoryCache
+
+    cache = HistoryCache(max_entries=10000, depth=20)
+
+    messages = await cache.get_or_load(
+        (guild_id, user_id),
+        loader=lambda count: load_from_redis(guild_id, user_id, count),
+    )
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from src.models.history_models import StoredMessage
+
+if TYPE_CHECKING:
+    from src.managers.metrics.metrics_manager import MetricsManager
+
+# Module version
+__version__ = "v5.0-10-10.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# (guild_id, user_id)
+CacheKey = Tuple[int, int]
+
+# Rough per-entry and per-message overhead (dicts, dataclass, floats)
+ENTRY_OVERHEAD_BYTES = 200
+MESSAGE_OVERHEAD_BYTES = 250
+
+
+# =============================================================================
+# Cache Entry
+# =============================================================================
+
+
+@dataclass
+class _CacheEntry:
+    """
+    Cached history for one user.
+
+    Attributes:
+        messages: Newest-first stored messages (at most depth)
+        complete: True if messages holds the user's entire history
+        expires_at: Monotonic time after which the entry is reloaded
+        size_bytes: Estimated memory held by the entry
+    """
+
+    messages: List[StoredMessage]
+    complete: bool
+    expires_at: float
+    size_bytes: int = 0
+
+    @property
+    def is_negative(self) -> bool:
+        """Check if this entry records that the user has no history."""
+        return not self.messages
+
+
+# =============================================================================
+# History Cache
+# =============================================================================
+
+
+class HistoryCache:
+    """
+    Read-through LRU cache of parsed user history.
+
+    Most monitored users never have a LOW+ message stored, so most lookups
+    end as an empty result; those are cached for negative_ttl seconds.
+    Positive entries live for ttl seconds so deletes made by other
+    processes (retention cleanup, a second bot instance) are picked up.
+
+    Entries are evicted least-recently-used first when either max_entries
+    or max_bytes is exceeded.
+
+    Attributes:
+        depth: Messages kept per user (newest first)
+        max_entries: Maximum cached users
+        max_bytes: Approximate memory cap for cached messages
+    """
+
+    DEFAULT_MAX_ENTRIES = 10000
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+    DEFAULT_DEPTH = 20
+    DEFAULT_TTL = 300.0
+    DEFAULT_NEGATIVE_TTL = 60.0
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        depth: int = DEFAULT_DEPTH,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        metrics_manager: Optional["MetricsManager"] = None,
+    ):
+        """
+        Initialize HistoryCache.
+
+        Args:
+            max_entries: Maximum cached users
+            max_bytes: Approximate memory cap for cached messages
+            depth: Messages kept per user (newest first)
+            ttl: Seconds a user's history stays cached
+            negative_ttl: Seconds an empty history stays cached
+            metrics_manager: Optional metrics manager
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1024, max_bytes)
+        self.depth = max(1, depth)
+        self._ttl = max(0.0, ttl)
+        self._negative_ttl = max(0.0, negative_ttl)
+        self._metrics = metrics_manager
+
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+        # Singleflight: one load per key, later callers await the same task
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        # Keys written while a load was in flight; that load is not cached
+        self._dirty: Set[CacheKey] = set()
+
+        # Statistics
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+        logger.info(
+            f"✅ HistoryCache initialized (max_entries={self.max_entries}, "
+            f"max_bytes={self.max_bytes // (1024 * 1024)}MB, depth={self.depth}, "
+            f"ttl={self._ttl}s, negative_ttl={self._negative_ttl}s)"
+        )
+
+    # =========================================================================
+    # Read-Through
+    # =========================================================================
+
+    async def get_or_load(
+        self,
+        key: CacheKey,
+        loader: Callable[[int], Awaitable[List[StoredMessage]]],
+        limit: Optional[int] = None,
+    ) -> List[StoredMessage]:
+        """
+        Get a user's newest messages, loading from Redis on a miss.
+
+        The loader is called with a message count and must return up to
+        that many messages, newest first, and raise on failure (failures
+        are not cached).
+
+        Args:
+            key: (guild_id, user_id)
+            loader: Coroutine function that reads history from Redis
+            limit: Messages wanted (default: depth)
+
+        Returns:
+            Newest-first stored messages (at most limit)
+        """
+        limit = self.depth if limit is None else limit
+
+        entry = self._lookup(key)
+        if entry is not None and (entry.complete or len(entry.messages) >= limit):
+            if entry.is_negative:
+                self._negative_hits += 1
+                self._record("negative_hit")
+            else:
+                self._hits += 1
+                self._record("hit")
+            return entry.messages[:limit]
+
+        if limit > self.depth:
+            # Deeper than we cache: read straight through
+            self._misses += 1
+            self._record("bypass")
+            return await loader(limit)
+
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self._coalesced += 1
+            self._record("coalesced")
+            try:
+                messages = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # The loading caller was cancelled; load for ourselves
+                messages = await loader(self.depth)
+            return messages[:limit]
+
+        self._misses += 1
+        self._record("miss")
+
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[key] = flight
+        self._dirty.discard(key)
+
+        try:
+            messages = await loader(self.depth)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # Waiters re-raise it; avoid "exception never retrieved"
+            flight.exception()
+            raise
+        else:
+            if key not in self._dirty:
+                self._store(key, messages, complete=len(messages) < self.depth)
+            flight.set_result(messages)
+            return messages[:limit]
+        finally:
+            self._inflight.pop(key, None)
+            self._dirty.discard(key)
+
+    # =========================================================================
+    # Write-Through Updates
+    # =========================================================================
+
+    def record_added(self, key: CacheKey, message: StoredMessage) -> None:
+        """
+        Apply a newly stored message to the cached entry.
+
+        Uncached users are left uncached; the next read loads them.
+
+        Args:
+            key: (guild_id, user_id)
+            message: Message just written to Redis
+        """
+        if key in self._inflight:
+            self._dirty.add(key)
+
+        entry = self._lookup(key)
+        if entry is None:
+            return
+
+        messages = [message] + entry.messages
+        complete = entry.complete
+        if len(messages) > self.depth:
+            messages = messages[: self.depth]
+            complete = False
+
+        self._store(key, messages, complete=complete)
+
+    def record_cleared(self, key: CacheKey) -> None:
+        """
+        Record that a user's history was deleted.
+
+        Args:
+            key: (guild_id, user_id)
+        """
+        if key in self._inflight:
+            self._dirty.add(key)
+        self._store(key, [], complete=True)
+
+    def invalidate(self, key: CacheKey) -> None:
+        """
+        Drop a cached entry so the next read goes to Redis.
+
+        Args:
+            key: (guild_id, user_id)
+        """
+        if key in self._inflight:
+            self._dirty.add(key)
+        self._remove(key)
+        self._update_gauges()
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._dirty.update(self._inflight)
+        self._entries.clear()
+        self._bytes = 0
+        self._update_gauges()
+
+    # =========================================================================
+    # Internal Helpers
+    # =========================================================================
+
+    def _lookup(self, key: CacheKey) -> Optional[_CacheEntry]:
+        """Get a live entry and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if time.monotonic() >= entry.expires_at:
+            self._remove(key)
+            self._update_gauges()
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: CacheKey, messages: List[StoredMessage], complete: bool) -> None:
+        """Insert or replace an entry, then evict down to the limits."""
+        self._remove(key)
+
+        ttl = self._ttl if messages else self._negative_ttl
+        if ttl <= 0:
+            self._update_gauges()
+            return
+
+        entry = _CacheEntry(
+            messages=list(messages),
+            complete=complete,
+            expires_at=time.monotonic() + ttl,
+            size_bytes=self._estimate_size(messages),
+        )
+        self._entries[key] = entry
+        self._bytes += entry.size_bytes
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+        self._update_gauges()
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry and release its bytes."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size_bytes
+
+    @staticmethod
+    def _estimate_size(messages: List[StoredMessage]) -> int:
+        """Estimate memory held by an entry's messages."""
+        size = ENTRY_OVERHEAD_BYTES
+        for message in messages:
+            size += MESSAGE_OVERHEAD_BYTES + sys.getsizeof(message.message)
+            if message.burst_message_ids:
+                size += 60 * len(message.burst_message_ids)
+        return size
+
+    def _record(self, result: str) -> None:
+        """Count a lookup result in metrics."""
+        if self._metrics:
+            self._metrics.inc_history_cache_requests(result)
+
+    def _update_gauges(self) -> None:
+        """Publish entry count and memory gauges."""
+        if self._metrics:
+            self._metrics.set_history_cache_size(len(self._entries), self._bytes)
+
+    # =========================================================================
+    # Properties and Status
+    # =========================================================================
+
+    @property
+    def size(self) -> int:
+        """Get number of cached users."""
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Get estimated memory held by cached messages."""
+        return self._bytes
+
+    @property
+    def hit_rate(self) -> float:
+        """Get fraction of lookups served without a Redis read."""
+        served = self._hits + self._negative_hits + self._coalesced
+        total = served + self._misses
+        return served / total if total else 0.0
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get cache status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "size_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "depth": self.depth,
+            "hits": self._hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "evictions": self._evictions,
+            "hit_rate": round(self.hit_rate, 4),
+            "inflight": len(self._inflight),
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"HistoryCache(entries={len(self._entries)}, "
+            f"bytes={self._bytes}, hit_rate={self.hit_rate:.2%})"
+        )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "HistoryCache",
+]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Redis Manager for Ash-Bot Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-9-3.1-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-9-3.1-6
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 9 - CRT Workflow Enhancements
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -29,12 +29,21 @@ RESPONSIBILITIES:
 - Auto-retry with exponential backoff (Phase 5)
 - Metrics collection integration (Phase 5)
 - Key pattern scanning for scheduled tasks (Phase 9)
+- Atomic sorted-set pop for drain queues (Phase 10)
+- Lua scripts called by SHA with NOSCRIPT reload (Phase 10)
+- Single round-trip capped sorted-set writes (Phase 10)
+- Pipelines and MULTI/EXEC transactions with retry and metrics (Phase 10)
+- Due-time index reads and atomic claims for schedulers (Phase 10)
 
 REDIS DATA STRUCTURES:
 - Sorted Sets: Used for time-ordered message history
   - Key: ash:history:{guild_id}:{user_id}
   - Score: Unix timestamp (for ordering)
   - Member: JSON string with message data
+- Sorted Sets: Used as due-time indexes for scheduled work
+  - Key: ash:followup:due, ash:pending_alert_index
+  - Score: Unix timestamp when the item is due
+  - Member: Record ID
 - Strings: Used for scheduled follow-ups, user preferences
   - Key: ash:followup:scheduled:{id}
   - Key: ash:preferences:{user_id}
@@ -42,11 +51,29 @@ REDIS DATA STRUCTURES:
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Any, Callable, List, Optional, TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 import redis.asyncio as redis
-from redis.exceptions import ConnectionError, TimeoutError, AuthenticationError
+from redis.exceptions import (
+    AuthenticationError,
+    ConnectionError,
+    NoScriptError,
+    TimeoutError,
+)
 
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
@@ -54,12 +81,196 @@ if TYPE_CHECKING:
     from src.managers.metrics.metrics_manager import MetricsManager
 
 # Module version
-__version__ = "v5.0-9-3.1-1"
+__version__ = "v5.0-9-3.1-6"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Lua Scripts
+# =============================================================================
+
+# Add a member, refresh the TTL and trim the oldest entries beyond
+# max_size in one atomic step. Returns the number of members trimmed.
+#   KEYS[1] = sorted set key
+#   ARGV    = score, member, ttl_seconds (0 = keep), max_size (0 = unbounded)
+SCRIPT_ZADD_CAPPED = """
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+local ttl = tonumber(ARGV[3])
+if ttl > 0 then
+    redis.call('EXPIRE', KEYS[1], ttl)
+end
+local max_size = tonumber(ARGV[4])
+if max_size > 0 then
+    local excess = redis.call('ZCARD', KEYS[1]) - max_size
+    if excess > 0 then
+        redis.call('ZREMRANGEBYRANK', KEYS[1], 0, excess - 1)
+        return excess
+    end
+end
+return 0
+"""
+
+# Claim up to `limit` members whose score is at or below `max_score`,
+# removing them from the index in the same atomic step so concurrent
+# schedulers can never claim the same item. Returns the claimed members.
+#   KEYS[1] = due-time sorted set key
+#   ARGV    = max_score, limit
+SCRIPT_ZPOP_DUE = """
+local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #members > 0 then
+    redis.call('ZREM', KEYS[1], unpack(members))
+end
+return members
+"""
+
+
+# =============================================================================
+# Redis Pipeline (Phase 10)
+# =============================================================================
+
+
+class RedisPipeline:
+    """
+    Commands collected for one round trip.
+
+    Commands are only recorded here; RedisManager.pipeline() sends them
+    when the block exits, so a retry after a connection error replays
+    the whole batch on a fresh redis-py pipeline. Commands should be
+    idempotent (SET, ZADD, EXPIRE, DEL, reads) for that reason.
+
+    Method names and arguments mirror the RedisManager wrappers.
+
+    Attributes:
+        transaction: Wrap the commands in MULTI/EXEC
+        results: One result per command after execution, None if the
+            pipeline failed or has not run yet
+
+    Example:
+        >>> async with redis_manager.pipeline() as pipe:
+        ...     pipe.zadd(key, score, member)
+        ...     pipe.expire(key, 3600)
+        >>> pipe.results
+        [1, True]
+    """
+
+    def __init__(self, transaction: bool = True) -> None:
+        """
+        Initialize RedisPipeline.
+
+        Args:
+            transaction: Wrap the commands in MULTI/EXEC
+
+        Note:
+            Use RedisManager.pipeline() instead of direct instantiation.
+        """
+        self.transaction = transaction
+        self.results: Optional[List[Any]] = None
+        self._commands: List[Tuple[str, tuple, dict]] = []
+
+    def _queue(self, method: str, *args: Any, **kwargs: Any) -> "RedisPipeline":
+        """Record one command."""
+        self._commands.append((method, args, kwargs))
+        return self
+
+    # Sorted sets
+
+    def zadd(self, key: str, score: float, member: str) -> "RedisPipeline":
+        """Queue ZADD."""
+        return self._queue("zadd", key, {member: score})
+
+    def zrange(
+        self,
+        key: str,
+        start: int,
+        stop: int,
+        desc: bool = True,
+        withscores: bool = False,
+    ) -> "RedisPipeline":
+        """Queue ZRANGE (ZREVRANGE when desc)."""
+        method = "zrevrange" if desc else "zrange"
+        return self._queue(method, key, start, stop, withscores=withscores)
+
+    def zcard(self, key: str) -> "RedisPipeline":
+        """Queue ZCARD."""
+        return self._queue("zcard", key)
+
+    def zrem(self, key: str, *members: str) -> "RedisPipeline":
+        """Queue ZREM."""
+        return self._queue("zrem", key, *members)
+
+    def zremrangebyrank(self, key: str, start: int, stop: int) -> "RedisPipeline":
+        """Queue ZREMRANGEBYRANK."""
+        return self._queue("zremrangebyrank", key, start, stop)
+
+    def zremrangebyscore(
+        self, key: str, min_score: float, max_score: float
+    ) -> "RedisPipeline":
+        """Queue ZREMRANGEBYSCORE."""
+        return self._queue("zremrangebyscore", key, min_score, max_score)
+
+    # Keys and strings
+
+    def expire(self, key: str, seconds: int) -> "RedisPipeline":
+        """Queue EXPIRE."""
+        return self._queue("expire", key, seconds)
+
+    def ttl(self, key: str) -> "RedisPipeline":
+        """Queue TTL."""
+        return self._queue("ttl", key)
+
+    def delete(self, *keys: str) -> "RedisPipeline":
+        """Queue DEL for one or more keys."""
+        return self._queue("delete", *keys)
+
+    def exists(self, key: str) -> "RedisPipeline":
+        """Queue EXISTS."""
+        return self._queue("exists", key)
+
+    def get(self, key: str) -> "RedisPipeline":
+        """Queue GET."""
+        return self._queue("get", key)
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> "RedisPipeline":
+        """Queue SET (SETEX when ttl is given)."""
+        if ttl:
+            return self._queue("setex", key, ttl, value)
+        return self._queue("set", key, value)
+
+    # Scripts
+
+    def script(
+        self,
+        name: str,
+        keys: Sequence[str] = (),
+        args: Sequence[Any] = (),
+    ) -> "RedisPipeline":
+        """Queue a registered Lua script (see RedisManager.register_script)."""
+        return self._queue("evalsha", name, tuple(keys), tuple(args))
+
+    @property
+    def script_names(self) -> Set[str]:
+        """Get names of the scripts queued in this pipeline."""
+        return {args[0] for method, args, _ in self._commands if method == "evalsha"}
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the pipeline ran and returned results."""
+        return self.results is not None
+
+    def __len__(self) -> int:
+        """Get number of queued commands."""
+        return len(self._commands)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"RedisPipeline(commands={len(self._commands)}, "
+            f"transaction={self.transaction}, succeeded={self.succeeded})"
+        )
+
+
 # =============================================================================
 # Redis Manager
 # =============================================================================
@@ -138,6 +349,18 @@ class RedisManager:
         self._total_operations = 0
         self._failed_operations = 0
 
+        # Phase 10: Lua script registry (name -> source, name -> SHA1)
+        self._scripts: Dict[str, str] = {}
+        self._script_shas: Dict[str, str] = {}
+        self._script_reloads = 0
+        self._scripts_loaded: Set[str] = set()
+        self.register_script("zadd_capped", SCRIPT_ZADD_CAPPED)
+        self.register_script("zpop_due", SCRIPT_ZPOP_DUE)
+
+        # Phase 10: Pipeline statistics
+        self._pipelines_executed = 0
+        self._pipelined_commands = 0
+
         logger.debug(
             f"RedisManager initialized (host: {self._host}, port: {self._port}, db: {self._db})"
         )
@@ -448,6 +671,52 @@ class RedisManager:
             logger.error(f"❌ ZRANGE failed for {key}: {e}")
             return []
 
+    async def zrangebyscore(
+        self,
+        key: str,
+        min_score: Any,
+        max_score: Any,
+        offset: int = 0,
+        count: Optional[int] = None,
+        withscores: bool = False,
+    ) -> List[Any]:
+        """
+        Get members by score range, lowest score first.
+
+        Args:
+            key: Redis key
+            min_score: Minimum score (inclusive, or "-inf")
+            max_score: Maximum score (inclusive, or "+inf")
+            offset: Members to skip (used with count)
+            count: Maximum members to return (None for all)
+            withscores: Include scores in result
+
+        Returns:
+            List of members (or tuples if withscores=True)
+            Empty list on failure (graceful degradation)
+        """
+        if not self._ensure_connected_safe():
+            return []
+
+        try:
+            result = await self._with_retry(
+                self._client.zrangebyscore,
+                "zrangebyscore",
+                key,
+                min_score,
+                max_score,
+                start=offset if count is not None else None,
+                num=count,
+                withscores=withscores,
+            )
+            logger.debug(
+                f"ZRANGEBYSCORE {key}: [{min_score}:{max_score}] count={len(result)}"
+            )
+            return result
+        except Exception as e:
+            logger.error(f"❌ ZRANGEBYSCORE failed for {key}: {e}")
+            return []
+
     async def zcard(self, key: str) -> int:
         """
         Get count of members in sorted set.
@@ -473,6 +742,33 @@ class RedisManager:
             logger.error(f"❌ ZCARD failed for {key}: {e}")
             return 0
 
+    async def zrem(self, key: str, *members: str) -> int:
+        """
+        Remove members from sorted set.
+
+        Args:
+            key: Redis key
+            *members: Members to remove
+
+        Returns:
+            Number of members removed (0 on failure)
+        """
+        if not members or not self._ensure_connected_safe():
+            return 0
+
+        try:
+            removed = await self._with_retry(
+                self._client.zrem,
+                "zrem",
+                key,
+                *members,
+            )
+            logger.debug(f"ZREM {key}: removed={removed}")
+            return removed
+        except Exception as e:
+            logger.error(f"❌ ZREM failed for {key}: {e}")
+            return 0
+
     async def zremrangebyrank(
         self,
         key: str,
@@ -548,6 +844,276 @@ class RedisManager:
             logger.error(f"❌ ZREMRANGEBYSCORE failed for {key}: {e}")
             return 0
 
+    async def zpopmin(
+        self,
+        key: str,
+        count: int = 1,
+    ) -> List[Any]:
+        """
+        Atomically remove and return the lowest-scored members.
+
+        Used by queues that drain oldest-first (Phase 10).
+
+        Args:
+            key: Redis key
+            count: Maximum number of members to pop
+
+        Returns:
+            List of (member, score) tuples, lowest score first
+            Empty list on failure (graceful degradation)
+        """
+        if not self._ensure_connected_safe():
+            return []
+
+        try:
+            result = await self._with_retry(
+                self._client.zpopmin,
+                "zpopmin",
+                key,
+                count,
+            )
+            logger.debug(f"ZPOPMIN {key}: count={count}, popped={len(result)}")
+            return result
+        except Exception as e:
+            logger.error(f"❌ ZPOPMIN failed for {key}: {e}")
+            return []
+
+    async def zadd_capped(
+        self,
+        key: str,
+        score: float,
+        member: str,
+        max_size: int = 0,
+        ttl_seconds: int = 0,
+    ) -> Optional[int]:
+        """
+        Add a member, refresh TTL and trim to max_size in one round trip.
+
+        Replaces the ZADD / EXPIRE / ZCARD / ZREMRANGEBYRANK sequence with
+        a single atomic script, so concurrent writers cannot both read a
+        stale count and over- or under-trim (Phase 10).
+
+        Args:
+            key: Redis key
+            score: Score (typically Unix timestamp as float)
+            member: Value to store (typically JSON string)
+            max_size: Keep only the newest max_size members (0 = unbounded)
+            ttl_seconds: TTL to set on the key (0 = leave unchanged)
+
+        Returns:
+            Number of old members trimmed
+            None if operation failed (graceful degradation)
+        """
+        result = await self.run_script(
+            "zadd_capped",
+            keys=[key],
+            args=[score, member, int(ttl_seconds), int(max_size)],
+        )
+        if result is None:
+            return None
+
+        logger.debug(f"ZADD (capped) {key}: score={score:.2f}, trimmed={result}")
+        return int(result)
+
+    async def zpop_due(
+        self,
+        key: str,
+        max_score: float,
+        limit: int = 100,
+    ) -> Optional[List[str]]:
+        """
+        Atomically claim members of a due-time index.
+
+        Returns up to limit members scored at or below max_score (oldest
+        first) and removes them in the same step, so two schedulers never
+        claim the same item (Phase 10). Callers re-add anything they could
+        not process.
+
+        Args:
+            key: Due-time sorted set key
+            max_score: Claim members due at or before this score (Unix time)
+            limit: Maximum members to claim
+
+        Returns:
+            Claimed members, oldest first
+            None if operation failed (graceful degradation)
+        """
+        result = await self.run_script(
+            "zpop_due",
+            keys=[key],
+            args=[max_score, int(limit)],
+        )
+        if result is None:
+            return None
+
+        logger.debug(f"ZPOP (due) {key}: max_score={max_score:.0f}, claimed={len(result)}")
+        return list(result)
+
+    # =========================================================================
+    # Lua Scripts (Phase 10)
+    # =========================================================================
+
+    def register_script(self, name: str, source: str) -> str:
+        """
+        Register a Lua script under a name.
+
+        The SHA1 is computed locally; the script is only sent to Redis the
+        first time EVALSHA reports NOSCRIPT (new server, restart or
+        SCRIPT FLUSH).
+
+        Args:
+            name: Script name used with run_script()
+            source: Lua source
+
+        Returns:
+            SHA1 digest of the script
+        """
+        sha = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        self._scripts[name] = source
+        self._script_shas[name] = sha
+        return sha
+
+    async def run_script(
+        self,
+        name: str,
+        keys: Sequence[str] = (),
+        args: Sequence[Any] = (),
+    ) -> Any:
+        """
+        Execute a registered Lua script by SHA.
+
+        Args:
+            name: Registered script name
+            keys: Redis keys touched by the script (KEYS)
+            args: Script arguments (ARGV)
+
+        Returns:
+            Script result, None if operation failed (graceful degradation)
+
+        Raises:
+            KeyError: If no script is registered under name
+        """
+        sha = self._script_shas[name]
+
+        if not self._ensure_connected_safe():
+            return None
+
+        try:
+            return await self._with_retry(
+                self._evalsha, f"script:{name}", name, sha, keys, args
+            )
+        except Exception as e:
+            logger.error(f"❌ Script '{name}' failed for {list(keys)}: {e}")
+            return None
+
+    async def _evalsha(
+        self,
+        name: str,
+        sha: str,
+        keys: Sequence[str],
+        args: Sequence[Any],
+    ) -> Any:
+        """EVALSHA, loading the script once if the server does not have it."""
+        try:
+            return await self._client.evalsha(sha, len(keys), *keys, *args)
+        except NoScriptError:
+            self._scripts_loaded.discard(name)
+            await self._load_script(name)
+            return await self._client.evalsha(sha, len(keys), *keys, *args)
+
+    async def _load_script(self, name: str) -> None:
+        """Send a registered script to the server (SCRIPT LOAD)."""
+        self._script_reloads += 1
+        logger.debug(f"📜 Loading Lua script '{name}' ({self._script_shas[name][:8]})")
+        await self._client.script_load(self._scripts[name])
+        self._scripts_loaded.add(name)
+
+    # =========================================================================
+    # Pipelines and Transactions (Phase 10)
+    # =========================================================================
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True) -> AsyncIterator[RedisPipeline]:
+        """
+        Collect commands and send them in one round trip on exit.
+
+        The batch goes through the same retry, reconnect and metrics path
+        as single commands (recorded as operation "pipeline"). Failures
+        are logged and leave pipe.results as None (graceful degradation);
+        if the block itself raises, nothing is sent.
+
+        Args:
+            transaction: Wrap the commands in MULTI/EXEC (atomic)
+
+        Yields:
+            RedisPipeline to queue commands on
+
+        Example:
+            >>> async with redis_manager.pipeline() as pipe:
+            ...     pipe.set(key, value, ttl=3600)
+            ...     pipe.delete(old_key)
+            >>> if pipe.succeeded:
+            ...     stored, deleted = pipe.results
+        """
+        pipe = RedisPipeline(transaction=transaction)
+        yield pipe
+        pipe.results = await self.execute_pipeline(pipe)
+
+    async def execute_pipeline(self, pipe: RedisPipeline) -> Optional[List[Any]]:
+        """
+        Send a pipeline's queued commands.
+
+        Args:
+            pipe: Pipeline built with RedisManager.pipeline()
+
+        Returns:
+            One result per command, None if operation failed
+            (graceful degradation)
+        """
+        if len(pipe) == 0:
+            return []
+
+        if not self._ensure_connected_safe():
+            return None
+
+        try:
+            results = await self._with_retry(self._run_pipeline, "pipeline", pipe)
+            self._pipelines_executed += 1
+            self._pipelined_commands += len(pipe)
+            logger.debug(
+                f"PIPELINE: {len(pipe)} commands, transaction={pipe.transaction}"
+            )
+            return results
+        except Exception as e:
+            logger.error(f"❌ PIPELINE of {len(pipe)} commands failed: {e}")
+            return None
+
+    async def _run_pipeline(self, pipe: RedisPipeline) -> List[Any]:
+        """Run one pipeline attempt, loading any scripts it needs first."""
+        for name in pipe.script_names - self._scripts_loaded:
+            await self._load_script(name)
+
+        try:
+            return await self._send_pipeline(pipe)
+        except NoScriptError:
+            # Server lost its script cache (restart or SCRIPT FLUSH)
+            for name in pipe.script_names:
+                await self._load_script(name)
+            return await self._send_pipeline(pipe)
+
+    async def _send_pipeline(self, pipe: RedisPipeline) -> List[Any]:
+        """Replay recorded commands on a fresh redis-py pipeline."""
+        async with self._client.pipeline(transaction=pipe.transaction) as batch:
+            for method, args, kwargs in pipe._commands:
+                if method == "evalsha":
+                    name, keys, script_args = args
+                    batch.evalsha(
+                        self._script_shas[name], len(keys), *keys, *script_args
+                    )
+                else:
+                    getattr(batch, method)(*args, **kwargs)
+            return await batch.execute()
+
     # =========================================================================
     # Key Management
     # =========================================================================
@@ -685,6 +1251,7 @@ class RedisManager:
         key: str,
         value: str,
         ttl: Optional[int] = None,
+        nx: bool = False,
     ) -> bool:
         """
         Set string value for key with optional TTL.
@@ -693,15 +1260,26 @@ class RedisManager:
             key: Redis key
             value: String value to store
             ttl: Optional TTL in seconds
+            nx: Only set if the key does not exist (SET NX)
 
         Returns:
             True if set successfully, False on failure
+            (or, with nx, if the key already existed)
         """
         if not self._ensure_connected_safe():
             return False
 
         try:
-            if ttl:
+            if nx:
+                result = await self._with_retry(
+                    self._client.set,
+                    "set",
+                    key,
+                    value,
+                    ex=ttl or None,
+                    nx=True,
+                )
+            elif ttl:
                 result = await self._with_retry(
                     self._client.setex,
                     "setex",
@@ -722,6 +1300,35 @@ class RedisManager:
             logger.error(f"❌ SET failed for {key}: {e}")
             return False
 
+    async def mget(self, keys: Sequence[str]) -> Optional[List[Optional[str]]]:
+        """
+        Get string values for several keys in one round trip.
+
+        Args:
+            keys: Redis keys
+
+        Returns:
+            One value per key (None where the key doesn't exist)
+            None if operation failed (graceful degradation)
+        """
+        if not keys:
+            return []
+
+        if not self._ensure_connected_safe():
+            return None
+
+        try:
+            result = await self._with_retry(
+                self._client.mget,
+                "mget",
+                list(keys),
+            )
+            logger.debug(f"MGET {len(keys)} keys")
+            return result
+        except Exception as e:
+            logger.error(f"❌ MGET failed for {len(keys)} keys: {e}")
+            return None
+
     async def keys(self, pattern: str) -> List[str]:
         """
         Find all keys matching pattern.
@@ -883,6 +1490,10 @@ class RedisManager:
             "total_operations": self._total_operations,
             "failed_operations": self._failed_operations,
             "consecutive_failures": self._consecutive_failures,
+            "scripts_registered": len(self._scripts),
+            "script_reloads": self._script_reloads,
+            "pipelines_executed": self._pipelines_executed,
+            "pipelined_commands": self._pipelined_commands,
             "success_rate": (
                 (self._total_operations - self._failed_operations) / self._total_operations
                 if self._total_operations > 0
@@ -945,5 +1556,6 @@ def create_redis_manager(
 
 __all__ = [
     "RedisManager",
+    "RedisPipeline",
     "create_redis_manager",
 ]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 User History Manager for Ash-Bot Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-2-4.0-1
-LAST MODIFIED: 2026-01-03
+FILE VERSION: v5.0-2-4.0-6
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 2 - Redis History Storage
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,8 @@ RESPONSIBILITIES:
 - Retrieve recent history for NLP context
 - Enforce TTL-based expiration and max message limits
 - Provide per-user, per-guild isolation
+- Serve repeat reads from an in-process history cache (Phase 10)
+- Maintain an incremental per-user escalation state (Phase 10)
 
 STORAGE RULES:
 - SAFE severity: NOT stored (no crisis indicators)
@@ -36,27 +38,33 @@ STORAGE RULES:
 
 KEY FORMAT:
     ash:history:{guild_id}:{user_id}
+    ash:escalation:{guild_id}:{user_id} (Phase 10)
 
 DATA STRUCTURE:
     Redis Sorted Set with:
     - Score: Unix timestamp (for ordering)
-    - Member: JSON string with message data
+    - Member: StoredMessage.encode() output (compact v1, or legacy JSON)
+
+    Escalation state is a Redis string holding EscalationState.encode()
+    output, rewritten on every LOW+ analysis.
 """
 
-import json
 import logging
+import time
 from datetime import datetime, timezone
 from typing import List, Optional, TYPE_CHECKING
 
-from src.models.history_models import StoredMessage
+from src.managers.storage.history_cache import HistoryCache
+from src.models.history_models import EscalationState, StoredMessage
 from src.models.nlp_models import MessageHistoryItem, CrisisAnalysisResult
 
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
     from src.managers.storage.redis_manager import RedisManager
+    from src.managers.metrics.metrics_manager import MetricsManager
 
 # Module version
-__version__ = "v5.0-2-4.0-1"
+__version__ = "v5.0-2-4.0-6"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -72,6 +80,12 @@ STORABLE_SEVERITIES = frozenset({"low", "medium", "high", "critical"})
 # Redis key prefix
 KEY_PREFIX = "ash:history"
 
+# Phase 10: Redis key prefix for escalation state
+ESCALATION_KEY_PREFIX = "ash:escalation"
+
+# Phase 10: Severity order for the escalation minimum severity
+SEVERITY_ORDER = ("low", "medium", "high", "critical")
+
 
 # =============================================================================
 # User History Manager
@@ -106,6 +120,7 @@ class UserHistoryManager:
         self,
         config_manager: "ConfigManager",
         redis_manager: "RedisManager",
+        metrics_manager: Optional["MetricsManager"] = None,
     ) -> None:
         """
         Initialize UserHistoryManager.
@@ -113,6 +128,7 @@ class UserHistoryManager:
         Args:
             config_manager: Configuration manager for history settings
             redis_manager: RedisManager for storage operations
+            metrics_manager: Optional metrics manager for cache metrics
 
         Note:
             Use create_user_history_manager() factory function instead
@@ -131,10 +147,72 @@ class UserHistoryManager:
         # Calculate TTL in seconds
         self._ttl_seconds = self._ttl_days * 24 * 60 * 60
 
+        # Phase 10: Member encoding (reads accept both formats)
+        self._storage_format = self._config.get(
+            "history", "storage_format", "compact"
+        ).lower()
+        self._compress_text = self._config.get("history", "compress_text", False)
+
+        # Phase 10: Read-through cache of parsed history per (guild, user)
+        self._cache: Optional[HistoryCache] = None
+        if self._config.get("history", "cache_enabled", True):
+            self._cache = HistoryCache(
+                max_entries=self._config.get(
+                    "history", "cache_max_entries", HistoryCache.DEFAULT_MAX_ENTRIES
+                ),
+                max_bytes=self._config.get("history", "cache_max_mb", 32) * 1024 * 1024,
+                depth=self._config.get(
+                    "history", "cache_depth", HistoryCache.DEFAULT_DEPTH
+                ),
+                ttl=self._config.get(
+                    "history", "cache_ttl_seconds", HistoryCache.DEFAULT_TTL
+                ),
+                negative_ttl=self._config.get(
+                    "history",
+                    "cache_negative_ttl_seconds",
+                    HistoryCache.DEFAULT_NEGATIVE_TTL,
+                ),
+                metrics_manager=metrics_manager,
+            )
+
+        # Phase 10: Incremental escalation tracking
+        self._escalation_enabled = self._config.get("history", "escalation_enabled", True)
+        self._escalation_alpha = float(
+            self._config.get("history", "escalation_ewma_alpha", 0.3)
+        )
+        self._escalation_half_life = float(
+            self._config.get("history", "escalation_half_life_hours", 6.0)
+        )
+        self._escalation_window = int(
+            self._config.get("history", "escalation_window_hours", 24)
+        )
+        self._escalation_min_messages = int(
+            self._config.get("history", "escalation_min_messages", 3)
+        )
+        self._escalation_enter_score = float(
+            self._config.get("history", "escalation_enter_score", 0.55)
+        )
+        self._escalation_exit_score = float(
+            self._config.get("history", "escalation_exit_score", 0.35)
+        )
+        self._escalation_min_slope = float(
+            self._config.get("history", "escalation_min_slope", 0.05)
+        )
+        self._escalation_min_severity = self._config.get(
+            "history", "escalation_min_severity", "medium"
+        ).lower()
+        if self._escalation_min_severity not in SEVERITY_ORDER:
+            self._escalation_min_severity = "medium"
+
+        # State is stale once the window and several half-lives have passed
+        self._escalation_ttl = int(
+            max(self._escalation_window, 4 * self._escalation_half_life) * 3600
+        )
+
         logger.info(
             f"📚 UserHistoryManager initialized "
             f"(TTL: {self._ttl_days}d, max: {self._max_messages} msgs, "
-            f"min_severity: {self._min_severity})"
+            f"min_severity: {self._min_severity}, format: {self._storage_format})"
         )
 
     # =========================================================================
@@ -154,6 +232,19 @@ class UserHistoryManager:
         """
         return f"{KEY_PREFIX}:{guild_id}:{user_id}"
 
+    def _make_escalation_key(self, guild_id: int, user_id: int) -> str:
+        """
+        Generate Redis key for user escalation state (Phase 10).
+
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+
+        Returns:
+            Redis key string: ash:escalation:{guild_id}:{user_id}
+        """
+        return f"{ESCALATION_KEY_PREFIX}:{guild_id}:{user_id}"
+
     @staticmethod
     def parse_key(key: str) -> tuple[Optional[int], Optional[int]]:
         """
@@ -203,6 +294,7 @@ class UserHistoryManager:
         message: str,
         analysis_result: CrisisAnalysisResult,
         message_id: Optional[str] = None,
+        burst_message_ids: Optional[List[str]] = None,
     ) -> bool:
         """
         Add a message to user's history.
@@ -216,6 +308,8 @@ class UserHistoryManager:
             message: Original message content
             analysis_result: NLP analysis result
             message_id: Optional Discord message ID
+            burst_message_ids: Optional IDs of all messages in a coalesced
+                burst (Phase 10)
 
         Returns:
             True if message was stored, False if skipped
@@ -241,20 +335,33 @@ class UserHistoryManager:
             crisis_score=analysis_result.crisis_score,
             severity=analysis_result.severity,
             message_id=message_id,
+            burst_message_ids=burst_message_ids,
         )
 
         # Score = timestamp as float for chronological ordering
         score = timestamp.timestamp()
 
         try:
-            # Add to sorted set
-            await self._redis.zadd(key, score, json.dumps(stored_msg.to_dict()))
+            # Phase 10: Add, refresh TTL and trim in a single atomic round trip
+            trimmed = await self._redis.zadd_capped(
+                key,
+                score,
+                stored_msg.encode(
+                    compact=self._storage_format == "compact",
+                    compress=self._compress_text,
+                ),
+                max_size=self._max_messages,
+                ttl_seconds=self._ttl_seconds,
+            )
+            if trimmed is None:
+                logger.warning(f"⚠️ History write for user {user_id} was not stored")
+                return False
 
-            # Set/refresh TTL
-            await self._redis.expire(key, self._ttl_seconds)
+            if trimmed:
+                logger.debug(f"🔪 Trimmed {trimmed} old messages from {key}")
 
-            # Trim to max messages if needed
-            await self._trim_history(key)
+            if self._cache:
+                self._cache.record_added((guild_id, user_id), stored_msg)
 
             logger.debug(
                 f"📝 Stored message for user {user_id} "
@@ -268,20 +375,115 @@ class UserHistoryManager:
             logger.error(f"❌ Failed to store message for user {user_id}: {e}")
             return False
 
-    async def _trim_history(self, key: str) -> None:
+    # =========================================================================
+    # Escalation Tracking (Phase 10)
+    # =========================================================================
+
+    async def update_escalation(
+        self,
+        guild_id: int,
+        user_id: int,
+        analysis_result: CrisisAnalysisResult,
+    ) -> Optional[EscalationState]:
         """
-        Trim history to max_messages, removing oldest entries.
+        Fold an analysis into the user's escalation state.
+
+        One GET and one SET per LOW+ analysis, independent of history
+        length. SAFE analyses are skipped like in add_message(); the
+        state's time decay stands in for them.
+
+        An episode starts when the average score, its trend and the
+        recent LOW+ count all pass their thresholds on a message of at
+        least escalation_min_severity, and ends once the average falls
+        below escalation_exit_score. state.triggered is set only on the
+        update that starts an episode, so each episode alerts once.
+
+        Two replicas updating the same user at the same instant may
+        drop one sample; the state is a trend signal, not a ledger.
 
         Args:
-            key: Redis key
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            analysis_result: NLP analysis result
+
+        Returns:
+            Updated EscalationState, or None if skipped or disabled
         """
-        count = await self._redis.zcard(key)
+        severity = analysis_result.severity.lower()
+        if not self._escalation_enabled or not self._should_store(severity):
+            return None
+
+        key = self._make_escalation_key(guild_id, user_id)
+        state = await self._load_escalation(key, user_id)
+
+        now = time.time()
+        state.observe(
+            analysis_result.crisis_score,
+            at=now,
+            alpha=self._escalation_alpha,
+            half_life_hours=self._escalation_half_life,
+        )
 
-        if count > self._max_messages:
-            # Remove oldest entries (lowest scores)
-            to_remove = count - self._max_messages
-            await self._redis.zremrangebyrank(key, 0, to_remove - 1)
-            logger.debug(f"🔪 Trimmed {to_remove} old messages from {key}")
+        if state.escalated:
+            if state.ewma < self._escalation_exit_score:
+                state.escalated = False
+                logger.info(
+                    f"📉 Escalation episode ended for user {user_id} "
+                    f"(ewma: {state.ewma:.2f})"
+                )
+        elif (
+            SEVERITY_ORDER.index(severity)
+            >= SEVERITY_ORDER.index(self._escalation_min_severity)
+            and state.ewma >= self._escalation_enter_score
+            and state.slope >= self._escalation_min_slope
+            and state.recent_count(now) >= self._escalation_min_messages
+        ):
+            state.escalated = True
+            state.triggered = True
+            logger.warning(
+                f"📈 Local escalation detected for user {user_id}: {state} "
+                f"({state.recent_count(now)} LOW+ in {self._escalation_window}h)"
+            )
+
+        try:
+            if not await self._redis.set(key, state.encode(), ttl=self._escalation_ttl):
+                logger.warning(f"⚠️ Escalation state for user {user_id} was not stored")
+        except Exception as e:
+            logger.error(f"❌ Failed to store escalation state for user {user_id}: {e}")
+
+        return state
+
+    async def get_escalation_state(
+        self,
+        guild_id: int,
+        user_id: int,
+    ) -> Optional[EscalationState]:
+        """
+        Get the user's escalation state without updating it.
+
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+
+        Returns:
+            EscalationState, or None if the user has none
+        """
+        key = self._make_escalation_key(guild_id, user_id)
+        state = await self._load_escalation(key, user_id)
+        return state if state.samples else None
+
+    async def _load_escalation(self, key: str, user_id: int) -> EscalationState:
+        """Read escalation state, starting fresh if missing or unreadable."""
+        try:
+            raw = await self._redis.get(key)
+            if raw:
+                return EscalationState.decode(raw)
+        except ValueError as e:
+            logger.warning(f"⚠️ Resetting unreadable escalation state for user {user_id}: {e}")
+        except Exception as e:
+            logger.error(f"❌ Failed to load escalation state for user {user_id}: {e}")
+
+        return EscalationState.new(self._escalation_window)
 
     # =========================================================================
     # Retrieval Operations
@@ -307,21 +509,9 @@ class UserHistoryManager:
         Returns:
             List of MessageHistoryItem (newest first)
         """
-        key = self._make_key(guild_id, user_id)
-
         try:
-            # Get most recent entries (highest scores = newest)
-            entries = await self._redis.zrange(key, 0, limit - 1, desc=True)
-
-            history: List[MessageHistoryItem] = []
-            for entry_json in entries:
-                try:
-                    entry_data = json.loads(entry_json)
-                    stored_msg = StoredMessage.from_dict(entry_data)
-                    history.append(stored_msg.to_history_item())
-                except (json.JSONDecodeError, KeyError, ValueError) as e:
-                    logger.warning(f"⚠️ Invalid history entry: {e}")
-                    continue
+            stored = await self._read_stored(guild_id, user_id, limit)
+            history = [stored_msg.to_history_item() for stored_msg in stored]
 
             logger.debug(
                 f"📖 Retrieved {len(history)} history entries for user {user_id}"
@@ -352,26 +542,83 @@ class UserHistoryManager:
         Returns:
             List of StoredMessage (newest first)
         """
-        key = self._make_key(guild_id, user_id)
-
         try:
-            entries = await self._redis.zrange(key, 0, limit - 1, desc=True)
-
-            messages: List[StoredMessage] = []
-            for entry_json in entries:
-                try:
-                    entry_data = json.loads(entry_json)
-                    messages.append(StoredMessage.from_dict(entry_data))
-                except (json.JSONDecodeError, KeyError, ValueError) as e:
-                    logger.warning(f"⚠️ Invalid stored message: {e}")
-                    continue
-
-            return messages
+            return await self._read_stored(guild_id, user_id, limit)
 
         except Exception as e:
             logger.error(f"❌ Failed to get stored messages for user {user_id}: {e}")
             return []
 
+    async def _read_stored(
+        self,
+        guild_id: int,
+        user_id: int,
+        limit: int,
+    ) -> List[StoredMessage]:
+        """
+        Read newest-first stored messages, through the cache if enabled.
+
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            limit: Maximum messages to retrieve
+
+        Returns:
+            List of StoredMessage (newest first)
+
+        Raises:
+            ConnectionError: If Redis could not be read
+        """
+
+        async def load(count: int) -> List[StoredMessage]:
+            return await self._load_stored(guild_id, user_id, count)
+
+        if self._cache:
+            return await self._cache.get_or_load((guild_id, user_id), load, limit)
+        return await load(limit)
+
+    async def _load_stored(
+        self,
+        guild_id: int,
+        user_id: int,
+        count: int,
+    ) -> List[StoredMessage]:
+        """
+        Load and parse the newest stored messages from Redis.
+
+        Read through a pipeline so a failed read raises instead of looking
+        like an empty history (which the cache would otherwise keep).
+
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            count: Maximum messages to load
+
+        Returns:
+            List of StoredMessage (newest first)
+
+        Raises:
+            ConnectionError: If Redis could not be read
+        """
+        key = self._make_key(guild_id, user_id)
+
+        # Get most recent entries (highest scores = newest)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zrange(key, 0, count - 1, desc=True)
+
+        if not pipe.succeeded:
+            raise ConnectionError(f"History read failed for {key}")
+
+        messages: List[StoredMessage] = []
+        for member in pipe.results[0]:
+            try:
+                messages.append(StoredMessage.decode(member))
+            except (KeyError, ValueError) as e:
+                logger.warning(f"⚠️ Invalid history entry: {e}")
+                continue
+
+        return messages
+
     async def get_history_count(self, guild_id: int, user_id: int) -> int:
         """
         Get count of stored messages for user.
@@ -411,6 +658,12 @@ class UserHistoryManager:
         try:
             result = await self._redis.delete(key)
 
+            # Phase 10: Escalation state is derived from the history
+            await self._redis.delete(self._make_escalation_key(guild_id, user_id))
+
+            if self._cache:
+                self._cache.record_cleared((guild_id, user_id))
+
             if result > 0:
                 logger.info(f"🗑️ Cleared history for user {user_id} in guild {guild_id}")
                 return True
@@ -493,7 +746,7 @@ class UserHistoryManager:
                 if msg.severity in severity_counts:
                     severity_counts[msg.severity] += 1
 
-            return {
+            stats = {
                 "message_count": count,
                 "ttl_seconds": ttl,
                 "ttl_days": round(ttl / 86400, 1) if ttl > 0 else 0,
@@ -501,6 +754,19 @@ class UserHistoryManager:
                 "has_history": count > 0,
             }
 
+            # Phase 10: Local escalation trend
+            if self._escalation_enabled:
+                state = await self.get_escalation_state(guild_id, user_id)
+                if state:
+                    stats["escalation"] = {
+                        "ewma": round(state.ewma, 3),
+                        "slope": round(state.slope, 4),
+                        "recent_count": state.recent_count(time.time()),
+                        "escalated": state.escalated,
+                    }
+
+            return stats
+
         except Exception as e:
             logger.error(f"❌ Failed to get stats for user {user_id}: {e}")
             return {
@@ -531,6 +797,25 @@ class UserHistoryManager:
         """Get configured minimum severity to store."""
         return self._min_severity
 
+    @property
+    def escalation_enabled(self) -> bool:
+        """Check if local escalation tracking is enabled."""
+        return self._escalation_enabled
+
+    @property
+    def cache(self) -> Optional[HistoryCache]:
+        """Get the history cache (None if disabled)."""
+        return self._cache
+
+    def get_cache_status(self) -> Optional[dict]:
+        """
+        Get history cache status.
+
+        Returns:
+            Cache status dictionary, or None if the cache is disabled
+        """
+        return self._cache.get_status() if self._cache else None
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
@@ -549,6 +834,7 @@ class UserHistoryManager:
 def create_user_history_manager(
     config_manager: "ConfigManager",
     redis_manager: "RedisManager",
+    metrics_manager: Optional["MetricsManager"] = None,
 ) -> UserHistoryManager:
     """
     Factory function for UserHistoryManager.
@@ -559,6 +845,7 @@ def create_user_history_manager(
     Args:
         config_manager: Configuration manager for history settings
         redis_manager: RedisManager for storage operations
+        metrics_manager: Optional metrics manager for cache metrics
 
     Returns:
         UserHistoryManager instance
@@ -573,6 +860,7 @@ def create_user_history_manager(
     return UserHistoryManager(
         config_manager=config_manager,
         redis_manager=redis_manager,
+        metrics_manager=metrics_manager,
     )
 
 
@@ -585,4 +873,5 @@ __all__ = [
     "create_user_history_manager",
     "STORABLE_SEVERITIES",
     "KEY_PREFIX",
+    "ESCALATION_KEY_PREFIX",
 ]
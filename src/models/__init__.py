@@ -13,24 +13,24 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Data Models Package for Ash-Bot Service
 ---
-FILE VERSION: v5.0-2-2.0-1
-LAST MODIFIED: 2026-01-03
+FILE VERSION: v5.0-2-2.0-3
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 2 - Redis History Storage
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
 ============================================================================
 This package contains data models and dataclasses:
-- NLP Models: CrisisAnalysisResult, MessageHistoryItem, SignalResult, SeverityLevel
-- History Models: StoredMessage
+- NLP Models: CrisisAnalysisResult, MessageHistoryItem, AnalysisRequest, SignalResult, SeverityLevel
+- History Models: StoredMessage, EscalationState
 
 USAGE:
     from src.models import CrisisAnalysisResult, MessageHistoryItem, SeverityLevel
-    from src.models import StoredMessage
+    from src.models import StoredMessage, EscalationState
 """
 
 # Module version
-__version__ = "v5.0-2-2.0-1"
+__version__ = "v5.0-2-2.0-3"
 
 # =============================================================================
 # NLP Models
@@ -38,6 +38,7 @@ __version__ = "v5.0-2-2.0-1"
 from .nlp_models import (
     SeverityLevel,
     MessageHistoryItem,
+    AnalysisRequest,
     SignalResult,
     CrisisAnalysisResult,
 )
@@ -47,6 +48,7 @@ from .nlp_models import (
 # =============================================================================
 from .history_models import (
     StoredMessage,
+    EscalationState,
 )
 
 # =============================================================================
@@ -57,8 +59,10 @@ __all__ = [
     # NLP Models
     "SeverityLevel",
     "MessageHistoryItem",
+    "AnalysisRequest",
     "SignalResult",
     "CrisisAnalysisResult",
     # History Models
     "StoredMessage",
+    "EscalationState",
 ]
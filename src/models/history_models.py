@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 History Data Models for Ash-Bot Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-2-2.0-1
-LAST MODIFIED: 2026-01-03
+FILE VERSION: v5.0-2-2.0-4
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 2 - Redis History Storage
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -24,24 +24,81 @@ Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alp
 RESPONSIBILITIES:
 - Define data classes for Redis history storage
 - Provide serialization/deserialization for JSON storage
+- Provide a versioned compact encoding for Redis members (Phase 10)
 - Enable conversion to NLP API format (MessageHistoryItem)
+- Hold the incremental per-user escalation state (Phase 10)
 
 MODELS:
 - StoredMessage: Message stored in Redis with crisis analysis metadata
+- EscalationState: Running score average, trend and recent LOW+ count (Phase 10)
 """
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Union
+import base64
+import binascii
+import json
 import logging
+import math
+import struct
+import zlib
 
 # Module version
-__version__ = "v5.0-2-2.0-1"
+__version__ = "v5.0-2-2.0-4"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Compact Encoding (Phase 10)
+# =============================================================================
+
+# Compact member layout (version 1):
+#
+#   "1" + base64(header) + "|" + text
+#
+# header = flags (B), severity code (B), crisis_score (d),
+#          timestamp as UTC epoch microseconds (q), message_id (Q),
+#          then burst count (H) and burst IDs (Q each) if FLAG_BURST is set.
+#
+# The text stays raw UTF-8 so it is not inflated by base64; when
+# FLAG_COMPRESSED is set it is base64(zlib(text)) instead. The Redis client
+# runs with decode_responses=True, so members must remain valid text.
+# JSON members always start with "{", which is never a version tag.
+
+COMPACT_FORMAT_VERSION = 1
+_COMPACT_TAG = str(COMPACT_FORMAT_VERSION)
+COMPACT_SEPARATOR = "|"
+
+# Severity codes are part of the stored format: append only, never reorder
+SEVERITY_CODES = ("unknown", "safe", "low", "medium", "high", "critical")
+
+FLAG_MESSAGE_ID = 0x01
+FLAG_BURST = 0x02
+FLAG_COMPRESSED = 0x04
+FLAG_NAIVE_TIMESTAMP = 0x08
+
+_HEADER = struct.Struct("<BBdqQ")
+_BURST_COUNT = struct.Struct("<H")
+_SNOWFLAKE = struct.Struct("<Q")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_MAX_SNOWFLAKE = 2**64 - 1
+
+# Only texts this long are worth trying to compress
+COMPRESS_MIN_LENGTH = 200
+
+
+def _snowflake(value: Optional[str]) -> Optional[int]:
+    """Parse a Discord ID string as an unsigned 64-bit integer, or None."""
+    if value is None or not str(value).isdigit():
+        return None
+    number = int(value)
+    return number if number <= _MAX_SNOWFLAKE else None
+
+
 # =============================================================================
 # Stored Message
 # =============================================================================
@@ -61,12 +118,15 @@ class StoredMessage:
         crisis_score: Score from NLP analysis (0.0-1.0)
         severity: Severity level (low, medium, high, critical)
         message_id: Discord message ID (optional)
+        burst_message_ids: All message IDs when several rapid messages
+            were analyzed together (Phase 10, optional)
 
     Key Format in Redis:
         ash:history:{guild_id}:{user_id}
 
     Storage Format:
-        Sorted set with timestamp as score, JSON as member
+        Sorted set with timestamp as score, encode() output as member
+        (compact version 1 by default, JSON for older entries)
     """
 
     message: str
@@ -74,6 +134,7 @@ class StoredMessage:
     crisis_score: float
     severity: str
     message_id: Optional[str] = None
+    burst_message_ids: Optional[List[str]] = None
 
     # Maximum message length to store
     MAX_MESSAGE_LENGTH = 500
@@ -85,7 +146,7 @@ class StoredMessage:
         Returns:
             Dictionary representation for Redis storage
         """
-        return {
+        data = {
             "message": self.message,
             "timestamp": self.timestamp,
             "crisis_score": self.crisis_score,
@@ -93,6 +154,12 @@ class StoredMessage:
             "message_id": self.message_id,
         }
 
+        # Phase 10: Only written for coalesced bursts
+        if self.burst_message_ids:
+            data["burst_message_ids"] = self.burst_message_ids
+
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StoredMessage":
         """
@@ -113,6 +180,153 @@ class StoredMessage:
             crisis_score=float(data.get("crisis_score", 0.0)),
             severity=data.get("severity", "unknown"),
             message_id=data.get("message_id"),
+            burst_message_ids=data.get("burst_message_ids"),
+        )
+
+    def encode(self, compact: bool = True, compress: bool = False) -> str:
+        """
+        Encode as a Redis sorted-set member.
+
+        Falls back to JSON when a field does not fit the compact layout
+        (non-numeric IDs, unknown severity, unparseable timestamp).
+
+        Args:
+            compact: Use the compact versioned format (False for JSON)
+            compress: zlib-compress long message text (compact only)
+
+        Returns:
+            Encoded member string
+        """
+        if compact:
+            encoded = self._encode_compact(compress)
+            if encoded is not None:
+                return encoded
+        return json.dumps(self.to_dict())
+
+    def _encode_compact(self, compress: bool) -> Optional[str]:
+        """Encode in compact version 1, or None if a field does not fit."""
+        severity = self.severity.lower()
+        if severity not in SEVERITY_CODES:
+            return None
+
+        try:
+            parsed = self.parsed_timestamp
+        except (ValueError, AttributeError):
+            return None
+
+        flags = 0
+        if parsed.tzinfo is None:
+            flags |= FLAG_NAIVE_TIMESTAMP
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        delta = parsed - _EPOCH
+        micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+        message_id = 0
+        if self.message_id is not None:
+            message_id = _snowflake(self.message_id)
+            if message_id is None:
+                return None
+            flags |= FLAG_MESSAGE_ID
+
+        burst_ids: List[int] = []
+        if self.burst_message_ids:
+            burst_ids = [_snowflake(value) for value in self.burst_message_ids]
+            if None in burst_ids or len(burst_ids) > 0xFFFF:
+                return None
+            flags |= FLAG_BURST
+
+        text = self.message
+        if compress and len(text) >= COMPRESS_MIN_LENGTH:
+            packed = base64.b64encode(zlib.compress(text.encode("utf-8"), 9)).decode("ascii")
+            if len(packed) < len(text.encode("utf-8")):
+                text = packed
+                flags |= FLAG_COMPRESSED
+
+        header = _HEADER.pack(
+            flags,
+            SEVERITY_CODES.index(severity),
+            float(self.crisis_score),
+            micros,
+            message_id,
+        )
+        if burst_ids:
+            header += _BURST_COUNT.pack(len(burst_ids))
+            header += b"".join(_SNOWFLAKE.pack(value) for value in burst_ids)
+
+        return (
+            f"{_COMPACT_TAG}"
+            f"{base64.b64encode(header).decode('ascii')}"
+            f"{COMPACT_SEPARATOR}{text}"
+        )
+
+    @classmethod
+    def decode(cls, member: Union[str, bytes]) -> "StoredMessage":
+        """
+        Decode a Redis sorted-set member in any supported format.
+
+        Args:
+            member: Member written by encode() or by the pre-Phase 10 JSON path
+
+        Returns:
+            StoredMessage instance
+
+        Raises:
+            ValueError: If the member is malformed or of an unknown version
+            KeyError: If a JSON member is missing required fields
+        """
+        if isinstance(member, bytes):
+            member = member.decode("utf-8")
+
+        tag = member[:1]
+        if tag == _COMPACT_TAG:
+            return cls._decode_compact(member)
+
+        if tag == "{":
+            return cls.from_dict(json.loads(member))
+
+        raise ValueError(f"Unknown stored message format: {member[:8]!r}")
+
+    @classmethod
+    def _decode_compact(cls, member: str) -> "StoredMessage":
+        """Decode a compact version 1 member."""
+        header_b64, separator, text = member[1:].partition(COMPACT_SEPARATOR)
+        if not separator:
+            raise ValueError("Compact stored message is missing its separator")
+
+        try:
+            header = binascii.a2b_base64(header_b64)
+            flags, severity_code, crisis_score, micros, message_id = _HEADER.unpack_from(header)
+
+            burst_ids: Optional[List[str]] = None
+            if flags & FLAG_BURST:
+                (count,) = _BURST_COUNT.unpack_from(header, _HEADER.size)
+                offset = _HEADER.size + _BURST_COUNT.size
+                burst_ids = [
+                    str(_SNOWFLAKE.unpack_from(header, offset + i * _SNOWFLAKE.size)[0])
+                    for i in range(count)
+                ]
+
+            if flags & FLAG_COMPRESSED:
+                text = zlib.decompress(binascii.a2b_base64(text)).decode("utf-8")
+        except (struct.error, zlib.error, binascii.Error) as e:
+            raise ValueError(f"Corrupt compact stored message: {e}") from e
+
+        if severity_code >= len(SEVERITY_CODES):
+            raise ValueError(f"Unknown severity code: {severity_code}")
+
+        # Formatting a naive datetime and appending the offset is noticeably
+        # cheaper than isoformat() on an aware one, and gives the same string
+        timestamp = (_EPOCH_NAIVE + timedelta(microseconds=micros)).isoformat()
+        if not flags & FLAG_NAIVE_TIMESTAMP:
+            timestamp += "+00:00"
+
+        return cls(
+            message=text,
+            timestamp=timestamp,
+            crisis_score=crisis_score,
+            severity=SEVERITY_CODES[severity_code],
+            message_id=str(message_id) if flags & FLAG_MESSAGE_ID else None,
+            burst_message_ids=burst_ids,
         )
 
     @classmethod
@@ -123,6 +337,7 @@ class StoredMessage:
         crisis_score: float,
         severity: str,
         message_id: Optional[str] = None,
+        burst_message_ids: Optional[List[str]] = None,
     ) -> "StoredMessage":
         """
         Factory method to create a StoredMessage with validation.
@@ -133,6 +348,7 @@ class StoredMessage:
             crisis_score: Crisis score from NLP (0.0-1.0)
             severity: Severity level string
             message_id: Discord message ID (optional)
+            burst_message_ids: All message IDs in a coalesced burst (optional)
 
         Returns:
             StoredMessage instance
@@ -160,6 +376,7 @@ class StoredMessage:
             crisis_score=clamped_score,
             severity=severity.lower(),
             message_id=message_id,
+            burst_message_ids=burst_message_ids,
         )
 
     @property
@@ -218,10 +435,252 @@ class StoredMessage:
         )
 
 
+# =============================================================================
+# Escalation State (Phase 10)
+# =============================================================================
+
+# Escalation state layout (version 1):
+#
+#   "1" + base64(header + counts)
+#
+# header = flags (B), updated_at epoch seconds (d), ewma (d), the five
+#          decayed regression sums (d each), samples (I), newest bucket
+#          hour (I), bucket count (H); counts = one uint16 per hour bucket.
+
+ESCALATION_FORMAT_VERSION = 1
+_ESCALATION_TAG = str(ESCALATION_FORMAT_VERSION)
+_ESCALATION_HEADER = struct.Struct("<BdddddddIIH")
+_ESCALATION_COUNT = struct.Struct("<H")
+_MAX_BUCKET_COUNT = 0xFFFF
+
+FLAG_ESCALATED = 0x01
+
+
+@dataclass
+class EscalationState:
+    """
+    Incremental escalation state for one user.
+
+    Updated in O(1) per LOW+ analysis instead of being recomputed from
+    the full history:
+
+    - ewma: exponentially weighted average of crisis scores; it also
+      decays toward zero with a half-life while the user is quiet
+    - slope: weighted least-squares trend of crisis score per message,
+      where each sample's weight halves every half-life
+    - recent_count(): LOW+ messages in the last len(counts) hours, kept
+      in a ring of hourly buckets
+
+    The regression is kept as decayed sums relative to the newest sample
+    (x = 0 for the newest, -1 for the one before, ...), so they stay
+    bounded however long the state lives.
+
+    Attributes:
+        updated_at: Epoch seconds of the newest sample
+        ewma: Weighted average crisis score
+        sum_w, sum_wx, sum_wxx, sum_wy, sum_wxy: Decayed regression sums
+        samples: Samples observed since the state was created
+        bucket_hour: Epoch hour of the newest count bucket
+        counts: LOW+ messages per hour, indexed by epoch hour % len(counts)
+        escalated: Whether the user is in an escalation episode
+        triggered: Set when this update started an episode (not stored)
+    """
+
+    updated_at: float = 0.0
+    ewma: float = 0.0
+    sum_w: float = 0.0
+    sum_wx: float = 0.0
+    sum_wxx: float = 0.0
+    sum_wy: float = 0.0
+    sum_wxy: float = 0.0
+    samples: int = 0
+    bucket_hour: int = 0
+    counts: List[int] = field(default_factory=lambda: [0] * 24)
+    escalated: bool = False
+    triggered: bool = False
+
+    @classmethod
+    def new(cls, window_hours: int) -> "EscalationState":
+        """Create an empty state counting over window_hours."""
+        return cls(counts=[0] * max(1, int(window_hours)))
+
+    # =========================================================================
+    # Update
+    # =========================================================================
+
+    def observe(
+        self,
+        crisis_score: float,
+        at: float,
+        alpha: float,
+        half_life_hours: float,
+    ) -> None:
+        """
+        Fold one LOW+ analysis into the state.
+
+        Args:
+            crisis_score: Crisis score of the analysis (0.0-1.0)
+            at: Epoch seconds of the analysis
+            alpha: Weight of the new score in the average
+            half_life_hours: Hours for older samples to lose half their weight
+        """
+        score = max(0.0, min(1.0, float(crisis_score)))
+
+        if self.samples:
+            idle_hours = max(0.0, at - self.updated_at) / 3600
+            decay = 0.5 ** (idle_hours / half_life_hours) if half_life_hours > 0 else 0.0
+
+            # Shift the origin to the new sample (x -> x - 1), then decay
+            self.sum_wxx = decay * (self.sum_wxx - 2 * self.sum_wx + self.sum_w)
+            self.sum_wxy = decay * (self.sum_wxy - self.sum_wy)
+            self.sum_wx = decay * (self.sum_wx - self.sum_w)
+            self.sum_w *= decay
+            self.sum_wy *= decay
+
+            self.ewma = (1 - alpha) * self.ewma * decay + alpha * score
+        else:
+            self.ewma = score
+
+        # New sample at x = 0 with weight 1
+        self.sum_w += 1.0
+        self.sum_wy += score
+
+        self.updated_at = max(self.updated_at, at)
+        self.samples += 1
+        self._count(int(at // 3600))
+
+    def _count(self, hour: int) -> None:
+        """Add one message to the bucket for an epoch hour."""
+        size = len(self.counts)
+
+        if hour > self.bucket_hour:
+            # Clear buckets for hours skipped since the newest one
+            for skipped in range(max(self.bucket_hour + 1, hour - size + 1), hour + 1):
+                self.counts[skipped % size] = 0
+            self.bucket_hour = hour
+        elif hour <= self.bucket_hour - size:
+            return  # Older than the window
+
+        index = hour % size
+        self.counts[index] = min(_MAX_BUCKET_COUNT, self.counts[index] + 1)
+
+    # =========================================================================
+    # Derived Values
+    # =========================================================================
+
+    @property
+    def slope(self) -> float:
+        """Weighted trend of crisis score per message (0.0 if undefined)."""
+        denominator = self.sum_w * self.sum_wxx - self.sum_wx * self.sum_wx
+        if self.samples < 2 or denominator <= 1e-9:
+            return 0.0
+        return (self.sum_w * self.sum_wxy - self.sum_wx * self.sum_wy) / denominator
+
+    def recent_count(self, now: float) -> int:
+        """
+        Count LOW+ messages within the window ending at now.
+
+        Args:
+            now: Epoch seconds
+
+        Returns:
+            Messages in the last len(counts) hours
+        """
+        size = len(self.counts)
+        oldest = int(now // 3600) - size
+        total = 0
+        for index, count in enumerate(self.counts):
+            if count:
+                hour = self.bucket_hour - ((self.bucket_hour - index) % size)
+                if hour > oldest:
+                    total += count
+        return total
+
+    # =========================================================================
+    # Encoding
+    # =========================================================================
+
+    def encode(self) -> str:
+        """Encode as a compact Redis string value."""
+        header = _ESCALATION_HEADER.pack(
+            FLAG_ESCALATED if self.escalated else 0,
+            self.updated_at,
+            self.ewma,
+            self.sum_w,
+            self.sum_wx,
+            self.sum_wxx,
+            self.sum_wy,
+            self.sum_wxy,
+            min(self.samples, 0xFFFFFFFF),
+            self.bucket_hour,
+            len(self.counts),
+        )
+        counts = b"".join(_ESCALATION_COUNT.pack(count) for count in self.counts)
+        return f"{_ESCALATION_TAG}{base64.b64encode(header + counts).decode('ascii')}"
+
+    @classmethod
+    def decode(cls, value: Union[str, bytes]) -> "EscalationState":
+        """
+        Decode a value written by encode().
+
+        Raises:
+            ValueError: If the value is malformed or of an unknown version
+        """
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+
+        if value[:1] != _ESCALATION_TAG:
+            raise ValueError(f"Unknown escalation state format: {value[:8]!r}")
+
+        try:
+            raw = binascii.a2b_base64(value[1:])
+            (
+                flags, updated_at, ewma, sum_w, sum_wx, sum_wxx, sum_wy, sum_wxy,
+                samples, bucket_hour, size,
+            ) = _ESCALATION_HEADER.unpack_from(raw)
+            counts = [
+                _ESCALATION_COUNT.unpack_from(
+                    raw, _ESCALATION_HEADER.size + i * _ESCALATION_COUNT.size
+                )[0]
+                for i in range(size)
+            ]
+        except (struct.error, binascii.Error) as e:
+            raise ValueError(f"Corrupt escalation state: {e}") from e
+
+        if not size or not all(map(math.isfinite, (ewma, sum_w, sum_wxx, sum_wxy))):
+            raise ValueError("Corrupt escalation state: invalid values")
+
+        return cls(
+            updated_at=updated_at,
+            ewma=ewma,
+            sum_w=sum_w,
+            sum_wx=sum_wx,
+            sum_wxx=sum_wxx,
+            sum_wy=sum_wy,
+            sum_wxy=sum_wxy,
+            samples=samples,
+            bucket_hour=bucket_hour,
+            counts=counts,
+            escalated=bool(flags & FLAG_ESCALATED),
+        )
+
+    def __str__(self) -> str:
+        """Human-readable string representation."""
+        return (
+            f"EscalationState("
+            f"ewma={self.ewma:.2f}, "
+            f"slope={self.slope:+.3f}/msg, "
+            f"samples={self.samples}, "
+            f"escalated={self.escalated})"
+        )
+
+
 # =============================================================================
 # Export public interface
 # =============================================================================
 
 __all__ = [
     "StoredMessage",
+    "EscalationState",
+    "COMPACT_FORMAT_VERSION",
 ]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 NLP Data Models for Ash-Bot Service
 ---
-FILE VERSION: v5.0-7-3.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-7-3.0-2
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 7 - Core Safety & User Preferences
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -27,6 +27,7 @@ RESPONSIBILITIES:
 
 MODELS:
 - MessageHistoryItem: Single message in history context
+- AnalysisRequest: Single /analyze request body (Phase 10)
 - SignalResult: Individual model signal result
 - CrisisAnalysisResult: Complete analysis response from Ash-NLP
 """
@@ -36,7 +37,7 @@ from typing import Any, Dict, List, Optional
 import logging
 
 # Module version
-__version__ = "v5.0-7-3.0-1"
+__version__ = "v5.0-7-3.0-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -184,6 +185,67 @@ class MessageHistoryItem:
         )
 
 
+# =============================================================================
+# Analysis Request (Phase 10)
+# =============================================================================
+
+
+@dataclass
+class AnalysisRequest:
+    """
+    Single message analysis request.
+
+    Used both as the body of POST /analyze and as one item of a
+    POST /analyze/batch request.
+
+    Attributes:
+        message: Message content to analyze
+        user_id: Discord user ID, optional
+        channel_id: Discord channel ID, optional
+        message_history: Previous messages for escalation detection
+        user_timezone: IANA timezone of the user, optional
+        include_explanation: Whether to request an explanation block
+        verbosity: Explanation verbosity level
+    """
+
+    message: str
+    user_id: Optional[str] = None
+    channel_id: Optional[str] = None
+    message_history: Optional[List[MessageHistoryItem]] = None
+    user_timezone: Optional[str] = None
+    include_explanation: bool = True
+    verbosity: str = "standard"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary for API request.
+
+        Returns:
+            Dictionary representation for JSON serialization
+        """
+        result: Dict[str, Any] = {
+            "message": self.message,
+            "include_explanation": self.include_explanation,
+            "verbosity": self.verbosity,
+        }
+
+        if self.user_id:
+            result["user_id"] = str(self.user_id)
+
+        if self.channel_id:
+            result["channel_id"] = str(self.channel_id)
+
+        if self.message_history:
+            result["message_history"] = [
+                item.to_dict() for item in self.message_history
+            ]
+
+        if self.user_timezone:
+            result["user_timezone"] = self.user_timezone
+
+        return result
+
+
 # =============================================================================
 # Signal Result
 # =============================================================================
@@ -587,6 +649,7 @@ class CrisisAnalysisResult:
 __all__ = [
     "SeverityLevel",
     "MessageHistoryItem",
+    "AnalysisRequest",
     "SignalResult",
     "CrisisAnalysisResult",
 ]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Prompts Package for Ash-Bot Service
 ---
-FILE VERSION: v5.0-4-2.0-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-4-2.0-2
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 4 - Ash AI Integration
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -26,6 +26,7 @@ PROMPTS:
 - ASH_SYSTEM_PROMPT: Core Ash personality system prompt
 - CRISIS_RESOURCES: Crisis hotline and resource information
 - SAFETY_TRIGGERS: Keywords that trigger resource sharing
+- SUMMARY_SYSTEM_PROMPT: Rolling conversation summary prompt (Phase 10)
 
 USAGE:
     from src.prompts import ASH_SYSTEM_PROMPT, CRISIS_RESOURCES
@@ -52,6 +53,8 @@ from .ash_system_prompt import (
     HANDOFF_MESSAGE,
     CRT_ARRIVAL_MESSAGE,
     OPT_OUT_ACKNOWLEDGMENT,
+    SUMMARY_SYSTEM_PROMPT,
+    SUMMARY_CONTEXT_TEMPLATE,
     get_welcome_message,
     get_closing_message,
 )
@@ -70,6 +73,8 @@ __all__ = [
     "HANDOFF_MESSAGE",
     "CRT_ARRIVAL_MESSAGE",
     "OPT_OUT_ACKNOWLEDGMENT",
+    "SUMMARY_SYSTEM_PROMPT",
+    "SUMMARY_CONTEXT_TEMPLATE",
     "get_welcome_message",
     "get_closing_message",
 ]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Ash System Prompt Definition for Ash-Bot Service
 ---
-FILE VERSION: v5.0-7-2.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-7-2.0-2
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 7 - Core Safety & User Preferences
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -25,6 +25,7 @@ RESPONSIBILITIES:
 - Define crisis resources for sharing
 - Define safety trigger keywords
 - Define welcome and closing messages
+- Define conversation summary prompts (Phase 10)
 
 IMPORTANT:
     This prompt should be reviewed by community leadership before deployment
@@ -32,7 +33,7 @@ IMPORTANT:
 """
 
 # Module version
-__version__ = "v5.0-7-2.0-1"
+__version__ = "v5.0-7-2.0-2"
 
 
 # =============================================================================
@@ -297,6 +298,26 @@ OPT_OUT_ACKNOWLEDGMENT = (
 )
 
 
+# =============================================================================
+# Conversation Summary Prompts (Phase 10)
+# =============================================================================
+
+SUMMARY_SYSTEM_PROMPT = """You maintain a running summary of a supportive conversation between Ash, a peer-support companion, and a community member who may be in crisis.
+
+Update the summary with the new messages. Keep:
+- What the person is going through, in their own framing
+- Any risk indicators, safety concerns or plans they mentioned
+- People, coping strategies and resources that came up
+- What Ash has already offered or suggested
+
+Write in plain third person, at most 150 words. Output only the summary."""
+
+SUMMARY_CONTEXT_TEMPLATE = (
+    "Summary of the earlier part of this conversation "
+    "(older messages are not shown):\n{summary}"
+)
+
+
 # =============================================================================
 # Export public interface
 # =============================================================================
@@ -309,6 +330,8 @@ __all__ = [
     "HANDOFF_MESSAGE",
     "CRT_ARRIVAL_MESSAGE",
     "OPT_OUT_ACKNOWLEDGMENT",
+    "SUMMARY_SYSTEM_PROMPT",
+    "SUMMARY_CONTEXT_TEMPLATE",
     "get_welcome_message",
     "get_closing_message",
 ]
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Utilities Package for Ash-Bot Service
 ---
-FILE VERSION: v5.0-5-5.1-1
-LAST MODIFIED: 2026-01-04
+FILE VERSION: v5.0-5-5.1-3
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 5 - Production Hardening
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -23,14 +23,18 @@ Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alp
 PACKAGE CONTENTS:
 - circuit_breaker: Circuit breaker pattern for preventing cascading failures
 - retry: Retry utilities with exponential backoff
+- latency_tracker: Rolling latency EWMA and percentiles (Phase 10)
+- concurrency_limiter: AIMD adaptive concurrency limiter (Phase 10)
 
 USAGE:
     from src.utils import CircuitBreaker, CircuitOpenError
     from src.utils import retry_async, RetryConfig
+    from src.utils import LatencyTracker
+    from src.utils import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
 """
 
 # Module version
-__version__ = "v5.0-5-5.1-1"
+__version__ = "v5.0-5-5.1-3"
 
 # =============================================================================
 # Circuit Breaker
@@ -55,6 +59,21 @@ from .retry import (
     with_retry,
 )
 
+# =============================================================================
+# Latency Tracking (Phase 10)
+# =============================================================================
+from .latency_tracker import (
+    LatencyTracker,
+)
+
+# =============================================================================
+# Concurrency Limiting (Phase 10)
+# =============================================================================
+from .concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitExceeded,
+)
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -72,4 +91,9 @@ __all__ = [
     "RetryError",
     "retry_async",
     "with_retry",
+    # Latency Tracking
+    "LatencyTracker",
+    # Concurrency Limiting
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyLimitExceeded",
 ]
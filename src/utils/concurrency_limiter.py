@@ -0,0 +1,338 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Adaptive Concurrency Limiter for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-6.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Cap in-flight requests to an upstream service
+- Adapt the cap with AIMD: grow while latency is healthy, shrink on
+  overload signals (429/5xx, timeouts, latency well above baseline)
+- Queue callers FIFO when the cap is reached, rejecting after a deadline
+- Expose limit, in-flight count, queue length and rejection counts
+
+USAGE:
+    from src.utils import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+
+    limiter = AdaptiveConcurrencyLimiter(name="nlp_api", initial_limit=8)
+
+    try:
+        wait = await limiter.acquire()
+    except ConcurrencyLimitExceeded:
+        ...  # Shed load
+    try:
+        response = await send()
+        limiter.release(latency=elapsed)
+    except OverloadError:
+        limiter.release(overloaded=True)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+# Module version
+__version__ = "v5.0-10-6.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Exceptions
+# =============================================================================
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """
+    Raised when a caller waited too long for a concurrency slot.
+
+    Attributes:
+        limiter_name: Name of the limiter
+        limit: Concurrency limit at the time of rejection
+        waited: Seconds the caller spent queued
+    """
+
+    def __init__(self, limiter_name: str, limit: int, waited: float):
+        self.limiter_name = limiter_name
+        self.limit = limit
+        self.waited = waited
+        super().__init__(
+            f"Concurrency limiter '{limiter_name}' rejected request "
+            f"(limit={limit}, waited={waited:.2f}s)"
+        )
+
+
+# =============================================================================
+# Adaptive Concurrency Limiter
+# =============================================================================
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter.
+
+    Every healthy response grows the limit by 1/limit, so the limit rises
+    by about one per round of requests. An overload signal, or a latency
+    above latency_tolerance x baseline, multiplies the limit by
+    backoff_ratio. Decreases are spaced at least one baseline latency
+    apart so a single slow burst does not collapse the limit.
+
+    The baseline is a decaying minimum: it drops to any faster sample
+    immediately and drifts slowly towards recent latency otherwise, so it
+    follows the service if its normal speed changes.
+
+    Attributes:
+        name: Identifier used in logs and errors
+        min_limit: Lower bound for the limit
+        max_limit: Upper bound for the limit
+        max_queue_wait: Seconds a caller may wait before rejection
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter("nlp_api")
+        >>> await limiter.acquire()
+        >>> limiter.release(latency=0.12)
+    """
+
+    DEFAULT_INITIAL_LIMIT = 8
+    DEFAULT_MIN_LIMIT = 1
+    DEFAULT_MAX_LIMIT = 64
+    DEFAULT_MAX_QUEUE_WAIT = 5.0
+    DEFAULT_BACKOFF_RATIO = 0.75
+    DEFAULT_LATENCY_TOLERANCE = 2.5
+    BASELINE_DRIFT = 0.01
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        max_queue_wait: float = DEFAULT_MAX_QUEUE_WAIT,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+    ):
+        """
+        Initialize AdaptiveConcurrencyLimiter.
+
+        Args:
+            name: Identifier used in logs and errors
+            initial_limit: Starting concurrency limit
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            max_queue_wait: Seconds a caller may wait before rejection
+            backoff_ratio: Multiplier applied on overload (0-1)
+            latency_tolerance: Latency/baseline ratio treated as overload
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.max_queue_wait = max(0.0, max_queue_wait)
+        self.backoff_ratio = min(0.99, max(0.1, backoff_ratio))
+        self.latency_tolerance = max(1.0, latency_tolerance)
+
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+
+        # Statistics
+        self._rejections = 0
+        self._decreases = 0
+
+        logger.info(
+            f"✅ AdaptiveConcurrencyLimiter '{name}' initialized "
+            f"(limit={self.limit}, range={self.min_limit}-{self.max_limit}, "
+            f"max_wait={self.max_queue_wait}s)"
+        )
+
+    # =========================================================================
+    # Acquire / Release
+    # =========================================================================
+
+    async def acquire(self) -> float:
+        """
+        Wait for a concurrency slot.
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            ConcurrencyLimitExceeded: If no slot freed up within max_queue_wait
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return 0.0
+
+        start = time.monotonic()
+        waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter, timeout=self.max_queue_wait)
+        except asyncio.TimeoutError:
+            self._rejections += 1
+            raise ConcurrencyLimitExceeded(
+                limiter_name=self.name,
+                limit=self.limit,
+                waited=time.monotonic() - start,
+            )
+        except asyncio.CancelledError:
+            # Slot may have been handed over just before cancellation
+            if waiter.done() and not waiter.cancelled():
+                self._in_flight -= 1
+                self._wake_waiters()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+        return time.monotonic() - start
+
+    def release(
+        self,
+        latency: Optional[float] = None,
+        overloaded: bool = False,
+    ) -> None:
+        """
+        Return a slot and feed the outcome into the limit.
+
+        Args:
+            latency: Request latency in seconds (None if it failed)
+            overloaded: True for 429/5xx/timeout responses
+        """
+        self._in_flight = max(0, self._in_flight - 1)
+
+        if overloaded:
+            self._decrease("overload response")
+        elif latency is not None:
+            self._on_latency(latency)
+
+        self._wake_waiters()
+
+    def _on_latency(self, latency: float) -> None:
+        """Update baseline and apply additive increase or latency backoff."""
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            self._baseline += self.BASELINE_DRIFT * (latency - self._baseline)
+
+        if latency > self._baseline * self.latency_tolerance:
+            self._decrease(f"latency {latency * 1000:.0f}ms")
+        elif self._in_flight + 1 >= self.limit:
+            # Only grow when the limit is actually the constraint
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def _decrease(self, reason: str) -> None:
+        """Multiplicatively shrink the limit, at most once per baseline RTT."""
+        now = time.monotonic()
+        if now - self._last_decrease < (self._baseline or 0.0):
+            return
+
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        self._last_decrease = now
+        self._decreases += 1
+
+        if self.limit != previous:
+            logger.info(
+                f"📉 Concurrency limit '{self.name}' {previous} → {self.limit} ({reason})"
+            )
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to queued callers in FIFO order."""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def limit(self) -> int:
+        """Get current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Get number of requests holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Get number of callers waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def has_capacity(self) -> bool:
+        """Check if a slot is free right now."""
+        return self._in_flight < self.limit and not self._waiters
+
+    @property
+    def rejections(self) -> int:
+        """Get number of callers rejected after waiting."""
+        return self._rejections
+
+    # =========================================================================
+    # Status Methods
+    # =========================================================================
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get limiter status.
+
+        Returns:
+            Status dictionary for logging/debugging
+        """
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "baseline_ms": (
+                round(self._baseline * 1000, 1) if self._baseline is not None else None
+            ),
+            "decreases": self._decreases,
+            "rejections": self._rejections,
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"AdaptiveConcurrencyLimiter(name='{self.name}', limit={self.limit}, "
+            f"in_flight={self._in_flight}, queued={len(self._waiters)})"
+        )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyLimitExceeded",
+]
@@ -0,0 +1,173 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Latency Tracker for Ash-Bot Service
+---
+FILE VERSION: v5.0-10-5.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Track an exponentially weighted moving average of request latency
+- Keep a bounded window of recent samples for percentile queries
+- Provide latency statistics for routing and status reporting
+
+USAGE:
+    from src.utils import LatencyTracker
+
+    tracker = LatencyTracker(window_size=200, ewma_alpha=0.2)
+    tracker.observe(0.123)
+
+    tracker.ewma              # Smoothed latency in seconds
+    tracker.percentile(0.95)  # p95 over the recent window
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+# Module version
+__version__ = "v5.0-10-5.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Latency Tracker
+# =============================================================================
+
+
+class LatencyTracker:
+    """
+    Rolling latency statistics for one upstream target.
+
+    Keeps an EWMA for cheap, responsive comparisons and a bounded window
+    of raw samples for percentiles. Percentiles sort the window on
+    demand, which is fine for the few hundred samples kept here.
+
+    Attributes:
+        window_size: Number of recent samples kept for percentiles
+        ewma_alpha: Weight of the newest sample in the EWMA (0-1)
+
+    Example:
+        >>> tracker = LatencyTracker()
+        >>> tracker.observe(0.2)
+        >>> tracker.percentile(0.95)
+        0.2
+    """
+
+    DEFAULT_WINDOW_SIZE = 200
+    DEFAULT_EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+    ):
+        """
+        Initialize LatencyTracker.
+
+        Args:
+            window_size: Number of recent samples kept for percentiles
+            ewma_alpha: Weight of the newest sample in the EWMA (0-1)
+        """
+        self.window_size = max(1, window_size)
+        self.ewma_alpha = min(1.0, max(0.01, ewma_alpha))
+
+        self._samples: Deque[float] = deque(maxlen=self.window_size)
+        self._ewma: Optional[float] = None
+        self._total = 0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record one latency sample.
+
+        Args:
+            seconds: Observed latency in seconds
+        """
+        self._samples.append(seconds)
+        self._total += 1
+
+        if self._ewma is None:
+            self._ewma = seconds
+        else:
+            self._ewma += self.ewma_alpha * (seconds - self._ewma)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Get a latency percentile over the recent window.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            Latency in seconds, or None if no samples yet
+        """
+        if not self._samples:
+            return None
+
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
+
+    @property
+    def ewma(self) -> Optional[float]:
+        """Get smoothed latency in seconds (None if no samples yet)."""
+        return self._ewma
+
+    @property
+    def sample_count(self) -> int:
+        """Get number of samples currently in the window."""
+        return len(self._samples)
+
+    @property
+    def total_observed(self) -> int:
+        """Get number of samples observed since creation."""
+        return self._total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get latency statistics.
+
+        Returns:
+            Dictionary with EWMA and percentiles in milliseconds
+        """
+
+        def to_ms(value: Optional[float]) -> Optional[float]:
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "samples": len(self._samples),
+            "ewma_ms": to_ms(self._ewma),
+            "p50_ms": to_ms(self.percentile(0.50)),
+            "p95_ms": to_ms(self.percentile(0.95)),
+            "p99_ms": to_ms(self.percentile(0.99)),
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        ewma = f"{self._ewma * 1000:.1f}ms" if self._ewma is not None else "n/a"
+        return f"LatencyTracker(samples={len(self._samples)}, ewma={ewma})"
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "LatencyTracker",
+]
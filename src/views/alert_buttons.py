@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Alert Button Views for Ash-Bot Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-8-1.0-1
-LAST MODIFIED: 2026-01-05
+FILE VERSION: v5.0-8-1.0-2
+LAST MODIFIED: 2026-01-18
 PHASE: Phase 8 - Metrics & Reporting
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-bot
@@ -39,8 +39,10 @@ from discord.ui import View, Button
 from typing import Optional
 import logging
 
+from src.managers.discord.discord_resolver import resolve_user
+
 # Module version
-__version__ = "v5.0-8-1.0-1"
+__version__ = "v5.0-8-1.0-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -289,7 +291,7 @@ class AlertButtonView(View):
 
         # Get the user to start session with
         try:
-            target_user = await bot.fetch_user(self.user_id)
+            target_user = await resolve_user(bot, self.user_id)
         except discord.NotFound:
             await interaction.response.send_message(
                 "⚠️ Could not find the user. They may have left the server.",
@@ -683,8 +685,8 @@ class PersistentAlertView(View):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            # Fetch user
-            target_user = await bot.fetch_user(user_id)
+            # Resolve user (gateway/resolver cache before REST)
+            target_user = await resolve_user(bot, user_id)
 
             # Start session
             from src.managers.ash import SessionExistsError
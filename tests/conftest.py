@@ -0,0 +1,60 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Shared Test Fixtures for Ash-Bot
+---
+FILE VERSION: v5.0-10-4.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Provide a config manager stand-in backed by plain dictionaries
+
+USAGE:
+    def test_something(make_config):
+        config = make_config({"nlp": {"batch_enabled": True}})
+"""
+
+from typing import Any, Callable, Dict, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+
+@pytest.fixture
+def make_config() -> Callable[[Optional[Dict[str, Dict[str, Any]]]], MagicMock]:
+    """
+    Build a ConfigManager stand-in from section dictionaries.
+
+    get() and get_section() read the given sections; anything missing
+    falls back to the caller's default, as with the real manager.
+    """
+
+    def _make(sections: Optional[Dict[str, Dict[str, Any]]] = None) -> MagicMock:
+        sections = sections or {}
+        config = MagicMock()
+        config.get.side_effect = lambda section, key, default=None: (
+            sections.get(section, {}).get(key, default)
+        )
+        config.get_section.side_effect = lambda section: dict(sections.get(section, {}))
+        return config
+
+    return _make
@@ -0,0 +1,182 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Alert Dispatcher Tests
+---
+FILE VERSION: v5.0-10-20.0-3
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify crisis and escalation alerts both start auto-initiate tracking
+- Verify mirror copies of an alert are registered with auto-initiate
+- Verify a send held past the deadline is still tracked, not failed
+- Verify an alert folded into a storm digest gives back the cooldown
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_alerting/test_alert_dispatcher.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from src.managers.alerting.alert_dispatcher import create_alert_dispatcher
+from src.managers.alerting.alert_storm import AlertStormTracker
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _channel(channel_id: int, sent_id: int) -> MagicMock:
+    """Alert channel whose send() returns a message with sent_id."""
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = channel_id
+    channel.name = f"alerts-{channel_id}"
+    channel.send = AsyncMock(return_value=SimpleNamespace(id=sent_id, channel=channel))
+    return channel
+
+
+@pytest.fixture
+def dispatcher(make_config):
+    """AlertDispatcher with two alert channels and a mocked auto-initiate."""
+    channels = {1: _channel(1, 100), 2: _channel(2, 200)}
+
+    channel_config = MagicMock()
+    channel_config.get_crt_role_ids.return_value = []
+    channel_config.get_alert_channels.return_value = [1, 2]
+
+    cooldown = MagicMock()
+    cooldown.try_acquire = AsyncMock(return_value=True)
+    cooldown.set_cooldown = AsyncMock()
+    cooldown.release_cooldown = AsyncMock()
+
+    manager = create_alert_dispatcher(
+        config_manager=make_config({"alerting": {"storm_enabled": False}}),
+        channel_config=channel_config,
+        embed_builder=MagicMock(),
+        cooldown_manager=cooldown,
+        bot=SimpleNamespace(get_channel=channels.get),
+    )
+    manager.channels = channels
+
+    auto_initiate = MagicMock(is_enabled=True)
+    auto_initiate.track_alert = AsyncMock(return_value=True)
+    auto_initiate.track_mirrors = AsyncMock()
+    manager.set_auto_initiate_manager(auto_initiate)
+    return manager, auto_initiate
+
+
+def _message() -> SimpleNamespace:
+    """Original Discord message stand-in."""
+    return SimpleNamespace(
+        id=10,
+        author=SimpleNamespace(id=42, display_name="someone"),
+        channel=SimpleNamespace(id=9),
+        jump_url="https://discord.com/channels/1/9/10",
+    )
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestAutoInitiateTracking:
+    """Every alert kind gets an auto-initiate timer."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("escalation", [False, True])
+    async def test_alert_is_tracked_with_its_mirrors(self, dispatcher, escalation):
+        manager, auto_initiate = dispatcher
+        message = _message()
+        result = SimpleNamespace(severity="high")
+
+        if escalation:
+            primary = await manager.dispatch_escalation_alert(
+                message, result, history_count=5, trend="escalating"
+            )
+        else:
+            primary = await manager.dispatch_alert(message, result)
+
+        assert primary is not None
+        auto_initiate.track_alert.assert_awaited_once()
+        tracked = auto_initiate.track_alert.await_args.kwargs
+        assert tracked["alert_message"] is primary
+        assert tracked["original_message"] is message
+
+        mirror_id = 200 if primary.id == 100 else 100
+        auto_initiate.track_mirrors.assert_awaited_once_with(primary.id, [mirror_id])
+
+
+class TestSlowSends:
+    """A send that outlasts the deadline is awaited, not written off."""
+
+    @pytest.mark.asyncio
+    async def test_late_send_is_tracked_and_keeps_cooldown(self, dispatcher):
+        manager, auto_initiate = dispatcher
+        manager._send_timeout = 0.01
+        released = asyncio.Event()
+
+        async def rate_limited_send(**kwargs):
+            # Held back by a rate limit well past the deadline
+            await released.wait()
+            return SimpleNamespace(id=100, channel=manager.channels[1])
+
+        manager.channels[1].send = AsyncMock(side_effect=rate_limited_send)
+        manager.channels[2].send = AsyncMock(
+            side_effect=discord.Forbidden(MagicMock(status=403), "no access")
+        )
+
+        dispatch = asyncio.create_task(
+            manager.dispatch_alert(_message(), SimpleNamespace(severity="high"))
+        )
+        await asyncio.sleep(0.05)
+        assert not dispatch.done()
+
+        released.set()
+        primary = await dispatch
+
+        assert primary.id == 100
+        auto_initiate.track_alert.assert_awaited_once()
+        manager._cooldown.release_cooldown.assert_not_awaited()
+        assert manager.get_status()["channel_failures"] == 1
+
+
+class TestStormFolding:
+    """MEDIUM alerts folded into a digest during an alert storm."""
+
+    @pytest.mark.asyncio
+    async def test_folded_alert_releases_cooldown(self, dispatcher):
+        manager, auto_initiate = dispatcher
+        manager._storm = AlertStormTracker(embed_builder=MagicMock(), threshold=2)
+        for channel_id in manager.channels:
+            manager._storm.record(channel_id)
+        result = SimpleNamespace(severity="medium", crisis_score=0.6)
+
+        try:
+            assert await manager.dispatch_alert(_message(), result) is None
+        finally:
+            await manager._storm.close()
+
+        assert manager.get_status()["alerts_folded"] == 1
+        auto_initiate.track_alert.assert_not_awaited()
+        manager._cooldown.release_cooldown.assert_awaited_once_with(42)
@@ -0,0 +1,146 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Auto-Initiate Mirror Alert Tests
+---
+FILE VERSION: v5.0-10-18.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify buttons on a mirror alert copy cancel the tracked alert's timer
+- Verify another replica resolves mirrors through Redis
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_alerting/test_auto_initiate_mirrors.py -v
+"""
+
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+import pytest
+
+from src.managers.alerting.auto_initiate_manager import create_auto_initiate_manager
+
+
+# =============================================================================
+# Stand-ins
+# =============================================================================
+
+
+class FakePipeline:
+    """Applies queued string writes when the block exits."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self.succeeded = True
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self._redis.values[key] = value
+
+    def zadd(self, key: str, score: float, member: str) -> None:
+        pass
+
+    def zrem(self, key: str, member: str) -> None:
+        pass
+
+
+class FakeRedis:
+    """The string-key subset of RedisManager used for pending alerts."""
+
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+        self.is_connected = True
+
+    def pipeline(self, transaction: bool = False) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.values.get(key)
+
+
+def _message(message_id: int, channel_id: int) -> SimpleNamespace:
+    """Minimal discord.Message stand-in."""
+    return SimpleNamespace(id=message_id, channel=SimpleNamespace(id=channel_id))
+
+
+@pytest.fixture
+def make_manager(make_config):
+    """Build an AutoInitiateManager (no scheduler, no Ash managers)."""
+
+    def _make(redis: Optional[FakeRedis] = None):
+        config = make_config({"auto_initiate": {"enabled": True, "delay_minutes": 3}})
+        return create_auto_initiate_manager(
+            config_manager=config,
+            redis_manager=redis,
+            bot=SimpleNamespace(),
+        )
+
+    return _make
+
+
+async def _track_with_mirrors(manager) -> None:
+    """Track alert 100 (channel 1) with copies 200 and 300 elsewhere."""
+    await manager.track_alert(
+        alert_message=_message(100, 1),
+        user_id=42,
+        severity="high",
+        original_message=_message(10, 9),
+    )
+    await manager.track_mirrors(100, [200, 300])
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestMirrorAcknowledge:
+    """Acknowledging any copy of a multi-channel alert."""
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_on_mirror_cancels_tracked_alert(self, make_manager):
+        manager = make_manager()
+        await _track_with_mirrors(manager)
+
+        assert await manager.cancel_alert(300, reason="button_clicked")
+        assert manager.pending_count == 0
+
+        # Already handled: the other copies find nothing left to cancel
+        assert not await manager.cancel_alert(200)
+        assert not await manager.cancel_alert(100)
+
+    @pytest.mark.asyncio
+    async def test_mirror_resolves_through_redis_on_other_replica(self, make_manager):
+        redis = FakeRedis()
+        await _track_with_mirrors(make_manager(redis))
+
+        other = make_manager(redis)
+        assert await other.cancel_alert(200, reason="button_clicked")
+
+    @pytest.mark.asyncio
+    async def test_unknown_message_is_not_cancelled(self, make_manager):
+        manager = make_manager()
+        await _track_with_mirrors(manager)
+
+        assert not await manager.cancel_alert(999)
+        assert manager.pending_count == 1
@@ -0,0 +1,122 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Cooldown Backend Tests
+---
+FILE VERSION: v5.0-10-15.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify the backend interface cannot be instantiated half-implemented
+- Verify Redis cooldown counts and snapshots read Redis, not the local cache
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_alerting/test_cooldown_backends.py -v
+"""
+
+import time
+from fnmatch import fnmatch
+from typing import Dict, List, Optional
+
+import pytest
+
+from src.managers.alerting.cooldown_backends import (
+    REDIS_KEY_PREFIX,
+    CooldownBackend,
+    RedisCooldownBackend,
+)
+
+
+# =============================================================================
+# Redis Stand-in
+# =============================================================================
+
+
+class FakeRedis:
+    """The string-key subset of RedisManager used by the cooldown backend."""
+
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+        self.is_connected = True
+
+    def register_script(self, name: str, script: str) -> None:
+        pass
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
+        self.values[key] = value
+        return True
+
+    async def scan_iter(self, pattern: str) -> List[str]:
+        return [key for key in self.values if fnmatch(key, pattern)]
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [self.values.get(key) for key in keys]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestCooldownBackendInterface:
+    """The abstract backend interface."""
+
+    def test_partial_backend_cannot_be_created(self):
+        class Partial(CooldownBackend):
+            async def acquire(self, user_id: int, duration_seconds: int) -> bool:
+                return True
+
+        with pytest.raises(TypeError):
+            Partial()
+
+
+class TestRedisCooldownReads:
+    """Counts and snapshots come from Redis, shared by every replica."""
+
+    @pytest.mark.asyncio
+    async def test_counts_cooldowns_set_by_other_replicas(self):
+        redis = FakeRedis()
+        mine = RedisCooldownBackend(redis)
+        other = RedisCooldownBackend(redis)
+
+        await mine.set(1, 300)
+        await other.set(2, 300)
+
+        assert await mine.active_count() == 2
+        assert set(await mine.snapshot()) == {1, 2}
+        assert mine.get_status()["cached_cooldowns"] == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_skips_expired_and_unparseable_values(self):
+        redis = FakeRedis()
+        backend = RedisCooldownBackend(redis)
+        redis.values[f"{REDIS_KEY_PREFIX}1"] = f"{time.time() + 300:.3f}"
+        redis.values[f"{REDIS_KEY_PREFIX}2"] = f"{time.time() - 1:.3f}"
+        redis.values[f"{REDIS_KEY_PREFIX}3"] = "garbage"
+
+        assert list(await backend.snapshot()) == [1]
+
+    @pytest.mark.asyncio
+    async def test_disconnected_redis_falls_back_to_local_cache(self):
+        redis = FakeRedis()
+        backend = RedisCooldownBackend(redis)
+        await backend.set(1, 300)
+        redis.values[f"{REDIS_KEY_PREFIX}2"] = f"{time.time() + 300:.3f}"
+
+        redis.is_connected = False
+        assert await backend.active_count() == 1
+        assert list(await backend.snapshot()) == [1]
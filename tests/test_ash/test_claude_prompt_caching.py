@@ -0,0 +1,168 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Claude Prompt Caching Tests
+---
+FILE VERSION: v5.0-10-22.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Run ClaudeClientManager against a stub Anthropic client
+- Verify cache_control sits on the system prompt and the newest message
+- Verify cache read/write tokens are counted apart from input tokens
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_ash/test_claude_prompt_caching.py -v
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.managers.ash.claude_client_manager import create_claude_client_manager
+
+
+# =============================================================================
+# Anthropic Stand-in
+# =============================================================================
+
+CACHED = {"type": "ephemeral"}
+
+
+class StubMessages:
+    """messages.create() that records requests and returns canned usage."""
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+        self.usages: List[Dict[str, int]] = []
+
+    async def create(self, **request: Any) -> SimpleNamespace:
+        self.requests.append(request)
+        usage = self.usages.pop(0) if self.usages else {}
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="hi, I'm here")],
+            usage=SimpleNamespace(
+                input_tokens=usage.get("input", 0),
+                output_tokens=usage.get("output", 0),
+                cache_read_input_tokens=usage.get("cache_read", 0),
+                cache_creation_input_tokens=usage.get("cache_write", 0),
+            ),
+        )
+
+
+@pytest.fixture
+def make_claude(make_config):
+    """Build a ClaudeClientManager around a StubMessages client."""
+
+    def _make(prompt_caching: bool = True):
+        stub = StubMessages()
+        claude = create_claude_client_manager(
+            config_manager=make_config({"ash": {"prompt_caching": prompt_caching}}),
+            secrets_manager=MagicMock(),
+            metrics_manager=MagicMock(),
+            client=SimpleNamespace(messages=stub),
+        )
+        return claude, stub
+
+    return _make
+
+
+CONVERSATION = [
+    {"role": "user", "content": "rough day"},
+    {"role": "assistant", "content": "I'm sorry. Want to talk about it?"},
+    {"role": "user", "content": "yeah"},
+]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestCacheBreakpoints:
+    """cache_control placement in the request sent to the API."""
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_and_newest_message_are_cached(self, make_claude):
+        claude, stub = make_claude()
+
+        await claude.create_message("You are Ash.", CONVERSATION, context="Summary: ...")
+        request = stub.requests[0]
+
+        assert request["system"] == [
+            {"type": "text", "text": "You are Ash.", "cache_control": CACHED},
+            {"type": "text", "text": "Summary: ..."},
+        ]
+
+        messages = request["messages"]
+        assert messages[:2] == CONVERSATION[:2]
+        assert messages[-1] == {
+            "role": "user",
+            "content": [{"type": "text", "text": "yeah", "cache_control": CACHED}],
+        }
+
+        # The caller's history is left as it was
+        assert CONVERSATION[-1] == {"role": "user", "content": "yeah"}
+
+    @pytest.mark.asyncio
+    async def test_block_content_marks_only_its_last_block(self, make_claude):
+        claude, stub = make_claude()
+        blocks = [{"type": "text", "text": "one"}, {"type": "text", "text": "two"}]
+
+        await claude.create_message("You are Ash.", [{"role": "user", "content": blocks}])
+        sent = stub.requests[0]["messages"][-1]["content"]
+
+        assert "cache_control" not in sent[0]
+        assert sent[1]["cache_control"] == CACHED
+        assert "cache_control" not in blocks[1]
+
+    @pytest.mark.asyncio
+    async def test_caching_disabled_sends_plain_strings(self, make_claude):
+        claude, stub = make_claude(prompt_caching=False)
+
+        await claude.create_message("You are Ash.", CONVERSATION, context="Summary: ...")
+        request = stub.requests[0]
+
+        assert request["system"] == "You are Ash.\n\nSummary: ..."
+        assert request["messages"] == CONVERSATION
+
+
+class TestCacheUsageAccounting:
+    """Token counts from the response usage block."""
+
+    @pytest.mark.asyncio
+    async def test_cache_reads_and_writes_are_counted(self, make_claude):
+        claude, stub = make_claude()
+        stub.usages = [
+            {"input": 20, "output": 30, "cache_write": 1000},
+            {"input": 10, "output": 25, "cache_read": 1000, "cache_write": 60},
+        ]
+
+        await claude.create_message("You are Ash.", CONVERSATION[:1])
+        await claude.create_message("You are Ash.", CONVERSATION)
+
+        stats = claude.get_stats()
+        assert stats["input_tokens"] == 30
+        assert stats["total_tokens_used"] == 55
+        assert stats["cache_write_tokens"] == 1060
+        assert stats["cache_read_tokens"] == 1000
+        assert stats["cache_hit_ratio"] == round(1000 / 2090, 3)
+
+        claude._metrics.inc_claude_tokens.assert_any_call("cache_read", 1000)
+        claude._metrics.inc_claude_tokens.assert_any_call("cache_write", 60)
@@ -0,0 +1,201 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Claude Scheduler Tests
+---
+FILE VERSION: v5.0-10-25.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify waiting requests are admitted strictly by priority, with one slot
+  held back for urgent requests
+- Verify the per-minute token budget holds requests back
+- Verify a request cancelled just as it was admitted gives its slot back
+- Verify transient failures are retried and client errors are not
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_ash/test_claude_scheduler.py -v
+"""
+
+import asyncio
+from typing import List
+
+import anthropic
+import httpx
+import pytest
+
+from src.managers.ash import claude_scheduler
+from src.managers.ash.claude_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_FOLLOWUP,
+    PRIORITY_NORMAL,
+    PRIORITY_URGENT,
+    ClaudeScheduler,
+)
+
+
+# =============================================================================
+# Stand-ins
+# =============================================================================
+
+_REQUEST = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+
+
+def _status_error(status: int) -> anthropic.APIStatusError:
+    """API error for an HTTP status, as the SDK would raise it."""
+    response = httpx.Response(status, request=_REQUEST)
+    return anthropic.APIStatusError(f"HTTP {status}", response=response, body=None)
+
+
+class Holder:
+    """A request that keeps its slot until released."""
+
+    def __init__(self, scheduler: ClaudeScheduler, priority: int = PRIORITY_NORMAL):
+        self.released = asyncio.Event()
+        self.task = asyncio.create_task(scheduler.run(self._call, priority))
+
+    async def _call(self) -> str:
+        await self.released.wait()
+        return "done"
+
+    async def finish(self) -> None:
+        self.released.set()
+        await self.task
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestAdmission:
+    """Slots and priority order."""
+
+    @pytest.mark.asyncio
+    async def test_waiting_requests_start_by_priority(self):
+        scheduler = ClaudeScheduler(max_concurrent=1, tokens_per_minute=0)
+        holder = Holder(scheduler)
+        await asyncio.sleep(0)
+
+        order: List[int] = []
+
+        async def request(priority: int) -> None:
+            async def call() -> None:
+                order.append(priority)
+
+            await scheduler.run(call, priority)
+
+        priorities = [PRIORITY_BACKGROUND, PRIORITY_FOLLOWUP, PRIORITY_NORMAL, PRIORITY_URGENT]
+        waiting = [asyncio.create_task(request(p)) for p in priorities]
+        await asyncio.sleep(0)
+        assert scheduler.depth == 4
+
+        await holder.finish()
+        await asyncio.gather(*waiting)
+
+        assert order == sorted(priorities)
+
+    @pytest.mark.asyncio
+    async def test_one_slot_is_held_back_for_urgent(self):
+        scheduler = ClaudeScheduler(max_concurrent=2, tokens_per_minute=0)
+        normal = Holder(scheduler)
+        queued = Holder(scheduler)
+        urgent = Holder(scheduler, PRIORITY_URGENT)
+        await asyncio.sleep(0)
+
+        assert scheduler.in_flight == 2
+        assert scheduler.get_status()["depth_by_priority"]["normal"] == 1
+
+        for holder in (urgent, normal, queued):
+            await holder.finish()
+        assert scheduler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_admitted_releases_the_slot(self):
+        scheduler = ClaudeScheduler(max_concurrent=1, tokens_per_minute=0)
+        await scheduler._acquire(PRIORITY_NORMAL, 0)
+
+        waiter = asyncio.create_task(scheduler._acquire(PRIORITY_NORMAL, 0))
+        await asyncio.sleep(0)
+
+        # The slot passes to the waiter, which is cancelled before it resumes
+        scheduler._release()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert scheduler.in_flight == 0
+        assert await scheduler.run(lambda: asyncio.sleep(0, "ok")) == "ok"
+
+
+class TestTokenBudget:
+    """Per-minute estimated token budget."""
+
+    @pytest.mark.asyncio
+    async def test_request_waits_for_budget(self, monkeypatch):
+        monkeypatch.setattr(claude_scheduler, "TOKEN_WINDOW_SECONDS", 0.2)
+        scheduler = ClaudeScheduler(max_concurrent=4, tokens_per_minute=1000)
+
+        await scheduler.run(lambda: asyncio.sleep(0), estimated_tokens=800)
+        second = asyncio.create_task(
+            scheduler.run(lambda: asyncio.sleep(0, "ok"), estimated_tokens=400)
+        )
+        await asyncio.sleep(0.05)
+
+        assert not second.done()
+        assert scheduler.get_status()["tokens_in_window"] == 800
+
+        assert await asyncio.wait_for(second, timeout=1.0) == "ok"
+
+
+class TestRetries:
+    """Which failures are retried."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [anthropic.APIConnectionError(request=_REQUEST), _status_error(500), _status_error(408)],
+    )
+    async def test_transient_failure_is_retried(self, monkeypatch, error):
+        monkeypatch.setattr(claude_scheduler, "calculate_delay", lambda attempt, config: 0.01)
+        scheduler = ClaudeScheduler(tokens_per_minute=0)
+        attempts: List[int] = []
+
+        async def call() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise error
+            return "ok"
+
+        assert await scheduler.run(call) == "ok"
+        assert len(attempts) == 2
+        assert scheduler.get_status()["retried"] == 1
+        assert not scheduler.is_paused
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(self):
+        scheduler = ClaudeScheduler(tokens_per_minute=0)
+        attempts: List[int] = []
+
+        async def call() -> str:
+            attempts.append(1)
+            raise _status_error(400)
+
+        with pytest.raises(anthropic.APIStatusError):
+            await scheduler.run(call)
+        assert len(attempts) == 1
+        assert scheduler.in_flight == 0
@@ -0,0 +1,238 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Reply Stream Tests
+---
+FILE VERSION: v5.0-10-21.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify long replies split at the best boundary inside the limit
+- Verify finish() posts, edits and trims messages to match the final text
+- Verify a failed streamed update still ends with the full reply posted
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_ash/test_reply_stream.py -v
+"""
+
+import asyncio
+from typing import Callable, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from src.managers.ash.reply_stream import ReplyStream, split_message
+from src.managers.discord.outbound_queue import PRIORITY_DM, ROUTE_DM
+
+
+# =============================================================================
+# Stand-ins
+# =============================================================================
+
+
+class FakeMessage:
+    """Posted Discord message that records edits and deletion."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.edits: List[str] = []
+        self.deleted = False
+
+    async def edit(self, content: str) -> "FakeMessage":
+        self.content = content
+        self.edits.append(content)
+        return self
+
+    async def delete(self) -> None:
+        self.deleted = True
+
+
+class FakeChannel:
+    """Channel whose sends return FakeMessages; fail_sends raises instead."""
+
+    def __init__(self):
+        self.sent: List[FakeMessage] = []
+        self.fail_sends = 0
+
+    async def send(self, content: str) -> FakeMessage:
+        if self.fail_sends:
+            self.fail_sends -= 1
+            raise discord.DiscordException("send failed")
+        message = FakeMessage(content)
+        self.sent.append(message)
+        return message
+
+
+async def _until(predicate: Callable[[], bool], timeout: float = 1.0) -> None:
+    """Yield to the render loop until predicate holds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "render never happened"
+        await asyncio.sleep(0.01)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def channel() -> FakeChannel:
+    """Channel the reply is posted in."""
+    return FakeChannel()
+
+
+@pytest.fixture
+def make_stream(channel):
+    """Build a ReplyStream on the fake channel without an edit delay."""
+
+    def _make(max_length: int = 2000, outbound_queue: Optional[MagicMock] = None):
+        return ReplyStream(
+            channel,
+            edit_interval=0.0,
+            max_length=max_length,
+            outbound_queue=outbound_queue,
+        )
+
+    return _make
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestSplitMessage:
+    """Splitting text into Discord-sized chunks."""
+
+    def test_short_text_is_one_chunk(self):
+        assert split_message("  Hello there.  ", limit=100) == ["Hello there."]
+
+    def test_blank_text_has_no_chunks(self):
+        assert split_message("   \n ", limit=100) == []
+
+    def test_prefers_paragraph_break(self):
+        first = "a" * 60 + ". " + "b" * 10
+        text = first + "\n\n" + "c" * 50
+
+        assert split_message(text, limit=100) == [first, "c" * 50]
+
+    def test_falls_back_to_word_break(self):
+        words = " ".join(["word"] * 30)
+
+        chunks = split_message(words, limit=50)
+
+        assert all(len(chunk) <= 50 for chunk in chunks)
+        assert all(not chunk.startswith(" ") and not chunk.endswith(" ") for chunk in chunks)
+        assert " ".join(chunks) == words
+
+    def test_break_before_half_limit_is_ignored(self):
+        text = "a" * 10 + " " + "b" * 150
+
+        assert split_message(text, limit=100) == ["a" * 10 + " " + "b" * 89, "b" * 61]
+
+    def test_hard_cut_without_boundaries(self):
+        chunks = split_message("x" * 250, limit=100)
+
+        assert chunks == ["x" * 100, "x" * 100, "x" * 50]
+
+
+class TestReplyStreamFinish:
+    """Rendering the final reply."""
+
+    @pytest.mark.asyncio
+    async def test_finish_posts_text(self, make_stream, channel):
+        stream = make_stream()
+
+        messages = await stream.finish("I'm here with you.")
+
+        assert [m.content for m in channel.sent] == ["I'm here with you."]
+        assert messages == channel.sent
+        assert stream.posted is True
+        assert stream.first_visible_seconds is not None
+
+    @pytest.mark.asyncio
+    async def test_finish_splits_long_text(self, make_stream, channel):
+        stream = make_stream(max_length=100)
+        text = " ".join(["word"] * 50)
+
+        messages = await stream.finish(text)
+
+        assert len(messages) == 3
+        assert all(len(m.content) <= 100 for m in messages)
+        assert " ".join(m.content for m in messages) == text
+
+    @pytest.mark.asyncio
+    async def test_finish_edits_streamed_message(self, make_stream, channel):
+        stream = make_stream()
+        stream.feed("Hi there. I'm")
+        await _until(lambda: channel.sent)
+
+        assert channel.sent[0].content == "Hi there."
+
+        messages = await stream.finish("Hi there. I'm here with you.")
+
+        assert len(channel.sent) == 1
+        assert messages == channel.sent
+        assert channel.sent[0].edits == ["Hi there. I'm here with you."]
+
+    @pytest.mark.asyncio
+    async def test_finish_deletes_surplus_messages(self, make_stream, channel):
+        stream = make_stream(max_length=100)
+        stream.feed(" ".join(["word"] * 40) + " more")
+        await _until(lambda: len(channel.sent) == 2)
+
+        messages = await stream.finish("Short answer.")
+
+        assert [m.content for m in messages] == ["Short answer."]
+        assert channel.sent[1].deleted is True
+
+    @pytest.mark.asyncio
+    async def test_finish_unchanged_text_does_not_edit(self, make_stream, channel):
+        stream = make_stream()
+        stream.feed("Hi there. ")
+        await _until(lambda: channel.sent)
+
+        await stream.finish("Hi there.")
+
+        assert channel.sent[0].edits == []
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_update_still_posts_final(self, make_stream, channel):
+        stream = make_stream()
+        channel.fail_sends = 1
+        stream.feed("Hi there. ")
+        await asyncio.sleep(0.05)
+        assert stream.posted is False
+
+        messages = await stream.finish("Hi there. I'm here with you.")
+
+        assert [m.content for m in messages] == ["Hi there. I'm here with you."]
+
+    @pytest.mark.asyncio
+    async def test_finish_sends_through_outbound_queue(self, make_stream, channel):
+        queue = MagicMock()
+        queue.send = AsyncMock(return_value=FakeMessage("Hello."))
+        stream = make_stream(outbound_queue=queue)
+
+        await stream.finish("Hello.")
+
+        queue.send.assert_awaited_once_with(
+            channel, PRIORITY_DM, "Hello.", route_kind=ROUTE_DM
+        )
+        assert channel.sent == []
@@ -0,0 +1,178 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+============================================================================
+Analysis Queue Tests
+---
+FILE VERSION: v5.0-10-1.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify classes are served by weighted round-robin (8:4:1 by default)
+- Verify users take turns within a class
+- Verify a full queue evicts lower classes before applying its policy
+- Verify the drop_oldest and drop_newest overflow policies
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_discord/test_analysis_queue.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from src.managers.discord.analysis_queue import (
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    PRIORITY_ELEVATED,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    AnalysisQueue,
+    create_analysis_queue,
+)
+from src.managers.discord.burst_coalescer import MessageBurst
+
+
+# =============================================================================
+# Stand-ins
+# =============================================================================
+
+_CHANNEL = SimpleNamespace(id=2, name="general")
+
+
+def _burst(
+    message_id: int,
+    priority_class: str = PRIORITY_NORMAL,
+    user_id: int = 1,
+) -> MessageBurst:
+    """One-message burst; the priority class rides in the message content."""
+    message = SimpleNamespace(
+        id=message_id,
+        content=priority_class,
+        author=SimpleNamespace(id=user_id),
+        channel=_CHANNEL,
+    )
+    return MessageBurst(messages=[message])
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def make_queue(make_config):
+    """Build a one-worker AnalysisQueue that records the order of analysis."""
+
+    def _make(**settings) -> AnalysisQueue:
+        processed: List[int] = []
+
+        async def handler(burst: MessageBurst) -> None:
+            processed.append(burst.anchor.id)
+
+        queue = create_analysis_queue(
+            config_manager=make_config({"analysis_queue": {"worker_count": 1, **settings}}),
+            handler=handler,
+            classifier=lambda burst: burst.anchor.content,
+        )
+        queue.processed = processed
+        return queue
+
+    return _make
+
+
+async def _drain(queue: AnalysisQueue, count: int) -> List[int]:
+    """Run the workers until count bursts were analyzed."""
+    queue.start()
+    try:
+        while len(queue.processed) < count:
+            await asyncio.sleep(0.01)
+    finally:
+        await queue.stop()
+    return queue.processed
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestScheduling:
+    """Order in which queued bursts are analyzed."""
+
+    @pytest.mark.asyncio
+    async def test_weighted_round_robin_across_classes(self, make_queue):
+        queue = make_queue()
+        classes = {}
+        for message_id in range(1, 61):
+            priority_class = (PRIORITY_HIGH, PRIORITY_ELEVATED, PRIORITY_NORMAL)[message_id % 3]
+            classes[message_id] = priority_class
+            queue.submit(_burst(message_id, priority_class))
+
+        order = await _drain(queue, 26)
+
+        served = [classes[message_id] for message_id in order[:26]]
+        round_ = [PRIORITY_HIGH] * 8 + [PRIORITY_ELEVATED] * 4 + [PRIORITY_NORMAL]
+        assert served == round_ * 2
+
+    @pytest.mark.asyncio
+    async def test_users_take_turns_within_a_class(self, make_queue):
+        queue = make_queue()
+        for message_id, user_id in [(1, 10), (2, 10), (3, 10), (4, 20), (5, 30)]:
+            queue.submit(_burst(message_id, user_id=user_id))
+
+        assert await _drain(queue, 5) == [1, 4, 5, 2, 3]
+
+
+class TestOverflow:
+    """What a full queue drops."""
+
+    @pytest.mark.parametrize("policy", [OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST])
+    def test_full_queue_evicts_lower_class_first(self, make_queue, policy):
+        queue = make_queue(max_size=2, overflow_policy=policy)
+        queue.submit(_burst(1, PRIORITY_NORMAL))
+        queue.submit(_burst(2, PRIORITY_ELEVATED))
+
+        assert queue.submit(_burst(3, PRIORITY_HIGH))
+
+        status = queue.get_status()
+        assert status["depth_by_class"] == {
+            PRIORITY_HIGH: 1, PRIORITY_ELEVATED: 1, PRIORITY_NORMAL: 0
+        }
+        assert status["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_makes_room(self, make_queue):
+        queue = make_queue(max_size=2, overflow_policy=OVERFLOW_DROP_OLDEST)
+        for message_id in (1, 2, 3):
+            assert queue.submit(_burst(message_id))
+
+        assert queue.dropped == 1
+        assert await _drain(queue, 2) == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_rejects_incoming(self, make_queue):
+        queue = make_queue(max_size=2, overflow_policy=OVERFLOW_DROP_NEWEST)
+        for message_id in (1, 2):
+            assert queue.submit(_burst(message_id))
+
+        assert not queue.submit(_burst(3))
+        # A higher class still displaces lower-class work
+        assert queue.submit(_burst(4, PRIORITY_HIGH))
+
+        assert queue.dropped == 2
+        assert await _drain(queue, 2) == [4, 2]
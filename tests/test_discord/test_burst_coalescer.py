@@ -0,0 +1,144 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+============================================================================
+Burst Coalescer Tests
+---
+FILE VERSION: v5.0-10-2.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify a burst is flushed once its quiet window passes
+- Verify a steady stream is flushed at the maximum burst age
+- Verify a burst is flushed as soon as it reaches the size cap
+- Verify users and channels get separate bursts
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_discord/test_burst_coalescer.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from src.managers.discord.burst_coalescer import (
+    BurstCoalescer,
+    MessageBurst,
+    create_burst_coalescer,
+)
+
+
+# =============================================================================
+# Stand-ins
+# =============================================================================
+
+_CHANNEL = SimpleNamespace(id=2, name="general")
+
+
+def _message(message_id: int, user_id: int = 1, channel=_CHANNEL) -> SimpleNamespace:
+    """Monitored message stand-in."""
+    return SimpleNamespace(
+        id=message_id,
+        content=f"message {message_id}",
+        author=SimpleNamespace(id=user_id),
+        channel=channel,
+    )
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def make_coalescer(make_config):
+    """Build a BurstCoalescer that collects flushed bursts."""
+
+    def _make(**settings) -> BurstCoalescer:
+        flushed: List[MessageBurst] = []
+        coalescer = create_burst_coalescer(
+            config_manager=make_config({"burst_coalescing": settings}),
+            on_flush=flushed.append,
+        )
+        coalescer.flushed = flushed
+        return coalescer
+
+    return _make
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestBurstFlush:
+    """When a pending burst is handed on for analysis."""
+
+    @pytest.mark.asyncio
+    async def test_quiet_window_ends_burst(self, make_coalescer):
+        coalescer = make_coalescer(window_seconds=0.1, max_window_seconds=5.0)
+        coalescer.add(_message(1))
+        await asyncio.sleep(0.05)
+        coalescer.add(_message(2))
+
+        # Second message restarted the window
+        await asyncio.sleep(0.07)
+        assert coalescer.flushed == []
+
+        await asyncio.sleep(0.1)
+        assert len(coalescer.flushed) == 1
+        burst = coalescer.flushed[0]
+        assert burst.message_ids == ["1", "2"]
+        assert burst.content == "message 1\nmessage 2"
+        assert burst.anchor.id == 2
+
+    @pytest.mark.asyncio
+    async def test_max_age_flushes_steady_stream(self, make_coalescer):
+        coalescer = make_coalescer(window_seconds=0.1, max_window_seconds=0.25)
+
+        message_id = 0
+        while not coalescer.flushed:
+            message_id += 1
+            coalescer.add(_message(message_id))
+            await asyncio.sleep(0.05)
+
+        assert coalescer.flushed[0].age_seconds < 0.35
+        assert 2 < coalescer.flushed[0].size < message_id + 1
+
+    @pytest.mark.asyncio
+    async def test_size_cap_flushes_immediately(self, make_coalescer):
+        coalescer = make_coalescer(max_messages=3)
+        for message_id in range(1, 5):
+            coalescer.add(_message(message_id))
+
+        assert [b.message_ids for b in coalescer.flushed] == [["1", "2", "3"]]
+        assert coalescer.pending_count == 1
+        assert coalescer.get_status()["messages_coalesced"] == 2
+        coalescer.discard_all()
+
+    @pytest.mark.asyncio
+    async def test_users_and_channels_are_separate(self, make_coalescer):
+        coalescer = make_coalescer(window_seconds=0.05)
+        other_channel = SimpleNamespace(id=3, name="vent")
+
+        coalescer.add(_message(1, user_id=1))
+        coalescer.add(_message(2, user_id=2))
+        coalescer.add(_message(3, user_id=1, channel=other_channel))
+        assert coalescer.pending_count == 3
+
+        assert coalescer.flush_all() == 3
+        assert sorted(b.anchor.id for b in coalescer.flushed) == [1, 2, 3]
@@ -0,0 +1,232 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Deferred Analysis Queue Tests
+---
+FILE VERSION: v5.0-10-7.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify replayed entries leave the queue
+- Verify transient replay failures keep the entry and pause draining
+- Verify entries are dropped once gone or retried too often
+- Verify a replayed burst carries its entry and is deferred again when its
+  analysis does not finish
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_discord/test_deferred_queue.py -v
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.managers.discord.burst_coalescer import MessageBurst
+from src.managers.discord.deferred_queue import (
+    DeferredAnalysis,
+    DeferredAnalysisQueue,
+)
+from src.managers.discord.discord_manager import DiscordManager
+
+
+# =============================================================================
+# Redis Stand-in
+# =============================================================================
+
+
+class FakeSortedSets:
+    """The sorted-set subset of RedisManager used by the deferred queue."""
+
+    def __init__(self):
+        self.sets: Dict[str, Dict[str, float]] = {}
+
+    async def zadd_capped(self, key: str, score: float, member: str, max_size: int) -> int:
+        zset = self.sets.setdefault(key, {})
+        zset[member] = score
+        trimmed = 0
+        while len(zset) > max_size:
+            del zset[min(zset, key=zset.get)]
+            trimmed += 1
+        return trimmed
+
+    async def zpopmin(self, key: str, count: int = 1) -> List[Tuple[str, float]]:
+        zset = self.sets.get(key, {})
+        items = sorted(zset.items(), key=lambda item: item[1])[:count]
+        for member, _ in items:
+            del zset[member]
+        return items
+
+    async def zcard(self, key: str) -> int:
+        return len(self.sets.get(key, {}))
+
+    def entries(self) -> List[DeferredAnalysis]:
+        return [
+            DeferredAnalysis.from_json(member)
+            for zset in self.sets.values()
+            for member in zset
+        ]
+
+
+def _entry(message_id: int, attempts: int = 1) -> DeferredAnalysis:
+    return DeferredAnalysis(
+        message_ids=[str(message_id)],
+        guild_id=1,
+        channel_id=2,
+        user_id=3,
+        content=f"message {message_id}",
+        created_at=time.time() - 60 + message_id,
+        attempts=attempts,
+    )
+
+
+def _queue(redis: FakeSortedSets, replay, max_attempts: int = 3) -> DeferredAnalysisQueue:
+    return DeferredAnalysisQueue(
+        redis_manager=redis,
+        replay=replay,
+        capacity=lambda: 100,
+        max_attempts=max_attempts,
+    )
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestDeferredAnalysisQueue:
+    """Drain behaviour of the deferred analysis queue."""
+
+    @pytest.mark.asyncio
+    async def test_replayed_entries_leave_the_queue(self):
+        redis = FakeSortedSets()
+        replayed: List[str] = []
+
+        async def replay(entry: DeferredAnalysis) -> bool:
+            replayed.append(entry.content)
+            return True
+
+        queue = _queue(redis, replay)
+        for message_id in (1, 2):
+            await queue.defer(_entry(message_id))
+
+        assert await queue.drain(10) == 2
+        assert replayed == ["message 1", "message 2"]
+        assert redis.entries() == []
+        assert queue.get_status()["replayed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_keeps_entry_and_pauses(self):
+        redis = FakeSortedSets()
+        calls: List[str] = []
+
+        async def replay(entry: DeferredAnalysis) -> bool:
+            calls.append(entry.anchor_id)
+            raise ConnectionError("Discord 503")
+
+        queue = _queue(redis, replay)
+        for message_id in (1, 2):
+            await queue.defer(_entry(message_id))
+
+        # Stops after the first failure instead of burning through the queue
+        assert await queue.drain(10) == 1
+        assert calls == ["1"]
+
+        kept = {entry.anchor_id: entry.attempts for entry in redis.entries()}
+        assert kept == {"1": 2, "2": 1}
+
+        status = queue.get_status()
+        assert status["retried"] == 1
+        assert status["dropped"] == 0
+        assert status["paused_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_gone_entries_are_dropped(self):
+        redis = FakeSortedSets()
+
+        async def replay(entry: DeferredAnalysis) -> bool:
+            return False  # Channel or messages deleted
+
+        queue = _queue(redis, replay)
+        await queue.defer(_entry(1))
+
+        assert await queue.drain(10) == 1
+        assert redis.entries() == []
+        assert queue.get_status()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_dropped_after_max_attempts(self):
+        redis = FakeSortedSets()
+
+        async def replay(entry: DeferredAnalysis) -> bool:
+            raise ConnectionError("Discord 503")
+
+        queue = _queue(redis, replay, max_attempts=2)
+        await queue.defer(_entry(1))
+
+        await queue.drain(1)  # attempt 1 fails -> kept with attempts=2
+        assert [entry.attempts for entry in redis.entries()] == [2]
+
+        await queue.drain(1)  # attempt 2 fails -> over max_attempts
+        assert redis.entries() == []
+        assert queue.get_status()["dropped"] == 1
+
+
+class TestReplayedAnalysis:
+    """A replayed burst going through DiscordManager's analysis pipeline."""
+
+    @staticmethod
+    def _manager(analyze: AsyncMock, deferrable: bool = False) -> DiscordManager:
+        manager = DiscordManager.__new__(DiscordManager)
+        manager.user_history = None
+        manager.channel_config = MagicMock()
+        manager.nlp_client = MagicMock(analyze_message=analyze)
+        manager.nlp_client.is_deferrable.return_value = deferrable
+        manager._deferred_queue = MagicMock(defer=AsyncMock(return_value=True))
+        return manager
+
+    @staticmethod
+    def _burst(entry: DeferredAnalysis) -> MessageBurst:
+        anchor = SimpleNamespace(
+            id=1,
+            guild=SimpleNamespace(id=1),
+            channel=SimpleNamespace(id=2),
+            author=SimpleNamespace(id=3),
+        )
+        return MessageBurst(messages=[anchor], text=entry.content, deferred=entry)
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_defers_entry_again(self):
+        manager = self._manager(AsyncMock(side_effect=RuntimeError("boom")))
+        entry = _entry(1, attempts=2)
+
+        await manager._analyze_and_process(self._burst(entry))
+
+        manager._deferred_queue.defer.assert_awaited_once_with(entry)
+        assert entry.attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_nlp_outage_defers_entry_once(self):
+        manager = self._manager(AsyncMock(return_value=MagicMock()), deferrable=True)
+        entry = _entry(1, attempts=2)
+
+        await manager._analyze_and_process(self._burst(entry))
+
+        manager._deferred_queue.defer.assert_awaited_once_with(entry)
+        assert entry.attempts == 3
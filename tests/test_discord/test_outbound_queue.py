@@ -0,0 +1,127 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Outbound Queue Tests
+---
+FILE VERSION: v5.0-10-17.0-2
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify discord.RateLimited is counted as a 429 and the call retried
+- Verify the Discord client is configured to raise RateLimited
+- Verify critical calls survive their caller giving up, and other
+  abandoned calls are dropped and counted
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_discord/test_outbound_queue.py -v
+"""
+
+import asyncio
+from typing import List
+
+import discord
+import pytest
+
+from src.managers.discord.outbound_queue import (
+    MIN_RATELIMIT_TIMEOUT,
+    PRIORITY_ALERT,
+    PRIORITY_CRITICAL,
+    PRIORITY_DM,
+    OutboundQueue,
+    get_max_ratelimit_timeout,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+async def outbound():
+    """A started OutboundQueue, stopped after the test."""
+    queue = OutboundQueue(max_retries=2)
+    queue.start()
+    yield queue
+    await queue.stop()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestRateLimited:
+    """429s surfaced by discord.py as RateLimited."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_counted_and_retried(self, outbound):
+        attempts: List[int] = []
+
+        async def call() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise discord.RateLimited(0.05)
+            return "sent"
+
+        assert await outbound.submit("send:1", PRIORITY_ALERT, call) == "sent"
+
+        status = outbound.get_status()
+        assert len(attempts) == 2
+        assert status["rate_limited"] == 1
+        assert status["retried"] == 1
+        assert status["rate_limited_by_route"] == {"send:1": 1}
+
+    def test_client_timeout_follows_queue_config(self, make_config):
+        assert get_max_ratelimit_timeout(make_config({})) == MIN_RATELIMIT_TIMEOUT
+
+        config = make_config({"discord_outbound": {"max_ratelimit_timeout_seconds": 5}})
+        assert get_max_ratelimit_timeout(config) == MIN_RATELIMIT_TIMEOUT
+
+        config = make_config({"discord_outbound": {"max_ratelimit_timeout_seconds": 90}})
+        assert get_max_ratelimit_timeout(config) == 90.0
+
+        # Without the queue, discord.py keeps waiting out every limit itself
+        config = make_config({"discord_outbound": {"enabled": False}})
+        assert get_max_ratelimit_timeout(config) is None
+
+
+class TestAbandonedCalls:
+    """Calls whose caller stopped waiting while they were rate limited."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("priority, sent", [(PRIORITY_CRITICAL, True), (PRIORITY_DM, False)])
+    async def test_caller_timeout_during_rate_limit(self, outbound, priority, sent):
+        attempts: List[int] = []
+
+        async def call() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise discord.RateLimited(0.2)
+            return "sent"
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(outbound.submit("send:1", priority, call), 0.05)
+
+        # Route unblocks after the Retry-After
+        await asyncio.sleep(0.4)
+
+        status = outbound.get_status()
+        assert len(attempts) == (2 if sent else 1)
+        assert status["completed"] == (1 if sent else 0)
+        assert status["abandoned_by_priority"]["critical"] == 0
+        assert status["abandoned_by_priority"]["dm"] == (0 if sent else 1)
@@ -0,0 +1,269 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+NLP Micro-Batching Tests
+---
+FILE VERSION: v5.0-10-4.0-3
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Run NLPClientManager against an aiohttp stand-in for Ash-NLP
+- Verify concurrent analyses are merged into one /analyze/batch call
+- Verify per-item batch errors only fail their own caller
+- Verify batch latency does not feed the single-call limiter and trackers
+- Verify servers without /analyze/batch fall back without tripping the breaker
+- Verify closing the client mid-batch fails the waiting callers instead of
+  leaving them hanging
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_nlp/test_nlp_batching.py -v
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.managers.nlp.nlp_client_manager import create_nlp_client_manager
+
+
+# =============================================================================
+# Ash-NLP Stand-in
+# =============================================================================
+
+
+def _analysis(message: str) -> Dict[str, Any]:
+    """Fake analysis: messages containing "help" are HIGH, others SAFE."""
+    crisis = "help" in message
+    return {
+        "crisis_detected": crisis,
+        "severity": "high" if crisis else "safe",
+        "confidence": 0.9,
+        "crisis_score": 0.8 if crisis else 0.05,
+        "requires_intervention": crisis,
+        "recommended_action": "alert" if crisis else "none",
+        "request_id": f"req-{message}",
+    }
+
+
+class FakeNLPServer:
+    """
+    Minimal Ash-NLP server.
+
+    Records every request path so tests can assert how calls were sent.
+    """
+
+    def __init__(
+        self, batch: bool = True, advertise_batch: bool = True, batch_delay: float = 0.0
+    ):
+        self.batch = batch
+        self.advertise_batch = advertise_batch
+        self.batch_delay = batch_delay
+        self.calls: List[str] = []
+        self.batch_sizes: List[int] = []
+
+        self.app = web.Application(middlewares=[self.record])
+        self.app.router.add_get("/status", self.status)
+        self.app.router.add_post("/analyze", self.analyze)
+        if batch:
+            self.app.router.add_post("/analyze/batch", self.analyze_batch)
+
+    @web.middleware
+    async def record(self, request: web.Request, handler) -> web.StreamResponse:
+        # Recorded here so requests to missing routes are counted too
+        self.calls.append(request.path)
+        return await handler(request)
+
+    async def status(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"capabilities": {"batch": self.advertise_batch, "max_batch_size": 32}}
+        )
+
+    async def analyze(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response(_analysis(body["message"]))
+
+    async def analyze_batch(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.batch_sizes.append(len(body["requests"]))
+        await asyncio.sleep(self.batch_delay)
+
+        results = []
+        for item in body["requests"]:
+            if item["message"] == "bad":
+                results.append({"error": "model failure", "request_id": "req-bad"})
+            else:
+                results.append(_analysis(item["message"]))
+        return web.json_response({"results": results})
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+async def start_nlp(make_config):
+    """Start a FakeNLPServer and an NLPClientManager pointed at it."""
+    started = []
+
+    async def _start(**server_kwargs):
+        fake = FakeNLPServer(**server_kwargs)
+        server = TestServer(fake.app)
+        await server.start_server()
+
+        config = make_config({
+            "nlp": {
+                "base_url": str(server.make_url("")).rstrip("/"),
+                "timeout_seconds": 5,
+                "retry_attempts": 0,
+                "batch_enabled": True,
+                "batch_window_ms": 50,
+                "batch_max_size": 16,
+            },
+        })
+        client = create_nlp_client_manager(config_manager=config)
+        started.append((server, client))
+        return fake, client
+
+    yield _start
+
+    for server, client in started:
+        await client.close()
+        await server.close()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestNLPBatching:
+    """Micro-batching against a stand-in Ash-NLP server."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_analyses_share_one_batch(self, start_nlp):
+        fake, client = await start_nlp()
+
+        results = await asyncio.gather(
+            client.analyze_message("hello"),
+            client.analyze_message("please help"),
+            client.analyze_message("all good"),
+        )
+
+        assert fake.calls.count("/analyze/batch") == 1
+        assert fake.batch_sizes == [3]
+        assert "/analyze" not in fake.calls
+        assert [r.severity for r in results] == ["safe", "high", "safe"]
+        assert [r.request_id for r in results] == [
+            "req-hello", "req-please help", "req-all good"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_latency_stays_out_of_single_call_baselines(self, start_nlp):
+        fake, client = await start_nlp()
+        pool = client.endpoint_pool
+
+        await asyncio.gather(
+            client.analyze_message("hello"),
+            client.analyze_message("there"),
+        )
+        assert fake.batch_sizes == [2]
+        assert pool.latency.sample_count == 0
+        assert pool.primary.latency.sample_count == 0
+        assert client.get_stats()["concurrency"]["baseline_ms"] is None
+
+        await client.analyze_message("solo")
+        assert pool.latency.sample_count == 1
+        assert pool.primary.latency.sample_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_item_error_fails_only_its_caller(self, start_nlp):
+        fake, client = await start_nlp()
+
+        good, bad = await asyncio.gather(
+            client.analyze_message("please help"),
+            client.analyze_message("bad"),
+        )
+
+        assert good.severity == "high"
+        assert not good.is_degraded
+        assert bad.is_degraded
+
+    @pytest.mark.asyncio
+    async def test_missing_batch_endpoint_falls_back_without_breaker_failure(
+        self, start_nlp
+    ):
+        # Older server: advertises batching but has no /analyze/batch route
+        fake, client = await start_nlp(batch=False, advertise_batch=True)
+
+        results = await asyncio.gather(
+            client.analyze_message("hello"),
+            client.analyze_message("please help"),
+        )
+
+        assert [r.severity for r in results] == ["safe", "high"]
+        assert fake.calls.count("/analyze/batch") == 1
+        assert fake.calls.count("/analyze") == 2
+
+        breaker = client._circuit_breaker.get_metrics()
+        assert breaker["total_failures"] == 0
+        assert client.circuit_is_closed
+        assert client.get_stats()["batching"]["server_supported"] is False
+
+        # The rejection is cached: later bursts go straight to /analyze
+        await asyncio.gather(
+            client.analyze_message("one"),
+            client.analyze_message("two"),
+        )
+        assert fake.calls.count("/analyze/batch") == 1
+        assert fake.calls.count("/analyze") == 4
+
+    @pytest.mark.asyncio
+    async def test_rejection_survives_stale_capability_probe(self, start_nlp):
+        fake, client = await start_nlp(batch=False, advertise_batch=True)
+
+        await asyncio.gather(
+            client.analyze_message("hello"),
+            client.analyze_message("there"),
+        )
+
+        # /status still advertises batching, but the 404 wins until the TTL
+        await client._probe_batch_support()
+        assert client.get_stats()["batching"]["server_supported"] is False
+
+
+class TestNLPBatchClose:
+    """Closing the client while a batch is on the wire."""
+
+    @pytest.mark.asyncio
+    async def test_close_during_batch_fails_waiting_callers(self, start_nlp):
+        fake, client = await start_nlp(batch_delay=5.0)
+
+        analyses = asyncio.gather(
+            client.analyze_message("hello"),
+            client.analyze_message("please help"),
+        )
+        while not fake.batch_sizes:
+            await asyncio.sleep(0.01)
+
+        await client.close()
+        results = await asyncio.wait_for(analyses, timeout=2.0)
+
+        assert [r.is_degraded for r in results] == [True, True]
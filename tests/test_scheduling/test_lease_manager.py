@@ -0,0 +1,290 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Lease Manager Tests
+---
+FILE VERSION: v5.0-10-14.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify only one replica acquires a lease and the other stands by
+- Verify renewal keeps a hold and drops one that expired or moved
+- Verify a stale fencing token is rejected after a handover
+- Verify release hands the lease over and fail-open covers a Redis outage
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_scheduling/test_lease_manager.py -v
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import pytest
+
+from src.managers.scheduling.lease_manager import create_lease_manager
+
+
+# =============================================================================
+# Stand-ins
+# =============================================================================
+
+
+class FakeLeaseRedis:
+    """
+    RedisManager stand-in running the lease scripts against a dict.
+
+    Each script follows the KEYS/ARGV contract of its Lua source, so two
+    managers sharing one instance behave like two replicas sharing Redis.
+    Lease keys never expire on their own; expire() plays the TTL running out.
+    """
+
+    def __init__(self) -> None:
+        self.data: Dict[str, str] = {}
+        self.scripts: Dict[str, str] = {}
+        self.down = False
+
+    def register_script(self, name: str, source: str) -> str:
+        self.scripts[name] = source
+        return name
+
+    async def run_script(
+        self, name: str, keys: Sequence[str] = (), args: Sequence[Any] = ()
+    ) -> Any:
+        if self.down:
+            return None
+        assert name in self.scripts, f"script {name} was never registered"
+        return getattr(self, f"_{name}")(list(keys), [str(arg) for arg in args])
+
+    def expire(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    def _lease_acquire(self, keys: List[str], argv: List[str]) -> List[Any]:
+        holder = self.data.get(keys[0])
+        if holder == argv[0]:
+            return [int(self.data.get(keys[1], "0")), holder, int(argv[1])]
+        if holder is not None:
+            return [0, holder, int(argv[1])]
+        self.data[keys[0]] = argv[0]
+        self.data[keys[1]] = str(int(self.data.get(keys[1], "0")) + 1)
+        return [int(self.data[keys[1]]), argv[0], int(argv[1])]
+
+    def _lease_renew(self, keys: List[str], argv: List[str]) -> int:
+        return self._lease_check(keys, argv)
+
+    def _lease_check(self, keys: List[str], argv: List[str]) -> int:
+        held = self.data.get(keys[0]) == argv[0] and self.data.get(keys[1]) == argv[1]
+        return 1 if held else 0
+
+    def _lease_release(self, keys: List[str], argv: List[str]) -> int:
+        if self.data.get(keys[0]) == argv[0]:
+            del self.data[keys[0]]
+            return 1
+        return 0
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+LEASE = "reports"
+LEASE_KEY = f"ash:lease:{LEASE}"
+
+
+@pytest.fixture
+def redis() -> FakeLeaseRedis:
+    """Shared lease store for every replica in a test."""
+    return FakeLeaseRedis()
+
+
+@pytest.fixture
+def make_replica(make_config, redis):
+    """Build a LeaseManager sharing the fake Redis with other replicas."""
+
+    def _make(redis_manager: Optional[FakeLeaseRedis] = redis, **leases: Any):
+        return create_lease_manager(
+            config_manager=make_config({"leases": leases}),
+            redis_manager=redis_manager,
+        )
+
+    return _make
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestLeaseAcquire:
+    """Two replicas racing for the same lease."""
+
+    @pytest.mark.asyncio
+    async def test_first_replica_leads_second_stands_by(self, make_replica, redis):
+        leader, standby = make_replica(), make_replica()
+
+        assert await leader.ensure(LEASE) is True
+        assert await standby.ensure(LEASE) is False
+
+        assert leader.token(LEASE) == 1
+        assert standby.token(LEASE) is None
+        assert standby.holds(LEASE) is False
+        assert redis.data[LEASE_KEY] == leader.holder_id
+
+        status = standby.get_status()["leases"][LEASE]
+        assert status["state"] == "standby"
+        assert leader.get_status()["leases"][LEASE]["state"] == "leader"
+
+    @pytest.mark.asyncio
+    async def test_reacquiring_own_lease_keeps_token(self, make_replica):
+        leader = make_replica()
+        await leader.ensure(LEASE)
+        leader._leases[LEASE].valid_until = 0.0
+
+        assert await leader.ensure(LEASE) is True
+        assert leader.token(LEASE) == 1
+        assert leader.get_status()["leases"][LEASE]["acquisitions"] == 1
+
+
+class TestLeaseRenewal:
+    """Renewal of a held lease."""
+
+    @pytest.mark.asyncio
+    async def test_renewal_keeps_hold(self, make_replica):
+        leader = make_replica()
+        await leader.ensure(LEASE)
+
+        await leader._renew_all()
+
+        assert leader.holds(LEASE) is True
+        assert leader.token(LEASE) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_lost_on_renewal(self, make_replica, redis):
+        leader = make_replica()
+        await leader.ensure(LEASE)
+
+        redis.expire(LEASE_KEY)
+        await leader._renew_all()
+
+        assert leader.holds(LEASE) is False
+        assert leader.get_status()["leases"][LEASE]["losses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lease_taken_over_is_lost_on_renewal(self, make_replica, redis):
+        leader, standby = make_replica(), make_replica()
+        await leader.ensure(LEASE)
+
+        redis.expire(LEASE_KEY)
+        assert await standby.ensure(LEASE) is True
+        await leader._renew_all()
+
+        assert leader.holds(LEASE) is False
+        assert standby.token(LEASE) == 2
+
+    @pytest.mark.asyncio
+    async def test_renewal_during_outage_keeps_local_hold(self, make_replica, redis):
+        leader = make_replica()
+        await leader.ensure(LEASE)
+
+        redis.down = True
+        await leader._renew_all()
+
+        assert leader.token(LEASE) == 1
+        assert leader.get_status()["leases"][LEASE]["losses"] == 0
+
+
+class TestLeaseFencing:
+    """Fencing tokens guarding irreversible actions."""
+
+    @pytest.mark.asyncio
+    async def test_current_token_passes(self, make_replica):
+        leader = make_replica()
+        await leader.ensure(LEASE)
+
+        assert await leader.is_current(LEASE, leader.token(LEASE)) is True
+
+    @pytest.mark.asyncio
+    async def test_stale_token_rejected_after_handover(self, make_replica, redis):
+        leader, standby = make_replica(), make_replica()
+        await leader.ensure(LEASE)
+        token = leader.token(LEASE)
+
+        # Leader stalls past its TTL and the standby takes over
+        redis.expire(LEASE_KEY)
+        await standby.ensure(LEASE)
+
+        assert await leader.is_current(LEASE, token) is False
+        assert leader.holds(LEASE) is False
+        assert await standby.is_current(LEASE, standby.token(LEASE)) is True
+
+    @pytest.mark.asyncio
+    async def test_token_from_earlier_hold_rejected(self, make_replica):
+        leader = make_replica()
+        await leader.ensure(LEASE)
+
+        assert await leader.is_current(LEASE, 0) is False
+        assert await leader.is_current(LEASE, None) is False
+
+
+class TestLeaseRelease:
+    """Handing a lease over and working without Redis."""
+
+    @pytest.mark.asyncio
+    async def test_release_lets_standby_take_over(self, make_replica, redis):
+        leader, standby = make_replica(), make_replica()
+        await leader.ensure(LEASE)
+        await standby.ensure(LEASE)
+
+        await leader.stop()
+
+        assert LEASE_KEY not in redis.data
+        assert await standby.ensure(LEASE) is True
+        assert standby.token(LEASE) == 2
+
+    @pytest.mark.asyncio
+    async def test_release_does_not_delete_other_holder(self, make_replica, redis):
+        leader, standby = make_replica(), make_replica()
+        await leader.ensure(LEASE)
+        redis.expire(LEASE_KEY)
+        await standby.ensure(LEASE)
+
+        await leader.release(LEASE)
+
+        assert redis.data[LEASE_KEY] == standby.holder_id
+
+    @pytest.mark.asyncio
+    async def test_outage_fails_open(self, make_replica, redis):
+        replica = make_replica()
+        redis.down = True
+
+        assert await replica.ensure(LEASE) is True
+        assert replica.holds(LEASE) is True
+        assert await replica.is_current(LEASE, None) is True
+        assert replica.get_status()["leases"][LEASE]["state"] == "unreachable"
+
+    @pytest.mark.asyncio
+    async def test_outage_fails_closed_when_configured(self, make_replica, redis):
+        replica = make_replica(fail_open=False)
+        redis.down = True
+
+        assert await replica.ensure(LEASE) is False
+        assert replica.holds(LEASE) is False
+
+    @pytest.mark.asyncio
+    async def test_without_redis_every_replica_works(self, make_replica):
+        replica = make_replica(redis_manager=None)
+
+        assert await replica.ensure(LEASE) is True
+        assert replica.holds(LEASE) is True
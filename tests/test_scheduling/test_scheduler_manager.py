@@ -0,0 +1,106 @@
+"""
+============================================================================
+Ash-Bot: Crisis Detection Discord Bot
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Monitor  → Send messages to Ash-NLP for crisis classification
+    Alert    → Notify Crisis Response Team via embeds when crisis detected
+    Track    → Maintain user history for escalation pattern detection
+    Protect  → Safeguard our LGBTQIA+ community through early intervention
+
+============================================================================
+Scheduler Manager Tests
+---
+FILE VERSION: v5.0-10-13.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 10 - Throughput & Backpressure
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-bot
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+============================================================================
+RESPONSIBILITIES:
+- Verify a replaced job never runs alongside its in-flight predecessor
+- Verify a replacement starts once the in-flight run returns
+
+USAGE:
+    docker exec ash-bot python -m pytest tests/test_scheduling/test_scheduler_manager.py -v
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from src.managers.scheduling.scheduler_manager import create_scheduler_manager
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+async def scheduler(make_config):
+    """A started SchedulerManager, stopped after the test."""
+    manager = create_scheduler_manager(config_manager=make_config({}))
+    manager.start()
+    yield manager
+    await manager.stop()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestSchedulerOverlap:
+    """Replacing a job while its callback is running."""
+
+    @pytest.mark.asyncio
+    async def test_replacement_waits_for_running_callback(self, scheduler):
+        events: List[str] = []
+        release = asyncio.Event()
+
+        async def slow() -> None:
+            events.append("old:start")
+            await release.wait()
+            events.append("old:end")
+
+        async def fast() -> None:
+            events.append("new:run")
+
+        scheduler.schedule("job", slow, delay=0)
+        await asyncio.sleep(0.01)
+        assert events == ["old:start"]
+
+        # Due immediately, but must not start while the old run is in flight
+        scheduler.schedule("job", fast, delay=0)
+        await asyncio.sleep(0.05)
+        assert events == ["old:start"]
+        assert scheduler.is_scheduled("job")
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert events == ["old:start", "old:end", "new:run"]
+        assert not scheduler.is_scheduled("job")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_running_job_is_not_rescheduled(self, scheduler):
+        runs: List[str] = []
+        release = asyncio.Event()
+
+        async def repeating() -> float:
+            runs.append("run")
+            await release.wait()
+            return 0.0
+
+        scheduler.schedule("job", repeating, delay=0)
+        await asyncio.sleep(0.01)
+        scheduler.cancel("job")
+        release.set()
+        await asyncio.sleep(0.05)
+
+        assert runs == ["run"]
+        assert not scheduler.is_scheduled("job")